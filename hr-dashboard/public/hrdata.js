@@ -1,31366 +1 @@
-window.hrData = {
-  "meta": {
-    "generatedAt": "2026-01-06T07:14:19.849Z",
-    "totalRecords": 612,
-    "columns": [
-      "序号_",
-      "姓名_",
-      "区域_",
-      "部门_",
-      "组别_",
-      "岗位_",
-      "入职日期_",
-      "其他_",
-      "辅助列_",
-      "24年剩余调休_",
-      "24年年假使用情况_总年假",
-      "已使用年假",
-      "剩余年假",
-      "24年已使用育儿假_",
-      "1月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "2月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "1-2月使用年假_",
-      "24年剩余年假_",
-      "截至24.2月剩余年假_",
-      "3月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "4月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "5月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "6月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "7月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "8月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "9月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "折算调休数",
-      "10月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "11月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "12月_年假",
-      "事假h",
-      "病假",
-      "其他",
-      "调休",
-      "加班\n加班费",
-      "加班\n转调休",
-      "育儿假",
-      "备注",
-      "25年年假使用情况_总年假",
-      "已使用\n年假",
-      "剩余年假",
-      "25年总加班情况_累计\n加班/天",
-      "已调\n休/天",
-      "剩余调休",
-      "累计计薪加班/h",
-      "25年总请假_累计\n事假",
-      "累计\n病假",
-      "累计\n其他",
-      "累计\n育儿假",
-      ""
-    ],
-    "filters": {
-      "departments": [],
-      "groups": [],
-      "areas": [],
-      "positions": []
-    }
-  },
-  "data": [
-    {
-      "序号_": 1,
-      "姓名_": "刘其坚",
-      "区域_": "上海",
-      "部门_": "总经办",
-      "组别_": "/",
-      "岗位_": "CEO",
-      "入职日期_": 41933,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": 46023
-    },
-    {
-      "序号_": 2,
-      "姓名_": "刘玉",
-      "区域_": "上海",
-      "部门_": "财务部",
-      "组别_": "/",
-      "岗位_": "财务专员",
-      "入职日期_": 43563,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 13,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": " ",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 46.5,
-      "已调\n休/天": 5,
-      "剩余调休": 33.5,
-      "累计计薪加班/h": 29,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 3,
-      "姓名_": "胡生娜",
-      "区域_": "上海",
-      "部门_": "财务部",
-      "组别_": "/",
-      "岗位_": "财务总监",
-      "入职日期_": 43983,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": "",
-      "病假": 0.5,
-      "其他": "",
-      "调休": 2,
-      "加班\n加班费": 17,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 38.5,
-      "已调\n休/天": 20,
-      "剩余调休": 1.5,
-      "累计计薪加班/h": 17,
-      "25年总请假_累计\n事假": 0.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 4,
-      "姓名_": "邓雅芳",
-      "区域_": "上海",
-      "部门_": "财务部",
-      "组别_": "/",
-      "岗位_": "财务主管",
-      "入职日期_": 44531,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 61,
-      "已调\n休/天": 38.5,
-      "剩余调休": 1.5,
-      "累计计薪加班/h": 15.5,
-      "25年总请假_累计\n事假": 50.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 6,
-      "": ""
-    },
-    {
-      "序号_": 5,
-      "姓名_": "周彤",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "行政前台",
-      "入职日期_": 43549,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 19,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 55,
-      "已调\n休/天": 11,
-      "剩余调休": 49,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 6,
-      "姓名_": "张晓伟",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "IT网络工程师",
-      "入职日期_": 43577,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 37,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 19,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 4,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 87.5,
-      "已调\n休/天": 24,
-      "剩余调休": 100.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 7,
-      "姓名_": "卢佳",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "行政主管",
-      "入职日期_": 44144,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 10,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 21.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 4.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 26.5,
-      "已调\n休/天": 7.5,
-      "剩余调休": 19,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 31.5,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 8,
-      "姓名_": "周子蛟",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "商务组",
-      "岗位_": "商务BD",
-      "入职日期_": 44256,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 6.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 11.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": 1.5,
-      "6月_年假": 1,
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 35.5,
-      "已调\n休/天": 27,
-      "剩余调休": 8.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 37.5,
-      "累计\n病假": 8.5,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 9,
-      "姓名_": "胡惜文",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "/",
-      "岗位_": "业务一部经理",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 17.42,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 7.5,
-      "已使用\n年假": 6,
-      "25年总加班情况_累计\n加班/天": 44.5,
-      "已调\n休/天": 15.5,
-      "剩余调休": 41.42,
-      "累计计薪加班/h": 5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4,
-      "": ""
-    },
-    {
-      "序号_": 10,
-      "姓名_": "何尚杰",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "市场渠道组",
-      "岗位_": "业务主管",
-      "入职日期_": 43270,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 17.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 115,
-      "已调\n休/天": 117.5,
-      "剩余调休": 2.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 33,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 11,
-      "姓名_": "饶洁",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "业务运营组",
-      "岗位_": "业务主管",
-      "入职日期_": 43696,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 4,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 9,
-      "25年总加班情况_累计\n加班/天": 13.5,
-      "已调\n休/天": 9.5,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 12,
-      "姓名_": "黄佳慧",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "培训讲师",
-      "入职日期_": 43612,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 9,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16.5,
-      "累计\n病假": 4,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 13,
-      "姓名_": "刘鑫",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体主管",
-      "入职日期_": 44159,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": 3,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 5,
-      "剩余调休": 19,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 14,
-      "姓名_": "屈翎野",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体专员",
-      "入职日期_": 43185,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 28,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 6.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 16.5,
-      "剩余调休": 11.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 15,
-      "姓名_": "陆常斌",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "视频剪辑",
-      "入职日期_": 44991,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 40,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 16,
-      "剩余调休": 48,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 16,
-      "姓名_": "孙玉凤",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人力资源总监",
-      "入职日期_": 43192,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 66.5,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 21,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 2.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1.5,
-      "4月_年假": 1,
-      "5月_年假": 0.5,
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": 77.5,
-      "10月_年假": "2",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 141.5,
-      "已调\n休/天": 20.5,
-      "剩余调休": 95,
-      "累计计薪加班/h": 15,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 17,
-      "姓名_": "纪志豪",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "资深人事",
-      "入职日期_": 43947,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 44,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 10,
-      "加班\n加班费": "",
-      "加班\n转调休": 25.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 4,
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 144,
-      "已调\n休/天": 93,
-      "剩余调休": 95,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2,
-      "累计\n其他": 9,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 18,
-      "姓名_": "熊溜溜",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "资深人事",
-      "入职日期_": 44088,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 0.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 14,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 81.5,
-      "已调\n休/天": 2,
-      "剩余调休": 79.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 152,
-      "累计\n病假": 0,
-      "累计\n其他": 66,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 19,
-      "姓名_": "郭昱伶",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "资深人事",
-      "入职日期_": 44322,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 12.5,
-      "加班\n转调休": 5.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 6.5,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 42,
-      "已调\n休/天": 24,
-      "剩余调休": 5.5,
-      "累计计薪加班/h": 12.5,
-      "25年总请假_累计\n事假": 37,
-      "累计\n病假": 3.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 20,
-      "姓名_": "李丽萍",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 44979,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5.5,
-      "剩余年假": -0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": 15,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5.5,
-      "截至24.2月剩余年假_": -5.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 15,
-      "已调\n休/天": 3,
-      "剩余调休": 12,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20.5,
-      "累计\n病假": 0,
-      "累计\n其他": 1.5,
-      "累计\n育儿假": 1.5,
-      "": ""
-    },
-    {
-      "序号_": 21,
-      "姓名_": "郭洁",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "产品部",
-      "岗位_": "产品部经理",
-      "入职日期_": 43045,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": 24,
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 52.5,
-      "已调\n休/天": 27.5,
-      "剩余调休": 1.5,
-      "累计计薪加班/h": 27.5,
-      "25年总请假_累计\n事假": 37.5,
-      "累计\n病假": 10,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 22,
-      "姓名_": "毛意伟",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "研发主管（PHP）",
-      "入职日期_": 43243,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 25.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": 0.5,
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": 3.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 68,
-      "已调\n休/天": 81.5,
-      "剩余调休": 12,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 18,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 23,
-      "姓名_": "彭鲲",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "产品经理",
-      "入职日期_": 44270,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 0.5,
-      "6月_年假": 1.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 79.5,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 63.5,
-      "25年总请假_累计\n事假": 7,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 24,
-      "姓名_": "王冉冉",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "测试主管",
-      "入职日期_": 44333,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 49,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 7.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 127.5,
-      "已调\n休/天": 119,
-      "剩余调休": 57.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4.5,
-      "累计\n病假": 2.5,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 25,
-      "姓名_": "张金凯",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "测试主管",
-      "入职日期_": 44333,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 20,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 149.5,
-      "已调\n休/天": 139,
-      "剩余调休": 30.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 26,
-      "姓名_": "王晓倩",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 43640,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 59,
-      "已调\n休/天": 80,
-      "剩余调休": 3.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 42.5,
-      "累计\n病假": 0.5,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 27,
-      "姓名_": "李浩然",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "资深前端开发工程师",
-      "入职日期_": 44305,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 19.1,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 38,
-      "已调\n休/天": 31.75,
-      "剩余调休": 25.35,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 28,
-      "姓名_": "孙唯嘉",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "产品主管",
-      "入职日期_": 44788,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 17,
-      "病假": 1.5,
-      "其他": "",
-      "调休": 9.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 75,
-      "已调\n休/天": 74.97,
-      "剩余调休": 0.0300000000000011,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 54.23,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 29,
-      "姓名_": "赵德正",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45041,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 93,
-      "已调\n休/天": 40,
-      "剩余调休": 16,
-      "累计计薪加班/h": 37,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 1.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 30,
-      "姓名_": "王澜滔",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "市场渠道组",
-      "岗位_": "平面设计",
-      "入职日期_": 43311,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 3.5,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 31,
-      "姓名_": "王依",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "UI设计师",
-      "入职日期_": 43381,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 1.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 7,
-      "累计\n其他": 4,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 32,
-      "姓名_": "郝惠军",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "设计主管",
-      "入职日期_": 43972,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 43,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": 8,
-      "加班\n转调休": 22.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 140,
-      "已调\n休/天": 72.5,
-      "剩余调休": 49,
-      "累计计薪加班/h": 56,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 33,
-      "姓名_": "张潭辉",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "UI设计师",
-      "入职日期_": 43972,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 4,
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 44,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 34,
-      "姓名_": "测试王艳",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "/",
-      "岗位_": "测试总监",
-      "入职日期_": 44025,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 15,
-      "已使用年假": 12,
-      "剩余年假": 9,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 15,
-      "已使用\n年假": 6,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 35,
-      "姓名_": "王付佳",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 44067,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 55.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 3,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 76,
-      "已调\n休/天": 0,
-      "剩余调休": 90,
-      "累计计薪加班/h": 41.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 36,
-      "姓名_": "赵亚楠",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "测试主管",
-      "入职日期_": 42695,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 40,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 0.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 21,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 67,
-      "已调\n休/天": 22.5,
-      "剩余调休": 72.5,
-      "累计计薪加班/h": 4,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 3,
-      "累计\n育儿假": 4.5,
-      "": ""
-    },
-    {
-      "序号_": 37,
-      "姓名_": "李贵洲",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "研发主管（PHP）",
-      "入职日期_": 44068,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 20,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 18,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 121,
-      "已调\n休/天": 0,
-      "剩余调休": 20,
-      "累计计薪加班/h": 137,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 38,
-      "姓名_": "宛超",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 43626,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 25,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 102,
-      "已调\n休/天": 29.5,
-      "剩余调休": 4,
-      "累计计薪加班/h": 77.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 39,
-      "姓名_": "王沨",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "测试主管",
-      "入职日期_": 44322,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 15,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 18,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 37.5,
-      "已调\n休/天": 52.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 40,
-      "姓名_": "罗细娟",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "BI组",
-      "岗位_": "数据开发主管",
-      "入职日期_": 44445,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 100,
-      "已调\n休/天": 49.5,
-      "剩余调休": 4.5,
-      "累计计薪加班/h": 40,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 2.5,
-      "": ""
-    },
-    {
-      "序号_": 41,
-      "姓名_": "徐姣姣",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 44970,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 48,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": 32,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 124,
-      "已调\n休/天": 36.5,
-      "剩余调休": 3.5,
-      "累计计薪加班/h": 108,
-      "25年总请假_累计\n事假": 4.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 42,
-      "姓名_": "李雅珠",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "产品经理",
-      "入职日期_": 44789,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 16,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 90.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 43,
-      "姓名_": "臧兆鋆",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45050,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2,
-      "加班\n加班费": 9,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 94,
-      "已调\n休/天": 46,
-      "剩余调休": 31,
-      "累计计薪加班/h": 17,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 44,
-      "姓名_": "李帅华",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45036,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 12,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 9,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 66,
-      "已调\n休/天": 9,
-      "剩余调休": 22,
-      "累计计薪加班/h": 40,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 45,
-      "姓名_": "胡翔翔",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "研发主管（IOS）",
-      "入职日期_": 42709,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0.25,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 34.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 121.5,
-      "已调\n休/天": 64,
-      "剩余调休": 57.75,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 18.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 46,
-      "姓名_": "杨海燕",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 43997,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 17.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 3,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 101,
-      "已调\n休/天": 87.5,
-      "剩余调休": 29.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 47,
-      "姓名_": "李海侠",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 44267,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": 8,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1,
-      "4月_年假": 3,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 36,
-      "剩余调休": 20,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 48,
-      "姓名_": "褚晨雯",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "资深产品经理",
-      "入职日期_": 44578,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": 10.5,
-      "加班\n转调休": 10,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 42,
-      "已调\n休/天": 9.5,
-      "剩余调休": 26,
-      "累计计薪加班/h": 14.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4.5,
-      "": ""
-    },
-    {
-      "序号_": 49,
-      "姓名_": "朱梦雅",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 44991,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 38.17,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 102.5,
-      "已调\n休/天": 38.17,
-      "剩余调休": 64,
-      "累计计薪加班/h": 46.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 50,
-      "姓名_": "陆文宇",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 44993,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 6.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": 1.5,
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 35,
-      "已调\n休/天": 30.5,
-      "剩余调休": 4.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 146.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 51,
-      "姓名_": "汤喆",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "研发主管（Java）",
-      "入职日期_": 42802,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 93.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 12.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 112,
-      "已调\n休/天": 153.5,
-      "剩余调休": 52,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 9,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 52,
-      "姓名_": "刘程",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 125.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 73,
-      "已调\n休/天": 191.5,
-      "剩余调休": 7,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 19,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 53,
-      "姓名_": "邢杏杏",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "测试主管",
-      "入职日期_": 44333,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 39.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": 147,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 278.5,
-      "已调\n休/天": 45.5,
-      "剩余调休": 44.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 54,
-      "姓名_": "黄健",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 44760,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 7,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 4,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 170.5,
-      "已调\n休/天": 55.5,
-      "剩余调休": 2.5,
-      "累计计薪加班/h": 120.5,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 55,
-      "姓名_": "邱成",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 44984,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 7.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 7,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 88.5,
-      "已调\n休/天": 10,
-      "剩余调休": 0,
-      "累计计薪加班/h": 83.5,
-      "25年总请假_累计\n事假": 12.5,
-      "累计\n病假": 8,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 56,
-      "姓名_": "陈绪慧",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "产品主管",
-      "入职日期_": 43727,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 0.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 13,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 27,
-      "剩余调休": 29.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 23.5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 57,
-      "姓名_": "章发晨",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 43528,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0.170000000000002,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 13,
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 5.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 107.5,
-      "已调\n休/天": 73.67,
-      "剩余调休": 34,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 21,
-      "累计\n病假": 13,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4,
-      "": ""
-    },
-    {
-      "序号_": 58,
-      "姓名_": "申国超",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "游戏开发工程师",
-      "入职日期_": 44340,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 32,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 32,
-      "加班\n加班费": "",
-      "加班\n转调休": 32,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 199,
-      "已调\n休/天": 152,
-      "剩余调休": 36,
-      "累计计薪加班/h": 32.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 59,
-      "姓名_": "李一鸣",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "设计主管",
-      "入职日期_": 45019,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 29.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 60,
-      "姓名_": "梅守强",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "研发主管（IOS）",
-      "入职日期_": 42835,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 11.75,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 39.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 252.5,
-      "已调\n休/天": 12,
-      "剩余调休": 11.25,
-      "累计计薪加班/h": 242,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 61,
-      "姓名_": "骆方涛",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 43257,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 14,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 6,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 106.5,
-      "已调\n休/天": 54.5,
-      "剩余调休": 66,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 62,
-      "姓名_": "齐浩迎",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "研发主管（Android）",
-      "入职日期_": 43535,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 101.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 35,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": 112,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 205.5,
-      "已调\n休/天": 83.5,
-      "剩余调休": 111.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 1,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 63,
-      "姓名_": "吴俊志",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "产品一部主管",
-      "入职日期_": 44350,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 26,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 6.5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": 9,
-      "加班\n转调休": 8.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 3.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 7,
-      "25年总加班情况_累计\n加班/天": 108.5,
-      "已调\n休/天": 56,
-      "剩余调休": 29,
-      "累计计薪加班/h": 49.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 64,
-      "姓名_": "李华南",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "测试经理",
-      "入职日期_": 43972,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 15,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 0.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 123,
-      "已调\n休/天": 90,
-      "剩余调休": 48,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 65,
-      "姓名_": "吴利丹",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 43978,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 54,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 32,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 5.5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": 38.83,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 129,
-      "已调\n休/天": 55.17,
-      "剩余调休": 81,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 66,
-      "姓名_": "朴雪花",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "资深产品经理",
-      "入职日期_": 44113,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 11.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 12.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 84.5,
-      "已调\n休/天": 59.5,
-      "剩余调休": 25,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 67,
-      "姓名_": "易鹏",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 44825,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 50,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 18.5,
-      "加班\n转调休": 10,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 136,
-      "已调\n休/天": 88.5,
-      "剩余调休": 48.5,
-      "累计计薪加班/h": 41,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 68,
-      "姓名_": "皮亚楠",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 44880,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8.77,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": 32,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 205,
-      "已调\n休/天": 26.5,
-      "剩余调休": 6.27,
-      "累计计薪加班/h": 180.5,
-      "25年总请假_累计\n事假": 9,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 69,
-      "姓名_": "朱秀梅",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "产品主管",
-      "入职日期_": 44256,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3.5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 32,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 232,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 224,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 70,
-      "姓名_": "耿童童",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45019,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": 22,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 127,
-      "已调\n休/天": 96.42,
-      "剩余调休": 46.58,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 71,
-      "姓名_": "蒲科辉",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "/",
-      "岗位_": "研发副总",
-      "入职日期_": 42005,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 10,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 52.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 6.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 9,
-      "25年总加班情况_累计\n加班/天": 263,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 247,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 72,
-      "姓名_": "沈刚",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "/",
-      "岗位_": "研发副总",
-      "入职日期_": 42005,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 15,
-      "已使用年假": 11,
-      "剩余年假": 6.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 1,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 1.5,
-      "5月_年假": 0.5,
-      "6月_年假": 2,
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 15,
-      "已使用\n年假": 8.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 73,
-      "姓名_": "周宏坤",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "资深Java开发工程师",
-      "入职日期_": 43957,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 66.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 58.5,
-      "25年总请假_累计\n事假": 42.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 74,
-      "姓名_": "夏菁",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "测试二部",
-      "岗位_": "测试经理",
-      "入职日期_": 44075,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 83,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 3,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 19,
-      "加班\n转调休": 19.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": 120,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 203.5,
-      "已调\n休/天": 31.5,
-      "剩余调休": 92,
-      "累计计薪加班/h": 43,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 75,
-      "姓名_": "王敬豪",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 44753,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 2.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 58.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 58.5,
-      "25年总请假_累计\n事假": 26.5,
-      "累计\n病假": 1.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 76,
-      "姓名_": "吴登朋",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 44970,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 12,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 28,
-      "加班\n转调休": 5.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2.5,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 260,
-      "已调\n休/天": 61.5,
-      "剩余调休": 33,
-      "累计计薪加班/h": 177.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 77,
-      "姓名_": "胡军",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "研发主管（Java）",
-      "入职日期_": 44256,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 14.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 3,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8.5,
-      "25年总加班情况_累计\n加班/天": 67,
-      "已调\n休/天": 47.5,
-      "剩余调休": 34,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 78,
-      "姓名_": "赵朝龙",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "系统运维组",
-      "岗位_": "运维工程师",
-      "入职日期_": 44977,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 21.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 63,
-      "已调\n休/天": 66.5,
-      "剩余调休": 2,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 79,
-      "姓名_": "黄金伟",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "系统运维组",
-      "岗位_": "运维主管",
-      "入职日期_": 44322,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 98,
-      "已调\n休/天": 98,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 80,
-      "姓名_": "孙运成",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 44992,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 4,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 15.5,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 10.5,
-      "25年总请假_累计\n事假": 39.5,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 81,
-      "姓名_": "牟立强",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "业务二部总监",
-      "入职日期_": 43166,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 12,
-      "加班\n加班费": "",
-      "加班\n转调休": 8.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 4,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 6,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 118.5,
-      "已调\n休/天": 84,
-      "剩余调休": 37,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 82,
-      "姓名_": "吴戈",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "业务运营",
-      "入职日期_": 44166,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 6,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 4,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 4,
-      "剩余调休": 10,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 83,
-      "姓名_": "孙静怡",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "业务运营",
-      "入职日期_": 44324,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 3,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 19,
-      "剩余调休": 0,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 84,
-      "姓名_": "陈春霞",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 43262,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 160,
-      "已调\n休/天": 146,
-      "剩余调休": 14,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 85,
-      "姓名_": "朱行悟",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 43424,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 1.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 61,
-      "已调\n休/天": 44,
-      "剩余调休": 17,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 86,
-      "姓名_": "马泽生",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "资深销售五级",
-      "入职日期_": 43612,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 96,
-      "已调\n休/天": 80,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4,
-      "": ""
-    },
-    {
-      "序号_": 87,
-      "姓名_": "周媛",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售主管",
-      "入职日期_": 43455,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 88,
-      "姓名_": "董皊",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "董皊组",
-      "岗位_": "运营主管",
-      "入职日期_": 43619,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 6.5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 5.5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 4,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 7,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 89,
-      "姓名_": "朱韦平",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "董皊组",
-      "岗位_": "运营专员",
-      "入职日期_": 43766,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 176,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 160,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4,
-      "": ""
-    },
-    {
-      "序号_": 90,
-      "姓名_": "李梦",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "李梦组",
-      "岗位_": "运营主管",
-      "入职日期_": 43808,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 7,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 7,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 91,
-      "姓名_": "蒋杰",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "行政&营销总监",
-      "入职日期_": 42005,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 8.5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 15.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": 3,
-      "8月_年假": 1.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8,
-      "25年总加班情况_累计\n加班/天": 15.5,
-      "已调\n休/天": 0,
-      "剩余调休": 15.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 92,
-      "姓名_": "杨召军",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 43640,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 120,
-      "已调\n休/天": 120,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 34,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 93,
-      "姓名_": "刘欢",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售二级",
-      "入职日期_": 43920,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 80,
-      "已调\n休/天": 64,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0.83,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 94,
-      "姓名_": "周明",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 43160,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 103,
-      "已调\n休/天": 91,
-      "剩余调休": 12,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 95,
-      "姓名_": "丁应强",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售四级",
-      "入职日期_": 43248,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 128,
-      "已调\n休/天": 128,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 43,
-      "累计\n病假": 5.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 96,
-      "姓名_": "刘伦星",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 43920,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 20,
-      "已调\n休/天": 16,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 97,
-      "姓名_": "王景武",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售二级",
-      "入职日期_": 43437,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 92,
-      "已调\n休/天": 84,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 98,
-      "姓名_": "吴菲",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "吴菲组",
-      "岗位_": "运营主管",
-      "入职日期_": 43384,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 9.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4.5,
-      "事假h": 22.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 99,
-      "姓名_": "许慧",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "吴菲组",
-      "岗位_": "运营专员",
-      "入职日期_": 43766,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 160,
-      "已调\n休/天": 136,
-      "剩余调休": 0,
-      "累计计薪加班/h": 32,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 2.5,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 100,
-      "姓名_": "陈慧",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "吴菲组",
-      "岗位_": "运营专员",
-      "入职日期_": 43906,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 10,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 7,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 7.5,
-      "24年剩余年假_": -7.5,
-      "截至24.2月剩余年假_": -7.5,
-      "3月_年假": "",
-      "4月_年假": 2.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 132,
-      "已调\n休/天": 112,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 27,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 101,
-      "姓名_": "万建国",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 43215,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 24,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 14,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 102,
-      "姓名_": "方世军",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "资深销售三级",
-      "入职日期_": 43724,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 88,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 103,
-      "姓名_": "韩丽丽",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "韩丽丽组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 44151,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 1.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1.5,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "3",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 80,
-      "已调\n休/天": 80,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 32,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 104,
-      "姓名_": "马玉",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "董皊组",
-      "岗位_": "资深运营",
-      "入职日期_": 43353,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "3",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 208,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 216,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 105,
-      "姓名_": "宋洪丰",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "李梦组",
-      "岗位_": "运营专员",
-      "入职日期_": 43776,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 3.5,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 13,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 6.5,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 205,
-      "已调\n休/天": 56,
-      "剩余调休": 0,
-      "累计计薪加班/h": 165,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 7,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 106,
-      "姓名_": "左楠",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "李梦组",
-      "岗位_": "运营专员",
-      "入职日期_": 44333,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": 1.5,
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 72,
-      "已调\n休/天": 40,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 4,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 107,
-      "姓名_": "雷雪",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "吴菲组",
-      "岗位_": "运营专员",
-      "入职日期_": 44333,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 144,
-      "已调\n休/天": 136,
-      "剩余调休": 0,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 8,
-      "": ""
-    },
-    {
-      "序号_": 108,
-      "姓名_": "陈佳明",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "平台运维组",
-      "岗位_": "运维专员",
-      "入职日期_": 43160,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2,
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 220,
-      "已调\n休/天": 17,
-      "剩余调休": 19,
-      "累计计薪加班/h": 216,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 109,
-      "姓名_": "邱圆",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "平台运维组",
-      "岗位_": "运维专员",
-      "入职日期_": 43206,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 34,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 3,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 208,
-      "已调\n休/天": 41,
-      "剩余调休": 41,
-      "累计计薪加班/h": 152,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 110,
-      "姓名_": "张书田",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "平台运维组",
-      "岗位_": "运维主管",
-      "入职日期_": 43213,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 17.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": 0.5,
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 247.5,
-      "已调\n休/天": 1,
-      "剩余调休": 4,
-      "累计计薪加班/h": 234,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 111,
-      "姓名_": "吴阳明",
-      "区域_": "厦门",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "运营总监",
-      "入职日期_": 42005,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 3,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 1,
-      "剩余年假": 6,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": 0.5,
-      "备注": "",
-      "2月_年假": 3.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 5.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 3,
-      "剩余调休": 0,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 7,
-      "": ""
-    },
-    {
-      "序号_": 112,
-      "姓名_": "刘骏",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "厦门内容部经理",
-      "入职日期_": 42979,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": 5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 3.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 19.52,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 113,
-      "姓名_": "林碧虹",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容主管",
-      "入职日期_": 43969,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1.5,
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 7,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 114,
-      "姓名_": "陈雅真",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容主管",
-      "入职日期_": 44010,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 7,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": 2,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 7,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 26,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 115,
-      "姓名_": "吴芳芳",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 44657,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 5,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 116,
-      "姓名_": "叶聪玲",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容主管",
-      "入职日期_": 42355,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 6.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 117,
-      "姓名_": "蔡惠娜",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容编辑",
-      "入职日期_": 42788,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 118,
-      "姓名_": "郑建珍",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容编辑",
-      "入职日期_": 43474,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 0.5,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 7.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 119,
-      "姓名_": "黄娜君",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "资深销售三级",
-      "入职日期_": 43627,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 6,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": 25,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 296,
-      "累计\n病假": 0,
-      "累计\n其他": 1,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 120,
-      "姓名_": "廖齐辉",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "廖齐辉组",
-      "岗位_": "销售主管",
-      "入职日期_": 43677,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 208,
-      "已调\n休/天": 112,
-      "剩余调休": 96,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 32,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 121,
-      "姓名_": "刘益先",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 42095,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 3,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 24,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 122,
-      "姓名_": "蓝坤燕",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "资深销售一级",
-      "入职日期_": 44292,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1.5,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 123,
-      "姓名_": "汤章溢",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 42416,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 7,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": 5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 56,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 124,
-      "姓名_": "蔡小明",
-      "区域_": "龙岩",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 43906,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 125,
-      "姓名_": "许财杰",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许财杰组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 44060,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 8,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": 2.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 126,
-      "姓名_": "许满玉",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许满玉组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 44259,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 7,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 127,
-      "姓名_": "魏力莉",
-      "区域_": "长泰",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "资深销售三级",
-      "入职日期_": 42461,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 4,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 128,
-      "姓名_": "李胜航",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 44158,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 40,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0.5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 1.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 48,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 129,
-      "姓名_": "刘凌",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "研发主管（前端）",
-      "入职日期_": 42835,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 5.5,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 130,
-      "姓名_": "刘海亮",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 44074,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 131,
-      "姓名_": "骆毅佳",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "产品经理",
-      "入职日期_": 44762,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 2,
-      "剩余调休": 6,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 132,
-      "姓名_": "陈燕飞",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 44767,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 3,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 47.5,
-      "已调\n休/天": 35.5,
-      "剩余调休": 20,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 133,
-      "姓名_": "杜雅妮",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营主管",
-      "入职日期_": 43368,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 9,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 199,
-      "已调\n休/天": 186,
-      "剩余调休": 21,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 134,
-      "姓名_": "陈珊",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 43928,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 0.5,
-      "剩余年假": 8.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": 2.5,
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 7,
-      "24年剩余年假_": 2.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 20,
-      "剩余调休": 8,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 26,
-      "累计\n其他": 12.5,
-      "累计\n育儿假": 2.5,
-      "": ""
-    },
-    {
-      "序号_": 135,
-      "姓名_": "李梦阳",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "李梦阳组",
-      "岗位_": "运营主管",
-      "入职日期_": 42943,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 7,
-      "剩余年假": 9,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 32,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 304,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 312,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 136,
-      "姓名_": "王家盛",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "李梦阳组",
-      "岗位_": "运营专员",
-      "入职日期_": 43556,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 5.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": 0.5,
-      "4月_年假": 1.5,
-      "5月_年假": 0.5,
-      "6月_年假": 0.5,
-      "7月_年假": 4,
-      "8月_年假": 1.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 200,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 152,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 137,
-      "姓名_": "夜琛",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "李梦阳组",
-      "岗位_": "运营专员",
-      "入职日期_": 43654,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 184,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 184,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 138,
-      "姓名_": "孙敏",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "李梦阳组",
-      "岗位_": "运营专员",
-      "入职日期_": 43619,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 3,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3.5,
-      "1-2月使用年假_": 7.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": 0.5,
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 8.5,
-      "25年总加班情况_累计\n加班/天": 216,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 216,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 139,
-      "姓名_": "刘悦莉",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "李梦阳组",
-      "岗位_": "运营专员",
-      "入职日期_": 43941,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 4,
-      "剩余年假": 6.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 32,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": 1,
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 320,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 304,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 140,
-      "姓名_": "陈可欣",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 44040,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 6,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 14.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 7.5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 244,
-      "已调\n休/天": 226.5,
-      "剩余调休": 17.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 141,
-      "姓名_": "林月荧",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 44657,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 164,
-      "已调\n休/天": 160,
-      "剩余调休": 20,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 142,
-      "姓名_": "蓝青青",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "蓝青青组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 44970,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1.5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 48,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 143,
-      "姓名_": "林福美",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售二级",
-      "入职日期_": 44970,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1.5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1.5,
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 96,
-      "已调\n休/天": 96,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 144,
-      "姓名_": "魏尧天",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "测试主管",
-      "入职日期_": 44973,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 3.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 40,
-      "剩余调休": 19.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 145,
-      "姓名_": "林贵煌",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 44979,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 146,
-      "姓名_": "黄艺慧",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45005,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 21,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 147,
-      "姓名_": "李敏",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45019,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 148,
-      "姓名_": "刘建镇",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "刘建镇组",
-      "岗位_": "销售主管",
-      "入职日期_": 45064,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 149,
-      "姓名_": "王甜",
-      "区域_": "长沙",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事主管",
-      "入职日期_": 44124,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 168,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 172,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 150,
-      "姓名_": "李清",
-      "区域_": "长沙",
-      "部门_": "长沙营销中心",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 42828,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 4,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 64,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 6,
-      "": ""
-    },
-    {
-      "序号_": 151,
-      "姓名_": "刘丽",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容主管",
-      "入职日期_": 43992,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 160,
-      "已调\n休/天": 1,
-      "剩余调休": 16,
-      "累计计薪加班/h": 152,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 152,
-      "姓名_": "王思婕",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 42982,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 128,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 128,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 153,
-      "姓名_": "长沙王艳",
-      "区域_": "长沙",
-      "部门_": "长沙营销中心",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 43913,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 32,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 154,
-      "姓名_": "杨琼",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 43936,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 0,
-      "剩余调休": 5,
-      "累计计薪加班/h": 56,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 155,
-      "姓名_": "李瑶",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 44165,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 3,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 21,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 156,
-      "姓名_": "刘莹",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容主管",
-      "入职日期_": 43922,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 9,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 157,
-      "姓名_": "陈宇",
-      "区域_": "长沙",
-      "部门_": "长沙营销中心",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体运营主管",
-      "入职日期_": 44113,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0.5,
-      "累计\n育儿假": 3.5,
-      "": ""
-    },
-    {
-      "序号_": 158,
-      "姓名_": "何倩",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "何倩组",
-      "岗位_": "销售主管",
-      "入职日期_": 42562,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 28,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": "",
-      "": ""
-    },
-    {
-      "序号_": 159,
-      "姓名_": "何双",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "何双组",
-      "岗位_": "销售主管",
-      "入职日期_": 43709,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 160,
-      "姓名_": "苏星星",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "中级销售主管",
-      "入职日期_": 44113,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 161,
-      "姓名_": "丁辉",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 41640,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 0,
-      "剩余年假": 10,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 10,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 162,
-      "姓名_": "彭乾",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "彭乾组",
-      "岗位_": "运营主管",
-      "入职日期_": 43661,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 8,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": 8,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 176,
-      "已调\n休/天": 89,
-      "剩余调休": 15,
-      "累计计薪加班/h": 80,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 163,
-      "姓名_": "侯佳玲",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "彭乾组",
-      "岗位_": "运营专员",
-      "入职日期_": 43767,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 14,
-      "加班\n加班费": 8,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 2,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 168,
-      "已调\n休/天": 129.5,
-      "剩余调休": 8.5,
-      "累计计薪加班/h": 32,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 164,
-      "姓名_": "苏坚",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "苏坚组",
-      "岗位_": "运营主管",
-      "入职日期_": 43914,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": 1,
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 208,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 208,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 9.5,
-      "": ""
-    },
-    {
-      "序号_": 165,
-      "姓名_": "刘艺霞",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "彭乾组",
-      "岗位_": "运营专员",
-      "入职日期_": 43915,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 184,
-      "已调\n休/天": 10.5,
-      "剩余调休": 5.5,
-      "累计计薪加班/h": 168,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 166,
-      "姓名_": "王臣立",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45023,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 167,
-      "姓名_": "王海云",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45033,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1.5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 168,
-      "姓名_": "彭蕾",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "何双组",
-      "岗位_": "资深销售二级",
-      "入职日期_": 45061,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": 2,
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 169,
-      "姓名_": "袁晶",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "销售经理",
-      "入职日期_": 44284,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 4,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 170,
-      "姓名_": "谢娟",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "菅丽萍组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 43678,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 171,
-      "姓名_": "张文君",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售主管",
-      "入职日期_": 43897,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 2,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 12,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 172,
-      "姓名_": "郭学雷",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 173,
-      "姓名_": "陆慧敏",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "资深销售二级",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 6,
-      "剩余调休": 2,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 174,
-      "姓名_": "张珍珠",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "资深销售三级",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 10.5,
-      "剩余调休": 21.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 6,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 175,
-      "姓名_": "菅丽萍",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "菅丽萍组",
-      "岗位_": "销售主管",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 3,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 176,
-      "姓名_": "柴明军",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张庆庆组",
-      "岗位_": "运营专员",
-      "入职日期_": 44021,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 177,
-      "姓名_": "张庆庆",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张庆庆组",
-      "岗位_": "运营主管",
-      "入职日期_": 43647,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 178,
-      "姓名_": "罗培生",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "研发&营销总监",
-      "入职日期_": 44978,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 14,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 8,
-      "剩余调休": 6,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 179,
-      "姓名_": "杜润平",
-      "区域_": "上海",
-      "部门_": "总经办",
-      "组别_": "/",
-      "岗位_": "总经理助理",
-      "入职日期_": 45040,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 1.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 3,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 1.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 1.5,
-      "25年总请假_累计\n事假": 72,
-      "累计\n病假": 9.5,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 180,
-      "姓名_": "李赛赛",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "资深销售四级",
-      "入职日期_": 45061,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 160,
-      "已调\n休/天": 160,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 181,
-      "姓名_": "岳娟",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "资深销售三级",
-      "入职日期_": 45062,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 40,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 182,
-      "姓名_": "张俊",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "吴菲组",
-      "岗位_": "运营专员",
-      "入职日期_": 45068,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 160,
-      "已调\n休/天": 160,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 61.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 183,
-      "姓名_": "凌婧",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 44908,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4.5,
-      "1-2月使用年假_": 5.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 184,
-      "姓名_": "蔡洁",
-      "区域_": "成都",
-      "部门_": "戏剧业务部",
-      "组别_": "/",
-      "岗位_": "戏剧业务部负责人",
-      "入职日期_": 44911,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 185,
-      "姓名_": "张中林",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "/",
-      "岗位_": "运营专员",
-      "入职日期_": 45238,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 3,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10.5,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 186,
-      "姓名_": "徐玲馨",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45078,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 2,
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 3,
-      "累计\n其他": 2.5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 187,
-      "姓名_": "尹钧正",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45078,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 18.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": 15.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 107.5,
-      "已调\n休/天": 72,
-      "剩余调休": 12,
-      "累计计薪加班/h": 42,
-      "25年总请假_累计\n事假": 40,
-      "累计\n病假": 12.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 188,
-      "姓名_": "周建明",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许财杰组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45078,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 189,
-      "姓名_": "吴凯莉",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "吴凯莉组",
-      "岗位_": "销售主管",
-      "入职日期_": 45078,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 190,
-      "姓名_": "蔡子俊",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45082,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 7.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 23.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 125,
-      "已调\n休/天": 101,
-      "剩余调休": 32,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 191,
-      "姓名_": "陈钊",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45091,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 12,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "1.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 35.5,
-      "已调\n休/天": 8,
-      "剩余调休": 19.5,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 12,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 192,
-      "姓名_": "李叶泥泥",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "运营策划",
-      "入职日期_": 45091,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": 12.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 76,
-      "累计\n病假": 12,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 193,
-      "姓名_": "陈震",
-      "区域_": "厦门",
-      "部门_": "产研三部",
-      "组别_": "家长通一组",
-      "岗位_": "php开发工程师",
-      "入职日期_": 45102,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 194,
-      "姓名_": "刘涛",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45102,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 9.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 9.5,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 195,
-      "姓名_": "刘天来",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "书法事业部主管",
-      "入职日期_": 45110,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0.5,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1.5,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 5.5,
-      "25年总加班情况_累计\n加班/天": 15,
-      "已调\n休/天": 19,
-      "剩余调休": 12,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 196,
-      "姓名_": "陈雪清",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "书法高级教研",
-      "入职日期_": 45110,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 14,
-      "已调\n休/天": 9,
-      "剩余调休": 5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 2,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 197,
-      "姓名_": "潘惠心",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "书法高级教研",
-      "入职日期_": 45113,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3.5,
-      "剩余年假": 5.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 2.5,
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": 1,
-      "4月_年假": 1,
-      "5月_年假": 4,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 15,
-      "已使用\n年假": 9.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 9.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 9,
-      "累计\n病假": 11,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 198,
-      "姓名_": "刘洋",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "产品经理",
-      "入职日期_": 45117,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 1,
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 199,
-      "姓名_": "周宇洋",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "苏坚组",
-      "岗位_": "运营专员",
-      "入职日期_": 45117,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 200,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 200,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 200,
-      "姓名_": "方志海",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "书法高级教研",
-      "入职日期_": 45117,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 5.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 1.5,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 7.5,
-      "已使用\n年假": 7.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 13.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 201,
-      "姓名_": "乐敏",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "美术事业部",
-      "岗位_": "美术事业部主管",
-      "入职日期_": 45125,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 18.5,
-      "24年年假使用情况_总年假": 10,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": 5,
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 2,
-      "4月_年假": 2,
-      "5月_年假": 1,
-      "6月_年假": 2,
-      "7月_年假": 3,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 28.5,
-      "已调\n休/天": 47,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 202,
-      "姓名_": "程坤宇",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45133,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 138,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": 40,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": 120,
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 209,
-      "已调\n休/天": 35,
-      "剩余调休": 80,
-      "累计计薪加班/h": 112,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 203,
-      "姓名_": "叶云霞",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 45139,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 176,
-      "已调\n休/天": 133.5,
-      "剩余调休": 22.5,
-      "累计计薪加班/h": 28,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 204,
-      "姓名_": "黄伟",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售主管",
-      "入职日期_": 45139,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 0.5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 28,
-      "已调\n休/天": 28,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 205,
-      "姓名_": "夏伶慧",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "产品经理",
-      "入职日期_": 45139,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 0.5,
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 12,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 12,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 3.5,
-      "": ""
-    },
-    {
-      "序号_": 206,
-      "姓名_": "党磊",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "销售专员",
-      "入职日期_": 45142,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 207,
-      "姓名_": "曹佳军",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "业务运营组",
-      "岗位_": "业务运营",
-      "入职日期_": 45145,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 7,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 2,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 13,
-      "已调\n休/天": 14,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 208,
-      "姓名_": "张小高",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45146,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 152,
-      "已调\n休/天": 152,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 209,
-      "姓名_": "张程莹",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "测试主管",
-      "入职日期_": 45146,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 210,
-      "姓名_": "李浩瀚",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "李浩瀚组",
-      "岗位_": "销售主管",
-      "入职日期_": 45148,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 4,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 44,
-      "已调\n休/天": 28,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 211,
-      "姓名_": "蔡璐滢",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "平面设计",
-      "入职日期_": 45148,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 13,
-      "加班\n加班费": "",
-      "加班\n转调休": 13,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 13,
-      "已调\n休/天": 13,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 212,
-      "姓名_": "章婷",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "美术事业部",
-      "岗位_": "美术高级教研",
-      "入职日期_": 45152,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 2,
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 6.5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 40.5,
-      "已调\n休/天": 32,
-      "剩余调休": 8.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 9.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 213,
-      "姓名_": "王秀婷",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "美术事业部",
-      "岗位_": "美术高级教研",
-      "入职日期_": 45152,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4.48,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 20.48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 49.5,
-      "累计\n病假": 33.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 214,
-      "姓名_": "陈佳俊",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "何双组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45166,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 2.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 215,
-      "姓名_": "张卓",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "销售专员",
-      "入职日期_": 45166,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 0.5,
-      "4月_年假": 1,
-      "5月_年假": 0.5,
-      "6月_年假": 1.5,
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 16,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 216,
-      "姓名_": "周波涛",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "销售主管",
-      "入职日期_": 45173,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 8,
-      "事假h": 6.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 9,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 74,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 217,
-      "姓名_": "王之枫",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45174,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": 3,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": 0.5,
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 0.5,
-      "4月_年假": 3,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 37,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20,
-      "累计\n病假": 1,
-      "累计\n其他": 2,
-      "累计\n育儿假": 5,
-      "": ""
-    },
-    {
-      "序号_": 218,
-      "姓名_": "孙超",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "产品主管",
-      "入职日期_": 45181,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 68,
-      "已调\n休/天": 20,
-      "剩余调休": 8,
-      "累计计薪加班/h": 52,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 219,
-      "姓名_": "陈锴",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许满玉组",
-      "岗位_": "销售专员",
-      "入职日期_": 45187,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 24,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 132,
-      "已调\n休/天": 132,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 120,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 220,
-      "姓名_": "樊云曦",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45222,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1.5,
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 221,
-      "姓名_": "赵小明",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "研发主管（PHP）",
-      "入职日期_": 45222,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 6,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 222,
-      "姓名_": "汪燕萍",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45222,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 3.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 223,
-      "姓名_": "罗琳",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45229,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": -1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": 10,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 6,
-      "已使用\n年假": 7,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 18.5,
-      "累计\n病假": 0,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 224,
-      "姓名_": "蓝传涛",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45231,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 26.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": 3,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 235.5,
-      "已调\n休/天": 33,
-      "剩余调休": 38,
-      "累计计薪加班/h": 198.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 6,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 225,
-      "姓名_": "徐宁",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45231,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 28,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 6,
-      "剩余年假": -2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 7,
-      "25年总加班情况_累计\n加班/天": 136,
-      "已调\n休/天": 100,
-      "剩余调休": 56,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 226,
-      "姓名_": "汪诗雨",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45231,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 46,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 115,
-      "剩余调休": 19,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 10,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 227,
-      "姓名_": "张家惠",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45231,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 40,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": 40,
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 92,
-      "已调\n休/天": 64,
-      "剩余调休": 0,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 228,
-      "姓名_": "安治豪",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45232,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 4,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 44,
-      "已调\n休/天": 16,
-      "剩余调休": 28,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 229,
-      "姓名_": "邓超",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45236,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 60,
-      "已调\n休/天": 60,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 230,
-      "姓名_": "王亚超",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "产品经理",
-      "入职日期_": 45244,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 231,
-      "姓名_": "段云侠",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "产品经理",
-      "入职日期_": 45244,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 19.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 11,
-      "加班\n加班费": "",
-      "加班\n转调休": 24.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 61,
-      "已调\n休/天": 50.5,
-      "剩余调休": 30,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 232,
-      "姓名_": "王哲",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45250,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": 1.5,
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1.5,
-      "4月_年假": 1.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 64,
-      "剩余调休": 24,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20.5,
-      "累计\n病假": 0,
-      "累计\n其他": 6.5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 233,
-      "姓名_": "蒋昌铭",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45251,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2.5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 12,
-      "已调\n休/天": 12,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 234,
-      "姓名_": "王鹏飞",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45258,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 9.5,
-      "加班\n加班费": 35.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 2.5,
-      "5月_年假": 0.5,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 206.5,
-      "已调\n休/天": 94.5,
-      "剩余调休": 20,
-      "累计计薪加班/h": 130.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 235,
-      "姓名_": "吴雪峰",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45259,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 11.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 34,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 99.5,
-      "已调\n休/天": 54.5,
-      "剩余调休": 22.5,
-      "累计计薪加班/h": 34,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 10,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 236,
-      "姓名_": "陈天行",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "文案编辑",
-      "入职日期_": 45264,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 17,
-      "累计\n病假": 1.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 237,
-      "姓名_": "祝傲",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45266,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 24,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 2,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 37.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 176,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 177.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 238,
-      "姓名_": "戴佳磊",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45266,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 3,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": 16,
-      "加班\n转调休": 3.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 6.5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 101,
-      "已调\n休/天": 6,
-      "剩余调休": 15.5,
-      "累计计薪加班/h": 91.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 239,
-      "姓名_": "陈畴竹",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45272,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 39.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": 25,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 95.5,
-      "已调\n休/天": 92.5,
-      "剩余调休": 42.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 240,
-      "姓名_": "刘杰",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45273,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 35.5,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 4,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 6.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 77,
-      "已调\n休/天": 35,
-      "剩余调休": 55.5,
-      "累计计薪加班/h": 22,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 241,
-      "姓名_": "田方玉",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45285,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 18.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 4,
-      "": ""
-    },
-    {
-      "序号_": 242,
-      "姓名_": "邬甜甜",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45285,
-      "其他_": 45292,
-      "辅助列_": 45658,
-      "24年剩余调休_": 22,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 78,
-      "已调\n休/天": 85,
-      "剩余调休": 15,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 9,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 243,
-      "姓名_": "严金",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45293,
-      "其他_": 45293,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2.33,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 29,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 75,
-      "已调\n休/天": 29,
-      "剩余调休": 48.33,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 3,
-      "": ""
-    },
-    {
-      "序号_": 244,
-      "姓名_": "邹芳梅",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45306,
-      "其他_": 45306,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 5,
-      "已使用年假": 5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 3.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 245,
-      "姓名_": "唐鹤鸿",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "资深研发",
-      "入职日期_": 45313,
-      "其他_": 45313,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 14.5,
-      "已使用年假": 11.5,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": 48,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": 2,
-      "4月_年假": 1.5,
-      "5月_年假": 2.5,
-      "6月_年假": 1.5,
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": 2,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 15,
-      "已使用\n年假": 13,
-      "25年总加班情况_累计\n加班/天": 168,
-      "已调\n休/天": 37,
-      "剩余调休": 40,
-      "累计计薪加班/h": 103,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 246,
-      "姓名_": "陈婧乐",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "音乐事业部",
-      "岗位_": "音乐事业部主管",
-      "入职日期_": 45341,
-      "其他_": 45341,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0.5,
-      "24年年假使用情况_总年假": 4.5,
-      "已使用年假": 0,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 6,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 54.5,
-      "已调\n休/天": 40.5,
-      "剩余调休": 14.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 110.5,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 247,
-      "姓名_": "黄娜",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "李梦组",
-      "岗位_": "运营专员",
-      "入职日期_": 45341,
-      "其他_": 45341,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 9.5,
-      "已使用年假": 8,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 1.5,
-      "5月_年假": 2.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 3.5,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 192,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 192,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 248,
-      "姓名_": "贲小康",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45352,
-      "其他_": 45352,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 20,
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 3,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 94,
-      "已调\n休/天": 83,
-      "剩余调休": 19,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 29.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 249,
-      "姓名_": "汪兰兰",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45352,
-      "其他_": 45352,
-      "辅助列_": 45658,
-      "24年剩余调休_": 30,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 10,
-      "加班\n加班费": "",
-      "加班\n转调休": 7,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": 0.5,
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 66,
-      "已调\n休/天": 81,
-      "剩余调休": 15,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 250,
-      "姓名_": "焦少平",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45352,
-      "其他_": 45352,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 5.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 108,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 108,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 251,
-      "姓名_": "邢卓远",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张庆庆组",
-      "岗位_": "运营专员",
-      "入职日期_": 45355,
-      "其他_": 45355,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 1.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 252,
-      "姓名_": "许欣瑜",
-      "区域_": "厦门",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45356,
-      "其他_": 45356,
-      "辅助列_": 45658,
-      "24年剩余调休_": 12,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 3.5,
-      "25年年假使用情况_总年假": 8,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 19,
-      "已调\n休/天": 3,
-      "剩余调休": 9,
-      "累计计薪加班/h": 19,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 253,
-      "姓名_": "姜海伦",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "姜海伦组",
-      "岗位_": "销售主管",
-      "入职日期_": 45356,
-      "其他_": 45356,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 254,
-      "姓名_": "张双麒",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45357,
-      "其他_": 45357,
-      "辅助列_": 45658,
-      "24年剩余调休_": 32,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 8,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 9,
-      "加班\n加班费": "",
-      "加班\n转调休": 32,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 8,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 162.5,
-      "已调\n休/天": 55.5,
-      "剩余调休": 40.5,
-      "累计计薪加班/h": 98.5,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 255,
-      "姓名_": "冯猛飞",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "测试主管",
-      "入职日期_": 45357,
-      "其他_": 45357,
-      "辅助列_": 45658,
-      "24年剩余调休_": 48,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 8,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 30.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 8,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 118.5,
-      "已调\n休/天": 83,
-      "剩余调休": 83.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 256,
-      "姓名_": "胡彬",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45357,
-      "其他_": 45357,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 19.5,
-      "已调\n休/天": 17.5,
-      "剩余调休": 10,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 257,
-      "姓名_": "秦加成",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "韩丽丽组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45357,
-      "其他_": 45357,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 4,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 56,
-      "累计\n病假": 1.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 258,
-      "姓名_": "王磊",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "销售专员",
-      "入职日期_": 45362,
-      "其他_": 45362,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 8,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 259,
-      "姓名_": "骆家旺",
-      "区域_": "上海",
-      "部门_": "上海营销中心",
-      "组别_": "新媒体运营组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45364,
-      "其他_": 45364,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 260,
-      "姓名_": "庞家兴",
-      "区域_": "上海",
-      "部门_": "上海营销中心",
-      "组别_": "新媒体运营组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45364,
-      "其他_": 45364,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 3.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 80,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 261,
-      "姓名_": "刘平",
-      "区域_": "上海",
-      "部门_": "上海营销中心",
-      "组别_": "新媒体运营组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45364,
-      "其他_": 45364,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 6,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 262,
-      "姓名_": "郭子齐",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "/",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45365,
-      "其他_": 45365,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 263,
-      "姓名_": "赵景楠",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售专员",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 2,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 264,
-      "姓名_": "孙路路",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "销售专员",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 3,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": 1.5,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 81,
-      "已调\n休/天": 63,
-      "剩余调休": 18,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 265,
-      "姓名_": "王一凯",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "何倩组",
-      "岗位_": "销售专员",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 266,
-      "姓名_": "曾璠玥",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "何倩组",
-      "岗位_": "销售专员",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 4,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 109,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 267,
-      "姓名_": "李贺军",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售专员",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 3,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 268,
-      "姓名_": "林海燕",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 1.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 2,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 14,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 269,
-      "姓名_": "习辉平",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "习辉平组",
-      "岗位_": "销售主管",
-      "入职日期_": 45369,
-      "其他_": 45369,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 4,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 148,
-      "已调\n休/天": 108,
-      "剩余调休": 40,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 270,
-      "姓名_": "田永嘉",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "销售专员",
-      "入职日期_": 45371,
-      "其他_": 45371,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2.5,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 2,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 80,
-      "已调\n休/天": 80,
-      "剩余调休": 2.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 271,
-      "姓名_": "姚德",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "销售专员",
-      "入职日期_": 45371,
-      "其他_": 45371,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 84,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 272,
-      "姓名_": "谢雪平",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45372,
-      "其他_": 45372,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 1,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 273,
-      "姓名_": "孙世豪",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "菅丽萍组",
-      "岗位_": "销售专员",
-      "入职日期_": 45376,
-      "其他_": 45376,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 4,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 36,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 274,
-      "姓名_": "赵鹏飞",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "C#开发工程师",
-      "入职日期_": 45383,
-      "其他_": 45383,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 3.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 33,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 179.5,
-      "已调\n休/天": 70,
-      "剩余调休": 48.5,
-      "累计计薪加班/h": 61,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 275,
-      "姓名_": "林双玲",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45383,
-      "其他_": 45383,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 13,
-      "剩余调休": 3,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 276,
-      "姓名_": "叶瑞珠",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45383,
-      "其他_": 45383,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 20,
-      "已调\n休/天": 20,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 277,
-      "姓名_": "王通",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45389,
-      "其他_": 45389,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 6,
-      "加班\n加班费": "",
-      "加班\n转调休": 6,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "4",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 118,
-      "已调\n休/天": 118,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 96.5,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 278,
-      "姓名_": "施俊杰",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "资深销售五级",
-      "入职日期_": 45392,
-      "其他_": 45392,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 3.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": 2,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 153,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 279,
-      "姓名_": "倪亦歆",
-      "区域_": "上海",
-      "部门_": "财务部",
-      "组别_": "/",
-      "岗位_": "财务专员",
-      "入职日期_": 45397,
-      "其他_": 45397,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 3.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 7.5,
-      "已调\n休/天": 7.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 73,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 280,
-      "姓名_": "裴芳芳",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "阅读事业部主管",
-      "入职日期_": 45397,
-      "其他_": 45397,
-      "辅助列_": 45658,
-      "24年剩余调休_": 52,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 0,
-      "剩余年假": 7,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": 3,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 1.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 84,
-      "已调\n休/天": 49.75,
-      "剩余调休": 28.25,
-      "累计计薪加班/h": 68,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 281,
-      "姓名_": "陈金彬",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "学科运营",
-      "入职日期_": 45397,
-      "其他_": 45397,
-      "辅助列_": 45658,
-      "24年剩余调休_": 9,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 0,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": 3,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 35.5,
-      "已调\n休/天": 34.75,
-      "剩余调休": 9.75,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 282,
-      "姓名_": "石桂芳",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45397,
-      "其他_": 45397,
-      "辅助列_": 45658,
-      "24年剩余调休_": 23.5,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 2,
-      "剩余年假": 8.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": 2,
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 86,
-      "已调\n休/天": 65,
-      "剩余调休": 37.5,
-      "累计计薪加班/h": 7,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 283,
-      "姓名_": "曾晓媛",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45397,
-      "其他_": 45397,
-      "辅助列_": 45658,
-      "24年剩余调休_": 7,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 1,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 28,
-      "已调\n休/天": 21,
-      "剩余调休": 14,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 284,
-      "姓名_": "展小茸",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45399,
-      "其他_": 45399,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 0,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 33,
-      "已调\n休/天": 33,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 285,
-      "姓名_": "贾潇",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "美术事业部",
-      "岗位_": "市场推广",
-      "入职日期_": 45404,
-      "其他_": 45404,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 29.5,
-      "已调\n休/天": 24,
-      "剩余调休": 5.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 6,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 286,
-      "姓名_": "彭文波",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售主管",
-      "入职日期_": 45406,
-      "其他_": 45406,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 3.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 3.5,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 48,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 287,
-      "姓名_": "龙浩",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "资深销售二级",
-      "入职日期_": 45406,
-      "其他_": 45406,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 3.5,
-      "病假": 0.5,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 0.5,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 25,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 288,
-      "姓名_": "李超凡",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45418,
-      "其他_": 45418,
-      "辅助列_": 45658,
-      "24年剩余调休_": 50.5,
-      "24年年假使用情况_总年假": 3.5,
-      "已使用年假": 2,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 24.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 127.5,
-      "已调\n休/天": 90.5,
-      "剩余调休": 87.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 10,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 289,
-      "姓名_": "张小萍",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "蓝青青组",
-      "岗位_": "销售专员",
-      "入职日期_": 45425,
-      "其他_": 45425,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 290,
-      "姓名_": "张积隆",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45427,
-      "其他_": 45427,
-      "辅助列_": 45658,
-      "24年剩余调休_": 1,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": 1,
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": 0.5,
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 220,
-      "已调\n休/天": 1,
-      "剩余调休": 0,
-      "累计计薪加班/h": 236,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 1,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 291,
-      "姓名_": "施钧夫",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45429,
-      "其他_": 45429,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 0.5,
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 80,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 292,
-      "姓名_": "张文杰",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "平面设计",
-      "入职日期_": 45434,
-      "其他_": 45434,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 0,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": 23,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 143,
-      "已调\n休/天": 25,
-      "剩余调休": 23,
-      "累计计薪加班/h": 111,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 293,
-      "姓名_": "汪笑青",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45439,
-      "其他_": 45439,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": 4,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 52,
-      "已调\n休/天": 50.5,
-      "剩余调休": 1.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 294,
-      "姓名_": "王正",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45439,
-      "其他_": 45439,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 1.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 12,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 295,
-      "姓名_": "徐琴",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45439,
-      "其他_": 45439,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 120,
-      "已调\n休/天": 120,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 296,
-      "姓名_": "陈敏莲",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售二级",
-      "入职日期_": 45440,
-      "其他_": 45440,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": 4,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3.5,
-      "截至24.2月剩余年假_": -3.5,
-      "3月_年假": 0.5,
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 53,
-      "已调\n休/天": 50,
-      "剩余调休": 3,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 297,
-      "姓名_": "李九三",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45441,
-      "其他_": 45441,
-      "辅助列_": 45658,
-      "24年剩余调休_": 56,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 10,
-      "加班\n加班费": "",
-      "加班\n转调休": 19.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 2,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 96.5,
-      "已调\n休/天": 122,
-      "剩余调休": 30.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 298,
-      "姓名_": "顾慧",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "商务组",
-      "岗位_": "商务BD",
-      "入职日期_": 45446,
-      "其他_": 45446,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": 2.5,
-      "病假": 2,
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 7,
-      "累计\n病假": 6,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 299,
-      "姓名_": "雷方平",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45446,
-      "其他_": 45446,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": 1,
-      "4月_年假": 1.5,
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 0,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 117.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 300,
-      "姓名_": "王海鑫",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "音乐事业部",
-      "岗位_": "音乐编辑",
-      "入职日期_": 45446,
-      "其他_": 45446,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 17,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 70,
-      "已调\n休/天": 69,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 301,
-      "姓名_": "张士炎",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45446,
-      "其他_": 45446,
-      "辅助列_": 45658,
-      "24年剩余调休_": 64,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": "",
-      "加班\n转调休": 22.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 121.5,
-      "已调\n休/天": 132.5,
-      "剩余调休": 53,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 302,
-      "姓名_": "贺提鸿",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45448,
-      "其他_": 45448,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 0,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 24,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 112.5,
-      "已调\n休/天": 113,
-      "剩余调休": -0.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 303,
-      "姓名_": "尹贻浩",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45454,
-      "其他_": 45454,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 1,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 28,
-      "剩余调休": 12,
-      "累计计薪加班/h": 32,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 304,
-      "姓名_": "张展腾",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "习辉平组",
-      "岗位_": "销售专员",
-      "入职日期_": 45454,
-      "其他_": 45454,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 46,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": " ",
-      "已调\n休/天": 81.1,
-      "剩余调休": 339.9,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 305,
-      "姓名_": "刘浩",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "产品经理",
-      "入职日期_": 45455,
-      "其他_": 45455,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 3,
-      "已使用年假": 3,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 23,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 306,
-      "姓名_": "陈良伟",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45462,
-      "其他_": 45462,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 307,
-      "姓名_": "崔婷",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45467,
-      "其他_": 45467,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": "",
-      "剩余调休": "",
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 308,
-      "姓名_": "郑鸿政",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售主管",
-      "入职日期_": 45467,
-      "其他_": 45467,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 4.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 17,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 309,
-      "姓名_": "汪天辰",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45474,
-      "其他_": 45474,
-      "辅助列_": 45658,
-      "24年剩余调休_": 22.5,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 2.5,
-      "剩余年假": 5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 19.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 79,
-      "已调\n休/天": 52,
-      "剩余调休": 49.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 310,
-      "姓名_": "肖福",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许财杰组",
-      "岗位_": "销售专员",
-      "入职日期_": 45474,
-      "其他_": 45474,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": 24,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 7,
-      "1-2月使用年假_": 7.5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 135,
-      "已调\n休/天": 135,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 311,
-      "姓名_": "黄培源",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45474,
-      "其他_": 45474,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 13,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 10.5,
-      "剩余调休": 10.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 312,
-      "姓名_": "俞忠",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "蓝青青组",
-      "岗位_": "销售专员",
-      "入职日期_": 45476,
-      "其他_": 45476,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 4.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 72,
-      "已调\n休/天": 72,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 36,
-      "累计\n病假": 0,
-      "累计\n其他": 10,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 313,
-      "姓名_": "颜雅红",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45488,
-      "其他_": 45488,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 0,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 9,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 314,
-      "姓名_": "彭书琴",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许财杰组",
-      "岗位_": "销售专员",
-      "入职日期_": 45489,
-      "其他_": 45489,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2.5,
-      "已使用年假": 2.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 59.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 315,
-      "姓名_": "卢珠玉",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45495,
-      "其他_": 45495,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 316,
-      "姓名_": "严重阳",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45496,
-      "其他_": 45496,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 85,
-      "已调\n休/天": 77,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 0,
-      "累计\n其他": 10,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 317,
-      "姓名_": "欧静华",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "业务主管",
-      "入职日期_": 45497,
-      "其他_": 45497,
-      "辅助列_": 45658,
-      "24年剩余调休_": 2.5,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 2,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 38.5,
-      "已调\n休/天": 39,
-      "剩余调休": 2,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 318,
-      "姓名_": "杨潮侠",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45498,
-      "其他_": 45498,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 176,
-      "已调\n休/天": 175.5,
-      "剩余调休": 0.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 319,
-      "姓名_": "房金伟",
-      "区域_": "北京",
-      "部门_": "北京营销中心",
-      "组别_": "房金伟组",
-      "岗位_": "销售主管",
-      "入职日期_": 45502,
-      "其他_": 45502,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 2,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 16,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 6.5,
-      "累计\n病假": 5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 320,
-      "姓名_": "李啸",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45505,
-      "其他_": 45505,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 9,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 49,
-      "已调\n休/天": 0,
-      "剩余调休": 25,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 321,
-      "姓名_": "杨爱民",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "杨爱民组",
-      "岗位_": "销售主管",
-      "入职日期_": 45505,
-      "其他_": 45505,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 3,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 47,
-      "已调\n休/天": 37,
-      "剩余调休": 10,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 322,
-      "姓名_": "袁欢",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "销售专员",
-      "入职日期_": 45505,
-      "其他_": 45505,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 2,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 4,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 28.5,
-      "已调\n休/天": 28.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 323,
-      "姓名_": "康琪",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45512,
-      "其他_": 45512,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 10.5,
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 4,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 7,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 84,
-      "已调\n休/天": 76.5,
-      "剩余调休": 7.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 55,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 324,
-      "姓名_": "高芳芹",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "英语教研",
-      "入职日期_": 45516,
-      "其他_": 45516,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0.5,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 3.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 325,
-      "姓名_": "陈智萍",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "蓝青青组",
-      "岗位_": "销售专员",
-      "入职日期_": 45516,
-      "其他_": 45516,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 1,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 56,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 18,
-      "累计\n病假": 24,
-      "累计\n其他": 10,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 326,
-      "姓名_": "王世光",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45518,
-      "其他_": 45518,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": 1.5,
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 40,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 5.5,
-      "": ""
-    },
-    {
-      "序号_": 327,
-      "姓名_": "李根德",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "西安销售组",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45523,
-      "其他_": 45523,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 2,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 12,
-      "已调\n休/天": 12,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 328,
-      "姓名_": "高结",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45530,
-      "其他_": 45530,
-      "辅助列_": 45658,
-      "24年剩余调休_": 4.5,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 35,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": 0.5,
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 152,
-      "已调\n休/天": 16,
-      "剩余调休": 4,
-      "累计计薪加班/h": 152.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 329,
-      "姓名_": "刘永衡",
-      "区域_": "北京",
-      "部门_": "北京营销中心",
-      "组别_": "房金伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45530,
-      "其他_": 45530,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 1.5,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 8,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 330,
-      "姓名_": "汤晓雨",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45531,
-      "其他_": 45531,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 2.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 4,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 32,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 331,
-      "姓名_": "陈旺",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45532,
-      "其他_": 45532,
-      "辅助列_": 45658,
-      "24年剩余调休_": 8,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 21,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 61.5,
-      "已调\n休/天": 24,
-      "剩余调休": 0.5,
-      "累计计薪加班/h": 45,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 332,
-      "姓名_": "王凯杰",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45537,
-      "其他_": 45537,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 333,
-      "姓名_": "张艳",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "销售专员",
-      "入职日期_": 45537,
-      "其他_": 45537,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 3,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 88,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 334,
-      "姓名_": "姚泽毅",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45537,
-      "其他_": 45537,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 6,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 36,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 28,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 335,
-      "姓名_": "田井林",
-      "区域_": "北京",
-      "部门_": "北京营销中心",
-      "组别_": "房金伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45540,
-      "其他_": 45540,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 1.5,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 8,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 336,
-      "姓名_": "高峰",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "菅丽萍组",
-      "岗位_": "销售专员",
-      "入职日期_": 45544,
-      "其他_": 45544,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": 2,
-      "其他": "",
-      "调休": 10,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 43.5,
-      "已调\n休/天": 39.5,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 11.5,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 337,
-      "姓名_": "李希栋",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45544,
-      "其他_": 45544,
-      "辅助列_": 45658,
-      "24年剩余调休_": 16,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 19.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 77.5,
-      "已调\n休/天": 42.5,
-      "剩余调休": 51,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 338,
-      "姓名_": "李成龙",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "菅丽萍组",
-      "岗位_": "销售专员",
-      "入职日期_": 45544,
-      "其他_": 45544,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 1,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 87.5,
-      "已调\n休/天": 87,
-      "剩余调休": 0.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 339,
-      "姓名_": "周贵清",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45547,
-      "其他_": 45547,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 1.5,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 80,
-      "已调\n休/天": 80,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 1.5,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 340,
-      "姓名_": "屈淑怡",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45553,
-      "其他_": 45553,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": 1,
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 341,
-      "姓名_": "钮天翔",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "测试主管",
-      "入职日期_": 45553,
-      "其他_": 45553,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 3.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 35,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 111,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 115,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 342,
-      "姓名_": "程金殷",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "李梦组",
-      "岗位_": "运营专员",
-      "入职日期_": 45553,
-      "其他_": 45553,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 184,
-      "已调\n休/天": 48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 128,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 343,
-      "姓名_": "彭朝磊",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45553,
-      "其他_": 45553,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 19,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 7,
-      "1-2月使用年假_": 7,
-      "24年剩余年假_": -5.5,
-      "截至24.2月剩余年假_": -5.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 4.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 10,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 71,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 344,
-      "姓名_": "汤灿坤",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "音乐事业部",
-      "岗位_": "音乐教研",
-      "入职日期_": 45573,
-      "其他_": 45573,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 1,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 60,
-      "已调\n休/天": 50.5,
-      "剩余调休": 9.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 37.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 345,
-      "姓名_": "罗剑华",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许财杰组",
-      "岗位_": "销售专员",
-      "入职日期_": 45573,
-      "其他_": 45573,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 346,
-      "姓名_": "李小青",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45573,
-      "其他_": 45573,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 86,
-      "已调\n休/天": 86,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 347,
-      "姓名_": "扶婧媛",
-      "区域_": "长沙",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45586,
-      "其他_": 45586,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 48,
-      "25年总请假_累计\n事假": 48,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 348,
-      "姓名_": "蒋李妹",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45586,
-      "其他_": 45586,
-      "辅助列_": 45658,
-      "24年剩余调休_": 23,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 1.5,
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 10,
-      "已使用\n年假": 9,
-      "25年总加班情况_累计\n加班/天": 38,
-      "已调\n休/天": 28,
-      "剩余调休": 33,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 349,
-      "姓名_": "敬强圣",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "姜海伦组",
-      "岗位_": "销售专员",
-      "入职日期_": 45586,
-      "其他_": 45586,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 13,
-      "加班\n加班费": "",
-      "加班\n转调休": 26,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3.5,
-      "1-2月使用年假_": 5.5,
-      "24年剩余年假_": -4.5,
-      "截至24.2月剩余年假_": -4.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 55,
-      "已调\n休/天": 29,
-      "剩余调休": 26,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 350,
-      "姓名_": "尹超",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45587,
-      "其他_": 45587,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": 4,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 10,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 351,
-      "姓名_": "杨坤霖",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45593,
-      "其他_": 45593,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 12.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 4,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 52,
-      "已调\n休/天": 23.5,
-      "剩余调休": 28.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 6.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 352,
-      "姓名_": "曹龙飞",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "韩丽丽组",
-      "岗位_": "销售专员",
-      "入职日期_": 45594,
-      "其他_": 45594,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 56,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 353,
-      "姓名_": "董玉清",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45594,
-      "其他_": 45594,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 5,
-      "1-2月使用年假_": 5,
-      "24年剩余年假_": -4,
-      "截至24.2月剩余年假_": -4,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 68,
-      "已调\n休/天": 68,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 354,
-      "姓名_": "何健涛",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45600,
-      "其他_": 45600,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 2,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": 1,
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 355,
-      "姓名_": "单冰冰",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45601,
-      "其他_": 45601,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 1,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 2,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 356,
-      "姓名_": "罗婕",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "董皊组",
-      "岗位_": "运营专员",
-      "入职日期_": 45602,
-      "其他_": 45602,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": 0.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 152,
-      "已调\n休/天": 152,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 357,
-      "姓名_": "姜仕威",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售专员",
-      "入职日期_": 45608,
-      "其他_": 45608,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 358,
-      "姓名_": "王利蝶",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "资深销售一级",
-      "入职日期_": 45608,
-      "其他_": 45608,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 204,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 359,
-      "姓名_": "于晓雨",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "英语教研",
-      "入职日期_": 45614,
-      "其他_": 45614,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 27.75,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 360,
-      "姓名_": "陈兰兰",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45614,
-      "其他_": 45614,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1.5,
-      "1-2月使用年假_": 1.5,
-      "24年剩余年假_": -1,
-      "截至24.2月剩余年假_": -1,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 3,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 361,
-      "姓名_": "李纤",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45621,
-      "其他_": 45621,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 3.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 41,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 3.5,
-      "24年剩余年假_": -3,
-      "截至24.2月剩余年假_": -3,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 90.5,
-      "已调\n休/天": 87,
-      "剩余调休": 3.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 1,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 362,
-      "姓名_": "徐世鹏",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45621,
-      "其他_": 45621,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 40.5,
-      "已调\n休/天": 24,
-      "剩余调休": 8.5,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 363,
-      "姓名_": "陈前洲",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45621,
-      "其他_": 45621,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2.5,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 29,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 13,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 364,
-      "姓名_": "杨浩宇",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45623,
-      "其他_": 45623,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 1,
-      "1-2月使用年假_": 1,
-      "24年剩余年假_": -0.5,
-      "截至24.2月剩余年假_": -0.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 40,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 365,
-      "姓名_": "罗丹丹",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45623,
-      "其他_": 45623,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 4.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 0.5,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 38,
-      "已调\n休/天": 29.5,
-      "剩余调休": 8.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 366,
-      "姓名_": "邱容",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "何倩组",
-      "岗位_": "销售专员",
-      "入职日期_": 45628,
-      "其他_": 45628,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1.5",
-      "11月_年假": 0.5,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 367,
-      "姓名_": "郭二宁",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45628,
-      "其他_": 45628,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 2.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 3,
-      "1-2月使用年假_": 3,
-      "24年剩余年假_": -2.5,
-      "截至24.2月剩余年假_": -2.5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 85.5,
-      "已调\n休/天": 27.5,
-      "剩余调休": 34,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 32,
-      "累计\n病假": 0.5,
-      "累计\n其他": 3,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 368,
-      "姓名_": "钱策",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45628,
-      "其他_": 45628,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 1.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 2,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": 10,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 3,
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 0,
-      "剩余调休": 26,
-      "累计计薪加班/h": 54,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 369,
-      "姓名_": "许宁",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "外教运营",
-      "入职日期_": 45628,
-      "其他_": 45628,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -1.5,
-      "截至24.2月剩余年假_": -1.5,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": 1,
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 37,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 370,
-      "姓名_": "黄涛",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45630,
-      "其他_": 45630,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 2,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 3,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 73.5,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 63.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 371,
-      "姓名_": "江佳新",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45635,
-      "其他_": 45635,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 7.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 0.5,
-      "1-2月使用年假_": 0.5,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 54,
-      "已调\n休/天": 34,
-      "剩余调休": 20,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 372,
-      "姓名_": "顾学新",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45635,
-      "其他_": 45635,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0.5,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 2.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 373,
-      "姓名_": "闫丽扬",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45635,
-      "其他_": 45635,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0.5,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": 1.5,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": 4,
-      "1-2月使用年假_": 5.5,
-      "24年剩余年假_": -5,
-      "截至24.2月剩余年假_": -5,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 64,
-      "已调\n休/天": 46,
-      "剩余调休": 18,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 374,
-      "姓名_": "薛文博",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45644,
-      "其他_": 45644,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0,
-      "已使用年假": 0,
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 375,
-      "姓名_": "叶家美",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "学科运营",
-      "入职日期_": 45649,
-      "其他_": 45649,
-      "辅助列_": 45658,
-      "24年剩余调休_": 0,
-      "24年年假使用情况_总年假": 0,
-      "已使用年假": 0,
-      "剩余年假": 3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 7,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 0,
-      "24年剩余年假_": 0,
-      "截至24.2月剩余年假_": 0,
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 5,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 71,
-      "已调\n休/天": 30,
-      "剩余调休": 34,
-      "累计计薪加班/h": 14,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 376,
-      "姓名_": "李一翔",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "产研总监",
-      "入职日期_": 45659,
-      "其他_": 45659,
-      "辅助列_": 45659,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.98,
-      "24年已使用育儿假_": "",
-      "1月_年假": 2,
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 2.5,
-      "加班\n加班费": 10.5,
-      "加班\n转调休": 8.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": 2,
-      "24年剩余年假_": -2,
-      "截至24.2月剩余年假_": -2,
-      "3月_年假": "",
-      "4月_年假": 2,
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 9.98,
-      "已使用\n年假": 8,
-      "25年总加班情况_累计\n加班/天": 89.5,
-      "已调\n休/天": 6.5,
-      "剩余调休": 17,
-      "累计计薪加班/h": 66,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 377,
-      "姓名_": "罗石琴",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45698,
-      "其他_": 45698,
-      "辅助列_": 45698,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.95,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.45,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 378,
-      "姓名_": "黄梅花",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45705,
-      "其他_": 45705,
-      "辅助列_": 45705,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 48,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 12,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 379,
-      "姓名_": "罗海太",
-      "区域_": "厦门",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45705,
-      "其他_": 45705,
-      "辅助列_": 45705,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.86,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.36,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 19,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 19,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 380,
-      "姓名_": "雷舜玥",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "姜海伦组",
-      "岗位_": "销售专员",
-      "入职日期_": 45707,
-      "其他_": 45707,
-      "辅助列_": 45707,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 21,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.33,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 29,
-      "已调\n休/天": 24,
-      "剩余调休": 5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 381,
-      "姓名_": "蔡娜涵",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45708,
-      "其他_": 45708,
-      "辅助列_": 45708,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 2.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": 1,
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.32,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 12,
-      "已调\n休/天": 12,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2.5,
-      "累计\n病假": 6,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 382,
-      "姓名_": "马捞捞",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45708,
-      "其他_": 45708,
-      "辅助列_": 45708,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 44,
-      "加班\n加班费": 18,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 4.5,
-      "25年年假使用情况_总年假": 4.32,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 272,
-      "已调\n休/天": 68,
-      "剩余调休": 6,
-      "累计计薪加班/h": 207,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 383,
-      "姓名_": "袁成荫",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 45708,
-      "其他_": 45708,
-      "辅助列_": 45708,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 4.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.32,
-      "已使用\n年假": 4.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 384,
-      "姓名_": "白嘉鹏",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 45712,
-      "其他_": 45712,
-      "辅助列_": 45712,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 4.26,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 17,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.26,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 248,
-      "已调\n休/天": 230.5,
-      "剩余调休": 17.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 385,
-      "姓名_": "余鹏飞",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45712,
-      "其他_": 45712,
-      "辅助列_": 45712,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 4.26,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.26,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 40,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 52,
-      "累计\n病假": 34,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 386,
-      "姓名_": "吴俊宇",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "数学事业部",
-      "岗位_": "数学事业部主管",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 5.66,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 8.16,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 387,
-      "姓名_": "吕静龙",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.66,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1.5,
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 40,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 388,
-      "姓名_": "吴昭霖",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 4,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 28,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 389,
-      "姓名_": "秦羽筱",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 0.5,
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 390,
-      "姓名_": "杨英琴",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.66,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 391,
-      "姓名_": "陈燕钟",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 11,
-      "已调\n休/天": 8,
-      "剩余调休": 3,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 392,
-      "姓名_": "杨本毅",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 45719,
-      "其他_": 45719,
-      "辅助列_": 45719,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 4.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.16,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 393,
-      "姓名_": "张文静",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45720,
-      "其他_": 45720,
-      "辅助列_": 45720,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 16,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 48,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 394,
-      "姓名_": "崔红达",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45726,
-      "其他_": 45726,
-      "辅助列_": 45726,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.07,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5.5,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.07,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 10,
-      "已调\n休/天": 5.5,
-      "剩余调休": 4.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 34,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 395,
-      "姓名_": "肖嘉俊",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45726,
-      "其他_": 45726,
-      "辅助列_": 45726,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 4.07,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.07,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 3,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 61,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 396,
-      "姓名_": "陈柄杰",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45726,
-      "其他_": 45726,
-      "辅助列_": 45726,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0700000000000003,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": 1,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.07,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 19.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 19.5,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 397,
-      "姓名_": "李晓倩",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45726,
-      "其他_": 45726,
-      "辅助列_": 45726,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.57,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 0.5,
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 4.07,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 12,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 398,
-      "姓名_": "陈雅婷",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许满玉组",
-      "岗位_": "销售专员",
-      "入职日期_": 45726,
-      "其他_": 45726,
-      "辅助列_": 45726,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.07,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 3,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.07,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 22,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 399,
-      "姓名_": "丁亚坤",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "何双组",
-      "岗位_": "销售专员",
-      "入职日期_": 45727,
-      "其他_": 45727,
-      "辅助列_": 45727,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.05,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.05,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 400,
-      "姓名_": "郭明哲",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "产品经理",
-      "入职日期_": 45735,
-      "其他_": 45735,
-      "辅助列_": 45735,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.45,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.95,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 97,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 105,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 401,
-      "姓名_": "方超印",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "书法事业部",
-      "岗位_": "书法高级教研",
-      "入职日期_": 45733,
-      "其他_": 45733,
-      "辅助列_": 45733,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0299999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 13,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 1,
-      "6月_年假": 1,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 3.97,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 6,
-      "已调\n休/天": 5,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 23,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 402,
-      "姓名_": "徐雨星",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45733,
-      "其他_": 45733,
-      "辅助列_": 45733,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.97,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.97,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 3,
-      "已调\n休/天": 2.5,
-      "剩余调休": 0.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 403,
-      "姓名_": "农秋双",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 45733,
-      "其他_": 45733,
-      "辅助列_": 45733,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0299999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 11.5,
-      "病假": "",
-      "其他": "",
-      "调休": 24,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3.5,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.97,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 28,
-      "已调\n休/天": 28,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 404,
-      "姓名_": "谢馨怡",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45733,
-      "其他_": 45733,
-      "辅助列_": 45733,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 104,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 405,
-      "姓名_": "吴婵冰",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "习辉平组",
-      "岗位_": "销售专员",
-      "入职日期_": 45736,
-      "其他_": 45736,
-      "辅助列_": 45736,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0699999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4.5,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 3,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.93,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 28,
-      "已调\n休/天": 28,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 26,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 406,
-      "姓名_": "潘婧瑜",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45740,
-      "其他_": 45740,
-      "辅助列_": 45740,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.88,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 19,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 3.88,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 81,
-      "已调\n休/天": 9,
-      "剩余调休": 0,
-      "累计计薪加班/h": 85,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 407,
-      "姓名_": "余亚璐",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45741,
-      "其他_": 45741,
-      "辅助列_": 45741,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.86,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 0.5,
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 3.86,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 40,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 408,
-      "姓名_": "肖茜",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45741,
-      "其他_": 45741,
-      "辅助列_": 45741,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.86,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.86,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 409,
-      "姓名_": "高岩",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45743,
-      "其他_": 45743,
-      "辅助列_": 45743,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.84,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 9,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 410,
-      "姓名_": "张书华",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45743,
-      "其他_": 45743,
-      "辅助列_": 45743,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 32.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.84,
-      "已使用\n年假": 4,
-      "25年总加班情况_累计\n加班/天": 78.5,
-      "已调\n休/天": 23,
-      "剩余调休": 0,
-      "累计计薪加班/h": 55.5,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 411,
-      "姓名_": "朱兴佳",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45748,
-      "其他_": 45748,
-      "辅助列_": 45748,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.77,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.77,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 40,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 412,
-      "姓名_": "王燕丽",
-      "区域_": "长泰",
-      "部门_": "厦门内容部",
-      "组别_": "叶聪玲组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45748,
-      "其他_": 45748,
-      "辅助列_": 45748,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.27,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": 0.5,
-      "6月_年假": "",
-      "7月_年假": 0.5,
-      "8月_年假": 0.5,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.77,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 413,
-      "姓名_": "刘良海",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售专员",
-      "入职日期_": 45748,
-      "其他_": 45748,
-      "辅助列_": 45748,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.27,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.77,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 414,
-      "姓名_": "汤雨坚",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "行政前台",
-      "入职日期_": 45754,
-      "其他_": 45754,
-      "辅助列_": 45754,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1.5,
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.68,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 15,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 415,
-      "姓名_": "赵纪元",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45754,
-      "其他_": 45754,
-      "辅助列_": 45754,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": 1.5,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.68,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 53,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 416,
-      "姓名_": "潘飞",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售专员",
-      "入职日期_": 45754,
-      "其他_": 45754,
-      "辅助列_": 45754,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 3,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": 1,
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.68,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 60,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 417,
-      "姓名_": "张慧",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘莹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45756,
-      "其他_": 45756,
-      "辅助列_": 45756,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.16,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 3.66,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 418,
-      "姓名_": "梁军卫",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "C#开发工程师",
-      "入职日期_": 45761,
-      "其他_": 45761,
-      "辅助列_": 45761,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 5.09,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 21.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 7.09,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 42,
-      "已调\n休/天": 0,
-      "剩余调休": 34,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 20,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 419,
-      "姓名_": "徐康",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45761,
-      "其他_": 45761,
-      "辅助列_": 45761,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0899999999999999,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 13,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "0.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.59,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 45,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 53,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 420,
-      "姓名_": "罗菲菲",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "廖齐辉组",
-      "岗位_": "销售专员",
-      "入职日期_": 45761,
-      "其他_": 45761,
-      "辅助列_": 45761,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.59,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 9,
-      "加班\n加班费": "",
-      "加班\n转调休": 9,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 3.59,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 19,
-      "已调\n休/天": 18.5,
-      "剩余调休": 0.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 80,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 421,
-      "姓名_": "刘晨欣",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "董皊组",
-      "岗位_": "运营专员",
-      "入职日期_": 45763,
-      "其他_": 45763,
-      "辅助列_": 45763,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.56,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 24,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 3.56,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 72,
-      "已调\n休/天": 72,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 422,
-      "姓名_": "周子涛",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45768,
-      "其他_": 45768,
-      "辅助列_": 45768,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.49,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1,
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 3.49,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 4,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 423,
-      "姓名_": "林欣怡",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "产品助理",
-      "入职日期_": 45770,
-      "其他_": 45770,
-      "辅助列_": 45770,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 4,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 2.5,
-      "剩余调休": 13.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 93.47,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 424,
-      "姓名_": "赵红",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "韩丽丽组",
-      "岗位_": "销售专员",
-      "入职日期_": 45771,
-      "其他_": 45771,
-      "辅助列_": 45771,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0499999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "3",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.45,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 425,
-      "姓名_": "杨馨雨",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "/",
-      "岗位_": "运营专员",
-      "入职日期_": 45774,
-      "其他_": 45774,
-      "辅助列_": 45774,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0899999999999999,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.41,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 1,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 426,
-      "姓名_": "伍俊杰",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "/",
-      "岗位_": "运营专员",
-      "入职日期_": 45775,
-      "其他_": 45775,
-      "辅助列_": 45775,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.4,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.4,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 427,
-      "姓名_": "陈瑛楠",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "口才事业部",
-      "岗位_": "口才事业部主管",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.29,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 2,
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.29,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 21,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 428,
-      "姓名_": "财务张祥",
-      "区域_": "上海",
-      "部门_": "财务部",
-      "组别_": "/",
-      "岗位_": "财务专员",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.29,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 5,
-      "加班\n转调休": 7.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.29,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 12.5,
-      "已调\n休/天": 0,
-      "剩余调休": 7.5,
-      "累计计薪加班/h": 5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 429,
-      "姓名_": "朱晓荣",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "",
-      "岗位_": "外教运营",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 267,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 430,
-      "姓名_": "李倩",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "汤章溢组",
-      "岗位_": "销售专员",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.21,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 2.5,
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.29,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 30,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 431,
-      "姓名_": "王彭",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "杜雅妮组",
-      "岗位_": "运营专员",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.29,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 14,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.29,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 147,
-      "已调\n休/天": 123,
-      "剩余调休": 24,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 432,
-      "姓名_": "杨杰",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45783,
-      "其他_": 45783,
-      "辅助列_": 45783,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.21,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": 1.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.29,
-      "已使用\n年假": 3.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 433,
-      "姓名_": "段玉姝",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "外教运营",
-      "入职日期_": 45796,
-      "其他_": 45796,
-      "辅助列_": 45796,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.11,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.11,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 44,
-      "已调\n休/天": 0,
-      "剩余调休": 40,
-      "累计计薪加班/h": 4,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 434,
-      "姓名_": "刘旭",
-      "区域_": "北京",
-      "部门_": "北京营销中心",
-      "组别_": "/",
-      "岗位_": "运营专员",
-      "入职日期_": 45797,
-      "其他_": 45797,
-      "辅助列_": 45797,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.1,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 435,
-      "姓名_": "胥文秀",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "苏坚组",
-      "岗位_": "运营专员",
-      "入职日期_": 45799,
-      "其他_": 45799,
-      "辅助列_": 45799,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.57,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.07,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 80,
-      "已调\n休/天": 56,
-      "剩余调休": 16,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 3,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 436,
-      "姓名_": "臧广桐",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "数学事业部",
-      "岗位_": "数学教研",
-      "入职日期_": 45799,
-      "其他_": 45799,
-      "辅助列_": 45799,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0699999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.07,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 437,
-      "姓名_": "时秋菊",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "数学事业部",
-      "岗位_": "数学教研",
-      "入职日期_": 45803,
-      "其他_": 45803,
-      "辅助列_": 45803,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.01,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 6.01,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 2,
-      "": ""
-    },
-    {
-      "序号_": 438,
-      "姓名_": "方政",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "产品经理",
-      "入职日期_": 45805,
-      "其他_": 45805,
-      "辅助列_": 45805,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.99,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": 1,
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.99,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 6,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 439,
-      "姓名_": "陈孟莉",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "研学事业部",
-      "岗位_": "研学主管",
-      "入职日期_": 45811,
-      "其他_": 45811,
-      "辅助列_": 45811,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.9,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.9,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 440,
-      "姓名_": "史振亚",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45818,
-      "其他_": 45818,
-      "辅助列_": 45818,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 32.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 75,
-      "已调\n休/天": 16,
-      "剩余调休": 26.5,
-      "累计计薪加班/h": 32.5,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 441,
-      "姓名_": "张新宇",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "UI设计师",
-      "入职日期_": 45818,
-      "其他_": 45818,
-      "辅助列_": 45818,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.19,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 3,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.81,
-      "已使用\n年假": 3,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 19.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 442,
-      "姓名_": "贾云成",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "口才事业部",
-      "岗位_": "口才教研",
-      "入职日期_": 45824,
-      "其他_": 45824,
-      "辅助列_": 45824,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.73,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 7.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.73,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 31.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 39.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 443,
-      "姓名_": "张铭文",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "业务运营组",
-      "岗位_": "活动策划",
-      "入职日期_": 45824,
-      "其他_": 45824,
-      "辅助列_": 45824,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 10.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 95.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 444,
-      "姓名_": "张拴拴",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "口才事业部",
-      "岗位_": "口才教研",
-      "入职日期_": 45824,
-      "其他_": 45824,
-      "辅助列_": 45824,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.73,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": 8,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.73,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 445,
-      "姓名_": "李天",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "李天组",
-      "岗位_": "销售主管",
-      "入职日期_": 45826,
-      "其他_": 45826,
-      "辅助列_": 45826,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.7,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.7,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 44,
-      "已调\n休/天": 0,
-      "剩余调休": 44,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 446,
-      "姓名_": "蔡天竹",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45831,
-      "其他_": 45831,
-      "辅助列_": 45831,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.63,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.63,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 447,
-      "姓名_": "王翠萍",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "研学事业部",
-      "岗位_": "研学策划",
-      "入职日期_": 45831,
-      "其他_": 45831,
-      "辅助列_": 45831,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.13,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 12,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2.5,
-      "25年年假使用情况_总年假": 2.63,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 42.5,
-      "已调\n休/天": 18.5,
-      "剩余调休": 24,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 9.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 448,
-      "姓名_": "杨钰帆",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45831,
-      "其他_": 45831,
-      "辅助列_": 45831,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.63,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.63,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 449,
-      "姓名_": "刘雪婷",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "研学事业部",
-      "岗位_": "研学运营",
-      "入职日期_": 45835,
-      "其他_": 45835,
-      "辅助列_": 45835,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 450,
-      "姓名_": "陆其明",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "/",
-      "岗位_": "研发副总",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0599999999999996,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": 1.5,
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "5.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 7.56,
-      "已使用\n年假": 7.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 451,
-      "姓名_": "陈娟",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "英语学科运营",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.02,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 2.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.52,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 20,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 452,
-      "姓名_": "戚海生",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.02,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 4,
-      "加班\n加班费": 24,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 2,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.52,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 88,
-      "已调\n休/天": 21.5,
-      "剩余调休": 42.5,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 453,
-      "姓名_": "黄黎珊",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "学科运营",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.52,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 3,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.52,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 23,
-      "已调\n休/天": 15,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 454,
-      "姓名_": "王彬燕",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "美工编辑",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 455,
-      "姓名_": "刘彦婧",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "苏星星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.52,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.52,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 456,
-      "姓名_": "舒幸晨",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45839,
-      "其他_": 45839,
-      "辅助列_": 45839,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 2.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 457,
-      "姓名_": "李山鹏",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "刘建镇组",
-      "岗位_": "销售专员",
-      "入职日期_": 45840,
-      "其他_": 45840,
-      "辅助列_": 45840,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.51,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.51,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 4,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 458,
-      "姓名_": "张啸",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45842,
-      "其他_": 45842,
-      "辅助列_": 45842,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.48,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 459,
-      "姓名_": "叶雅雅",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "李浩瀚组",
-      "岗位_": "销售专员",
-      "入职日期_": 45845,
-      "其他_": 45845,
-      "辅助列_": 45845,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0600000000000001,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": 2,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.44,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 25,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 460,
-      "姓名_": "何小梅",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "许满玉组",
-      "岗位_": "销售专员",
-      "入职日期_": 45846,
-      "其他_": 45846,
-      "辅助列_": 45846,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 461,
-      "姓名_": "宋亚慧",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "/",
-      "岗位_": "行政前台",
-      "入职日期_": 45847,
-      "其他_": 45847,
-      "辅助列_": 45847,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.41,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.41,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 462,
-      "姓名_": "张冰聪",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "业务运营",
-      "入职日期_": 45852,
-      "其他_": 45852,
-      "辅助列_": 45852,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.84,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 2.34,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 463,
-      "姓名_": "陈昇",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45853,
-      "其他_": 45853,
-      "辅助列_": 45853,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 21,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 464,
-      "姓名_": "吴新晨",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45853,
-      "其他_": 45853,
-      "辅助列_": 45853,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 24,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 465,
-      "姓名_": "薛妍莹",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 45853,
-      "其他_": 45853,
-      "辅助列_": 45853,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 18,
-      "已调\n休/天": 18,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 466,
-      "姓名_": "郑德鑫",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "刘益先组",
-      "岗位_": "销售专员",
-      "入职日期_": 45853,
-      "其他_": 45853,
-      "辅助列_": 45853,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.17,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.33,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 13,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 467,
-      "姓名_": "庄莲欢",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "林碧虹组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45853,
-      "其他_": 45853,
-      "辅助列_": 45853,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.17,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 2.33,
-      "已使用\n年假": 2.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 468,
-      "姓名_": "陈慧云",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.25,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 1.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "2",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 1.5,
-      "剩余调休": 19.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 469,
-      "姓名_": "陈宇豪",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.25,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 24.5,
-      "已调\n休/天": 0,
-      "剩余调休": 19,
-      "累计计薪加班/h": 5.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 470,
-      "姓名_": "胡圆圆",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "英语教研",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 471,
-      "姓名_": "刘一帆",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "周媛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 5.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 4,
-      "已调\n休/天": 4,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 472,
-      "姓名_": "杨晓俊",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "业务运营",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.25,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 11,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 473,
-      "姓名_": "杨哲彬",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "BI组",
-      "岗位_": "数据开发工程师",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.75,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 16,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 56,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 72,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 474,
-      "姓名_": "岳浩",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.25,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 24,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 475,
-      "姓名_": "朱贯政",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45859,
-      "其他_": 45859,
-      "辅助列_": 45859,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.25,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.25,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 476,
-      "姓名_": "曾晖",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45860,
-      "其他_": 45860,
-      "辅助列_": 45860,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 477,
-      "姓名_": "林颖",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "课程研发",
-      "入职日期_": 45860,
-      "其他_": 45860,
-      "辅助列_": 45860,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.23,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 7.5,
-      "加班\n加班费": 22,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.23,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 104,
-      "已调\n休/天": 47,
-      "剩余调休": 5,
-      "累计计薪加班/h": 68,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 478,
-      "姓名_": "漆嘉欣",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "李浩瀚组",
-      "岗位_": "销售专员",
-      "入职日期_": 45861,
-      "其他_": 45861,
-      "辅助列_": 45861,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 479,
-      "姓名_": "严欣旻",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "英语课程运营",
-      "入职日期_": 45861,
-      "其他_": 45861,
-      "辅助列_": 45861,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 6.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 480,
-      "姓名_": "曾巧萍",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "英语教研",
-      "入职日期_": 45862,
-      "其他_": 45862,
-      "辅助列_": 45862,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.21,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 0.5,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 2.21,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 481,
-      "姓名_": "刘丹凤",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "/",
-      "岗位_": "运营专员",
-      "入职日期_": 45866,
-      "其他_": 45866,
-      "辅助列_": 45866,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.65,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1.5",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 4.15,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 1,
-      "": ""
-    },
-    {
-      "序号_": 482,
-      "姓名_": "卢春祥",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "刘益先组",
-      "岗位_": "销售专员",
-      "入职日期_": 45870,
-      "其他_": 45870,
-      "辅助列_": 45870,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.1,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 49,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 483,
-      "姓名_": "陈璐扬",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "平台运维组",
-      "岗位_": "运维专员",
-      "入职日期_": 45870,
-      "其他_": 45870,
-      "辅助列_": 45870,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 5.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 9.5,
-      "加班\n转调休": 9.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 70.5,
-      "已调\n休/天": 21.5,
-      "剩余调休": 11,
-      "累计计薪加班/h": 47.5,
-      "25年总请假_累计\n事假": 5.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 484,
-      "姓名_": "林诗珺",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "刘骏组",
-      "岗位_": "英语教研",
-      "入职日期_": 45873,
-      "其他_": 45873,
-      "辅助列_": 45873,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0499999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 24.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.05,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 55,
-      "已调\n休/天": 32.5,
-      "剩余调休": 22.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 485,
-      "姓名_": "刘帅龙",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "资深Java开发工程师",
-      "入职日期_": 45873,
-      "其他_": 45873,
-      "辅助列_": 45873,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0499999999999998,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 16,
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 2.05,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 21.5,
-      "已调\n休/天": 16,
-      "剩余调休": 5.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 486,
-      "姓名_": "严奕玫",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "陈雅真组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45873,
-      "其他_": 45873,
-      "辅助列_": 45873,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.55,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 2.05,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 5,
-      "已调\n休/天": 5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 487,
-      "姓名_": "邢谢晗",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "销售专员",
-      "入职日期_": 45875,
-      "其他_": 45875,
-      "辅助列_": 45875,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.03,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.03,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 21,
-      "已调\n休/天": 13,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 488,
-      "姓名_": "慕芊芊",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售专员",
-      "入职日期_": 45875,
-      "其他_": 45875,
-      "辅助列_": 45875,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.03,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.03,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 11,
-      "已调\n休/天": 11,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 489,
-      "姓名_": "杨骏杰",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "销售专员",
-      "入职日期_": 45875,
-      "其他_": 45875,
-      "辅助列_": 45875,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 2.03,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.03,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 32,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 490,
-      "姓名_": "袁张裕",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "新媒体组",
-      "岗位_": "视频编辑",
-      "入职日期_": 45875,
-      "其他_": 45875,
-      "辅助列_": 45875,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.03,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": 1,
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 2.03,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 4,
-      "累计计薪加班/h": 12,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 491,
-      "姓名_": "马梦杰",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售专员",
-      "入职日期_": 45875,
-      "其他_": 45875,
-      "辅助列_": 45875,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.03,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 2.03,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 492,
-      "姓名_": "刘光品",
-      "区域_": "长沙",
-      "部门_": "长沙内容部",
-      "组别_": "刘丽组",
-      "岗位_": "内容编辑",
-      "入职日期_": 45880,
-      "其他_": 45880,
-      "辅助列_": 45880,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.96,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.96,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 493,
-      "姓名_": "王忠于",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45880,
-      "其他_": 45880,
-      "辅助列_": 45880,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.04,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 1.96,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 16,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 494,
-      "姓名_": "扶廷婷",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "/",
-      "岗位_": "培训讲师",
-      "入职日期_": 45882,
-      "其他_": 45882,
-      "辅助列_": 45882,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.0700000000000001,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1,
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 1.93,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 495,
-      "姓名_": "华巧玉",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "数学事业部",
-      "岗位_": "数学教研",
-      "入职日期_": 45882,
-      "其他_": 45882,
-      "辅助列_": 45882,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.93,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "1",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.93,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 496,
-      "姓名_": "朱宇缘",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "英语教研",
-      "入职日期_": 45882,
-      "其他_": 45882,
-      "辅助列_": 45882,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 0.5,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 3,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 3,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 497,
-      "姓名_": "何俊敏",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "测试经理",
-      "入职日期_": 45887,
-      "其他_": 45887,
-      "辅助列_": 45887,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.36,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 0.5,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 3.36,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0.5,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 498,
-      "姓名_": "王少辉",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "销售专员",
-      "入职日期_": 45887,
-      "其他_": 45887,
-      "辅助列_": 45887,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.86,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 1.86,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 499,
-      "姓名_": "周小敏",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45888,
-      "其他_": 45888,
-      "辅助列_": 45888,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.85,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": 20,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.85,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 35.5,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 27.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 500,
-      "姓名_": "郭铭",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45890,
-      "其他_": 45890,
-      "辅助列_": 45890,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": -0.18,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 12,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 2,
-      "25年年假使用情况_总年假": 1.82,
-      "已使用\n年假": 2,
-      "25年总加班情况_累计\n加班/天": 20,
-      "已调\n休/天": 20,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 501,
-      "姓名_": "左品爽",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "外教教研",
-      "入职日期_": 45894,
-      "其他_": 45894,
-      "辅助列_": 45894,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.27,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.77,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 502,
-      "姓名_": "叶非",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45896,
-      "其他_": 45896,
-      "辅助列_": 45896,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 3.74,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 28.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.74,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 44.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 44.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 503,
-      "姓名_": "测试张祥",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45897,
-      "其他_": 45897,
-      "辅助列_": 45897,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.73,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 39,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.73,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 58,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 58,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 504,
-      "姓名_": "唐峰林",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "李天组",
-      "岗位_": "销售专员",
-      "入职日期_": 45901,
-      "其他_": 45901,
-      "辅助列_": 45901,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.67,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.67,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 16,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 505,
-      "姓名_": "黄达",
-      "区域_": "深圳",
-      "部门_": "产研三部",
-      "组别_": "业务管理三组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45901,
-      "其他_": 45901,
-      "辅助列_": 45901,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.67,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 1.67,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 506,
-      "姓名_": "黄萍",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "测试二部",
-      "岗位_": "敏捷经理",
-      "入职日期_": 45901,
-      "其他_": 45901,
-      "辅助列_": 45901,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.67,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 1.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 3.17,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 507,
-      "姓名_": "宋杰",
-      "区域_": "长沙",
-      "部门_": "长沙营销一部",
-      "组别_": "吴凯莉组",
-      "岗位_": "销售专员",
-      "入职日期_": 45901,
-      "其他_": 45901,
-      "辅助列_": 45901,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.67,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.67,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 508,
-      "姓名_": "余立洋",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "iOS开发工程师",
-      "入职日期_": 45903,
-      "其他_": 45903,
-      "辅助列_": 45903,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.64,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.64,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 40.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 40.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 509,
-      "姓名_": "吕梦娜",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "朱行悟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45903,
-      "其他_": 45903,
-      "辅助列_": 45903,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 510,
-      "姓名_": "郑旭伟",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45903,
-      "其他_": 45903,
-      "辅助列_": 45903,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.64,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 15,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.64,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 17,
-      "剩余调休": 15,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 511,
-      "姓名_": "郭祖源",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "习辉平组",
-      "岗位_": "销售专员",
-      "入职日期_": 45908,
-      "其他_": 45908,
-      "辅助列_": 45908,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.58,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": 2,
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.58,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 8,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 2,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 512,
-      "姓名_": "赵紫荆",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "英语教研",
-      "入职日期_": 45908,
-      "其他_": 45908,
-      "辅助列_": 45908,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.58,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 24,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.58,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 48,
-      "已调\n休/天": 21,
-      "剩余调休": 27,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 2,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 513,
-      "姓名_": "李赢",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45908,
-      "其他_": 45908,
-      "辅助列_": 45908,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.58,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 9.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.58,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 25.5,
-      "已调\n休/天": 0,
-      "剩余调休": 16,
-      "累计计薪加班/h": 9.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 514,
-      "姓名_": "产品王艳",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "产品经理",
-      "入职日期_": 45910,
-      "其他_": 45910,
-      "辅助列_": 45910,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.55,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.55,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 515,
-      "姓名_": "孔璐平",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "业务管理二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45910,
-      "其他_": 45910,
-      "辅助列_": 45910,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.05,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1.5,
-      "25年年假使用情况_总年假": 1.55,
-      "已使用\n年假": 1.5,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 0,
-      "剩余调休": 16,
-      "累计计薪加班/h": 8,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 516,
-      "姓名_": "李文玉",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45910,
-      "其他_": 45910,
-      "辅助列_": 45910,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.55,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.55,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 517,
-      "姓名_": "张路平",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育二组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45910,
-      "其他_": 45910,
-      "辅助列_": 45910,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.05,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 24,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.55,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 79.5,
-      "已调\n休/天": 8,
-      "剩余调休": 16,
-      "累计计薪加班/h": 63.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 518,
-      "姓名_": "王雪来",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45910,
-      "其他_": 45910,
-      "辅助列_": 45910,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.55,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 7.5,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.55,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 69.5,
-      "已调\n休/天": 8,
-      "剩余调休": 30,
-      "累计计薪加班/h": 55.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 519,
-      "姓名_": "苌笑",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "研学事业部",
-      "岗位_": "研学顾问",
-      "入职日期_": 45915,
-      "其他_": 45915,
-      "辅助列_": 45915,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.48,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 3.5,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 3.5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 520,
-      "姓名_": "宋超",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "杨爱民组",
-      "岗位_": "销售专员",
-      "入职日期_": 45915,
-      "其他_": 45915,
-      "辅助列_": 45915,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": 12,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.48,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 14,
-      "已调\n休/天": 14,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 17.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 521,
-      "姓名_": "李建鹏",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45915,
-      "其他_": 45915,
-      "辅助列_": 45915,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.48,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 24,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 40,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 522,
-      "姓名_": "许艳晶",
-      "区域_": "厦门",
-      "部门_": "厦门内容部",
-      "组别_": "教研组",
-      "岗位_": "英语教研",
-      "入职日期_": 45915,
-      "其他_": 45915,
-      "辅助列_": 45915,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 10,
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.48,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 32,
-      "已调\n休/天": 12.5,
-      "剩余调休": 19.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 523,
-      "姓名_": "高涵",
-      "区域_": "上海",
-      "部门_": "行政部",
-      "组别_": "/",
-      "岗位_": "IT网络工程师",
-      "入职日期_": 45916,
-      "其他_": 45916,
-      "辅助列_": 45916,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.47,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 15,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.47,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 15,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 15,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 524,
-      "姓名_": "刘佳伟",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "运营培训师",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.88,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": 0.5,
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 525,
-      "姓名_": "郑静",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "产品经理",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.38,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 526,
-      "姓名_": "柏润民",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "李天组",
-      "岗位_": "销售专员",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.38,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 527,
-      "姓名_": "张伟君",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.38,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 528,
-      "姓名_": "迟天宇",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "市场渠道组",
-      "岗位_": "平面设计",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 529,
-      "姓名_": "陈楠",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.38,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 16,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 530,
-      "姓名_": "刘仕杰",
-      "区域_": "深圳",
-      "部门_": "深圳营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45922,
-      "其他_": 45922,
-      "辅助列_": 45922,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.38,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 11,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.38,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 23,
-      "已调\n休/天": 20,
-      "剩余调休": 3,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 12,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 531,
-      "姓名_": "杨宇飞",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "PHP开发工程师",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 532,
-      "姓名_": "庄思婷",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "陈敏莲组",
-      "岗位_": "销售专员",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 533,
-      "姓名_": "黄泓博",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "/",
-      "岗位_": "外教运营",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 7.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 26,
-      "已调\n休/天": 0,
-      "剩余调休": 23.5,
-      "累计计薪加班/h": 5,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 534,
-      "姓名_": "池玉冬",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 535,
-      "姓名_": "邓晨威",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "陈敏莲组",
-      "岗位_": "销售专员",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 536,
-      "姓名_": "吕翔宙",
-      "区域_": "北京",
-      "部门_": "北京营销中心",
-      "组别_": "房金伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 537,
-      "姓名_": "王瑞鑫",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育一组",
-      "岗位_": "Android开发工程师",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 23.5,
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 39,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 39,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 538,
-      "姓名_": "翟建霞",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.65,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.65,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 539,
-      "姓名_": "张毓倩",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "口才事业部",
-      "岗位_": "口才教研",
-      "入职日期_": 45939,
-      "其他_": 45939,
-      "辅助列_": 45939,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.15,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 3.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 1.15,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 3.5,
-      "已调\n休/天": 0,
-      "剩余调休": 3.5,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 540,
-      "姓名_": "李珊珊",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45940,
-      "其他_": 45940,
-      "辅助列_": 45940,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.14,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.14,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 7,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 541,
-      "姓名_": "朱梓铭",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "培训组",
-      "岗位_": "培训讲师",
-      "入职日期_": 45944,
-      "其他_": 45944,
-      "辅助列_": 45944,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.08,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.08,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 542,
-      "姓名_": "肖元锋",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "李浩瀚组",
-      "岗位_": "销售专员",
-      "入职日期_": 45945,
-      "其他_": 45945,
-      "辅助列_": 45945,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.07,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 1,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.07,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 543,
-      "姓名_": "李立冬",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 45945,
-      "其他_": 45945,
-      "辅助列_": 45945,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.0700000000000001,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 5,
-      "加班\n加班费": "",
-      "加班\n转调休": 6,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 1,
-      "25年年假使用情况_总年假": 1.07,
-      "已使用\n年假": 1,
-      "25年总加班情况_累计\n加班/天": 6,
-      "已调\n休/天": 5,
-      "剩余调休": 1,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 544,
-      "姓名_": "陈仙福",
-      "区域_": "福州",
-      "部门_": "福州营销中心",
-      "组别_": "/",
-      "岗位_": "营销总监",
-      "入职日期_": 45947,
-      "其他_": 45947,
-      "辅助列_": 45947,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.04,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.04,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 545,
-      "姓名_": "佘竹",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "系统运维组",
-      "岗位_": "运维开发工程师",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 546,
-      "姓名_": "史文楠",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "测试主管",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.5,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 1,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 547,
-      "姓名_": "吴艳丽",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 548,
-      "姓名_": "熊培乐",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "销售专员",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5.5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 549,
-      "姓名_": "顾泽俊",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "教育三组",
-      "岗位_": "IOS开发工程师",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 8,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 40,
-      "已调\n休/天": 0,
-      "剩余调休": 24,
-      "累计计薪加班/h": 16,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 550,
-      "姓名_": "邓雨辉",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售专员",
-      "入职日期_": 45950,
-      "其他_": 45950,
-      "辅助列_": 45950,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 551,
-      "姓名_": "李黛妮",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "彭文波组",
-      "岗位_": "销售专员",
-      "入职日期_": 45952,
-      "其他_": 45952,
-      "辅助列_": 45952,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.97,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.97,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 14,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 552,
-      "姓名_": "程磊",
-      "区域_": "合肥",
-      "部门_": "合肥营销中心",
-      "组别_": "/",
-      "岗位_": "城市经理",
-      "入职日期_": 45957,
-      "其他_": 45957,
-      "辅助列_": 45957,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.9,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.9,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 553,
-      "姓名_": "郑青",
-      "区域_": "长沙",
-      "部门_": "长沙营销二部",
-      "组别_": "周波涛组",
-      "岗位_": "销售专员",
-      "入职日期_": 45957,
-      "其他_": 45957,
-      "辅助列_": 45957,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.9,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.9,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 554,
-      "姓名_": "陈子航",
-      "区域_": "上海",
-      "部门_": "产研一部",
-      "组别_": "PC组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45958,
-      "其他_": 45958,
-      "辅助列_": 45958,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.89,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": 28.5,
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.89,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 55,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 47,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 555,
-      "姓名_": "黄少杰",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "前端开发工程师",
-      "入职日期_": 45958,
-      "其他_": 45958,
-      "辅助列_": 45958,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.89,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 10.5,
-      "病假": 1,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.89,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 10.5,
-      "累计\n病假": 1,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 556,
-      "姓名_": "齐先送",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45958,
-      "其他_": 45958,
-      "辅助列_": 45958,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.89,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.89,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 557,
-      "姓名_": "张杰",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "研发主管（PHP）",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.31,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": 0.5,
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0.5,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 1,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 558,
-      "姓名_": "宗琳斌",
-      "区域_": "上海",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "人事专员",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.81,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 13,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 13,
-      "已调\n休/天": 0,
-      "剩余调休": 13,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 559,
-      "姓名_": "马艳欣",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "家长通二组",
-      "岗位_": "产品经理",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.31,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.31,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 560,
-      "姓名_": "张皓雄",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "陈春霞组",
-      "岗位_": "销售专员",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.81,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 561,
-      "姓名_": "康虎",
-      "区域_": "上海",
-      "部门_": "上海营销一部",
-      "组别_": "李浩瀚组",
-      "岗位_": "销售专员",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.81,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 562,
-      "姓名_": "杨洋",
-      "区域_": "上海",
-      "部门_": "上海营销三部",
-      "组别_": "万建国组",
-      "岗位_": "销售专员",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.81,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 563,
-      "姓名_": "张彦劼",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台三组",
-      "岗位_": "测试经理",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 1.31,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 1.31,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 564,
-      "姓名_": "沈惠",
-      "区域_": "上海",
-      "部门_": "上海营销二部",
-      "组别_": "刘伦星组",
-      "岗位_": "销售专员",
-      "入职日期_": 45964,
-      "其他_": 45964,
-      "辅助列_": 45964,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.81,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 18,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.81,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 18,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 565,
-      "姓名_": "张昭龙",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "叶瑞珠组",
-      "岗位_": "销售专员",
-      "入职日期_": 45965,
-      "其他_": 45965,
-      "辅助列_": 45965,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.79,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.79,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 566,
-      "姓名_": "杨玉珊",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "刘建镇组",
-      "岗位_": "销售专员",
-      "入职日期_": 45966,
-      "其他_": 45966,
-      "辅助列_": 45966,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.78,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.78,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 567,
-      "姓名_": "周春萍",
-      "区域_": "上海",
-      "部门_": "市场部",
-      "组别_": "培训直播组",
-      "岗位_": "新媒体主播",
-      "入职日期_": 45967,
-      "其他_": 45967,
-      "辅助列_": 45967,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.77,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.77,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 568,
-      "姓名_": "张磊",
-      "区域_": "济南",
-      "部门_": "济南营销中心",
-      "组别_": "/",
-      "岗位_": "城市经理",
-      "入职日期_": 45971,
-      "其他_": 45971,
-      "辅助列_": 45971,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.71,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.71,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 569,
-      "姓名_": "高付升",
-      "区域_": "济南",
-      "部门_": "济南营销中心",
-      "组别_": "/",
-      "岗位_": "城市经理",
-      "入职日期_": 45971,
-      "其他_": 45971,
-      "辅助列_": 45971,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.71,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.71,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 570,
-      "姓名_": "赵雅丽",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "数学事业部",
-      "岗位_": "数学教研",
-      "入职日期_": 45971,
-      "其他_": 45971,
-      "辅助列_": 45971,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.71,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.71,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 571,
-      "姓名_": "王建坤",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45971,
-      "其他_": 45971,
-      "辅助列_": 45971,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.71,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 16,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 16,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.71,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 16,
-      "已调\n休/天": 0,
-      "剩余调休": 16,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 24,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 572,
-      "姓名_": "黄昱梵",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45973,
-      "其他_": 45973,
-      "辅助列_": 45973,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.68,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.68,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 573,
-      "姓名_": "王帆",
-      "区域_": "西安",
-      "部门_": "西安营销中心",
-      "组别_": "黄伟组",
-      "岗位_": "销售专员",
-      "入职日期_": 45973,
-      "其他_": 45973,
-      "辅助列_": 45973,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.68,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.68,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 574,
-      "姓名_": "李昊霖",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45978,
-      "其他_": 45978,
-      "辅助列_": 45978,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.62,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.62,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 575,
-      "姓名_": "童楠",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45978,
-      "其他_": 45978,
-      "辅助列_": 45978,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.62,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.62,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 576,
-      "姓名_": "姚继英",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "业务管理一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45978,
-      "其他_": 45978,
-      "辅助列_": 45978,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.62,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.62,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 577,
-      "姓名_": "张发荣",
-      "区域_": "福州",
-      "部门_": "福州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45978,
-      "其他_": 45978,
-      "辅助列_": 45978,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.62,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.62,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 578,
-      "姓名_": "王吉宁",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45980,
-      "其他_": 45980,
-      "辅助列_": 45980,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.59,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.59,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 579,
-      "姓名_": "徐鑫",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "杨爱民组",
-      "岗位_": "销售专员",
-      "入职日期_": 45985,
-      "其他_": 45985,
-      "辅助列_": 45985,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.52,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 12,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.52,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 12,
-      "已调\n休/天": 8,
-      "剩余调休": 4,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 580,
-      "姓名_": "黄爱",
-      "区域_": "成都",
-      "部门_": "成都营销中心",
-      "组别_": "杨爱民组",
-      "岗位_": "销售专员",
-      "入职日期_": 45985,
-      "其他_": 45985,
-      "辅助列_": 45985,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.52,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 3.5,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.52,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 5,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 581,
-      "姓名_": "张永峰",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45985,
-      "其他_": 45985,
-      "辅助列_": 45985,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.52,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": 2,
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.52,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 2,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 582,
-      "姓名_": "许俊",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "/",
-      "岗位_": "幼儿园业务主管",
-      "入职日期_": 45988,
-      "其他_": 45988,
-      "辅助列_": 45988,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.48,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.48,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 583,
-      "姓名_": "王益萍",
-      "区域_": "厦门",
-      "部门_": "厦门营销二部",
-      "组别_": "陈敏莲组",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 3,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 3,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 584,
-      "姓名_": "焦玉美",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "BI组",
-      "岗位_": "数据开发工程师",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 0,
-      "剩余调休": 8,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 585,
-      "姓名_": "胡元骏",
-      "区域_": "南昌",
-      "部门_": "南昌营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 7.5,
-      "加班\n加班费": "",
-      "加班\n转调休": 7.5,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 7.5,
-      "已调\n休/天": 7.5,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 586,
-      "姓名_": "冯钰婷",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "外教教研组",
-      "岗位_": "外教教研",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 587,
-      "姓名_": "陈凯",
-      "区域_": "合肥",
-      "部门_": "合肥营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 588,
-      "姓名_": "万龙根",
-      "区域_": "南昌",
-      "部门_": "南昌营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 589,
-      "姓名_": "王枫",
-      "区域_": "合肥",
-      "部门_": "合肥营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 4,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 4,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 590,
-      "姓名_": "郑爱民",
-      "区域_": "福州",
-      "部门_": "福州营销中心",
-      "组别_": "/",
-      "岗位_": "销售主管",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 591,
-      "姓名_": "蔡燕",
-      "区域_": "武汉",
-      "部门_": "人力资源部",
-      "组别_": "/",
-      "岗位_": "资深人事",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 592,
-      "姓名_": "郑亮",
-      "区域_": "福州",
-      "部门_": "福州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 593,
-      "姓名_": "单甜甜",
-      "区域_": "郑州",
-      "部门_": "郑州营销中心",
-      "组别_": "张文君组",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": 8,
-      "加班\n加班费": "",
-      "加班\n转调休": 8,
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 8,
-      "已调\n休/天": 8,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 594,
-      "姓名_": "解维维",
-      "区域_": "合肥",
-      "部门_": "合肥营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 595,
-      "姓名_": "夏明明",
-      "区域_": "南昌",
-      "部门_": "南昌营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45992,
-      "其他_": 45992,
-      "辅助列_": 45992,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.42,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.42,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 596,
-      "姓名_": "龙伦东",
-      "区域_": "福州",
-      "部门_": "福州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 12,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 12,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 597,
-      "姓名_": "符加铭",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台一组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 598,
-      "姓名_": "谭滋利",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 599,
-      "姓名_": "杨智超",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "英语事业部",
-      "岗位_": "英语客户运营",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 600,
-      "姓名_": "罗睿琪",
-      "区域_": "上海",
-      "部门_": "业务一部",
-      "组别_": "美术事业部",
-      "岗位_": "新媒体运营",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 601,
-      "姓名_": "罗繁",
-      "区域_": "上海",
-      "部门_": "业务二部",
-      "组别_": "外教业务运营组",
-      "岗位_": "业务运营",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 602,
-      "姓名_": "骆静",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "测试工程师",
-      "入职日期_": 45999,
-      "其他_": 45999,
-      "辅助列_": 45999,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.33,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 8,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.33,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 8,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 603,
-      "姓名_": "牛博伟",
-      "区域_": "石家庄",
-      "部门_": "石家庄营销中心",
-      "组别_": "/",
-      "岗位_": "销售主管",
-      "入职日期_": 46001,
-      "其他_": 46001,
-      "辅助列_": 46001,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.3,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.3,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 604,
-      "姓名_": "洪志伟",
-      "区域_": "厦门",
-      "部门_": "厦门营销一部",
-      "组别_": "郑鸿政组",
-      "岗位_": "销售专员",
-      "入职日期_": 46006,
-      "其他_": 46006,
-      "辅助列_": 46006,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.23,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": 22,
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.23,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 22,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 605,
-      "姓名_": "刘佐军",
-      "区域_": "上海",
-      "部门_": "产研二部",
-      "组别_": "后台二组",
-      "岗位_": "Java开发工程师",
-      "入职日期_": 46006,
-      "其他_": 46006,
-      "辅助列_": 46006,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.23,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.23,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 606,
-      "姓名_": "赵忠凯",
-      "区域_": "济南",
-      "部门_": "济南营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 46006,
-      "其他_": 46006,
-      "辅助列_": 46006,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.23,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.23,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 607,
-      "姓名_": "杨秋新",
-      "区域_": "广州",
-      "部门_": "广州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 46007,
-      "其他_": 46007,
-      "辅助列_": 46007,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.22,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.22,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 608,
-      "姓名_": "李祖辉",
-      "区域_": "广州",
-      "部门_": "广州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 46007,
-      "其他_": 46007,
-      "辅助列_": 46007,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.22,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.22,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 609,
-      "姓名_": "胡玄",
-      "区域_": "广州",
-      "部门_": "广州营销中心",
-      "组别_": "/",
-      "岗位_": "销售专员",
-      "入职日期_": 46007,
-      "其他_": 46007,
-      "辅助列_": 46007,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.22,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.22,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 610,
-      "姓名_": "陈金燕",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "学科运营",
-      "入职日期_": 46008,
-      "其他_": 46008,
-      "辅助列_": 46008,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.21,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.21,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 611,
-      "姓名_": "梁茂标",
-      "区域_": "厦门",
-      "部门_": "业务一部",
-      "组别_": "阅读事业部",
-      "岗位_": "学科运营",
-      "入职日期_": 46013,
-      "其他_": 46013,
-      "辅助列_": 46013,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.14,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.14,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    },
-    {
-      "序号_": 612,
-      "姓名_": "邢雯雪",
-      "区域_": "上海",
-      "部门_": "产研三部",
-      "组别_": "DIM组",
-      "岗位_": "产品经理",
-      "入职日期_": 46015,
-      "其他_": 46015,
-      "辅助列_": 46015,
-      "24年剩余调休_": "",
-      "24年年假使用情况_总年假": "",
-      "已使用年假": "",
-      "剩余年假": 0.11,
-      "24年已使用育儿假_": "",
-      "1月_年假": "",
-      "事假h": "",
-      "病假": "",
-      "其他": "",
-      "调休": "",
-      "加班\n加班费": "",
-      "加班\n转调休": "",
-      "育儿假": "",
-      "备注": "",
-      "2月_年假": "",
-      "1-2月使用年假_": "",
-      "24年剩余年假_": "",
-      "截至24.2月剩余年假_": "",
-      "3月_年假": "",
-      "4月_年假": "",
-      "5月_年假": "",
-      "6月_年假": "",
-      "7月_年假": "",
-      "8月_年假": "",
-      "9月_年假": "",
-      "折算调休数": "",
-      "10月_年假": "",
-      "11月_年假": "",
-      "12月_年假": "",
-      "25年年假使用情况_总年假": 0.11,
-      "已使用\n年假": 0,
-      "25年总加班情况_累计\n加班/天": 0,
-      "已调\n休/天": 0,
-      "剩余调休": 0,
-      "累计计薪加班/h": 0,
-      "25年总请假_累计\n事假": 0,
-      "累计\n病假": 0,
-      "累计\n其他": 0,
-      "累计\n育儿假": 0,
-      "": ""
-    }
-  ]
-}
\ No newline at end of file
+window.hrData = {"format":"columnar","version":1,"meta":{"generatedAt":"2026-10-17T22:19:32.636Z","totalRecords":612,"columns":["序号_","姓名_","区域_","部门_","组别_","岗位_","入职日期_","其他_","辅助列_","24年剩余调休_","24年年假使用情况_总年假","已使用年假","剩余年假","24年已使用育儿假_","1月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","2月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","1-2月使用年假_","24年剩余年假_","截至24.2月剩余年假_","3月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","4月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","5月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","6月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","7月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","8月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","9月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","折算调休数","10月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","11月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","12月_年假","事假h","病假","其他","调休","加班\n加班费","加班\n转调休","育儿假","备注","25年年假使用情况_总年假","已使用\n年假","剩余年假","25年总加班情况_累计\n加班/天","已调\n休/天","剩余调休","累计计薪加班/h","25年总请假_累计\n事假","累计\n病假","累计\n其他","累计\n育儿假",""],"filters":{"departments":["上海营销一部","上海营销三部","上海营销中心","上海营销二部","业务一部","业务二部","产研一部","产研三部","产研二部","人力资源部","北京营销中心","南昌营销中心","厦门内容部","厦门营销一部","厦门营销二部","合肥营销中心","市场部","广州营销中心","总经办","戏剧业务部","成都营销中心","济南营销中心","深圳营销中心","石家庄营销中心","福州营销中心","行政部","西安营销中心","财务部","郑州营销中心","长沙内容部","长沙营销一部","长沙营销中心","长沙营销二部"],"groups":["/","BI组","DIM组","PC组","万建国组","业务管理一组","业务管理三组","业务管理二组","业务运营组","习辉平组","书法事业部","产品部","何倩组","何双组","刘丽组","刘伦星组","刘建镇组","刘益先组","刘莹组","刘骏组","口才事业部","叶瑞珠组","叶聪玲组","后台一组","后台三组","后台二组","吴凯莉组","吴菲组","周媛组","周波涛组","商务组","培训直播组","培训组","外教业务运营组","外教教研组","姜海伦组","家长通一组","家长通二组","市场渠道组","平台运维组","廖齐辉组","张庆庆组","张文君组","彭乾组","彭文波组","房金伟组","教研组","教育一组","教育三组","教育二组","数学事业部","新媒体组","新媒体运营组","朱行悟组","李天组","李梦组","李梦阳组","李浩瀚组","杜雅妮组","杨爱民组","林碧虹组","汤章溢组","测试二部","研学事业部","系统运维组","美术事业部","苏坚组","苏星星组","英语事业部","菅丽萍组","董皊组","蓝青青组","西安销售组","许满玉组","许财杰组","郑鸿政组","阅读事业部","陈敏莲组","陈春霞组","陈雅真组","韩丽丽组","音乐事业部","黄伟组"],"areas":["上海","北京","南昌","厦门","合肥","广州","成都","武汉","济南","深圳","石家庄","福州","西安","郑州","长沙","长泰","龙岩"],"positions":["Android开发工程师","C#开发工程师","CEO","IOS开发工程师","IT网络工程师","Java开发工程师","PHP开发工程师","UI设计师","iOS开发工程师","php开发工程师","业务一部经理","业务主管","业务二部总监","业务运营","中级销售主管","书法事业部主管","书法高级教研","产品一部主管","产品主管","产品助理","产品经理","产品部经理","产研总监","人事专员","人事主管","人力资源总监","内容主管","内容编辑","前端开发工程师","厦门内容部经理","口才事业部主管","口才教研","商务BD","城市经理","培训讲师","外教教研","外教运营","学科运营","市场推广","平面设计","幼儿园业务主管","总经理助理","戏剧业务部负责人","敏捷经理","数学事业部主管","数学教研","数据开发主管","数据开发工程师","文案编辑","新媒体专员","新媒体主播","新媒体主管","新媒体运营","新媒体运营主管","活动策划","测试主管","测试工程师","测试总监","测试经理","游戏开发工程师","研发&营销总监","研发主管（Android）","研发主管（IOS）","研发主管（Java）","研发主管（PHP）","研发主管（前端）","研发副总","研学主管","研学策划","研学运营","研学顾问","美工编辑","美术事业部主管","美术高级教研","英语学科运营","英语客户运营","英语教研","英语课程运营","营销总监","行政&营销总监","行政主管","行政前台","视频剪辑","视频编辑","设计主管","课程研发","财务专员","财务主管","财务总监","资深Java开发工程师","资深产品经理","资深人事","资深前端开发工程师","资深研发","资深运营","资深销售一级","资深销售三级","资深销售二级","资深销售五级","资深销售四级","运维专员","运维主管","运维工程师","运维开发工程师","运营专员","运营主管","运营培训师","运营总监","运营策划","销售专员","销售主管","销售经理","阅读事业部主管","音乐事业部主管","音乐教研","音乐编辑"]},"facets":{"departments":{"column":"部门_","values":["上海营销一部","上海营销三部","上海营销中心","上海营销二部","业务一部","业务二部","产研一部","产研三部","产研二部","人力资源部","北京营销中心","南昌营销中心","厦门内容部","厦门营销一部","厦门营销二部","合肥营销中心","市场部","广州营销中心","总经办","戏剧业务部","成都营销中心","济南营销中心","深圳营销中心","石家庄营销中心","福州营销中心","行政部","西安营销中心","财务部","郑州营销中心","长沙内容部","长沙营销一部","长沙营销中心","长沙营销二部"],"counts":[27,17,3,27,70,13,72,62,60,13,5,3,31,31,35,4,1,3,2,1,11,3,11,1,5,6,15,5,21,15,16,3,20]},"groups":{"column":"组别_","values":["/","BI组","DIM组","PC组","万建国组","业务管理一组","业务管理三组","业务管理二组","业务运营组","习辉平组","书法事业部","产品部","何倩组","何双组","刘丽组","刘伦星组","刘建镇组","刘益先组","刘莹组","刘骏组","口才事业部","叶瑞珠组","叶聪玲组","后台一组","后台三组","后台二组","吴凯莉组","吴菲组","周媛组","周波涛组","商务组","培训直播组","培训组","外教业务运营组","外教教研组","姜海伦组","家长通一组","家长通二组","市场渠道组","平台运维组","廖齐辉组","张庆庆组","张文君组","彭乾组","彭文波组","房金伟组","教研组","教育一组","教育三组","教育二组","数学事业部","新媒体组","新媒体运营组","朱行悟组","李天组","李梦组","李梦阳组","李浩瀚组","杜雅妮组","杨爱民组","林碧虹组","汤章溢组","测试二部","研学事业部","系统运维组","美术事业部","苏坚组","苏星星组","英语事业部","菅丽萍组","董皊组","蓝青青组","西安销售组","许满玉组","许财杰组","郑鸿政组","阅读事业部","陈敏莲组","陈春霞组","陈雅真组","韩丽丽组","音乐事业部","黄伟组"],"counts":[109,3,12,18,7,20,13,12,3,4,7,1,4,4,9,9,3,2,6,1,4,1,6,15,1,17,2,5,7,6,2,1,1,1,1,3,9,8,3,4,2,3,6,3,7,4,6,19,18,15,5,11,3,10,3,5,5,5,7,4,10,1,2,4,3,5,3,6,6,5,5,4,6,4,5,7,16,3,10,8,4,3,6]},"areas":{"column":"区域_","values":["上海","北京","南昌","厦门","合肥","广州","成都","武汉","济南","深圳","石家庄","福州","西安","郑州","长沙","长泰","龙岩"],"counts":[330,5,3,124,4,3,12,1,3,21,1,5,15,21,56,7,1]},"positions":{"column":"岗位_","values":["Android开发工程师","C#开发工程师","CEO","IOS开发工程师","IT网络工程师","Java开发工程师","PHP开发工程师","UI设计师","iOS开发工程师","php开发工程师","业务一部经理","业务主管","业务二部总监","业务运营","中级销售主管","书法事业部主管","书法高级教研","产品一部主管","产品主管","产品助理","产品经理","产品部经理","产研总监","人事专员","人事主管","人力资源总监","内容主管","内容编辑","前端开发工程师","厦门内容部经理","口才事业部主管","口才教研","商务BD","城市经理","培训讲师","外教教研","外教运营","学科运营","市场推广","平面设计","幼儿园业务主管","总经理助理","戏剧业务部负责人","敏捷经理","数学事业部主管","数学教研","数据开发主管","数据开发工程师","文案编辑","新媒体专员","新媒体主播","新媒体主管","新媒体运营","新媒体运营主管","活动策划","测试主管","测试工程师","测试总监","测试经理","游戏开发工程师","研发&营销总监","研发主管（Android）","研发主管（IOS）","研发主管（Java）","研发主管（PHP）","研发主管（前端）","研发副总","研学主管","研学策划","研学运营","研学顾问","美工编辑","美术事业部主管","美术高级教研","英语学科运营","英语客户运营","英语教研","英语课程运营","营销总监","行政&营销总监","行政主管","行政前台","视频剪辑","视频编辑","设计主管","课程研发","财务专员","财务主管","财务总监","资深Java开发工程师","资深产品经理","资深人事","资深前端开发工程师","资深研发","资深运营","资深销售一级","资深销售三级","资深销售二级","资深销售五级","资深销售四级","运维专员","运维主管","运维工程师","运维开发工程师","运营专员","运营主管","运营培训师","运营总监","运营策划","销售专员","销售主管","销售经理","阅读事业部主管","音乐事业部主管","音乐教研","音乐编辑"],"counts":[12,2,1,13,2,18,15,9,1,1,1,3,1,6,9,1,4,1,4,1,14,1,1,7,1,1,5,33,18,1,1,3,2,3,3,2,4,5,1,4,1,1,1,1,1,4,1,2,1,1,1,1,15,1,1,10,33,1,4,1,1,1,2,2,4,1,3,1,1,1,1,1,1,2,1,1,8,1,6,1,1,3,1,1,2,7,3,1,1,2,2,4,1,1,1,12,5,7,2,2,3,2,1,1,32,8,1,1,1,141,20,1,1,1,1,1]}}},"columns":{"序号_":{"type":"num","data":[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,610,611,612]},"姓名_":{"type":"str","data":["刘其坚","刘玉","胡生娜","邓雅芳","周彤","张晓伟","卢佳","周子蛟","胡惜文","何尚杰","饶洁","黄佳慧","刘鑫","屈翎野","陆常斌","孙玉凤","纪志豪","熊溜溜","郭昱伶","李丽萍","郭洁","毛意伟","彭鲲","王冉冉","张金凯","王晓倩","李浩然","孙唯嘉","赵德正","王澜滔","王依","郝惠军","张潭辉","测试王艳","王付佳","赵亚楠","李贵洲","宛超","王沨","罗细娟","徐姣姣","李雅珠","臧兆鋆","李帅华","胡翔翔","杨海燕","李海侠","褚晨雯","朱梦雅","陆文宇","汤喆","刘程","邢杏杏","黄健","邱成","陈绪慧","章发晨","申国超","李一鸣","梅守强","骆方涛","齐浩迎","吴俊志","李华南","吴利丹","朴雪花","易鹏","皮亚楠","朱秀梅","耿童童","蒲科辉","沈刚","周宏坤","夏菁","王敬豪","吴登朋","胡军","赵朝龙","黄金伟","孙运成","牟立强","吴戈","孙静怡","陈春霞","朱行悟","马泽生","周媛","董皊","朱韦平","李梦","蒋杰","杨召军","刘欢","周明","丁应强","刘伦星","王景武","吴菲","许慧","陈慧","万建国","方世军","韩丽丽","马玉","宋洪丰","左楠","雷雪","陈佳明","邱圆","张书田","吴阳明","刘骏","林碧虹","陈雅真","吴芳芳","叶聪玲","蔡惠娜","郑建珍","黄娜君","廖齐辉","刘益先","蓝坤燕","汤章溢","蔡小明","许财杰","许满玉","魏力莉","李胜航","刘凌","刘海亮","骆毅佳","陈燕飞","杜雅妮","陈珊","李梦阳","王家盛","夜琛","孙敏","刘悦莉","陈可欣","林月荧","蓝青青","林福美","魏尧天","林贵煌","黄艺慧","李敏","刘建镇","王甜","李清","刘丽","王思婕","长沙王艳","杨琼","李瑶","刘莹","陈宇","何倩","何双","苏星星","丁辉","彭乾","侯佳玲","苏坚","刘艺霞","王臣立","王海云","彭蕾","袁晶","谢娟","张文君","郭学雷","陆慧敏","张珍珠","菅丽萍","柴明军","张庆庆","罗培生","杜润平","李赛赛","岳娟","张俊","凌婧","蔡洁","张中林","徐玲馨","尹钧正","周建明","吴凯莉","蔡子俊","陈钊","李叶泥泥","陈震","刘涛","刘天来","陈雪清","潘惠心","刘洋","周宇洋","方志海","乐敏","程坤宇","叶云霞","黄伟","夏伶慧","党磊","曹佳军","张小高","张程莹","李浩瀚","蔡璐滢","章婷","王秀婷","陈佳俊","张卓","周波涛","王之枫","孙超","陈锴","樊云曦","赵小明","汪燕萍","罗琳","蓝传涛","徐宁","汪诗雨","张家惠","安治豪","邓超","王亚超","段云侠","王哲","蒋昌铭","王鹏飞","吴雪峰","陈天行","祝傲","戴佳磊","陈畴竹","刘杰","田方玉","邬甜甜","严金","邹芳梅","唐鹤鸿","陈婧乐","黄娜","贲小康","汪兰兰","焦少平","邢卓远","许欣瑜","姜海伦","张双麒","冯猛飞","胡彬","秦加成","王磊","骆家旺","庞家兴","刘平","郭子齐","赵景楠","孙路路","王一凯","曾璠玥","李贺军","林海燕","习辉平","田永嘉","姚德","谢雪平","孙世豪","赵鹏飞","林双玲","叶瑞珠","王通","施俊杰","倪亦歆","裴芳芳","陈金彬","石桂芳","曾晓媛","展小茸","贾潇","彭文波","龙浩","李超凡","张小萍","张积隆","施钧夫","张文杰","汪笑青","王正","徐琴","陈敏莲","李九三","顾慧","雷方平","王海鑫","张士炎","贺提鸿","尹贻浩","张展腾","刘浩","陈良伟","崔婷","郑鸿政","汪天辰","肖福","黄培源","俞忠","颜雅红","彭书琴","卢珠玉","严重阳","欧静华","杨潮侠","房金伟","李啸","杨爱民","袁欢","康琪","高芳芹","陈智萍","王世光","李根德","高结","刘永衡","汤晓雨","陈旺","王凯杰","张艳","姚泽毅","田井林","高峰","李希栋","李成龙","周贵清","屈淑怡","钮天翔","程金殷","彭朝磊","汤灿坤","罗剑华","李小青","扶婧媛","蒋李妹","敬强圣","尹超","杨坤霖","曹龙飞","董玉清","何健涛","单冰冰","罗婕","姜仕威","王利蝶","于晓雨","陈兰兰","李纤","徐世鹏","陈前洲","杨浩宇","罗丹丹","邱容","郭二宁","钱策","许宁","黄涛","江佳新","顾学新","闫丽扬","薛文博","叶家美","李一翔","罗石琴","黄梅花","罗海太","雷舜玥","蔡娜涵","马捞捞","袁成荫","白嘉鹏","余鹏飞","吴俊宇","吕静龙","吴昭霖","秦羽筱","杨英琴","陈燕钟","杨本毅","张文静","崔红达","肖嘉俊","陈柄杰","李晓倩","陈雅婷","丁亚坤","郭明哲","方超印","徐雨星","农秋双","谢馨怡","吴婵冰","潘婧瑜","余亚璐","肖茜","高岩","张书华","朱兴佳","王燕丽","刘良海","汤雨坚","赵纪元","潘飞","张慧","梁军卫","徐康","罗菲菲","刘晨欣","周子涛","林欣怡","赵红","杨馨雨","伍俊杰","陈瑛楠","财务张祥","朱晓荣","李倩","王彭","杨杰","段玉姝","刘旭","胥文秀","臧广桐","时秋菊","方政","陈孟莉","史振亚","张新宇","贾云成","张铭文","张拴拴","李天","蔡天竹","王翠萍","杨钰帆","刘雪婷","陆其明","陈娟","戚海生","黄黎珊","王彬燕","刘彦婧","舒幸晨","李山鹏","张啸","叶雅雅","何小梅","宋亚慧","张冰聪","陈昇","吴新晨","薛妍莹","郑德鑫","庄莲欢","陈慧云","陈宇豪","胡圆圆","刘一帆","杨晓俊","杨哲彬","岳浩","朱贯政","曾晖","林颖","漆嘉欣","严欣旻","曾巧萍","刘丹凤","卢春祥","陈璐扬","林诗珺","刘帅龙","严奕玫","邢谢晗","慕芊芊","杨骏杰","袁张裕","马梦杰","刘光品","王忠于","扶廷婷","华巧玉","朱宇缘","何俊敏","王少辉","周小敏","郭铭","左品爽","叶非","测试张祥","唐峰林","黄达","黄萍","宋杰","余立洋","吕梦娜","郑旭伟","郭祖源","赵紫荆","李赢","产品王艳","孔璐平","李文玉","张路平","王雪来","苌笑","宋超","李建鹏","许艳晶","高涵","刘佳伟","郑静","柏润民","张伟君","迟天宇","陈楠","刘仕杰","杨宇飞","庄思婷","黄泓博","池玉冬","邓晨威","吕翔宙","王瑞鑫","翟建霞","张毓倩","李珊珊","朱梓铭","肖元锋","李立冬","陈仙福","佘竹","史文楠","吴艳丽","熊培乐","顾泽俊","邓雨辉","李黛妮","程磊","郑青","陈子航","黄少杰","齐先送","张杰","宗琳斌","马艳欣","张皓雄","康虎","杨洋","张彦劼","沈惠","张昭龙","杨玉珊","周春萍","张磊","高付升","赵雅丽","王建坤","黄昱梵","王帆","李昊霖","童楠","姚继英","张发荣","王吉宁","徐鑫","黄爱","张永峰","许俊","王益萍","焦玉美","胡元骏","冯钰婷","陈凯","万龙根","王枫","郑爱民","蔡燕","郑亮","单甜甜","解维维","夏明明","龙伦东","符加铭","谭滋利","杨智超","罗睿琪","罗繁","骆静","牛博伟","洪志伟","刘佐军","赵忠凯","杨秋新","李祖辉","胡玄","陈金燕","梁茂标","邢雯雪"]},"区域_":{"type":"dict","values":["上海","厦门","长泰","龙岩","长沙","西安","郑州","深圳","成都","北京","福州","合肥","济南","南昌","武汉","石家庄","广州"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,2,2,2,1,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,6,6,6,6,6,6,6,6,7,0,0,0,0,8,8,8,0,0,1,4,0,7,0,1,7,1,1,1,0,4,1,0,0,1,5,0,5,0,0,7,0,1,0,0,4,5,4,0,0,1,0,7,1,1,0,0,0,0,6,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,4,0,0,0,0,0,0,6,1,8,0,0,0,0,5,0,0,0,8,6,0,4,4,6,1,7,0,0,1,6,0,1,1,7,0,0,1,1,1,1,0,0,4,4,0,1,0,4,1,0,4,1,1,0,0,0,0,0,0,0,7,0,4,1,1,0,1,1,1,1,1,2,1,0,1,9,0,8,5,7,1,1,7,5,0,9,4,0,4,0,7,9,6,0,6,1,0,0,0,0,0,1,1,4,1,8,4,0,0,0,1,4,0,4,4,1,0,0,0,7,4,0,4,0,0,0,0,0,0,0,0,1,0,1,0,1,8,1,1,1,1,1,0,0,6,5,2,1,1,0,0,0,0,1,1,4,0,1,1,1,4,7,1,4,4,0,0,0,2,4,0,0,4,4,0,0,1,0,0,0,0,5,7,0,0,0,1,1,1,0,9,4,0,0,0,0,0,0,0,0,0,7,0,0,4,0,0,0,0,1,1,4,5,1,5,0,1,1,0,1,1,1,1,1,0,0,0,0,0,0,0,7,1,1,0,0,1,8,1,0,1,0,1,0,6,0,0,6,4,0,0,0,0,0,0,0,6,0,0,0,7,7,0,4,0,0,0,7,1,0,0,0,0,0,0,0,8,0,1,0,1,0,7,0,0,5,7,0,1,0,0,1,9,0,0,0,1,0,0,1,10,0,0,5,0,0,4,4,11,4,0,0,0,0,0,0,0,0,0,0,0,1,1,0,12,12,0,6,5,5,0,0,0,10,0,8,8,0,0,1,0,13,0,11,13,11,10,14,10,6,11,13,10,0,0,0,0,0,0,15,1,0,12,16,16,16,1,1,0]},"部门_":{"type":"dict","values":["总经办","财务部","行政部","业务一部","人力资源部","产研二部","产研一部","产研三部","业务二部","上海营销二部","上海营销一部","上海营销三部","厦门内容部","厦门营销一部","厦门营销二部","长沙营销中心","长沙内容部","长沙营销二部","长沙营销一部","西安营销中心","郑州营销中心","成都营销中心","戏剧业务部","上海营销中心","深圳营销中心","北京营销中心","福州营销中心","合肥营销中心","市场部","济南营销中心","南昌营销中心","石家庄营销中心","广州营销中心"],"codes":[0,1,1,1,2,2,2,3,3,3,3,3,3,3,3,4,4,4,4,4,5,5,6,5,5,5,5,5,5,3,6,6,5,6,5,6,7,7,7,7,5,6,7,7,6,6,6,6,6,6,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,5,5,5,5,8,8,8,9,10,10,10,10,10,11,2,9,9,9,9,9,9,9,9,9,11,11,11,10,11,11,9,7,7,7,6,12,12,12,12,12,12,12,13,13,13,13,14,14,14,14,13,7,7,7,7,7,14,14,13,13,13,13,13,14,14,14,14,7,7,12,7,13,4,15,16,16,15,16,16,16,15,17,18,18,18,18,18,17,18,18,18,18,19,20,20,20,20,20,20,20,20,7,0,9,10,9,21,22,21,7,5,14,18,6,7,3,7,7,3,3,3,7,17,3,3,6,14,19,7,19,3,9,7,10,3,3,3,18,19,17,5,7,14,7,7,12,12,5,5,5,5,20,10,6,6,6,14,6,6,3,6,6,6,7,5,7,6,16,6,3,11,4,4,5,20,4,21,6,6,7,11,19,23,23,23,21,20,9,17,17,20,14,24,11,9,13,20,6,13,13,24,9,1,3,3,3,3,9,3,17,17,6,14,5,17,3,10,17,14,14,6,3,3,3,6,10,6,24,5,16,12,13,6,14,3,14,3,14,12,14,3,13,25,7,21,19,24,12,14,7,19,6,25,16,5,16,11,7,25,20,5,20,13,10,6,11,9,3,14,14,4,3,21,16,6,11,10,12,17,10,17,17,12,10,5,5,7,18,10,17,6,6,8,6,6,5,7,5,3,6,13,10,4,21,12,3,13,14,14,3,10,20,19,12,14,13,10,5,5,7,12,14,18,7,3,12,13,16,24,3,16,16,9,6,10,12,17,2,9,17,16,6,5,13,10,9,6,11,19,24,3,1,8,14,14,12,8,25,17,3,3,6,3,6,6,3,3,3,24,8,3,18,3,7,3,6,3,12,18,19,13,19,10,14,13,8,12,12,13,13,12,7,5,3,10,8,7,7,7,12,3,10,3,12,21,13,7,12,5,12,9,20,9,3,20,16,9,3,3,3,7,11,5,20,8,6,6,24,7,5,18,6,10,7,24,12,7,7,7,7,6,6,3,21,7,12,2,3,5,24,7,3,19,24,7,14,8,7,14,25,6,11,3,3,3,10,13,26,5,7,19,11,6,17,17,27,17,6,7,5,7,4,7,9,10,11,5,9,13,13,28,29,29,3,20,19,19,5,5,5,26,5,21,21,5,3,14,7,30,8,27,30,27,26,4,26,20,27,30,26,5,5,3,3,8,7,31,13,5,29,32,32,32,3,3,7]},"组别_":{"type":"dict","values":["/","商务组","市场渠道组","业务运营组","新媒体组","产品部","业务管理一组","教育一组","后台二组","教育三组","DIM组","业务管理二组","BI组","后台一组","PC组","教育二组","测试二部","系统运维组","陈春霞组","朱行悟组","周媛组","董皊组","李梦组","刘伦星组","吴菲组","万建国组","韩丽丽组","平台运维组","教研组","林碧虹组","陈雅真组","叶聪玲组","廖齐辉组","许财杰组","许满玉组","家长通一组","杜雅妮组","李梦阳组","蓝青青组","刘建镇组","刘丽组","刘莹组","何倩组","何双组","苏星星组","彭乾组","苏坚组","西安销售组","菅丽萍组","张文君组","张庆庆组","业务管理三组","吴凯莉组","书法事业部","美术事业部","黄伟组","李浩瀚组","周波涛组","音乐事业部","姜海伦组","新媒体运营组","习辉平组","阅读事业部","彭文波组","郑鸿政组","英语事业部","房金伟组","杨爱民组","数学事业部","家长通二组","口才事业部","","汤章溢组","研学事业部","李天组","刘益先组","刘骏组","陈敏莲组","培训组","后台三组","叶瑞珠组","培训直播组","外教教研组","外教业务运营组"],"codes":[0,0,0,0,0,0,0,1,0,2,3,4,4,4,4,0,0,0,0,0,5,6,7,6,8,6,6,6,6,2,9,7,6,0,6,9,10,11,10,12,13,9,10,10,9,9,9,14,9,9,13,13,13,13,13,9,14,14,9,7,7,15,7,7,14,7,7,15,15,7,0,0,8,16,8,13,8,17,17,8,0,0,0,18,19,19,20,21,21,22,0,18,0,18,0,23,0,24,24,24,25,25,26,21,22,22,24,27,27,27,14,28,29,30,29,31,31,31,0,32,0,0,0,0,33,34,0,35,35,35,35,35,36,36,37,37,37,37,37,36,36,38,0,35,35,30,35,39,0,4,40,40,4,41,41,41,4,42,43,44,0,45,45,46,45,44,44,43,47,48,49,0,0,0,48,50,50,51,0,18,19,24,0,0,0,11,6,33,52,7,51,4,35,51,53,53,53,11,46,53,54,15,36,55,10,47,3,18,51,56,53,54,54,43,47,57,6,51,34,51,51,30,30,13,6,13,8,0,19,15,15,15,0,15,14,4,15,14,15,11,8,11,14,40,14,58,22,0,0,8,50,0,59,15,15,11,26,47,60,60,60,0,49,18,42,42,49,0,61,25,18,0,48,14,0,0,0,23,0,62,62,62,62,23,54,63,57,7,38,6,57,62,19,57,0,0,9,1,4,58,9,20,9,61,6,40,29,64,7,33,53,38,62,33,31,0,65,0,66,11,67,47,0,29,38,51,47,15,66,40,6,40,25,51,66,48,6,48,0,20,14,22,23,58,33,0,0,62,59,41,14,26,19,30,63,21,63,57,28,20,13,8,51,44,19,42,7,7,0,7,7,8,10,8,62,14,0,19,0,59,29,62,64,36,0,68,19,0,0,31,0,64,20,13,8,69,29,34,43,51,53,29,64,40,61,62,40,41,23,14,20,31,63,0,23,63,41,14,6,32,21,23,7,26,0,0,70,0,71,72,36,29,0,0,46,68,68,9,73,14,9,70,3,70,74,0,73,44,73,0,65,15,62,28,44,55,39,55,56,34,0,0,29,30,64,75,29,10,6,65,20,0,12,11,51,30,62,56,65,28,0,75,27,76,13,30,18,49,18,4,49,40,23,0,68,65,11,25,6,0,0,9,14,74,51,16,52,7,19,11,61,28,10,11,11,69,15,9,73,67,69,28,0,62,6,74,10,2,55,0,10,77,0,69,77,66,7,0,70,62,78,56,64,0,17,69,55,25,9,63,63,0,57,14,69,8,69,0,69,18,56,25,79,23,80,39,81,0,0,68,0,0,55,8,8,6,0,13,67,67,13,0,77,12,0,82,0,0,0,0,0,0,49,0,0,0,13,8,65,54,83,10,0,64,8,0,0,0,0,62,62,10]},"岗位_":{"type":"dict","values":["CEO","财务专员","财务总监","财务主管","行政前台","IT网络工程师","行政主管","商务BD","业务一部经理","业务主管","培训讲师","新媒体主管","新媒体专员","视频剪辑","人力资源总监","资深人事","人事专员","产品部经理","研发主管（PHP）","产品经理","测试主管","PHP开发工程师","资深前端开发工程师","产品主管","前端开发工程师","平面设计","UI设计师","设计主管","测试总监","数据开发主管","测试工程师","研发主管（IOS）","IOS开发工程师","Android开发工程师","资深产品经理","研发主管（Java）","Java开发工程师","游戏开发工程师","研发主管（Android）","产品一部主管","测试经理","研发副总","资深Java开发工程师","运维工程师","运维主管","业务二部总监","业务运营","中级销售主管","资深销售五级","销售主管","运营主管","运营专员","行政&营销总监","资深销售一级","资深销售二级","资深销售四级","资深销售三级","资深运营","运维专员","运营总监","厦门内容部经理","内容主管","内容编辑","营销总监","销售专员","研发主管（前端）","人事主管","新媒体运营","新媒体运营主管","销售经理","研发&营销总监","总经理助理","戏剧业务部负责人","运营策划","php开发工程师","书法事业部主管","书法高级教研","美术事业部主管","美术高级教研","文案编辑","资深研发","音乐事业部主管","C#开发工程师","阅读事业部主管","学科运营","课程研发","市场推广","音乐编辑","英语教研","音乐教研","外教运营","产研总监","数学事业部主管","产品助理","口才事业部主管","数学教研","研学主管","口才教研","活动策划","研学策划","研学运营","英语学科运营","美工编辑","数据开发工程师","英语课程运营","视频编辑","外教教研","敏捷经理","iOS开发工程师","研学顾问","运营培训师","运维开发工程师","城市经理","新媒体主播","幼儿园业务主管","英语客户运营"],"codes":[0,1,2,3,4,5,6,7,8,9,9,10,11,12,13,14,15,15,15,16,17,18,19,20,20,21,22,23,24,25,26,27,26,28,24,20,18,21,20,29,30,19,21,24,31,32,33,34,33,32,35,36,20,36,36,23,32,37,27,31,32,38,39,40,32,34,33,33,23,30,41,41,42,40,36,30,35,43,44,36,45,46,46,47,47,48,49,50,51,50,52,53,54,53,55,47,54,50,51,51,47,56,47,57,51,51,51,58,58,44,59,60,61,61,62,61,62,62,56,49,63,53,63,64,47,47,56,24,65,24,19,30,50,51,50,51,51,51,51,51,51,47,54,20,24,62,26,49,66,67,61,62,67,62,62,61,68,49,49,47,63,50,51,50,51,64,64,54,69,53,49,63,54,56,49,51,50,70,71,55,56,51,63,72,51,26,30,53,49,30,24,73,74,24,75,76,76,19,51,76,77,30,51,49,19,64,46,53,20,49,25,78,78,53,64,49,21,23,64,26,18,62,62,36,30,30,30,64,64,19,19,26,64,32,33,79,32,32,33,24,30,30,33,62,80,81,51,16,16,36,51,16,49,30,20,30,53,64,67,67,67,67,64,64,64,64,64,67,49,64,64,64,64,82,64,64,64,48,1,83,84,85,85,64,86,49,54,30,64,21,64,25,64,53,64,54,30,7,67,87,30,64,33,64,19,62,62,49,26,64,67,64,85,64,62,64,9,64,49,24,49,64,64,88,64,21,67,32,64,62,24,62,64,24,64,64,21,64,64,64,20,51,64,89,64,53,16,85,64,62,33,64,64,62,53,51,64,53,88,64,36,36,21,64,64,64,33,32,90,33,26,36,30,36,84,91,67,64,16,64,62,85,64,51,64,92,64,67,64,62,64,64,64,36,36,21,62,64,64,19,76,62,64,62,64,85,62,62,64,30,64,62,64,4,64,64,62,82,24,64,51,64,93,64,51,51,94,1,90,64,51,62,90,51,51,95,95,19,96,30,26,97,98,97,49,67,99,64,100,41,101,30,84,102,64,64,64,64,64,64,4,46,62,62,64,64,62,24,30,88,64,46,103,21,30,62,85,64,104,88,51,64,58,88,42,62,64,64,64,105,64,62,64,10,95,88,40,64,21,64,106,30,30,64,21,107,64,108,64,21,64,88,21,19,24,24,32,32,109,64,30,88,5,110,19,64,30,25,64,64,21,64,90,24,64,64,33,64,97,67,10,64,64,63,111,20,64,64,32,64,64,112,64,30,24,30,18,16,19,64,64,64,40,64,64,64,113,112,112,95,64,64,64,30,36,30,64,30,64,64,36,114,64,103,64,106,64,64,64,49,15,64,64,64,64,64,36,36,115,67,46,30,49,64,36,64,64,64,64,84,84,19]},"入职日期_":{"type":"num","data":[41933,43563,43983,44531,43549,43577,44144,44256,43647,43270,43696,43612,44159,43185,44991,43192,43947,44088,44322,44979,43045,43243,44270,44333,44333,43640,44305,44788,45041,43311,43381,43972,43972,44025,44067,42695,44068,43626,44322,44445,44970,44789,45050,45036,42709,43997,44267,44578,44991,44993,42802,43647,44333,44760,44984,43727,43528,44340,45019,42835,43257,43535,44350,43972,43978,44113,44825,44880,44256,45019,42005,42005,43957,44075,44753,44970,44256,44977,44322,44992,43166,44166,44324,43262,43424,43612,43455,43619,43766,43808,42005,43640,43920,43160,43248,43920,43437,43384,43766,43906,43215,43724,44151,43353,43776,44333,44333,43160,43206,43213,42005,42979,43969,44010,44657,42355,42788,43474,43627,43677,42095,44292,42416,43906,44060,44259,42461,44158,42835,44074,44762,44767,43368,43928,42943,43556,43654,43619,43941,44040,44657,44970,44970,44973,44979,45005,45019,45064,44124,42828,43992,42982,43913,43936,44165,43922,44113,42562,43709,44113,41640,43661,43767,43914,43915,45023,45033,45061,44284,43678,43897,43647,43647,43647,43647,44021,43647,44978,45040,45061,45062,45068,44908,44911,45238,45078,45078,45078,45078,45082,45091,45091,45102,45102,45110,45110,45113,45117,45117,45117,45125,45133,45139,45139,45139,45142,45145,45146,45146,45148,45148,45152,45152,45166,45166,45173,45174,45181,45187,45222,45222,45222,45229,45231,45231,45231,45231,45232,45236,45244,45244,45250,45251,45258,45259,45264,45266,45266,45272,45273,45285,45285,45293,45306,45313,45341,45341,45352,45352,45352,45355,45356,45356,45357,45357,45357,45357,45362,45364,45364,45364,45365,45369,45369,45369,45369,45369,45369,45369,45371,45371,45372,45376,45383,45383,45383,45389,45392,45397,45397,45397,45397,45397,45399,45404,45406,45406,45418,45425,45427,45429,45434,45439,45439,45439,45440,45441,45446,45446,45446,45446,45448,45454,45454,45455,45462,45467,45467,45474,45474,45474,45476,45488,45489,45495,45496,45497,45498,45502,45505,45505,45505,45512,45516,45516,45518,45523,45530,45530,45531,45532,45537,45537,45537,45540,45544,45544,45544,45547,45553,45553,45553,45553,45573,45573,45573,45586,45586,45586,45587,45593,45594,45594,45600,45601,45602,45608,45608,45614,45614,45621,45621,45621,45623,45623,45628,45628,45628,45628,45630,45635,45635,45635,45644,45649,45659,45698,45705,45705,45707,45708,45708,45708,45712,45712,45719,45719,45719,45719,45719,45719,45719,45720,45726,45726,45726,45726,45726,45727,45735,45733,45733,45733,45733,45736,45740,45741,45741,45743,45743,45748,45748,45748,45754,45754,45754,45756,45761,45761,45761,45763,45768,45770,45771,45774,45775,45783,45783,45783,45783,45783,45783,45796,45797,45799,45799,45803,45805,45811,45818,45818,45824,45824,45824,45826,45831,45831,45831,45835,45839,45839,45839,45839,45839,45839,45839,45840,45842,45845,45846,45847,45852,45853,45853,45853,45853,45853,45859,45859,45859,45859,45859,45859,45859,45859,45860,45860,45861,45861,45862,45866,45870,45870,45873,45873,45873,45875,45875,45875,45875,45875,45880,45880,45882,45882,45882,45887,45887,45888,45890,45894,45896,45897,45901,45901,45901,45901,45903,45903,45903,45908,45908,45908,45910,45910,45910,45910,45910,45915,45915,45915,45915,45916,45922,45922,45922,45922,45922,45922,45922,45939,45939,45939,45939,45939,45939,45939,45939,45939,45940,45944,45945,45945,45947,45950,45950,45950,45950,45950,45950,45952,45957,45957,45958,45958,45958,45964,45964,45964,45964,45964,45964,45964,45964,45965,45966,45967,45971,45971,45971,45971,45973,45973,45978,45978,45978,45978,45980,45985,45985,45985,45988,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45999,45999,45999,45999,45999,45999,45999,46001,46006,46006,46006,46007,46007,46007,46008,46013,46015]},"其他_":{"type":"num","data":[45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45292,45293,45306,45313,45341,45341,45352,45352,45352,45355,45356,45356,45357,45357,45357,45357,45362,45364,45364,45364,45365,45369,45369,45369,45369,45369,45369,45369,45371,45371,45372,45376,45383,45383,45383,45389,45392,45397,45397,45397,45397,45397,45399,45404,45406,45406,45418,45425,45427,45429,45434,45439,45439,45439,45440,45441,45446,45446,45446,45446,45448,45454,45454,45455,45462,45467,45467,45474,45474,45474,45476,45488,45489,45495,45496,45497,45498,45502,45505,45505,45505,45512,45516,45516,45518,45523,45530,45530,45531,45532,45537,45537,45537,45540,45544,45544,45544,45547,45553,45553,45553,45553,45573,45573,45573,45586,45586,45586,45587,45593,45594,45594,45600,45601,45602,45608,45608,45614,45614,45621,45621,45621,45623,45623,45628,45628,45628,45628,45630,45635,45635,45635,45644,45649,45659,45698,45705,45705,45707,45708,45708,45708,45712,45712,45719,45719,45719,45719,45719,45719,45719,45720,45726,45726,45726,45726,45726,45727,45735,45733,45733,45733,45733,45736,45740,45741,45741,45743,45743,45748,45748,45748,45754,45754,45754,45756,45761,45761,45761,45763,45768,45770,45771,45774,45775,45783,45783,45783,45783,45783,45783,45796,45797,45799,45799,45803,45805,45811,45818,45818,45824,45824,45824,45826,45831,45831,45831,45835,45839,45839,45839,45839,45839,45839,45839,45840,45842,45845,45846,45847,45852,45853,45853,45853,45853,45853,45859,45859,45859,45859,45859,45859,45859,45859,45860,45860,45861,45861,45862,45866,45870,45870,45873,45873,45873,45875,45875,45875,45875,45875,45880,45880,45882,45882,45882,45887,45887,45888,45890,45894,45896,45897,45901,45901,45901,45901,45903,45903,45903,45908,45908,45908,45910,45910,45910,45910,45910,45915,45915,45915,45915,45916,45922,45922,45922,45922,45922,45922,45922,45939,45939,45939,45939,45939,45939,45939,45939,45939,45940,45944,45945,45945,45947,45950,45950,45950,45950,45950,45950,45952,45957,45957,45958,45958,45958,45964,45964,45964,45964,45964,45964,45964,45964,45965,45966,45967,45971,45971,45971,45971,45973,45973,45978,45978,45978,45978,45980,45985,45985,45985,45988,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45999,45999,45999,45999,45999,45999,45999,46001,46006,46006,46006,46007,46007,46007,46008,46013,46015]},"辅助列_":{"type":"num","data":[45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45658,45659,45698,45705,45705,45707,45708,45708,45708,45712,45712,45719,45719,45719,45719,45719,45719,45719,45720,45726,45726,45726,45726,45726,45727,45735,45733,45733,45733,45733,45736,45740,45741,45741,45743,45743,45748,45748,45748,45754,45754,45754,45756,45761,45761,45761,45763,45768,45770,45771,45774,45775,45783,45783,45783,45783,45783,45783,45796,45797,45799,45799,45803,45805,45811,45818,45818,45824,45824,45824,45826,45831,45831,45831,45835,45839,45839,45839,45839,45839,45839,45839,45840,45842,45845,45846,45847,45852,45853,45853,45853,45853,45853,45859,45859,45859,45859,45859,45859,45859,45859,45860,45860,45861,45861,45862,45866,45870,45870,45873,45873,45873,45875,45875,45875,45875,45875,45880,45880,45882,45882,45882,45887,45887,45888,45890,45894,45896,45897,45901,45901,45901,45901,45903,45903,45903,45908,45908,45908,45910,45910,45910,45910,45910,45915,45915,45915,45915,45916,45922,45922,45922,45922,45922,45922,45922,45939,45939,45939,45939,45939,45939,45939,45939,45939,45940,45944,45945,45945,45947,45950,45950,45950,45950,45950,45950,45952,45957,45957,45958,45958,45958,45964,45964,45964,45964,45964,45964,45964,45964,45965,45966,45967,45971,45971,45971,45971,45973,45973,45978,45978,45978,45978,45980,45985,45985,45985,45988,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45992,45999,45999,45999,45999,45999,45999,45999,46001,46006,46006,46006,46007,46007,46007,46008,46013,46015]},"24年剩余调休_":{"type":"num","data":[0,13,0,1.5,5,37,0,0,17.42,5,0,1,8,28,0,66.5,44,0,0,0,4,25.5,0,49,20,24.5,19.1,0,8,4.5,1.5,43,8,0,55.5,40,20,25,15,2,48,0,4,12,0.25,16,24,8,38.17,0,93.5,125.5,39.5,7,7.5,16.5,0.170000000000002,32,8,11.75,14,101.5,26,15,54,0,50,8.77,8,16,0,0,0,83,0,12,14.5,21.5,0,0,2.5,6,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,24,34,0,3,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,40,2.5,0,0,16,16,4,0,0,0,0,8,0,16,0,0,3.5,16,0,0,0,0,0,1,0,8,5,0,0,0,0,0,0,0,8,2,0,8,0,0,0,0,0,0,0,0,0,0,0,0,14,0,0,0,0,0,0,0,0,18.5,0,0,8,0,0,0,0,16,0,1.5,0,8,5.5,18.5,138,8,0,0,0,5,0,0,0,0,0,4.48,0,0,0,16,4,0,8,0,0,0,26.5,28,46,40,0,0,0,19.5,24,0,24,11.5,0,24,0,39.5,35.5,0,22,2.33,0,0,0.5,0,8,30,0,0,12,0,32,48,8,0,0,0,0,0,0,0,0,0,0,0,0,0,2.5,0,0,0,0,0,0,0,0,0,52,9,23.5,7,0,0,0,0,50.5,0,1,0,0,0,0,0,0,56,0,0,0,64,0,8,0,8,0,0,0,22.5,0,0,0,8,0,0,0,2.5,0,0,0,0,0,0,0,0,0,0,4.5,0,0,8,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,23,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"24年年假使用情况_总年假":{"type":"num","data":[5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,15,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,10,15,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,10,5,5,5,5,5,5,10,5,10,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,10,5,10,5,5,5,5,5,5,5,5,10,10,10,5,10,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,14.5,4.5,9.5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3.5,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2.5,2.5,2.5,2.5,2.5,2.5,2.5,2.5,2.5,2,2,2,2,2,2,2,2,2,2,2,2,2,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1.5,1,1,1,1,1,1,1,1,1,1,1,1,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0.5,0,0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"已使用年假":{"type":"num","data":[0,2.5,5,5,3,5,10,5,5,5,5,5,5,4,5,5,5,5,5,5.5,4.5,5,5,5,5,5,5,5,4.5,0,2,5,4.5,12,5,5,1,5,2,5,4.5,5,5,4.5,5,5,4.5,3,5,5,4,5,4.5,5,5,5,5,5,5,5,1,5,6.5,5,4.5,5,2,5,3.5,5,10,11,5,5,5,5,5,5,5,5,4,4,5,5,0,3,1,6.5,4,0,8.5,5,0,5,5,5,5,9.5,2.5,10,5,4,2,5,5,4.5,2.5,5,1,4.5,1,1,3,4,4.5,2,2.5,1,0,0,0,5,7,0,8,3,2,0.5,5,5,3,4.5,2.5,0.5,7,5.5,5,3,4,5,2.5,1.5,1.5,5,3,4.5,5,5,3,2,5,4,3,0,0,5,2,4,1,0,0,2,4,3,0,2,1.5,5,1,0,3,0,5,5,5,3,5,3,4,5,0,5,0,0,2,5,5,3,0,5,2.5,2.5,4.5,4,0.5,5,3.5,5,4,5,5,4.5,0,0.5,5,2,2,5,5,2,5,2,5,3.5,3,1,4,4,5,5,2,4,5,2,6,2,4,1,4,4.5,4.5,5,2.5,5,3,5,2,3,5,4,5,5,5,5,11.5,0,8,4,4,2,2.5,1,0,0,1,2,1.5,2,2,3.5,0,2,1,4,1,4,3,1.5,0,2,0,0,3,3.5,1,1,0,3.5,3.5,0,0,2,1,0,0,3.5,1,2,0,3,3,0,0,1.5,3,3,3,3,1,3,3,0,1,0,3,0,2,2,2.5,0,1,1,0,2.5,0,0,2,1,2,0,1,2,0,0.5,1,0,0,0,1.5,0,0,0,0,0,1.5,1,0,1,1.5,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"剩余年假":{"type":"num","data":[5,3.5,1,0,1.5,0.5,0,0,1.5,1,1,0,2,3.5,0,0,0,1,1,-0.5,0.5,0,1,2,0,0,0,0,0,1,4.5,0,0,9,0,3.5,3.5,4,2,0,1.5,0,0,1,0,0,0,0,0,0,0,0,0,0,0.5,5,0,0,0,1,3,4,3,0,0,0,5,0,1,0,1,6.5,0,5,0,0,1.5,3,0,0,0.5,0,0,2.5,5,0,5,3,0,0,2,3,3,5,0,5,5,0,3,0,1,2,0,0,1,0,3.5,3,0,0.5,6,0,3,0.5,4,3.5,4.5,2.5,6,5,3.5,1,2,0,1.5,0,0,5,0.5,0,3,1.5,9,8.5,9,0,2,1.5,6.5,6,4,5,3,0.5,1,0,0,2.5,3,0,4.5,4,4.5,5,2,0,3.5,0,3.5,5,10,8,2,5,4,2,2,0.5,0,4,4,0,2,5,0,5,0,4,0,0,3,0,4.5,5,0,0,0,2,3.5,0,0.5,5,1,1,4.5,0,5.5,0,2,0,0,0.5,4,5,5,3.5,7,1,0,5,0,2.5,1,0.5,0,0,0,0.5,0,0,5,0,-1,3,-2,3,0,0,3,1,0,0,4,0,0,0,4.5,4,0,1,0,0,3,0,2,3.5,0,0,0,5.5,0,3,5,0,0,0,0,0,0,0,0,1.5,2.5,0,1.5,0,4,0,0,2,5,3,0,0,0,0,1,0,0,7,3.5,8.5,4,1.5,2,0,0,1.5,1,0,0,4,0,0,0,0,0,0,0,1,0,5,4,3,0,3,0,0,5,0,0,0,4.5,0,1.5,2.5,3,0,3,1,0,0,0,0.5,0.5,2,2,1.5,4,0,0.5,1,0.5,0,0,0,0,0,3,2.5,3.5,0,0,2,0,0,0,1,0,1,0,3,1,3,2,2,3,2.5,0,0,0,0,2.5,1,4.5,0,2.5,1.5,0,2,4,3,0,0,3,1.98,2.95,0,1.86,0.33,-0.18,-0.18,-0.18,4.26,4.26,5.66,1.66,0.16,0.16,1.66,0.16,4.16,0,1.07,4.07,0.0700000000000003,1.57,1.07,3.05,1.45,-0.0299999999999998,2.97,-0.0299999999999998,0,-0.0699999999999998,0.88,0.86,1.86,-0.16,-0.16,3.77,1.27,3.27,1.18,0.18,1.18,0.16,5.09,0.0899999999999999,2.59,1.56,0.49,0,-0.0499999999999998,-0.0899999999999999,3.4,0.29,1.29,0,-0.21,3.29,-0.21,1.11,2.1,1.57,0.0699999999999998,3.01,0.99,2.9,0,-0.19,1.73,0,2.73,2.7,2.63,0.13,1.63,0,0.0599999999999996,0.02,0.02,2.52,0,1.52,0,2.51,1.48,-0.0600000000000001,2.42,2.41,1.84,0,0,2.33,-0.17,-0.17,0.25,2.25,0,0,0.25,1.75,0.25,2.25,0,2.23,0,0,0.21,2.65,0.1,0,0.0499999999999998,0.0499999999999998,0.55,2.03,2.03,2.03,1.03,1.03,1.96,-0.04,-0.0700000000000001,0.93,0,1.36,0.86,1.85,-0.18,1.27,3.74,1.73,1.67,0.67,1.67,1.67,1.64,0,1.64,1.58,1.58,1.58,1.55,0.05,1.55,1.05,1.55,1.48,1.48,1.48,1.48,1.47,0.88,1.38,1.38,1.38,0,1.38,1.38,1.15,1.15,0,1.15,1.15,1.15,1.15,1.65,0.15,1.14,1.08,1.07,0.0700000000000001,1.04,1,0.5,0,1,1,1,0.97,0.9,0.9,0.89,0.89,0.89,0.31,0.81,1.31,0.81,0.81,0.81,1.31,0.81,0.79,0.78,0.77,0.71,0.71,0.71,0.71,0.68,0.68,0.62,0.62,0.62,0.62,0.59,0.52,0.52,0.52,0.48,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.33,0.33,0.33,0.33,0.33,0.33,0.33,0.3,0.23,0.23,0.23,0.22,0.22,0.22,0.21,0.14,0.11]},"24年已使用育儿假_":{"type":"str","data":[null," ",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"1月_年假":{"type":"num","data":[null,2,0.5,1,null,null,null,null,2,2.5,2,2,0.5,1,2,2.5,null,null,5,5,1,null,null,null,4.5,3,null,2,2,4,null,5,null,2,1,null,3,null,3,2,2,3.5,1,null,3.5,2,3.5,2,null,null,1,null,3,2.5,2,null,null,3,3,3,4,null,null,5,4,3,3,3,1.5,2,null,1,2,null,1,2,2,1,null,1,2,null,null,null,2,3,3,5,1,7,2,2,3.5,null,5,2,null,4.5,2,7,null,2,null,null,null,2,2,2,3.5,null,null,2.5,1,2,null,2,2,2,5,1,1,null,1,null,3,4,2,3,null,2,2,null,3.5,4,3,5,1,4,5,0.5,2.5,3.5,3.5,3,2,2.5,null,1,null,null,null,1,2,5,3,3,2,2,4,2,null,3,1,null,4,4,3,null,null,null,null,null,null,null,null,2,null,2,1,1,null,4,1,null,3,null,3,2,4,5,2,2.5,null,1,3,2,2,1,1,1.5,5,2.5,5,2.5,null,2.5,null,1,2,3,2,1,1,null,1.5,8,1,2,3,3,1,2,4,2,2,4,2,null,1,2,2.5,2,2.5,null,3,2.5,3,1,3,2,null,null,2,null,1.5,6,0.5,null,null,2.5,null,4,2,8,8,2,3.5,5,5,3.5,6,null,null,null,2,5,1,4,3,1,4,3,2,4,2.5,3,3,2,2.5,1,2,2,2.5,4,4.5,null,2,null,3,2.5,null,4,2,2.5,1,3.5,null,4,3,2,null,3,null,4,3,3.5,3,null,null,0.5,2,3,1,4,2,2,null,2,2,2,2,1,3,2.5,2.5,1,1,2,null,2,4,1.5,2,2,2,null,4,null,1,1,2,1,null,null,3,3,5,2,2,4,3,3,null,null,null,0.5,null,3,2,null,3.5,1,null,null,null,null,null,null,2,null,null,null,1.5,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"事假h":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,24,null,null,null,null,8,null,17,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,22.5,null,null,null,null,null,null,null,null,null,null,null,null,null,5,null,null,null,null,null,null,25,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,12,12.5,null,null,null,null,2.5,null,null,null,5,null,null,null,null,null,null,null,8,null,null,null,null,null,null,6.5,3,null,24,null,null,null,10,null,null,null,null,null,null,4,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,8,null,20,null,null,16,null,null,null,null,null,null,null,null,null,null,null,null,3,null,8,null,null,null,null,4,null,1,null,null,null,8,8,8,null,null,null,null,null,null,5,3.5,null,null,null,null,null,null,null,4,null,null,2.5,null,null,null,null,null,null,null,null,null,null,null,1,null,8,null,8,null,null,null,null,null,null,null,null,10.5,null,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,19,null,8,null,null,null,null,null,1,null,null,null,null,null,null,null,16,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,2.5,null,null,null,4,null,null,4,4,null,null,null,null,null,null,null,null,null,null,null,13,null,11.5,8,4.5,null,null,null,8,null,null,null,null,null,8,3,8,null,null,null,null,null,null,null,null,null,null,null,8,8,null,null,null,null,null,null,null,null,null,null,null,null,10.5,null,null,null,8,null,null,null,null,null,null,null,null,2.5,null,null,4,null,null,null,4,null,null,null,null,null,null,null,5.5,8,null,null,null,5,null,null,null,null,null,null,5.5,null,null,null,null,null,null,null,null,8,16,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,1,null,null,8,null,null,8,null,null,null,null,null,null,null,null,null,null,4,8,1,null,null,null,null,null,null,null,8,8,null,null,null,10.5,null,null,null,null,null,null,null,null,18,null,8,8,null,null,null,16,null,null,null,null,null,null,null,8,3.5,null,null,3,null,null,null,8,null,4,null,8,null,null,null,null,12,null,null,null,null,null,8,null,22,null,null,null,null,null,null,null,null]},"病假":{"type":"num","data":[null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,3,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,3.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"其他":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"调休":{"type":"num","data":[null,null,2,null,1.5,8,2.5,6.5,null,17.5,null,null,null,3,null,null,10,0.5,null,3,2.5,3,null,8,null,5.5,null,9.5,null,null,null,4,null,null,null,0.5,null,null,18,null,null,null,2,null,8,17.5,8,1,null,6.5,2.5,8,null,null,null,0.5,1.5,32,null,null,6,3.5,3.5,0.5,null,11.5,null,2.5,null,1,null,null,null,null,null,null,null,null,null,null,12,null,null,16,8,null,null,null,null,null,null,16,16,null,null,null,null,null,16,16,null,null,null,null,null,null,16,2,null,null,null,null,null,7,5,null,null,null,null,8,null,null,null,null,null,null,16,null,null,null,null,null,2,null,null,16,null,null,null,14.5,4,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,14,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,16,null,null,null,null,1.5,null,null,7.5,null,null,null,null,null,null,1.5,null,null,null,5.5,1,8,null,null,null,null,8,null,null,13,null,null,null,null,null,null,null,null,null,null,null,8,null,2,4,16,8,null,null,11,8,null,9.5,null,null,null,3.5,4,8,null,null,null,null,5,null,null,1,10,null,null,null,null,9,5.5,null,null,null,null,null,null,null,null,8,null,null,null,null,5.5,5.5,4,null,null,null,null,8,6,null,null,3,1,null,null,null,null,null,null,null,null,null,null,1.5,4,null,null,3,10,1,null,17,4,24,null,5,null,null,null,null,null,24,2.5,null,null,null,null,16,3.5,8,null,null,16,null,3.5,null,null,null,null,null,null,null,null,null,null,8,null,10,null,8,null,null,null,null,null,1.5,null,8,null,5,13,null,null,null,null,null,null,16,null,null,null,null,41,null,5.5,null,null,null,8,null,null,null,3.5,null,1,null,5,2.5,null,16,null,16,null,44,8,17,null,null,8,null,null,null,null,16,null,5.5,null,null,null,null,null,null,null,null,24,null,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,9,24,null,null,null,null,null,16,null,16,null,14,null,null,null,8,null,null,8,null,null,null,null,null,8,null,null,12,null,null,null,null,4,3,8,null,null,null,null,null,null,null,null,null,8,16,null,null,1.5,null,null,null,null,null,8,null,null,7.5,8,null,8,null,null,null,24.5,16,5,null,8,8,null,8,null,null,null,null,null,null,null,8,12,null,null,null,null,null,null,null,null,null,15,8,5,null,null,null,null,null,null,null,12,null,10,null,null,null,8,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,7.5,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"加班\n加班费":{"type":"num","data":[null,null,17,8.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,12.5,null,null,null,16,null,null,null,null,null,8,null,null,8,null,16,null,null,18,null,null,8,null,null,9,9,null,null,8,10.5,8,null,null,null,null,4,7,null,null,null,null,39.5,null,null,9,null,null,null,18.5,32,32,null,52.5,null,null,19,2.5,28,null,null,null,null,null,null,8,null,null,null,null,null,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,13,null,null,16,16,17.5,24,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,32,null,24,24,32,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,8,8,16,16,null,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,15.5,null,null,null,null,null,null,null,null,null,null,null,24,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,null,null,null,null,null,35.5,34,null,37.5,16,null,null,null,null,null,null,48,null,16,null,null,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,33,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,23,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,35,null,null,21,null,null,null,null,null,null,null,null,null,35,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,24,8,null,16,null,null,null,null,null,10.5,null,null,null,null,null,18,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,null,19,8,null,null,32.5,null,null,null,null,null,null,null,null,13,null,null,null,null,null,null,null,null,5,null,null,null,null,null,null,null,null,null,null,null,32.5,null,7.5,null,8,null,null,null,null,null,null,null,24,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,22,null,null,null,null,null,9.5,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,20,null,null,28.5,39,null,null,null,null,24,null,null,null,null,9.5,null,null,null,24,7.5,null,null,null,null,15,null,null,null,null,null,null,null,null,null,null,null,null,null,23.5,null,null,null,null,null,null,null,null,null,null,null,8,null,null,null,null,28.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"加班\n转调休":{"type":"num","data":[null,null,null,null,19,19,21.5,11.5,null,null,null,null,null,null,40,21,25.5,14,5.5,15,null,8,null,7.5,16,null,null,null,null,null,null,22.5,null,null,null,21,null,null,null,null,null,8,null,null,34.5,24,8,10,16,null,12.5,12,12,null,null,13,5.5,32,8,null,24,35,8.5,24,32,12.5,10,null,null,22,null,null,null,19.5,null,5.5,8,null,null,null,8.5,null,null,16,8,16,null,null,null,null,15.5,16,16,null,null,null,null,null,16,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,null,null,16,null,null,null,null,null,16,8,null,16,null,null,null,24,16,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,8,null,16,null,null,null,null,null,null,null,23.5,12,8,null,null,null,null,null,null,null,null,null,40,16,null,null,null,null,8,null,4,13,null,null,null,null,null,null,null,null,null,null,null,8,3,8,null,null,12,null,8,24.5,null,null,null,null,null,null,3.5,25,6.5,null,8,29,null,null,null,null,16,7,null,null,null,null,32,30.5,5,null,null,null,null,null,null,null,8,null,null,null,null,12,null,8,null,null,null,null,8,6,null,null,3,3,null,null,null,null,null,null,24.5,null,null,null,null,4,null,null,4,19.5,null,null,null,22.5,24,null,46,null,null,null,null,19.5,24,13,null,null,null,null,16,null,8,null,9,16,null,4,null,null,null,null,null,null,null,null,null,null,null,null,12,19.5,8,null,null,null,null,null,null,null,8,null,8,26,null,12.5,null,null,null,null,16,null,null,null,null,null,null,null,null,null,null,null,10,null,8,7.5,null,8,null,7,8.5,null,16,null,21,null,null,8,8,null,null,8,null,null,null,null,16,null,null,null,null,null,null,null,null,null,null,24,null,8,null,null,null,null,null,null,null,null,null,null,null,null,21.5,null,9,16,null,4,null,null,null,16,7.5,null,null,8,null,null,null,8,null,null,8,null,null,8,null,null,8,null,null,16,null,null,null,null,8,null,8,null,null,null,null,null,null,8,null,null,8,16,null,null,5,null,null,null,null,null,null,null,null,null,8,null,null,null,null,9.5,16,null,5,8,8,8,null,8,null,null,null,null,null,8,null,null,12,null,null,null,16,8,null,null,null,null,8,8,24,null,null,8,null,8,8,null,12,null,16,null,null,null,8,null,null,null,11,null,null,7.5,null,null,null,null,null,3.5,null,null,null,6,null,null,null,null,null,8,null,null,null,null,8,null,null,null,13,null,null,null,null,null,null,null,null,null,null,null,null,16,null,null,null,null,8,null,null,12,null,null,null,null,8,7.5,null,null,null,null,null,null,null,8,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"育儿假":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,1,null,null,null,null,1,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,2.5,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"备注":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"2月_年假":{"type":"num","data":[null,1,0.5,3,2,null,5,null,null,0.5,2,0.5,null,1,null,null,null,null,null,null,0.5,null,null,null,0.5,2,2,1,1.5,1,3,null,0.5,1,null,null,1,null,3,0.5,null,1,2,4,null,null,null,1,null,1.5,null,null,2,2,null,null,4,2,null,null,null,null,null,null,1.5,null,null,null,null,2,1,2,1,4,3,2.5,1,null,2,null,null,1,null,0.5,1.5,null,1,0.5,1,null,null,null,1.5,null,null,0.5,null,null,1.5,0.5,3,null,1.5,null,null,null,1,null,0.5,0.5,3.5,1.5,1,1.5,0.5,1,0.5,2,null,4,1,null,1.5,null,1,3,1,null,null,null,null,1,null,3,null,1,null,3.5,1,null,null,null,null,1,2,1,null,null,2,3,1,null,null,null,2,null,1,1,null,3,null,null,1,2,1,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,1,5,1,4.5,null,2,null,2,null,1,null,1,null,2,4,1,0.5,null,1,null,2,null,null,null,2,null,1,1,2,3,null,null,2,2,1.5,0.5,1,1,null,2,null,2,null,1,3,1,null,1,null,null,null,null,null,null,null,1,null,null,1.5,null,1,3,1,null,1,2,null,1,1,3.5,null,null,null,2,null,null,2,null,null,1,null,null,3,1,null,1,null,null,0.5,2,1,null,null,null,1,1,2,0.5,1,1,1,1,null,null,null,null,null,1.5,5,3,null,1,null,1,0.5,4,null,null,1,1,null,null,null,2,1,1,null,null,1,null,7,null,1.5,1.5,1,null,1,2,4,null,2,1,null,4,null,null,1,2,null,null,0.5,null,null,null,4,2,null,null,null,null,null,null,0.5,7,null,null,1,null,1,3.5,null,1,null,5,2,1,null,null,null,null,1.5,null,1,null,1,null,0.5,3,null,null,null,0.5,null,4,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"1-2月使用年假_":{"type":"num","data":[0,3,1,4,2,0,5,0,2,3,4,2.5,0.5,2,2,2.5,0,0,5,5,1.5,0,0,0,5,5,2,3,3.5,5,3,5,0.5,3,1,0,4,0,6,2.5,2,4.5,3,4,3.5,2,3.5,3,0,1.5,1,0,5,4.5,2,0,4,5,3,3,4,0,0,5,5.5,3,3,3,1.5,4,1,3,3,4,4,4.5,3,1,2,1,2,1,0,0.5,3.5,3,4,5.5,2,7,2,2,5,0,5,2.5,0,4.5,3.5,7.5,3,2,1.5,0,0,2,3,2,4,0.5,3.5,4,2,3.5,0.5,3,2.5,4,5,5,2,0,2.5,0,4,7,3,3,0,2,2,1,3.5,7,3,6,1,7.5,6,0.5,2.5,3.5,3.5,4,4,3.5,0,1,2,3,1,1,2,5,5,3,3,3,4,5,0,3,2,2,5,4,3.5,0,0,0,0,0,0,0,0,2,0,2,1,2,5,5,5.5,0,5,0,5,2,5,5,3,2.5,2,5,4,2.5,2,2,1,3.5,5,2.5,5,4.5,0,3.5,1,3,5,3,2,3,3,1.5,2,9,2,2,5,3,3,2,5,5,3,4,3,0,1,2,2.5,2,2.5,0,4,2.5,3,2.5,3,3,3,1,2,1,3.5,6,1.5,1,3.5,2.5,0,4,4,8,8,4,3.5,5,6,3.5,6,3,1,0,3,5,1,4.5,5,2,4,3,2,5,3.5,5,3.5,3,3.5,2,3,2,2.5,4,4.5,0,3.5,5,6,2.5,1,4,3,3,5,3.5,0,5,4,2,0,3,2,5,4,3.5,3,1,0,7.5,2,4.5,2.5,5,2,3,2,6,2,4,3,1,7,2.5,2.5,2,3,2,0,2.5,4,1.5,2,6,4,0,4,0,1,1,2,1.5,7,0,3,4,5,3,5.5,4,4,3,5,2,1,0.5,0,3,2,1.5,3.5,2,0,1,0,0.5,3,0,2,0,0.5,0,5.5,0,0,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"24年剩余年假_":{"type":"num","data":[5,-0.5,-1,-4,0,0,-5,0,-2,-3,-4,-2.5,-0.5,-1,-2,2.5,0,0,-5,-5.5,-1,0,0,0,-5,-5,-2,-3,-3,0,0,-5,0,0,-1,0,0,0,-3,-2.5,-1.5,-4.5,-3,-3.5,-3.5,-2,-3,-1,0,-1.5,0,0,-4.5,-4.5,-2,0,-4,-5,-3,-3,0,0,3.5,-5,-5,-3,0,-3,0,-4,-1,1,-3,-4,-4,-4.5,-3,-1,-2,-1,-1,0,0,-0.5,1.5,-1,0,-2,-1,-2,-0.5,-2,0,0,-5,-2.5,0,-4,-1,-7.5,-3,-1,1.5,0,0,-1.5,-0.5,-2,0,0,5.5,0,0,-2.5,0,0,0,0,0,0,3,0,0.5,5,-2,-5,0,1.5,0,-2,0,-0.5,-1,2.5,0,-1.5,-1,-0.5,0,-0.5,0,0,0,-4,-2,-3,0,-1,0,0,-1,0,0,0,0,-3,0,-2,0,0,10,0,-1,0,0,-1,0,0,4,5,2,5,0,0,0,0,0,0,0,-2,0,-5,-0.5,5,-2,0,-5,0,0,-5,-0.5,0,-1.5,-4,0.5,-2.5,-0.5,-2,0,-3.5,0,-2,0,0,0,-0.5,2,-3,-5,0,-2,0,-3,0,0,-5,-1,-1,-5,-3,0,-1,-5,-2,-4,-1,-2,4,0,-1.5,-2,-2,0,0,-2,-2.5,0,-0.5,-3,-2,-3,-1,-2,-1,-0.5,-1.5,0,-1,-3.5,-0.5,1.5,-1,0,-4,-5,-2,-1,-3,-4,-3,-2,-1,2,0,0,-5,0,-2,-1,0,0,1,-1,-5,-1,-2.5,0,-3,-3.5,1.5,0.5,-0.5,0,-0.5,-1,0,-1,-3.5,-3,-2.5,-1,-1,0,-1.5,-5,-3.5,0,-5,-2,-2,0,0,0,-2,-4,-1,-2.5,-0.5,0,-5,-0.5,-3,0,-5,0,-1,-2,-5,-2,-2,-2,-1,-5,-1,-1.5,0,-1,-0.5,0,-1,-2.5,0,-0.5,-4.5,-4,0.5,-2.5,0.5,-1,0.5,-0.5,0,-5.5,0,-2,-3,-4,-2,-4.5,-3,-3,-2,-4,-1,0,0,0.5,-2.5,-1.5,-1,-3,-1.5,0.5,-0.5,0.5,0,-2.5,0.5,-1.5,0.5,0,0.5,-5,0,0,-2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"截至24.2月剩余年假_":{"type":"num","data":[0,-0.5,-1,-4,0,0,-5,0,-2,-3,-4,-2.5,-0.5,-1,-2,0,0,0,-5,-5.5,-1,0,0,0,-5,-5,-2,-3,-3,0,0,-5,0,0,-1,0,0,0,-3,-2.5,-1.5,-4.5,-3,-3.5,-3.5,-2,-3,-1,0,-1.5,0,0,-4.5,-4.5,-2,0,-4,-5,-3,-3,0,0,0,-5,-5,-3,0,-3,0,-4,-1,0,-3,-4,-4,-4.5,-3,-1,-2,-1,-1,0,0,-0.5,0,-1,0,-2,-1,-2,-0.5,-2,0,0,-5,-2.5,0,-4,-1,-7.5,-3,-1,0,0,0,-1.5,-0.5,-2,0,0,0,0,0,-2.5,0,0,0,0,0,0,0,0,0,0,-2,-5,0,0,0,-2,0,-0.5,-1,0,0,-1.5,-1,-0.5,0,-0.5,0,0,0,-4,-2,-3,0,-1,0,0,-1,0,0,0,0,-3,0,-2,0,0,0,0,-1,0,0,-1,0,0,0,0,0,0,0,0,0,0,0,0,0,-2,0,-5,-0.5,0,-2,0,-5,0,0,-5,-0.5,0,-1.5,-4,0,-2.5,-0.5,-2,0,-3.5,0,-2,0,0,0,-0.5,0,-3,-5,0,-2,0,-3,0,0,-5,-1,-1,-5,-3,0,-1,-5,-2,-4,-1,-2,0,0,-1.5,-2,-2,0,0,-2,-2.5,0,-0.5,-3,-2,-3,-1,-2,-1,-0.5,-1.5,0,-1,-3.5,-0.5,0,-1,0,-4,-5,-2,-1,-3,-4,-3,-2,-1,0,0,0,-5,0,-2,-1,0,0,0,-1,-5,-1,-2.5,0,-3,-3.5,0,0,-0.5,0,-0.5,-1,0,-1,-3.5,-3,-2.5,-1,-1,0,-1.5,-5,-3.5,0,-5,-2,-2,0,0,0,-2,-4,-1,-2.5,-0.5,0,-5,-0.5,-3,0,-5,0,-1,-2,-5,-2,-2,-2,-1,-5,-1,-1.5,0,-1,-0.5,0,-1,-2.5,0,-0.5,-4.5,-4,0,-2.5,0,-1,0,-0.5,0,-5.5,0,-2,-3,-4,-2,-4.5,-3,-3,-2,-4,-1,0,0,0,-2.5,-1.5,-1,-3,-1.5,0,-0.5,0,0,-2.5,0,-1.5,0,0,0,-5,0,0,-2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"3月_年假":{"type":"num","data":[null,null,null,null,0.5,null,null,null,1,null,1,null,1,null,null,1.5,4,null,null,null,null,0.5,null,1,null,null,1.5,null,null,null,0.5,null,null,null,null,null,1,null,null,null,null,0.5,1,null,1,null,1,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,1,null,null,1,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,1.5,1,2,null,null,1.5,null,1,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,0.5,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,1,null,1,null,null,null,null,2,null,null,0.5,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,1.5,null,1,null,null,null,2,null,null,null,null,null,null,null,null,null,null,2,null,2.5,0.5,null,0.5,null,null,null,null,null,null,null,1,null,null,null,null,null,1,1.5,null,1,1,null,null,null,null,null,null,null,null,null,2,null,1,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,1,null,null,null,null,1,null,1,1,null,null,1,null,null,null,null,null,null,3.5,null,null,null,0.5,0.5,null,1,1,null,0.5,null,null,1,null,null,null,1,null,null,null,1,null,null,null,null,1,null,null,null,null,null,null,null,null,null,4,null,null,1,null,null,0.5,1,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"4月_年假":{"type":"num","data":[null,1,1,null,null,null,0.5,2,null,null,null,1,0.5,null,null,1,1,null,null,null,1,3.5,1,null,null,null,null,null,2,1,null,null,4,1,3,null,0.5,0.5,null,1,2,null,null,0.5,null,null,3,2,null,1,2,null,null,null,1.5,null,null,null,2,null,null,null,null,null,null,null,null,0.5,1,null,0.5,1.5,2,null,null,null,null,null,null,4,null,null,null,null,null,2,null,null,null,0.5,0.5,null,null,null,null,null,null,1,null,2.5,null,null,null,null,2,1.5,null,null,null,0.5,null,null,0.5,null,null,1,null,1,null,null,null,1.5,null,null,0.5,null,null,null,0.5,1,2,null,null,1,1,1.5,null,2,1,null,1,null,null,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,null,0.5,null,null,2,null,null,null,null,1,2,5,null,null,null,null,null,null,null,null,null,3,null,null,null,null,null,null,1,null,1,null,null,null,null,null,null,null,2,1,0.5,1,1,2,1,null,null,null,null,null,1,null,null,1,2,null,null,1,null,3,null,null,null,null,null,null,null,null,null,1,null,null,null,1,1.5,null,2.5,null,2,null,null,null,null,null,null,null,0.5,1.5,null,1.5,3,null,0.5,null,null,null,null,null,1,0.5,null,1,1,2,null,0.5,null,null,null,null,null,null,null,null,1,null,null,null,null,null,1,null,null,null,null,null,null,null,null,2,null,null,2,2,null,null,0.5,null,1,1,null,1.5,null,1,null,null,null,1,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,1,null,null,null,null,null,null,null,null,null,1,null,0.5,null,1,null,2,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,0.5,null,null,null,1,null,null,null,null,1,null,2,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"5月_年假":{"type":"num","data":[null,null,1,null,null,null,null,1.5,1,null,null,null,1.5,null,2,0.5,null,null,null,null,2,null,0.5,null,null,null,null,1,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,3,1,null,5,1,null,null,null,0.5,null,null,1,null,null,null,null,null,1,null,null,null,null,null,1,null,1,0.5,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,1,null,null,null,null,null,1,null,null,null,null,1,0.5,null,null,null,null,null,1,null,0.5,1,null,null,1,1,5,null,null,null,null,null,1,null,3,null,null,null,0.5,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,1,2,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,3,null,null,null,1,null,0.5,null,null,null,1,0.5,4,1,null,null,1,null,null,null,null,null,null,null,null,null,1.5,null,null,null,0.5,null,null,1,null,1.5,null,3.5,null,null,2,null,null,null,null,null,1,null,null,0.5,1,null,null,1,null,2,null,null,null,null,2.5,null,2.5,null,0.5,null,null,null,null,null,null,null,0.5,null,null,1,null,null,1,0.5,null,null,null,null,null,null,null,null,1,null,null,1,null,null,null,1,null,null,null,1.5,null,null,null,null,null,null,null,null,null,1,null,null,null,null,0.5,1,1,null,null,null,null,null,0.5,null,null,null,0.5,1,null,null,1,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,1.5,null,null,null,null,1,1,null,null,0.5,null,null,null,2,null,null,null,1.5,null,null,null,null,null,null,null,null,3,1,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,null,1.5,null,null,null,1,null,null,null,null,null,null,null,null,0.5,1,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"6月_年假":{"type":"num","data":[null,null,null,null,null,null,null,1,null,null,null,null,null,1,null,0.5,null,null,null,null,null,null,1.5,2,null,null,1.5,1,null,1,null,null,null,1,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,2,1,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,2,null,null,1,1,2,null,null,null,null,0.5,0.5,1,null,null,null,null,null,null,0.5,null,1,null,0.5,0.5,null,null,null,null,null,0.5,null,null,null,null,null,null,1.5,null,null,null,null,null,1,null,null,null,null,null,null,null,null,2,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,0.5,1,0.5,2,0.5,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,0.5,null,0.5,null,null,null,null,null,null,null,null,null,0.5,null,null,null,1,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,1,null,null,null,null,null,null,null,1,null,null,null,null,null,1.5,1,null,null,2,null,1,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,0.5,0.5,null,null,null,null,null,null,1,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,null,null,1,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,null,null,null,1,null,null,null,null,null,null,1,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,3,null,0.5,null,null,null,null,null,null,1.5,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"7月_年假":{"type":"num","data":[null,null,null,null,1.5,null,4.5,0.5,null,null,null,null,3,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,1,null,null,null,0.5,null,1.5,null,null,null,null,null,null,2,null,null,null,null,1,null,null,null,null,null,null,null,null,2,null,1,null,null,1,null,null,null,0.5,6.5,1.5,null,1,null,0.5,1,null,1,null,null,null,2,null,null,null,null,4,null,null,3,null,null,null,null,null,null,1,null,null,1,1,null,null,1,null,null,null,null,1,null,3.5,1,null,null,null,null,null,null,null,null,0.5,2,null,1,null,null,null,null,null,null,null,null,null,null,4,null,1.5,null,0.5,null,null,0.5,null,null,1,null,null,null,1,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,0.5,null,null,null,0.5,null,null,null,null,1,null,1.5,3,null,null,null,null,null,1,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,1,null,1,2,null,null,null,null,null,1,null,null,null,null,null,null,2,null,null,2,null,null,1,null,null,null,null,null,null,null,null,null,1,null,null,0.5,null,null,1,1,null,null,null,null,null,null,null,1,null,1,null,null,1,null,null,null,null,1,null,null,1,0.5,null,null,null,0.5,null,1,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,3,null,null,1,null,null,null,null,null,4,null,1,3,null,null,1,2.5,1,null,1,1,null,4.5,null,null,2,null,1,null,null,null,null,null,null,null,null,1,null,1.5,1,null,null,null,null,null,1,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,0.5,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,1,null,null,null,null,1,null,0.5,null,null,2,1,null,null,null,null,null,1,null,null,2,null,null,null,null,2.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"8月_年假":{"type":"num","data":[null,null,1,1,null,null,null,null,null,1,null,null,1,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,1,null,null,null,null,null,null,1,1,null,null,1,null,0.5,null,null,null,null,null,null,null,null,3,null,1,null,4,4,0.5,null,null,1,null,null,1,null,1.5,null,1.5,null,null,0.5,null,2,null,null,null,1,0.5,null,null,null,null,null,3,null,0.5,null,1.5,null,null,2,0.5,1,1,null,1,0.5,5,null,2.5,null,null,null,1,0.5,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,4,1,null,null,null,null,2.5,null,null,null,null,null,null,null,null,null,0.5,1,null,null,null,null,5,2,null,5,null,5,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,1,null,1,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,1,1,null,2,null,null,null,null,null,0.5,null,null,null,null,null,null,null,3.5,null,null,1,null,0.5,null,5,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,1,null,null,1,null,null,null,null,1,0.5,null,null,null,null,null,1,null,null,null,1,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,1,null,null,null,0.5,null,1,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,0.5,null,1,null,null,0.5,null,null,1,null,1,null,1.5,null,null,null,2,0.5,null,null,null,null,null,null,null,1,null,1,null,null,null,null,1,0.5,null,null,null,null,null,null,null,null,null,null,null,2,null,null,0.5,null,1,1.5,null,2,null,null,null,null,null,null,null,1,null,2,null,null,1,null,null,null,null,null,1,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"9月_年假":{"type":"num","data":[null,null,null,null,1.5,4,null,null,1,null,4,1,null,3,null,1,null,null,null,null,0.5,1,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,1,0.5,null,null,null,null,null,null,null,null,null,3,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,1,null,null,null,1,null,null,1,null,null,1,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,0.5,null,1,null,null,null,null,null,1.5,null,null,1,2,1.5,null,null,null,null,null,null,1,null,null,null,1.5,null,null,null,null,null,null,null,2,1,0.5,null,null,null,null,0.5,null,null,2,null,1,null,null,null,0.5,null,null,1,0.5,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,null,null,null,null,null,null,1,null,null,1,null,null,null,null,null,null,null,null,null,2,null,2,null,null,null,null,null,null,null,null,null,1,null,null,null,1,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,1,2,null,2,null,null,null,0.5,null,0.5,null,null,1,null,null,null,1,null,1,null,null,null,null,0.5,null,1,1,0.5,null,null,null,4,null,null,null,null,null,1,null,null,null,null,null,1,null,null,null,1,null,null,null,0.5,null,null,null,3,null,null,null,null,null,null,null,3,null,null,null,null,null,null,4.5,null,null,1,null,1,null,2.5,0.5,null,null,null,null,null,null,null,null,null,0.5,1,null,null,null,2,1.5,null,null,null,null,null,0.5,null,null,null,2,null,null,1,null,null,1,0.5,null,1,null,null,null,null,3,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,null,null,null,2,null,null,null,null,1,null,1,null,4.5,null,null,0.5,null,null,1,1.5,2,null,null,2,null,1,0.5,null,null,2,1,1,3.5,null,null,null,2,2,null,2,null,1,null,null,null,null,null,null,3,null,null,null,null,null,null,null,1,null,null,null,null,1,1,1,null,2,3,null,null,null,3,null,null,null,null,null,null,1,null,0.5,null,2,null,null,1,null,null,1,1.5,null,null,null,null,null,null,0.5,1.5,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"折算调休数":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,77.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,32,null,null,null,null,null,null,null,null,null,null,null,147,null,null,null,null,null,null,null,null,112,null,null,38.83,null,null,null,null,null,null,null,null,120,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,120,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,40,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"10月_年假":{"type":"str","data":[null,null,null,null,null,"0.5",null,null,null,null,null,"0.5",null,"0.5",null,"2",null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,"1","2",null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,"0.5",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,"0.5","0.5",null,null,null,null,null,null,null,null,null,null,null,"3","3",null,null,null,null,null,"0.5","0.5",null,null,null,"0.5",null,null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,"1","0.5",null,null,null,null,null,"0.5",null,null,null,null,null,"2",null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,"0.5","1",null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,"1.5",null,null,null,"2",null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,"1",null,null,null,"1","2",null,null,null,null,null,null,null,null,"0.5",null,null,null,null,"2",null,null,"0.5",null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,"1.5",null,null,null,null,null,null,null,null,null,null,null,null,null,null,"4",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,"2",null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,"2",null,"1",null,null,null,null,null,null,null,null,null,"0.5",null,"1",null,null,null,null,null,null,null,null,null,null,null,"2",null,null,null,"1.5",null,null,null,null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,"0.5",null,null,"0.5",null,null,null,null,null,null,"0.5","0.5",null,"1",null,null,null,"0.5",null,null,null,null,null,"2",null,null,null,null,null,null,null,null,"1","0.5",null,"1",null,null,"3",null,null,null,null,null,null,null,"1","1",null,"1",null,null,"1",null,null,null,null,null,null,null,null,null,null,null,"5.5",null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,"2",null,null,null,null,null,null,null,null,null,null,null,null,"1.5",null,null,null,null,null,null,null,null,null,null,null,null,null,"1",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"11月_年假":{"type":"num","data":[null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,1,null,2,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,0.5,null,0.5,null,null,null,null,null,1,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,1,null,null,null,null,null,null,null,0.5,null,0.5,1,null,0.5,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,0.5,null,null,null,null,1,0.5,null,null,null,null,null,null,1,null,null,null,0.5,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,1.5,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,0.5,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,0.5,null,null,1,null,null,1,null,null,0.5,null,null,null,null,null,1,null,null,3,null,null,null,1,null,0.5,null,null,null,null,1,1,null,null,1,0.5,0.5,null,0.5,null,null,null,null,null,null,null,null,4,null,null,null,null,null,null,null,null,null,3,null,null,null,null,null,null,null,1,null,null,null,1,null,null,0.5,null,null,0.5,1,null,null,null,null,1,null,0.5,0.5,null,null,2,null,null,null,1.5,null,null,0.5,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,2.5,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,1,null,null,null,null,null,null,0.5,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"12月_年假":{"type":"num","data":[null,null,null,null,null,null,null,null,null,null,null,null,0.5,1,1,1,null,2,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,1,null,null,null,null,1,null,null,2,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,1,null,null,null,null,null,null,null,null,1,null,null,null,null,1,2,null,null,null,1,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,1,null,1,null,null,null,1,2,1,null,null,0.5,null,null,null,null,4,null,0.5,null,null,null,null,null,null,null,null,2,0.5,null,null,null,null,null,0.5,null,2,1.5,null,null,null,null,null,null,3,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,1,1,null,null,null,null,null,null,1,null,null,null,null,null,null,null,0.5,1,null,null,null,null,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,3.5,null,null,null,null,3.5,null,null,null,null,2,null,null,null,null,null,null,1,1,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,1,null,1,null,1.5,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,null,0.5,null,2,null,null,1,null,null,null,null,null,null,null,0.5,1,0.5,null,1.5,null,null,null,1,null,0.5,null,null,null,1,null,null,null,null,null,1,1,null,null,1,null,null,null,null,null,null,1,null,null,null,0.5,null,null,0.5,2.5,null,null,1,null,null,null,3,null,null,null,null,1,2,1,null,null,1,null,4.5,null,null,null,1.5,null,null,null,1,null,null,null,1,null,1,1,null,null,null,1,null,null,null,null,2,0.5,null,null,null,null,null,null,null,null,null,0.5,1,null,1,1,1,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,2.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,2,1,null,null,null,null,2,0.5,2,null,null,null,null,null,1.5,null,2,null,2,2,1,null,null,null,null,1,null,2,1,null,null,2,1,null,2,null,null,null,null,1,null,null,null,null,null,null,null,null,null,1.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,1,null,null,null,1,null,null,0.5,null,null,null,null,null,null,null,null,null,null,0.5,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]},"25年年假使用情况_总年假":{"type":"num","data":[5,5,5,5,5,5,10,5,7.5,5,10,5,10,10,5,10,5,5,6.5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,15,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,5,5,5,10,15,5,10,5,5,10,5,5,5,6,5,5,5,5,5,5,10,5,5,10,5,5,5,5,10,5,10,5,10,5,5,5,5,6.5,5,5,5,5,5,10,5,10,5,5,10,10,10,10,5,5,5,10,5,10,5,5,5,5,5,5,5,10,10,10,10,5,10,10,7.5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,10,5,5,5,5,10,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,15,5,5,7.5,10,5,5,5,5,5,10,5,5,5,5,6.5,5,5,5,5,5,5,5,5,5,5,6,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6.5,5,5,5,5,5,5,15,5,10,5,5,10,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,9,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,10,5,5,5,5,10,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,9.98,4.45,0,4.36,4.33,4.32,4.32,4.32,4.26,4.26,8.16,4.16,4.16,4.16,4.16,4.16,4.16,0,4.07,4.07,4.07,4.07,4.07,4.05,3.95,3.97,3.97,3.97,0,3.93,3.88,3.86,3.86,3.84,3.84,3.77,3.77,3.77,3.68,3.68,3.68,3.66,7.09,3.59,3.59,3.56,3.49,0,3.45,3.41,3.4,3.29,3.29,0,3.29,3.29,3.29,3.11,3.1,3.07,3.07,6.01,2.99,2.9,0,2.81,2.73,0,2.73,2.7,2.63,2.63,2.63,0,7.56,2.52,2.52,2.52,0,2.52,0,2.51,2.48,2.44,2.42,2.41,2.34,0,0,2.33,2.33,2.33,2.25,2.25,0,0,2.25,2.25,2.25,2.25,0,2.23,0,0,2.21,4.15,2.1,0,2.05,2.05,2.05,2.03,2.03,2.03,2.03,2.03,1.96,1.96,1.93,1.93,0,3.36,1.86,1.85,1.82,1.77,3.74,1.73,1.67,1.67,3.17,1.67,1.64,0,1.64,1.58,1.58,1.58,1.55,1.55,1.55,1.55,1.55,1.48,1.48,1.48,1.48,1.47,1.38,1.38,1.38,1.38,0,1.38,1.38,1.15,1.15,0,1.15,1.15,1.15,1.15,1.65,1.15,1.14,1.08,1.07,1.07,1.04,1,1,0,1,1,1,0.97,0.9,0.9,0.89,0.89,0.89,0.81,0.81,1.31,0.81,0.81,0.81,1.31,0.81,0.79,0.78,0.77,0.71,0.71,0.71,0.71,0.68,0.68,0.62,0.62,0.62,0.62,0.59,0.52,0.52,0.52,0.48,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.42,0.33,0.33,0.33,0.33,0.33,0.33,0.33,0.3,0.23,0.23,0.23,0.22,0.22,0.22,0.21,0.14,0.11]},"已使用\n年假":{"type":"num","data":[0,1.5,4,5,3.5,4.5,10,5,6,4,9,5,8,6.5,5,10,5,4,5.5,5.5,4.5,5,4,3,5,5,5,5,5,4,0.5,5,5,6,5,1.5,1.5,1,3,5,3.5,5,5,4,5,5,10,5,5,5,5,5,5,5,4.5,0,5,5,5,4,2,1,7,5,5,5,0,5,4,5,9,8.5,5,5,5,5,8.5,2,5,5,5.5,5,5,2.5,0,5,0,7,5,5,8,2,2,0,5,5,0,10,2,10,4,3,5,5,5.5,5,1.5,2,5,4.5,4,5,7,4.5,1,6.5,5.5,7.5,4,0,1.5,4,8,5,8.5,5,5,0,4.5,5,2,3.5,1,1.5,1,10,3,8.5,3.5,1.5,1,0,2,4.5,4,5,5,2.5,2,5,5.5,1,0.5,0,3,10,1.5,5,1.5,0,0,2,3,0,1,3,3,4.5,5,1,1,5,3,0,5,0,5,1,5,5,2,5,0.5,0,5,5,5,3,1.5,5,4.5,0,4,4,5.5,5,9.5,5,3,7.5,10,4.5,1,0,0,1.5,3,4,5,0,5,4,4,4.5,5,5,5,4.5,5,5,0,5,7,2,7,2,5,5,2,4,5,5,1,5,5,5,0.5,2.5,5,4,5,5,2,5,13,1.5,10,5,5,4.5,5,5,0,5,5,5,5,5,5,5,5,3.5,2.5,5,3.5,5,1,5,5,3,0,2,5,5,5,5,4,5,5,3,1.5,1.5,1,3.5,3,5,5,3.5,4,5,5,1,5,5,5,5,5,5,5,4,5,0,1,2,5,2,5,5,0,5,5,5,4.5,5,3.5,2.5,2,5,2,4,5,5,5,4.5,4.5,3,3,3.5,1,5,4.5,4,4.5,5,5,5,5,5,2,2.5,1.5,5,10,3,5,5,5,9,5,4,5,2,4,2,3,3,2,2.5,5,5,5,5,2.5,4,0.5,5,2.5,3.5,5,3,1,2,5,5,2,8,1.5,0,2.5,4,4.5,4.5,4.5,0,0,2.5,2.5,4,4,2.5,4,0,0,3,0,4,2.5,3,1,2.5,4,1,4,0,4,3,3,2,4,4,0,2.5,0.5,2.5,3.5,2.5,3.5,2,3.5,1,2,3,0,3.5,3.5,0,3,2,0,3.5,0,3.5,2,1,1.5,3,3,2,0,0,3,1,0,0,0,0,2.5,1,0,7.5,2.5,2.5,0,0,1,0,0,1,2.5,0,0,0.5,0,0,0,2.5,2.5,2,0,0,0,2,0.5,2,0,0,0,0,0,2,1.5,2,0,2,2,1.5,0,0,0,1,1,0,2,2,1,0,2,1,0,2,0.5,0,0,0,1,1.5,0,0,0,0,0,0,0,0,1.5,0,0.5,0,0,0,0,0,0,0.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0.5,0,0,0,0,0,0,0,0,0,0,0.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"25年总加班情况_累计\n加班/天":{"type":"str","data":[0,46.5,38.5,61,55,87.5,26.5,35.5,44.5,115,13.5,8,16,0,64,141.5,144,81.5,42,15,52.5,68,79.5,127.5,149.5,59,38,75,93,0,0,140,0,16,76,67,121,102,37.5,100,124,24,94,66,121.5,101,56,42,102.5,35,112,73,278.5,170.5,88.5,40,107.5,199,16,252.5,106.5,205.5,108.5,123,129,84.5,136,205,232,127,263,0,66.5,203.5,58.5,260,67,63,98,15.5,118.5,8,40,160,61,96,32,0,176,0,15.5,120,80,103,128,20,92,0,160,132,32,88,80,208,205,72,144,220,208,247.5,24,0,0,8,4,0,0,0,0,208,32,0,56,0,0,8,32,16,5.5,8,8,47.5,199,40,304,200,184,216,320,244,164,64,96,56,0,0,0,8,168,0,160,128,40,56,21,0,0,24,24,32,0,176,168,208,184,8,8,0,8,16,16,0,8,32,4,0,0,24,1.5,160,40,160,0,0,0,0,107.5,0,24,125,35.5,16,0,9.5,15,14,8,0,200,8,28.5,209,176,28,12,8,13,152,8,44,13,40.5,16,16,24,16,21,68,132,40,32,32,8,235.5,136,88,92,44,60,16,61,64,12,206.5,99.5,0,176,101,95.5,77,16,78,75,8,168,54.5,192,94,66,108,0,19,8,162.5,118.5,19.5,4,0,0,0,0,0,16,81,8,8,32,8,148,80,88,0,8,179.5,16,20,118,16,7.5,84,35.5,86,28,33,29.5,48,24,127.5,8,220,8,143,52,24,120,53,96.5,24,4,70,121.5,112.5,64," ",24,16,8,16,79,135,21,72,0,0,0,85,38.5,176,32,49,47,28.5,84,0,56,40,12,152,24,40,61.5,8,88,36,24,43.5,77.5,87.5,80,8,111,184,8,60,16,86,48,38,55,0,52,64,68,0,32,152,16,8,32,48,90.5,40.5,29,40,38,0,85.5,88,0,73.5,54,24,64,0,71,89.5,0,48,19,29,12,272,8,248,40,0,40,0,0,0,11,32,32,10,4,19.5,16,0,16,97,6,3,28,8,28,81,48,0,16,78.5,48,0,8,0,32,8,0,42,45,19,72,0,16,8,8,32,21,12.5,16,0,147,0,44,16,80,0,0,16,8,75,16,31.5,0,32,44,0,42.5,8,0,0,0,88,23,16,8,0,4,0,8,0,8,0,0,24,18,0,0,21,24.5,0,4,0,56,32,0,0,104,8,0,16,0,0,70.5,55,21.5,5,21,11,32,16,8,0,16,0,0,3,8,0,35.5,20,0,44.5,58,32,8,0,8,40.5,8,32,16,48,25.5,0,24,8,79.5,69.5,3.5,14,24,32,15,0,0,8,0,0,0,23,0,0,26,0,0,0,39,0,3.5,0,0,0,6,0,0,0,0,0,40,0,0,0,0,55,0,0,0,13,0,0,0,0,0,8,0,0,0,0,0,0,16,0,0,0,0,8,0,0,12,0,0,0,0,8,7.5,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"已调\n休/天":{"type":"num","data":[0,5,20,38.5,11,24,7.5,27,15.5,117.5,9.5,9,5,16.5,16,20.5,93,2,24,3,27.5,81.5,16,119,139,80,31.75,74.97,40,3.5,1.5,72.5,8,0,0,22.5,0,29.5,52.5,49.5,36.5,16,46,9,64,87.5,36,9.5,38.17,30.5,153.5,191.5,45.5,55.5,10,27,73.67,152,8,12,54.5,83.5,56,90,55.17,59.5,88.5,26.5,16,96.42,0,0,0,31.5,0,61.5,47.5,66.5,98,8,84,4,19,146,44,80,32,0,16,0,0,120,64,91,128,16,84,0,136,112,24,88,80,0,56,40,136,17,41,1,3,0,0,7,5,0,0,0,0,112,24,0,56,0,0,8,32,8,8,8,2,35.5,186,20,0,32,8,0,16,226.5,160,48,96,40,16,0,0,8,0,0,1,0,16,0,0,0,0,24,24,32,0,89,129.5,0,10.5,8,8,0,0,16,12,0,6,10.5,3,0,0,8,0,160,40,160,0,0,0,0,72,0,24,101,8,8,0,0,19,9,9.5,0,8,13.5,47,35,133.5,28,0,0,14,152,0,28,13,32,20.48,16,16,16,37,20,132,48,0,32,8,33,100,115,64,16,60,0,50.5,64,12,94.5,54.5,0,24,6,92.5,35,16,85,29,8,37,40.5,16,83,81,0,0,3,8,55.5,83,17.5,4,0,0,0,0,0,16,63,8,8,32,8,108,80,84,0,8,70,13,20,118,16,7.5,49.75,34.75,65,21,33,24,48,24,90.5,8,1,8,25,50.5,24,120,50,122,24,0,69,132.5,113,28,81.1,32,16,null,16,52,135,10.5,72,8,0,0,77,39,175.5,16,0,37,28.5,76.5,0,56,0,12,16,8,8,24,8,88,8,8,39.5,42.5,87,80,8,0,48,8,50.5,16,86,8,28,29,0,23.5,56,68,0,32,152,16,8,16,48,87,24,16,40,29.5,0,27.5,0,0,0,34,0,46,0,30,6.5,0,48,0,24,12,68,8,230.5,40,0,40,0,0,0,8,32,16,5.5,3,0,12,0,16,0,5,2.5,28,8,28,9,8,0,16,23,40,0,8,0,32,8,0,0,0,18.5,72,0,2.5,8,8,32,21,0,16,0,123,0,0,0,56,0,0,8,0,16,0,0,0,8,0,0,18.5,8,0,0,0,21.5,15,8,8,0,4,0,8,0,0,0,0,24,18,0,0,1.5,0,0,4,0,0,8,0,0,47,8,0,8,0,0,21.5,32.5,16,5,13,11,32,0,8,0,16,0,0,0,0,0,8,20,0,0,0,16,0,0,8,0,8,17,8,21,0,0,0,0,8,8,0,14,0,12.5,0,0,0,8,0,0,0,20,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,7.5,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"剩余调休":{"type":"num","data":[0,33.5,1.5,1.5,49,100.5,19,8.5,41.42,2.5,4,0,19,11.5,48,95,95,79.5,5.5,12,1.5,12,0,57.5,30.5,3.5,25.35,0.0300000000000011,16,1,0,49,0,0,90,72.5,20,4,0,4.5,3.5,8,31,22,57.75,29.5,20,26,64,4.5,52,7,44.5,2.5,0,29.5,34,36,16,11.25,66,111.5,29,48,81,25,48.5,6.27,0,46.58,0,0,0,92,0,33,34,2,0,0,37,10,0,14,17,16,0,0,0,0,15.5,0,16,12,0,4,8,0,0,0,8,0,0,0,0,0,0,19,41,4,0,0,0,1,1,0,0,0,0,96,8,0,0,0,0,0,0,48,0,0,6,20,21,8,0,0,0,0,0,17.5,20,16,0,19.5,0,0,0,0,0,0,16,8,0,5,0,0,0,0,0,0,0,15,8.5,0,5.5,0,0,0,8,0,4,0,2,21.5,1,0,0,6,0,0,0,0,0,0,0,0,12,0,0,32,19.5,8,0,0,12,5,0,0,0,0,0,80,22.5,0,0,8,4,0,0,16,0,8.5,0,0,8,0,0,8,0,0,0,0,0,38,56,19,0,28,0,16,30,24,0,20,22.5,0,0,15.5,42.5,55.5,0,15,48.33,0,40,14.5,0,19,15,0,0,9,0,40.5,83.5,10,0,0,0,0,0,0,0,18,0,0,0,0,40,2.5,4,0,0,48.5,3,0,0,0,0,28.25,9.75,37.5,14,0,5.5,0,0,87.5,0,0,0,23,1.5,0,0,3,30.5,0,4,1,53,-0.5,12,339.9,0,0,null,0,49.5,0,10.5,0,0,0,0,8,2,0.5,16,25,10,0,7.5,0,0,0,0,4,16,0,0.5,0,0,0,16,4,51,0.5,0,0,0,0,0,9.5,0,0,0,33,26,0,28.5,8,0,0,0,0,0,0,0,0,3.5,8.5,0,0,8.5,0,34,26,0,8,20,8,18,0,34,17,0,0,0,5,0,6,0,17.5,0,0,0,0,0,0,3,0,16,4.5,1,0,4,0,0,0,1,0.5,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,34,0,0.5,0,0,13.5,0,0,0,0,7.5,0,0,24,0,40,0,16,0,0,8,0,26.5,16,0,0,0,44,0,24,0,0,0,0,42.5,8,8,0,0,0,0,0,0,8,0,0,0,0,0,0,19.5,19,0,0,0,0,8,0,0,5,0,0,8,0,0,11,22.5,5.5,0,8,0,0,4,0,0,0,0,0,0,8,0,0,0,0,0,0,16,8,0,0,0,0,15,8,27,16,0,16,0,16,30,0,0,0,19.5,0,0,0,0,0,0,0,3,0,0,23.5,0,0,0,0,0,3.5,0,0,0,1,0,0,0,0,0,24,0,0,0,0,8,0,0,0,13,0,0,0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,8,0,0,4,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"累计计薪加班/h":{"type":"num","data":[0,29,17,15.5,0,0,0,0,5,0,0,0,0,0,0,15,0,0,12.5,0,27.5,0,63.5,0,0,0,0,0,37,0,0,56,0,16,41.5,4,137,77.5,0,40,108,0,17,40,0,0,24,14.5,46.5,0,0,0,0,120.5,83.5,0,0,32.5,0,242,0,0,49.5,0,8,0,41,180.5,224,0,247,0,58.5,43,58.5,177.5,0,16,0,10.5,0,0,24,0,0,0,0,0,160,0,0,0,0,0,0,0,0,0,32,16,0,0,0,216,165,16,8,216,152,234,24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,8,16,312,152,184,216,304,0,0,0,0,0,0,0,0,0,172,0,152,128,32,56,21,0,0,0,0,0,0,80,32,208,168,0,0,0,0,0,0,0,0,0,0,0,0,24,1.5,0,0,0,0,0,0,0,42,0,0,0,8,0,0,9.5,0,0,0,0,200,0,0,112,28,0,12,0,0,0,8,0,0,0,0,0,0,0,0,52,0,0,24,0,0,198.5,8,0,24,0,0,0,0,0,0,130.5,34,0,177.5,91.5,0,22,0,0,0,0,103,0,192,0,0,108,0,19,0,98.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,61,0,0,0,0,0,68,0,7,0,0,0,0,0,0,0,236,0,111,0,0,0,0,0,0,0,0,0,0,32,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,24,0,0,0,0,0,40,0,152.5,0,32,45,0,0,28,0,0,0,0,0,0,115,128,0,0,0,0,48,0,0,0,0,0,0,0,0,0,0,0,16,0,0,8,13,0,0,0,24,54,0,63.5,0,16,0,0,14,66,0,0,19,0,0,207,0,0,0,0,0,0,0,0,0,0,0,0,0,19.5,0,0,0,105,0,0,0,0,0,85,40,0,0,55.5,0,0,0,0,0,0,0,8,53,0,0,0,0,0,0,0,0,5,0,0,0,0,4,16,8,0,0,0,8,32.5,0,39.5,0,24,0,0,0,0,0,0,0,24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,5.5,0,0,0,72,24,0,0,68,0,0,0,0,0,47.5,0,0,0,0,0,0,12,0,0,0,0,0,3,0,0,27.5,0,0,44.5,58,0,0,0,0,40.5,0,0,0,0,9.5,0,8,16,63.5,55.5,3.5,0,40,0,15,0,0,0,0,0,0,0,0,0,5,0,0,0,39,0,0,0,0,0,0,0,0,0,0,0,16,0,0,0,0,47,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"25年总请假_累计\n事假":{"type":"num","data":[0,0,0.5,50.5,0,0,31.5,37.5,0,33,0,16.5,0,0,0,0,0,152,37,20.5,37.5,0,7,4.5,0,42.5,0,54.23,8,24,0,0,44,0,0,0,0,0,0,0,4.5,90.5,3,0,18.5,0,5,0,0,146.5,0,19,0,1,12.5,1,21,0,29.5,0,0,0,0,0,0,0,0,9,0,16,0,0,42.5,0,26.5,0,0,0,3.5,39.5,0,0,0,0,4,0,8,0,0,0,0,0,0.83,1,43,1,0,24.5,8,27,14,0,32,0,0,0,0,0,0,0,0,19.52,0,26,0,1,0,0,296,32,0,0,8,0,0,0,0,0,0,16,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,21,0,5,0,64,0,0,8,0,1,8,0,28,0,24,0,0,0,0,0,0,0,24,0,0,8,0,0,6,16,0,0,0,72,0,0,61.5,0,0,10.5,8,40,0,0,0,12,76,0,24,0,3,9,0,0,8,5,0,0,0,0,8,0,0,16,2,3,9.5,49.5,20,16,74,20,0,120,0.5,0,16,18.5,0,0,0,0,0,0,4,0,20.5,5,0,0,17,0,0,0,0,18.5,1,0,8,0,110.5,0,29.5,8,0,16,0,0,8,0,0,56,24,16,80,0,0,1.5,5,0,109,0,14,0,8,4,0,36,8,0,0,96.5,153,73,0,0,0,0,2,0,48,25,0,0,0,80,1,0,12,20,4.5,24,7,117.5,4,0,0,0,0,23,0,5.5,17,0,1,0,36,0,59.5,16,3,0,8,6.5,0,10.5,0,55,3,18,0,0,0,0,0,0,0,0,1,0,11.5,0,0,0,8,0,0,71,37.5,8,0,48,0,0,0,6.5,0,4,8,0,4,0,204,27.75,16,0,4,0,0,0,0,32,0,37,0,8,2.5,1,16,0,2,2,12,0,0,2.5,0,0,0,52,0,0,28,16.5,0,0,10,48,34,61,2,5,22,0,0,23,1,16.5,104,26,0,0,0,9,1,0,1,0,15,53,60,8,20,0,80,0,1,93.47,0,16,0,0,0,267,30,3,5,0,0,0,8,0,6,0,8,19.5,0,95.5,0,0,0,9.5,0,0,4,20,0,1,0,0,2.5,5,0,25,0,0,8,21,0,0,13,1,0,0,8,5.5,11,0,0,0,5,0,16,6.5,5,0,49,5.5,0,2,8,0.5,0,0,0,0,16,16,24,0,0,0,8,0,0,8,0,0,0,0,1,0.5,0,8,0,0,2,0,0,0,8,0,0,0,17.5,0,0,1,3,8,10.5,0,0,16,12,0,0,0,0,0,0,0,0,0,7,8,1,5,0,0,0,10.5,5.5,0,8,14,8,0,0,10.5,0,1,0,0,0,0,0,0,18,0,8,8,0,0,0,24,0,8,0,0,0,0,0,8,5,0,0,3,0,0,0,8,0,4,0,8,0,0,0,0,12,0,0,0,0,0,8,0,22,0,0,0,0,0,0,0,0]},"累计\n病假":{"type":"num","data":[0,0,1,0,0,0,0.5,8.5,0,2,3,4,0,0,0,3.5,2,0,3.5,0,10,0,0,2.5,0,0.5,0,2,1.5,1,7,2,0,0,0,0,0,0,0,0,1,1,1,0,0,2,0,0,0,0,9,2,0.5,1,8,0,13,0,0,0,0,3,3,1,0,2,0,0,0,0,0,0,0,3,1.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,34,0,0,5.5,0,0,0,2.5,0,0,0,0,0,7,0,1,0,0,0,0,0,0,0,0,0,0,5,0,0,1.5,0,0,1,0,0,0,0,0,0,0,0,0,26,0,0,0,0,0,0,0,0,0,0,0,2,0,0,1,0,0,0,0,0,2,9,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0.5,0,0,0,9.5,0,0,1,0,0,0,3,12.5,0,0,0,0,12,0,0,0,2,11,2.5,0,0,0,0,0,0,1,0,0,0,0,0,0,0,33.5,0,0,0,1,0,0,0,6,0,0,6,0,0,0,0,0,0,0,0,0,0,10,1.5,0,0,0,0,0,9,0,0,0,3,0,0,0,0,0,0,0,0.5,0,0,1.5,0,0,0,0,0,0,0.5,0,0,0,0,0,0,0,0,0,0,0,0,0.5,2,1,0,0,0,0,0,6,0,1,10,0,0,0,0,0,0,0,0,0,6,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,1,0,0,0,0,5,0,0,0,3,3.5,24,1,0,0,0,0,0,1,1,0,0,2,0,0,0,0,0,0,3,0,0,0,0,0,0,0,0,0.5,0,0,0,0,0,0,0,0,0,0,0,3.5,0,0,0.5,3,0,0,0,0,0,0,0,3,0.5,0,0,0,6,0,0,0,34,0,1,0,0,0.5,0,0,0,0,0,0,0,0,0,1,0,2,0,0,1,0,0,0,0,0,0,0.5,0,1,1,0,0,0,0,0,0,4,0,0,0,0,0,0.5,0,0,0,0,0,0,3,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.5,0.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"累计\n其他":{"type":"num","data":[0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,9,66,0,1.5,0,18,0,3,0,8,0,0,0,0,4,0,0,0,3,3,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,23.5,0,0,0,0,8,1,0,0,5,0,0,0,0,0,0,0,0,2,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,8,0,0,0,4,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,12.5,0,0,0,0,0,0,0,2,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0.5,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,2,2.5,0,0,0,0,0,0,0,2,0,3,0,0,0,0,0,2,0,0,0,0,8,0,0,0,0,0,0,0,0,8,2,0,0,0,0,2,3,0,0,10,0,0,0,0,0,6.5,0,8,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,0,0,0,0,0,1,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,10,0,0,0,10,0,0,0,0,0,0,0,0,10,0,0,0,0,0,0,0,0,0,0,0,0,0,1.5,0,0,0,0,0,0,0,0,0,0,10,0,0,0,2,0,0,0,0,0,0,1,3,0,0,0,0,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"累计\n育儿假":{"type":"num","data":[0,0,0,6,0,0,0,0,4,0,0,0,0,0,0,0,5,5,0,1.5,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,4.5,0,0,0,2.5,0,0,0,0,0,0,0,4.5,0,0,0,0,0,0,0,0,4,0,0,0,1,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,5,0,4,0,0,4,0,0,0,0,0,0,0,5,0,0,0,0,2,0,0,0,0,8,0,0,0,7,0,0,0,0,0,0,0,0,0,0,5,0,0,0,5,0,0,0,0,0,0,0,2.5,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,6,0,0,0,0,0,0,3.5,null,0,0,0,0,0,9.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3.5,0,0,0,0,0,0,0,0,0,0,0,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,4,0,3,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,5.5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]},"":{"type":"num","data":[46023,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null]}}}
\ No newline at end of file
@@ -1,20 +1,15 @@
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useEffect, type ButtonHTMLAttributes, type InputHTMLAttributes, type ReactNode } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
   Search,
   Filter,
   Columns,
   Download,
-  ChevronLeft,
-  ChevronRight,
   X,
 } from 'lucide-react';
 import {
   useReactTable,
   getCoreRowModel,
-  getPaginationRowModel,
-  getSortedRowModel,
-  getFilteredRowModel,
   flexRender,
   createColumnHelper,
   type SortingState,
@@ -23,11 +18,14 @@ import {
 } from '@tanstack/react-table';
 import { cn } from './lib/utils';
 import { MultiSelect } from './components/ui/MultiSelect';
+import type { HRQuery, HRRecord } from './lib/hrdata';
+import { useHRData } from './lib/useHRData';
+import { useVirtualRows } from './lib/useVirtualRows';
 
-// Types
-// @ts-ignore
-const hrDataRaw = window.hrData || { data: [], meta: { columns: [] } };
-type HRData = typeof hrDataRaw.data[0];
+// Data: loaded, searched, filtered and sorted in a Web Worker (lib/hrdata.worker.ts).
+// The table only holds the rows currently scrolled into view.
+const TABLE_COLUMNS = ['序号_', '姓名_', '部门_', '岗位_', '区域_', '组别_', '入职日期_'];
+const ROW_HEIGHT = 48;
 
 // Excel Date Converter
 const excelDateToJSDate = (serial: number | string) => {
@@ -38,17 +36,22 @@ const excelDateToJSDate = (serial: number | string) => {
   return date_info.toLocaleDateString('zh-CN');
 };
 
-const columnHelper = createColumnHelper<HRData>();
+const columnHelper = createColumnHelper<HRRecord>();
 
 // UI Components
-const Button = ({ className, variant = 'primary', size = 'md', ...props }: any) => {
-  const variants: any = {
+type ButtonProps = ButtonHTMLAttributes<HTMLButtonElement> & {
+  variant?: 'primary' | 'secondary' | 'ghost' | 'outline';
+  size?: 'sm' | 'md' | 'lg' | 'icon';
+};
+
+const Button = ({ className, variant = 'primary', size = 'md', ...props }: ButtonProps) => {
+  const variants = {
     primary: 'bg-indigo-600 text-white hover:bg-indigo-700 shadow-sm',
     secondary: 'bg-white text-gray-700 border border-gray-300 hover:bg-gray-50 shadow-sm',
     ghost: 'text-gray-600 hover:bg-gray-100',
     outline: 'border border-gray-300 text-gray-700 hover:bg-gray-50'
   };
-  const sizes: any = {
+  const sizes = {
     sm: 'px-3 py-1.5 text-xs',
     md: 'px-4 py-2 text-sm',
     lg: 'px-6 py-3 text-base',
@@ -67,7 +70,7 @@ const Button = ({ className, variant = 'primary', size = 'md', ...props }: any)
   );
 };
 
-const Input = ({ className, ...props }: any) => (
+const Input = ({ className, ...props }: InputHTMLAttributes<HTMLInputElement>) => (
   <input
     className={cn(
       "flex h-10 w-full rounded-lg border border-gray-300 bg-white px-3 py-2 text-sm placeholder:text-gray-400 focus:outline-none focus:ring-2 focus:ring-indigo-500 focus:border-transparent disabled:cursor-not-allowed disabled:opacity-50 transition-all",
@@ -77,8 +80,13 @@ const Input = ({ className, ...props }: any) => (
   />
 );
 
-const Badge = ({ children, variant = 'default' }: any) => {
-  const variants: any = {
+type BadgeProps = {
+  children: ReactNode;
+  variant?: 'default' | 'success' | 'warning' | 'danger' | 'indigo';
+};
+
+const Badge = ({ children, variant = 'default' }: BadgeProps) => {
+  const variants = {
     default: 'bg-gray-100 text-gray-800',
     success: 'bg-green-100 text-green-800',
     warning: 'bg-yellow-100 text-yellow-800',
@@ -104,34 +112,37 @@ function App() {
   const columns = useMemo(() => {
     // Basic Fixed Columns
     const baseCols = [
-      columnHelper.accessor('序号_', {
+      columnHelper.accessor(row => row['序号_'], {
+        id: '序号_',
         header: 'ID',
         cell: info => <span className="text-gray-500 font-mono text-xs">#{info.getValue()}</span>,
         size: 60,
       }),
-      columnHelper.accessor('姓名_', {
+      columnHelper.accessor(row => row['姓名_'], {
+        id: '姓名_',
         header: '姓名',
         cell: info => <span className="font-semibold text-gray-900">{info.getValue() as string}</span>,
       }),
-      columnHelper.accessor('部门_', {
+      columnHelper.accessor(row => row['部门_'], {
+        id: '部门_',
         header: '部门',
         cell: info => <Badge variant="indigo">{info.getValue() as string}</Badge>,
-        filterFn: 'arrIncludes',
       }),
-      columnHelper.accessor('岗位_', {
+      columnHelper.accessor(row => row['岗位_'], {
+        id: '岗位_',
         header: '岗位',
         cell: info => <span className="text-gray-600">{info.getValue() as string}</span>,
-        filterFn: 'arrIncludes',
       }),
-      columnHelper.accessor('区域_', {
+      columnHelper.accessor(row => row['区域_'], {
+        id: '区域_',
         header: '区域',
-        filterFn: 'arrIncludes',
       }),
-      columnHelper.accessor('组别_', {
+      columnHelper.accessor(row => row['组别_'], {
+        id: '组别_',
         header: '组别',
-        filterFn: 'arrIncludes',
       }),
-      columnHelper.accessor('入职日期_', {
+      columnHelper.accessor(row => row['入职日期_'], {
+        id: '入职日期_',
         header: '入职日期',
         cell: info => <span className="text-gray-500">{excelDateToJSDate(info.getValue() as number)}</span>,
       }),
@@ -140,24 +151,24 @@ function App() {
     return baseCols;
   }, []);
 
-  // Default Visibility: Hide most columns except key ones
-  useState(() => {
-    // No-op for now, just to match original structure I want to replace
-  });
+  // Search, filters and sorting are applied by the worker
+  const query = useMemo<HRQuery>(() => ({
+    search: globalFilter,
+    filters: Object.fromEntries(columnFilters.map(filter => [filter.id, filter.value as string[]])),
+    sorting: sorting.map(({ id, desc }) => ({ id, desc })),
+  }), [globalFilter, columnFilters, sorting]);
 
-  // Set initial visibility state logic
-  const initialVisibility = useMemo(() => {
-    const vis: VisibilityState = {};
-    hrDataRaw.meta.columns.forEach((col: string) => {
-      const isDefault = ['序号_', '姓名_', '部门_', '岗位_', '入职日期_', '区域_', '组别_', '剩余年假', '剩余调休'].includes(col);
-      vis[col] = isDefault;
-    });
-    return vis;
-  }, []);
+  const virtual = useVirtualRows(ROW_HEIGHT);
+  const { info, result, rows, error } = useHRData(TABLE_COLUMNS, query, { start: virtual.start, end: virtual.end });
+  const rowCount = result?.count ?? 0;
+  const layout = virtual.layout(rowCount);
+  const { scrollToTop } = virtual;
+
+  useEffect(() => scrollToTop(), [query, scrollToTop]);
 
   // Create Table Instance
   const table = useReactTable({
-    data: hrDataRaw.data,
+    data: rows,
     columns,
     state: {
       sorting,
@@ -165,55 +176,32 @@ function App() {
       globalFilter,
       columnVisibility,
     },
-    initialState: {
-      columnVisibility: initialVisibility
-    },
     onSortingChange: setSorting,
     onColumnFiltersChange: setColumnFilters,
     onGlobalFilterChange: setGlobalFilter,
     onColumnVisibilityChange: setColumnVisibility,
     getCoreRowModel: getCoreRowModel(),
-    getPaginationRowModel: getPaginationRowModel(),
-    getSortedRowModel: getSortedRowModel(),
-    getFilteredRowModel: getFilteredRowModel(),
-    // Global filter function
-    globalFilterFn: (row, columnId, filterValue) => {
-      const value = row.getValue(columnId);
-      return String(value).toLowerCase().includes(String(filterValue).toLowerCase());
-    },
-    filterFns: {
-      arrIncludes: (row, columnId, filterValue) => {
-        const cellValue = String(row.getValue(columnId));
-        if (!filterValue || filterValue.length === 0) return true;
-        return filterValue.includes(cellValue);
-      }
-    }
+    manualFiltering: true,
+    manualSorting: true,
   });
 
-  // Calculate Stats
-  const stats = useMemo(() => {
-    const totalEmployees = hrDataRaw.data.length;
-    const depts = new Set(hrDataRaw.data.map((d: any) => d['部门_'])).size;
-    const areas = new Set(hrDataRaw.data.map((d: any) => d['区域_'])).size;
-    const groups = new Set(hrDataRaw.data.map((d: any) => d['组别_'])).size;
-    const positions = new Set(hrDataRaw.data.map((d: any) => d['岗位_'])).size;
-    return { totalEmployees, depts, areas, groups, positions };
-  }, []);
+  // Filter options come precomputed with the data; department/area counts follow the current result
+  const countPresent = (counts?: number[]) => counts?.filter(Boolean).length ?? 0;
+  const stats = {
+    totalEmployees: info?.rowCount ?? 0,
+    matching: rowCount,
+    depts: countPresent(result?.facetCounts.departments),
+    areas: countPresent(result?.facetCounts.areas),
+  };
 
   const [showFilters, setShowFilters] = useState(false);
 
-  const facets = useMemo(() => {
-    const data = hrDataRaw.data;
-    const getOptions = (key: string) =>
-      Array.from(new Set(data.map((d: any) => d[key]))).filter(Boolean).sort() as string[];
-
-    return {
-      departments: getOptions('部门_'),
-      positions: getOptions('岗位_'),
-      areas: getOptions('区域_'),
-      groups: getOptions('组别_'),
-    };
-  }, []);
+  const facets = {
+    departments: info?.facets.departments.values ?? [],
+    positions: info?.facets.positions.values ?? [],
+    areas: info?.facets.areas.values ?? [],
+    groups: info?.facets.groups.values ?? [],
+  };
 
   // Helper to update column filter
   const setColumnFilter = (columnId: string, value: string[]) => {
@@ -239,7 +227,7 @@ function App() {
           </div>
           <div className="flex items-center gap-4">
             <div className="text-sm text-gray-500">
-              Generated: {new Date(hrDataRaw.meta.generatedAt).toLocaleDateString()}
+              {info ? `Generated: ${new Date(info.meta.generatedAt).toLocaleDateString()}` : 'Loading data...'}
             </div>
             <Button variant="outline" size="sm" className="gap-2">
               <Download className="w-4 h-4" /> Export
@@ -258,6 +246,9 @@ function App() {
           >
             <h3 className="text-sm font-medium text-gray-500 uppercase tracking-wider">Total Employees</h3>
             <div className="mt-2 text-3xl font-bold text-gray-900">{stats.totalEmployees}</div>
+            {result && stats.matching !== stats.totalEmployees && (
+              <div className="mt-1 text-sm text-indigo-600">{stats.matching} matching</div>
+            )}
           </motion.div>
           <motion.div
             initial={{ opacity: 0, y: 20 }}
@@ -286,7 +277,7 @@ function App() {
             <Input
               placeholder="Search employees..."
               value={globalFilter ?? ''}
-              onChange={(e: any) => setGlobalFilter(e.target.value)}
+              onChange={e => setGlobalFilter(e.target.value)}
               className="pl-9"
             />
           </div>
@@ -370,9 +361,9 @@ function App() {
 
         {/* Data Table */}
         <div className="bg-white rounded-xl shadow-sm border border-gray-200 overflow-hidden">
-          <div className="overflow-x-auto">
+          <div ref={virtual.containerRef} onScroll={virtual.onScroll} className="overflow-auto max-h-[70vh]">
             <table className="w-full text-sm text-left">
-              <thead className="bg-gray-50 border-b border-gray-200">
+              <thead className="sticky top-0 z-10 bg-gray-50 border-b border-gray-200">
                 {table.getHeaderGroups().map(headerGroup => (
                   <tr key={headerGroup.id}>
                     {headerGroup.headers.map(header => (
@@ -394,26 +385,28 @@ function App() {
                 ))}
               </thead>
               <tbody className="divide-y divide-gray-100">
-                {table.getRowModel().rows.length ? (
-                  table.getRowModel().rows.map((row, i) => (
-                    <motion.tr
-                      initial={{ opacity: 0, y: 5 }}
-                      animate={{ opacity: 1, y: 0 }}
-                      transition={{ delay: i * 0.02 }}
-                      key={row.id}
-                      className="hover:bg-gray-50/80 transition-colors"
-                    >
-                      {row.getVisibleCells().map(cell => (
-                        <td key={cell.id} className="px-6 py-3 whitespace-nowrap text-gray-600">
-                          {flexRender(cell.column.columnDef.cell, cell.getContext())}
-                        </td>
-                      ))}
-                    </motion.tr>
-                  ))
+                {rowCount ? (
+                  <>
+                    {layout.paddingTop > 0 && <tr style={{ height: layout.paddingTop }} />}
+                    {table.getRowModel().rows.map(row => (
+                      <tr key={layout.start + row.index} style={{ height: ROW_HEIGHT }} className="hover:bg-gray-50/80 transition-colors">
+                        {row.getVisibleCells().map(cell => (
+                          <td key={cell.id} className="px-6 py-3 whitespace-nowrap text-gray-600">
+                            {flexRender(cell.column.columnDef.cell, cell.getContext())}
+                          </td>
+                        ))}
+                      </tr>
+                    ))}
+                    {/* Rows the worker has not sent yet keep their place until they arrive */}
+                    {layout.end - layout.start > rows.length && (
+                      <tr style={{ height: (layout.end - layout.start - rows.length) * ROW_HEIGHT }} />
+                    )}
+                    {layout.paddingBottom > 0 && <tr style={{ height: layout.paddingBottom }} />}
+                  </>
                 ) : (
                   <tr>
                     <td colSpan={columns.length} className="px-6 py-12 text-center text-gray-500">
-                      No results found.
+                      {error ? `Failed to load data: ${error}` : result ? 'No results found.' : 'Loading data...'}
                     </td>
                   </tr>
                 )}
@@ -421,28 +414,10 @@ function App() {
             </table>
           </div>
 
-          {/* Pagination */}
+          {/* Visible range */}
           <div className="px-6 py-4 border-t border-gray-200 flex items-center justify-between">
             <div className="text-sm text-gray-500">
-              Showing {table.getState().pagination.pageIndex * table.getState().pagination.pageSize + 1} to {Math.min((table.getState().pagination.pageIndex + 1) * table.getState().pagination.pageSize, hrDataRaw.data.length)} of {hrDataRaw.data.length} results
-            </div>
-            <div className="flex items-center gap-2">
-              <Button
-                variant="secondary"
-                size="sm"
-                onClick={() => table.previousPage()}
-                disabled={!table.getCanPreviousPage()}
-              >
-                <ChevronLeft className="w-4 h-4" /> Previous
-              </Button>
-              <Button
-                variant="secondary"
-                size="sm"
-                onClick={() => table.nextPage()}
-                disabled={!table.getCanNextPage()}
-              >
-                Next <ChevronRight className="w-4 h-4" />
-              </Button>
+              Showing {rowCount ? layout.firstVisible + 1 : 0} to {layout.lastVisible} of {rowCount} results
             </div>
           </div>
         </div>
@@ -0,0 +1,154 @@
+// HR data loader
+//
+// The payload (public/hrdata.json, or window.hrData from public/hrdata.js) is produced by
+// pyexcel/export_hrdata.py and decoded inside hrdata.worker.ts. The columnar format stores
+// one array per column (numbers decoded into a Float64Array, department/group/area/
+// position as integer codes into a value list) plus precomputed facets, so the table
+// reads cells by row index instead of holding one object per employee.
+// The older row format ({ meta, data: [...] }) from converter.html is still accepted.
+
+export type CellValue = string | number | boolean;
+export type HRRecord = Record<string, CellValue>;
+export type ColumnReader = (row: number) => CellValue;
+
+export interface Facet {
+  column: string;
+  values: string[];
+  counts: number[];
+}
+
+export type FacetKey = 'departments' | 'groups' | 'areas' | 'positions';
+
+export interface HRDataset {
+  meta: {
+    generatedAt: string;
+    totalRecords: number;
+    columns: string[];
+  };
+  rowCount: number;
+  // Row indexes, used as the table data
+  rows: number[];
+  facets: Record<FacetKey, Facet>;
+  column: (name: string) => ColumnReader;
+}
+
+type ColumnPayload =
+  | { type: 'num'; data: (number | null)[] }
+  | { type: 'dict'; values: CellValue[]; codes: number[] }
+  | { type: 'str'; data: (CellValue | null)[] };
+
+interface ColumnarPayload {
+  format: 'columnar';
+  version: number;
+  meta: HRDataset['meta'] & { facets: Record<FacetKey, Facet> };
+  columns: Record<string, ColumnPayload>;
+}
+
+interface RowsPayload {
+  meta: HRDataset['meta'];
+  data: HRRecord[];
+}
+
+const FACET_COLUMNS: Record<FacetKey, string> = {
+  departments: '部门_',
+  groups: '组别_',
+  areas: '区域_',
+  positions: '岗位_',
+};
+
+const emptyColumn: ColumnReader = () => '';
+
+const range = (length: number) => Array.from({ length }, (_, i) => i);
+
+const decodeColumn = (column: ColumnPayload): ColumnReader => {
+  switch (column.type) {
+    case 'num': {
+      const values = Float64Array.from(column.data, v => (v === null ? NaN : v));
+      return row => {
+        const value = values[row];
+        return Number.isNaN(value) ? '' : value;
+      };
+    }
+    case 'dict': {
+      const codes = column.values.length <= 0xffff ? Uint16Array.from(column.codes) : Uint32Array.from(column.codes);
+      const values = column.values;
+      return row => values[codes[row]];
+    }
+    default: {
+      const data = column.data;
+      return row => data[row] ?? '';
+    }
+  }
+};
+
+const loadColumnar = (payload: ColumnarPayload): HRDataset => {
+  const readers = new Map<string, ColumnReader>();
+  for (const [name, column] of Object.entries(payload.columns)) {
+    readers.set(name, decodeColumn(column));
+  }
+  const { facets, ...meta } = payload.meta;
+  return {
+    meta,
+    rowCount: meta.totalRecords,
+    rows: range(meta.totalRecords),
+    facets,
+    column: name => readers.get(name) ?? emptyColumn,
+  };
+};
+
+const countFacet = (data: HRRecord[], column: string): Facet => {
+  const counts = new Map<string, number>();
+  for (const record of data) {
+    const value = record[column];
+    if (!value) continue;
+    counts.set(String(value), (counts.get(String(value)) ?? 0) + 1);
+  }
+  const values = Array.from(counts.keys()).sort();
+  return { column, values, counts: values.map(value => counts.get(value)!) };
+};
+
+const loadRows = (payload: RowsPayload): HRDataset => {
+  const data = payload.data;
+  const facets = Object.fromEntries(
+    Object.entries(FACET_COLUMNS).map(([key, column]) => [key, countFacet(data, column)])
+  ) as Record<FacetKey, Facet>;
+  return {
+    meta: payload.meta,
+    rowCount: data.length,
+    rows: range(data.length),
+    facets,
+    column: name => row => data[row][name] ?? '',
+  };
+};
+
+export const loadHRData = (raw: unknown): HRDataset => {
+  if (raw && (raw as ColumnarPayload).format === 'columnar') {
+    return loadColumnar(raw as ColumnarPayload);
+  }
+  const payload = (raw as RowsPayload | undefined) ?? { data: [], meta: { generatedAt: '', totalRecords: 0, columns: [] } };
+  return loadRows({ meta: payload.meta, data: payload.data ?? [] });
+};
+
+// Messages between the page (useHRData) and hrdata.worker.ts
+
+export interface HRQuery {
+  search: string;
+  // Column id -> selected values; empty lists are ignored
+  filters: Record<string, string[]>;
+  sorting: { id: string; desc: boolean }[];
+}
+
+export type WorkerRequest =
+  // Fetch url, or use data when the page had to load it itself
+  | { type: 'load'; url: string; columns: string[]; data?: unknown }
+  | { type: 'query'; id: number; query: HRQuery }
+  // Rows [start, end) of the result of query id
+  | { type: 'rows'; id: number; start: number; end: number };
+
+export type WorkerResponse =
+  | { type: 'ready'; meta: HRDataset['meta']; rowCount: number; facets: Record<FacetKey, Facet> }
+  // fetch() failed, e.g. the page was opened from file://
+  | { type: 'unavailable' }
+  | { type: 'result'; id: number; count: number; facetCounts: Record<FacetKey, number[]> }
+  | { type: 'rows'; id: number; start: number; rows: HRRecord[] }
+  | { type: 'error'; message: string };
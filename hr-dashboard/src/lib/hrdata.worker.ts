@@ -0,0 +1,150 @@
+// HR data worker
+//
+// Loads and decodes the dataset off the main thread and answers table queries: global
+// search on a prebuilt lowercase index, facet filters, sorting and per-facet counts of the
+// matching rows. The page only receives the rows it is about to render.
+
+import {
+  loadHRData,
+  type CellValue,
+  type FacetKey,
+  type HRDataset,
+  type HRQuery,
+  type HRRecord,
+  type WorkerRequest,
+  type WorkerResponse,
+} from './hrdata';
+
+const ctx = self as unknown as {
+  postMessage: (message: WorkerResponse) => void;
+  onmessage: ((event: MessageEvent<WorkerRequest>) => void) | null;
+};
+
+let dataset: HRDataset | null = null;
+// Table columns, in the order rows are sent back
+let columns: string[] = [];
+// One lowercase string per row: the table columns joined by '\n', which a search box can't contain
+let searchIndex: string[] = [];
+// Row order for each sorting, reused while the search text and filters change
+const orderCache = new Map<string, Int32Array>();
+const ORDER_CACHE_SIZE = 16;
+// Matching rows of the latest query, in display order
+let current = { id: 0, rows: new Int32Array(0) };
+
+const collator = new Intl.Collator('zh-CN', { numeric: true });
+
+const compareValues = (a: CellValue, b: CellValue) => {
+  if (typeof a === 'number' && typeof b === 'number') return a - b;
+  if (typeof a === 'number') return -1;
+  if (typeof b === 'number') return 1;
+  return collator.compare(String(a), String(b));
+};
+
+const buildSearchIndex = (data: HRDataset) => {
+  const readers = columns.map(name => data.column(name));
+  return data.rows.map(row => readers.map(read => String(read(row)).toLowerCase()).join('\n'));
+};
+
+const rowOrder = (data: HRDataset, sorting: HRQuery['sorting']) => {
+  const key = JSON.stringify(sorting);
+  let order = orderCache.get(key);
+  if (order) return order;
+
+  order = Int32Array.from(data.rows);
+  if (sorting.length) {
+    const keys = sorting.map(({ id, desc }) => ({ values: data.rows.map(data.column(id)), sign: desc ? -1 : 1 }));
+    order.sort((a, b) => {
+      for (const { values, sign } of keys) {
+        const result = compareValues(values[a], values[b]);
+        if (result) return result * sign;
+      }
+      return a - b;
+    });
+  }
+  if (orderCache.size >= ORDER_CACHE_SIZE) orderCache.clear();
+  orderCache.set(key, order);
+  return order;
+};
+
+const runQuery = (data: HRDataset, query: HRQuery) => {
+  const order = rowOrder(data, query.sorting);
+  const needle = query.search.toLowerCase();
+  const filters = Object.entries(query.filters)
+    .filter(([, values]) => values.length)
+    .map(([id, values]) => ({ read: data.column(id), values: new Set(values) }));
+
+  const matched = new Int32Array(order.length);
+  let count = 0;
+  for (const row of order) {
+    if (needle && !searchIndex[row].includes(needle)) continue;
+    if (filters.length && !filters.every(({ read, values }) => values.has(String(read(row))))) continue;
+    matched[count++] = row;
+  }
+  return matched.slice(0, count);
+};
+
+const countFacets = (data: HRDataset, rows: Int32Array) => {
+  const facetCounts = {} as Record<FacetKey, number[]>;
+  for (const [key, facet] of Object.entries(data.facets) as [FacetKey, HRDataset['facets'][FacetKey]][]) {
+    const positions = new Map(facet.values.map((value, i) => [value, i]));
+    const read = data.column(facet.column);
+    const counts = new Array<number>(facet.values.length).fill(0);
+    for (const row of rows) {
+      const i = positions.get(String(read(row)));
+      if (i !== undefined) counts[i]++;
+    }
+    facetCounts[key] = counts;
+  }
+  return facetCounts;
+};
+
+const readRows = (data: HRDataset, start: number, end: number) => {
+  const readers = columns.map(name => [name, data.column(name)] as const);
+  const rows: HRRecord[] = [];
+  for (let i = start; i < Math.min(end, current.rows.length); i++) {
+    const row = current.rows[i];
+    const record: HRRecord = {};
+    for (const [name, read] of readers) record[name] = read(row);
+    rows.push(record);
+  }
+  return rows;
+};
+
+const load = async (request: Extract<WorkerRequest, { type: 'load' }>) => {
+  columns = request.columns;
+  let raw = request.data;
+  if (raw === undefined) {
+    try {
+      const response = await fetch(request.url);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      raw = await response.json();
+    } catch {
+      ctx.postMessage({ type: 'unavailable' });
+      return;
+    }
+  }
+  dataset = loadHRData(raw);
+  searchIndex = buildSearchIndex(dataset);
+  orderCache.clear();
+  current = { id: 0, rows: new Int32Array(0) };
+  ctx.postMessage({ type: 'ready', meta: dataset.meta, rowCount: dataset.rowCount, facets: dataset.facets });
+};
+
+ctx.onmessage = async ({ data: request }) => {
+  try {
+    if (request.type === 'load') {
+      await load(request);
+      return;
+    }
+    if (!dataset) return;
+    if (request.type === 'query') {
+      current = { id: request.id, rows: runQuery(dataset, request.query) };
+      ctx.postMessage({ type: 'result', id: request.id, count: current.rows.length, facetCounts: countFacets(dataset, current.rows) });
+    } else if (request.id === current.id) {
+      // Requests for an older query are dropped; the page asks again for the new result
+      ctx.postMessage({ type: 'rows', id: request.id, start: request.start, rows: readRows(dataset, request.start, request.end) });
+    }
+  } catch (e) {
+    ctx.postMessage({ type: 'error', message: e instanceof Error ? e.message : String(e) });
+  }
+};
@@ -0,0 +1,117 @@
+// Page side of hrdata.worker.ts
+//
+// Starts the worker, which fetches public/hrdata.json so the data is not part of the bundle.
+// Opened from file:// (where fetch is blocked) the page loads public/hrdata.js instead and
+// hands window.hrData to the worker. Each query change is sent to the worker; only the rows
+// in the visible range (plus a margin) come back.
+
+import { useEffect, useRef, useState } from 'react';
+import HRDataWorker from './hrdata.worker?worker&inline';
+import type { Facet, FacetKey, HRDataset, HRQuery, HRRecord, WorkerRequest, WorkerResponse } from './hrdata';
+
+const DATA_URL = 'hrdata.json';
+const DATA_SCRIPT = 'hrdata.js';
+// Extra rows fetched above and below the visible range, so small scrolls need no round trip
+const ROW_MARGIN = 100;
+
+export interface HRDataInfo {
+  meta: HRDataset['meta'];
+  rowCount: number;
+  facets: Record<FacetKey, Facet>;
+}
+
+export interface HRResult {
+  id: number;
+  count: number;
+  facetCounts: Record<FacetKey, number[]>;
+}
+
+interface RowBlock {
+  id: number;
+  start: number;
+  end: number;
+}
+
+const loadScript = (src: string) =>
+  new Promise<void>((resolve, reject) => {
+    const script = document.createElement('script');
+    script.src = src;
+    script.onload = () => resolve();
+    script.onerror = () => reject(new Error(`Failed to load ${src}`));
+    document.head.appendChild(script);
+  });
+
+export const useHRData = (columns: string[], query: HRQuery, range: { start: number; end: number }) => {
+  const workerRef = useRef<Worker | null>(null);
+  const queryId = useRef(0);
+  const pending = useRef<RowBlock>({ id: 0, start: 0, end: 0 });
+  const [info, setInfo] = useState<HRDataInfo | null>(null);
+  const [result, setResult] = useState<HRResult | null>(null);
+  const [block, setBlock] = useState<{ id: number; start: number; rows: HRRecord[] } | null>(null);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    const worker = new HRDataWorker();
+    const send = (request: WorkerRequest) => worker.postMessage(request);
+    workerRef.current = worker;
+
+    worker.onmessage = async ({ data: response }: MessageEvent<WorkerResponse>) => {
+      switch (response.type) {
+        case 'ready':
+          setInfo({ meta: response.meta, rowCount: response.rowCount, facets: response.facets });
+          break;
+        case 'unavailable': {
+          const page = window as unknown as { hrData?: unknown };
+          try {
+            if (page.hrData === undefined) await loadScript(DATA_SCRIPT);
+            send({ type: 'load', url: '', columns, data: page.hrData });
+            delete page.hrData;
+          } catch (e) {
+            setError(e instanceof Error ? e.message : String(e));
+          }
+          break;
+        }
+        case 'result':
+          if (response.id === queryId.current) setResult(response);
+          break;
+        case 'rows':
+          if (response.id === queryId.current) setBlock(response);
+          break;
+        case 'error':
+          setError(response.message);
+          break;
+      }
+    };
+    send({ type: 'load', url: new URL(DATA_URL, document.baseURI).href, columns });
+
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+    };
+  }, [columns]);
+
+  useEffect(() => {
+    if (!info) return;
+    queryId.current += 1;
+    workerRef.current?.postMessage({ type: 'query', id: queryId.current, query } satisfies WorkerRequest);
+  }, [info, query]);
+
+  // Ask for the visible rows of the current result unless they are loaded or on their way
+  useEffect(() => {
+    if (!result) return;
+    const end = Math.min(range.end, result.count);
+    const covers = (rows: RowBlock | null) => rows !== null && rows.id === result.id && rows.start <= range.start && rows.end >= end;
+    if (covers(block && { id: block.id, start: block.start, end: block.start + block.rows.length }) || covers(pending.current)) return;
+
+    pending.current = { id: result.id, start: Math.max(0, range.start - ROW_MARGIN), end: end + ROW_MARGIN };
+    workerRef.current?.postMessage({ type: 'rows', ...pending.current } satisfies WorkerRequest);
+  }, [result, block, range.start, range.end]);
+
+  // Loaded rows from range.start on; rows still on their way are left out
+  const rows =
+    block && result && block.id === result.id && block.start <= range.start
+      ? block.rows.slice(range.start - block.start, range.end - block.start)
+      : [];
+
+  return { info, result, rows, error };
+};
@@ -0,0 +1,46 @@
+// Fixed-height row virtualization
+//
+// Only the rows inside the scroll container's viewport (plus an overscan) are rendered;
+// spacer rows above and below keep the scrollbar at the height of the full list.
+
+import { useCallback, useEffect, useRef, useState, type UIEvent } from 'react';
+
+export const useVirtualRows = (rowHeight: number, overscan = 10) => {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(0);
+
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+    // The observer also reports the initial size right after observe()
+    const observer = new ResizeObserver(() => setViewportHeight(container.clientHeight));
+    observer.observe(container);
+    return () => observer.disconnect();
+  }, []);
+
+  const onScroll = useCallback((event: UIEvent<HTMLDivElement>) => setScrollTop(event.currentTarget.scrollTop), []);
+
+  const scrollToTop = useCallback(() => {
+    if (containerRef.current) containerRef.current.scrollTop = 0;
+    setScrollTop(0);
+  }, []);
+
+  const first = Math.floor(scrollTop / rowHeight);
+  const visible = Math.ceil(viewportHeight / rowHeight);
+  // Rendered window; the row count is applied by layout() since it is known only once a query result arrives
+  const start = Math.max(0, first - overscan);
+  const end = first + visible + overscan;
+
+  const layout = (count: number) => ({
+    start: Math.min(start, count),
+    end: Math.min(end, count),
+    // Rows actually in view, for "Showing x to y"
+    firstVisible: Math.min(first, count),
+    lastVisible: Math.min(first + visible, count),
+    paddingTop: Math.min(start, count) * rowHeight,
+    paddingBottom: (count - Math.min(end, count)) * rowHeight,
+  });
+
+  return { containerRef, onScroll, scrollToTop, start, end, layout };
+};
@@ -0,0 +1,380 @@
+"""
+审计记录（SQLite）：保存每次同步的运行信息和逐条批注操作，并生成审计报告
+
+由 sync_comments 在用到时才导入（不影响其他命令的启动时间）；
+配置项由 sync_comments.apply_config 设置，这里通过 core 读取当前值
+"""
+
+import collections
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+import sync_comments as core
+
+
+# 每个事务写入的操作数
+AUDIT_BATCH_SIZE = 1000
+# 数据库中保留的批注预览长度（完整内容只保存哈希）
+AUDIT_PREVIEW_LENGTH = 200
+
+AUDIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    parent_id TEXT,
+    mode TEXT,
+    status TEXT,
+    started TEXT,
+    finished TEXT,
+    seconds REAL,
+    source_files TEXT,
+    target_file TEXT,
+    output_file TEXT,
+    log_file TEXT,
+    updated INTEGER,
+    merged INTEGER,
+    unchanged INTEGER,
+    conflicts INTEGER,
+    changed_cells INTEGER,
+    stats TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    target_file TEXT,
+    sheet TEXT,
+    name TEXT,
+    match_key TEXT,
+    row INTEGER,
+    col TEXT,
+    cell TEXT,
+    action TEXT,
+    origin TEXT,
+    author TEXT,
+    old_hash TEXT,
+    new_hash TEXT,
+    source_hash TEXT,
+    old_preview TEXT,
+    new_preview TEXT,
+    recorded REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS idx_runs_parent ON runs(parent_id);
+CREATE INDEX IF NOT EXISTS idx_operations_run ON operations(run_id, id);
+CREATE INDEX IF NOT EXISTS idx_operations_name ON operations(name, run_id);
+"""
+
+# 查询结果转换为与操作列表相同的键，供 write_operation_details 等直接使用
+AUDIT_OPERATION_FIELDS = (
+    "run_id, target_file, sheet, name, match_key, row, col AS column, cell, action, origin, author, "
+    "old_hash, new_hash, source_hash, old_preview AS original, new_preview AS source_text, recorded"
+)
+
+
+def text_hash(text):
+    """批注内容的哈希（前 16 位），没有批注时为 None"""
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def audit_db_path():
+    return core.AUDIT_DB if os.path.isabs(core.AUDIT_DB) else os.path.join(core.SCRIPT_DIR, core.AUDIT_DB)
+
+
+class AuditStore:
+    """
+    同步操作的审计数据库（SQLite，WAL 模式）
+
+    每次运行在 runs 表中有一条记录，开始时即写入（状态为“运行中”），运行失败时记录错误；
+    每个批注操作在 operations 表中一行，按 AUDIT_BATCH_SIZE 分批在事务中写入。
+    批量模式下多个进程同时写入同一数据库，WAL 模式下读写互不阻塞，写入时等待其他进程的事务结束。
+    path 为空字符串时使用 SQLite 的临时数据库（在磁盘上，关闭连接时自动删除）。
+    """
+
+    def __init__(self, path=None):
+        import sqlite3
+
+        self.path = audit_db_path() if path is None else path
+        self.conn = sqlite3.connect(self.path, timeout=60)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(AUDIT_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def begin_run(self, mode, target_file, output_file, parent_id=None):
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.urandom(3).hex()}"
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO runs (run_id, parent_id, mode, status, started, source_files, target_file, output_file) "
+                "VALUES (?, ?, ?, '运行中', ?, ?, ?, ?)",
+                (run_id, parent_id, mode, datetime.now().isoformat(timespec='seconds'),
+                 json.dumps(core.SOURCE_FILES, ensure_ascii=False), target_file, output_file),
+            )
+        return run_id
+
+    def add_operations(self, run_id, target_file, operations):
+        """分批写入操作；operations 可以是任意可迭代对象"""
+        batch = []
+        for op in operations:
+            original, source_text = op['original'], op['source_text']
+            batch.append((
+                run_id, target_file, op['sheet'], op['name'], core.format_match_key(op['key']), op['row'],
+                op['column'], op['cell'], op['action'], op['origin'], op['author'],
+                text_hash(original), text_hash(op['text']), text_hash(source_text),
+                None if original is None else original[:AUDIT_PREVIEW_LENGTH],
+                None if source_text is None else source_text[:AUDIT_PREVIEW_LENGTH],
+                time.time(),
+            ))
+            if len(batch) >= AUDIT_BATCH_SIZE:
+                self.insert_operations(batch)
+                batch = []
+        if batch:
+            self.insert_operations(batch)
+
+    def insert_operations(self, rows):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO operations (run_id, target_file, sheet, name, match_key, row, col, cell, action, origin, "
+                "author, old_hash, new_hash, source_hash, old_preview, new_preview, recorded) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete_operations(self, run_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM operations WHERE run_id = ?", (run_id,))
+
+    def action_counts(self, run_id):
+        """一次运行（不含批量模式下的各目标文件）各工作表各操作的数目 { (工作表, 操作): 数目 }"""
+        return collections.Counter({
+            (sheet, action): count for sheet, action, count in self.conn.execute(
+                "SELECT sheet, action, COUNT(*) FROM operations WHERE run_id = ? GROUP BY sheet, action", (run_id,)
+            )
+        })
+
+    def finish_run(self, run_id, status, seconds, counts=None, changed_cells=None, stats=None, log_file=None,
+                   error=None):
+        updated, merged, unchanged, conflicts = counts or (None, None, None, None)
+        with self.conn:
+            self.conn.execute(
+                "UPDATE runs SET status = ?, finished = ?, seconds = ?, updated = ?, merged = ?, unchanged = ?, "
+                "conflicts = ?, changed_cells = ?, stats = ?, log_file = ?, error = ? WHERE run_id = ?",
+                (status, datetime.now().isoformat(timespec='seconds'), seconds, updated, merged, unchanged,
+                 conflicts, changed_cells, None if stats is None else json.dumps(stats, ensure_ascii=False),
+                 log_file, error, run_id),
+            )
+
+    def get_run(self, run_id):
+        row = self.conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def runs(self, limit=20):
+        """最近的运行记录（新的在前）"""
+        return [dict(row) for row in self.conn.execute(
+            "SELECT * FROM runs ORDER BY started DESC, rowid DESC LIMIT ?", (limit,)
+        )]
+
+    def operations(self, run_id=None, name=None, action=None, limit=None):
+        """
+        按条件查询操作记录，逐行返回 dict（不一次性读入内存）
+
+        run_id 同时匹配批量模式下该次运行的各个目标文件。
+        """
+        sql = f"SELECT {AUDIT_OPERATION_FIELDS} FROM operations"
+        conditions, params = [], []
+        if run_id:
+            conditions.append("run_id IN (SELECT run_id FROM runs WHERE run_id = ? OR parent_id = ?)")
+            params += [run_id, run_id]
+        if name:
+            conditions.append("name = ?")
+            params.append(name)
+        if action:
+            conditions.append("action = ?")
+            params.append(action)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY run_id, id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self.conn.execute(sql, params):
+            yield dict(row)
+
+
+class AuditRun:
+    """
+    一次运行的审计记录
+
+    用法：with AuditRun('同步', 目标文件, 输出文件) as audit: ... audit.record(操作块) ... audit.finish(...)
+    with 块中出错时记录为失败和错误信息，未调用 finish 时记录为完成。
+    未启用审计记录时操作写入临时数据库，只用于统计和生成本次的文字日志，退出 with 块时删除。
+    """
+
+    def __init__(self, mode, target_file, output_file, parent_id=None):
+        self.store = self.run_id = None
+        self.scratch = self.scratch_id = None
+        self.mode = mode
+        self.target_file = target_file
+        self.start = time.perf_counter()
+        self.finished = False
+        if not core.AUDIT_ENABLED:
+            return
+        try:
+            self.store = AuditStore()
+            self.run_id = self.store.begin_run(mode, target_file, output_file, parent_id)
+        except Exception as e:
+            print(f"警告: 无法写入审计数据库（{e}），本次不记录")
+            self.store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.scratch is not None:
+            self.scratch.close()
+        if self.store is None:
+            return False
+        try:
+            if exc_type is not None:
+                error = "已中断" if issubclass(exc_type, KeyboardInterrupt) else f"{exc_type.__name__}: {exc}"
+                self.store.finish_run(self.run_id, '失败', time.perf_counter() - self.start, error=error)
+            elif not self.finished:
+                self.store.finish_run(self.run_id, '完成', time.perf_counter() - self.start)
+        finally:
+            self.store.close()
+        return False
+
+    def operations_store(self):
+        """记录本次操作的 (数据库, 运行编号)"""
+        if self.store is not None:
+            return self.store, self.run_id
+        if self.scratch is None:
+            self.scratch = AuditStore('')
+            self.scratch_id = self.scratch.begin_run(self.mode, self.target_file, None)
+        return self.scratch, self.scratch_id
+
+    def record(self, operations):
+        store, run_id = self.operations_store()
+        store.add_operations(run_id, self.target_file, operations)
+
+    def discard(self):
+        """删除已写入的操作（改用其他方式重新同步之前调用）"""
+        store, run_id = self.operations_store()
+        store.delete_operations(run_id)
+
+    def action_counts(self):
+        store, run_id = self.operations_store()
+        return store.action_counts(run_id)
+
+    def finish(self, counts, changed_cells=None, stats=None, log_file=None):
+        if self.store is not None:
+            self.store.finish_run(self.run_id, '完成', time.perf_counter() - self.start, counts, changed_cells,
+                                  stats, log_file)
+            self.finished = True
+
+
+def render_audit_log(store, run_id, log_file):
+    """根据审计数据库中的记录生成一次运行的文字日志（未生成文字日志或日志已删除时使用）"""
+    run = store.get_run(run_id)
+    if run is None:
+        raise ValueError(f"审计数据库中没有运行编号 {run_id}")
+    source_files = json.loads(run['source_files'] or '[]')
+    children = [dict(row) for row in store.conn.execute(
+        "SELECT * FROM runs WHERE parent_id = ? ORDER BY target_file", (run_id,)
+    )]
+    with open(log_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 80 + "\n")
+        f.write("Excel 批注同步日志（根据审计数据库生成）\n")
+        f.write("=" * 80 + "\n\n")
+
+        f.write(f"运行编号: {run['run_id']}\n")
+        f.write(f"运行方式: {run['mode']}\n")
+        f.write(f"开始时间: {run['started']}\n")
+        f.write(f"结束时间: {run['finished'] or '-'}\n")
+        f.write(f"状态: {run['status']}\n")
+        if run['error']:
+            f.write(f"错误: {run['error']}\n")
+        f.write(f"源文件: {', '.join(source_files)}\n")
+        if run['target_file']:
+            f.write(f"目标文件: {run['target_file']}\n")
+            f.write(f"输出文件: {run['output_file']}\n")
+        f.write("\n")
+
+        for item in [run] + children:
+            if item['updated'] is None:
+                continue
+            if item is not run:
+                f.write(f"{os.path.basename(item['target_file'])}（运行编号 {item['run_id']}，{item['status']}）\n")
+            f.write(f"同步批注数: {item['updated']} 个 | 合并批注数: {item['merged']} 个 | "
+                    f"未变化数: {item['unchanged']} 个 | 冲突数: {item['conflicts']} 个\n")
+            if item['seconds'] is not None:
+                f.write(f"用时: {item['seconds']:.3f} 秒\n")
+            f.write("\n")
+
+        core.write_operation_details(f, store.operations(run_id), show_origin=len(source_files) > 1,
+                                merged_operations=store.operations(run_id, action="合并"))
+
+
+def audit_command(args):
+    """审计数据库的查询和导出命令（--audit），返回退出码"""
+    import csv
+
+    path = audit_db_path()
+    if not os.path.exists(path):
+        print(f"审计数据库不存在: {path}")
+        return 1
+    store = AuditStore(path)
+    try:
+        if args.audit == 'runs':
+            for run in store.runs(args.limit or 20):
+                counts = '' if run['updated'] is None else (
+                    f"同步 {run['updated']} | 合并 {run['merged']} | 未变化 {run['unchanged']} | 冲突 {run['conflicts']}"
+                )
+                target = os.path.basename(run['target_file'] or '')
+                parent = f" (批量 {run['parent_id']})" if run['parent_id'] else ''
+                print(f"{run['run_id']}  {run['started']}  {run['mode']}  {run['status']}  {target}{parent}  {counts}")
+                if run['error']:
+                    print(f"    错误: {run['error']}")
+        elif args.audit == 'query':
+            for op in store.operations(args.run, args.name, args.action, args.limit):
+                print(f"{op['run_id']}  [{op['action']}] {op['name']} - 列{op['column']} "
+                      f"(单元格{core.sheet_cell(op['sheet'], op['cell'])})  {os.path.basename(op['target_file'] or '')}")
+        elif args.audit == 'export':
+            output = args.audit_file or f"sync_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            operations = store.operations(args.run, args.name, args.action, args.limit)
+            count = 0
+            with open(output, 'w', encoding='utf-8-sig' if not output.endswith('.json') else 'utf-8',
+                      newline='') as f:
+                if output.endswith('.json'):
+                    # 逐行写入 JSON 数组，不把全部记录读入内存
+                    f.write("[\n")
+                    for op in operations:
+                        f.write((",\n" if count else "") + json.dumps(op, ensure_ascii=False))
+                        count += 1
+                    f.write("\n]\n")
+                else:
+                    writer = None
+                    for op in operations:
+                        if writer is None:
+                            writer = csv.DictWriter(f, fieldnames=list(op))
+                            writer.writeheader()
+                        writer.writerow(op)
+                        count += 1
+            print(f"已导出 {count} 条操作记录: {output}")
+        elif args.audit == 'log':
+            if not args.run:
+                print("请用 --run 指定运行编号（可用 --audit runs 查看）")
+                return 1
+            output = args.audit_file or f"sync_log_{args.run}.txt"
+            render_audit_log(store, args.run, output)
+            print(f"日志已保存为: {output}")
+    finally:
+        store.close()
+    return 0
@@ -0,0 +1,415 @@
+"""
+性能基准测试 - 生成模拟的 HR 源文件/目标文件，测量 sync_comments.py 各阶段的用时和内存峰值
+
+用法:
+    # 只生成测试文件
+    python benchmark.py generate --rows 10000 --cols DU --density 0.05
+
+    # 运行基准测试（每个场景在独立进程中运行），结果写入 JSON
+    python benchmark.py run --rows 1000 10000 100000 --modes patch openpyxl --output results.json
+
+    # 比较两次结果，用时或内存明显变差时以退出码 1 结束
+    python benchmark.py compare old.json new.json --threshold 0.1
+"""
+
+import os
+import sys
+import json
+import random
+import hashlib
+import platform
+import argparse
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'bench_data')
+
+REGIONS = ['厦门', '福州', '泉州', '漳州', '龙岩', '广州', '深圳', '南昌', '长泰', '石家庄']
+SURNAMES = '王李张刘陈杨黄赵吴周徐孙马朱胡郭何林罗高'
+GIVEN_NAMES = '伟芳娜敏静丽强磊军洋勇艳杰娟涛明超秀霞平刚桂英华玉兰'
+AUTHORS = ['lingshi', 'hr_xm', 'hr_fz', 'hr_qz', 'admin']
+COMMENT_TEMPLATES = ['{d}日-{h}', '{d}日-{d2}日-{h}', '年假 {h}h', '事假 {d}日', '补卡 {d}日']
+NAME_COL, REGION_COL, START_ROW = 'B', 'C', 3
+
+
+def column_letter(index):
+    """列号转列字母（1 -> A）"""
+    letters = ''
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def column_index(letters):
+    """列字母转列号（A -> 1）"""
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + ord(ch) - 64
+    return index
+
+
+def default_sync_cols(last_col):
+    """默认同步列：与示例数据相同的 DO, DP, DS, DU；列数不够时取最后四列"""
+    if column_index(last_col) >= column_index('DU'):
+        return ['DO', 'DP', 'DS', 'DU']
+    last = column_index(last_col)
+    return [column_letter(i) for i in range(max(4, last - 3), last + 1)]
+
+
+def make_names(count, rng):
+    """生成不重名的模拟姓名"""
+    names = []
+    for i in range(count):
+        given = ''.join(rng.choice(GIVEN_NAMES) for _ in range(rng.choice((1, 2))))
+        names.append(f"{rng.choice(SURNAMES)}{given}{i}")
+    return names
+
+
+def make_comment_text(rng):
+    template = rng.choice(COMMENT_TEMPLATES)
+    d = rng.randint(1, 28)
+    return f"{rng.choice(AUTHORS)}:\n" + template.format(d=d, d2=min(d + 1, 28), h=rng.randint(1, 16))
+
+
+def dataset_paths(spec):
+    """按生成参数确定测试文件名，参数相同时直接复用已生成的文件"""
+    key = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]
+    stem = f"{spec['rows']}r_{spec['cols']}_{digest}"
+    return (os.path.join(spec['data_dir'], f'source_{stem}.xlsx'),
+            os.path.join(spec['data_dir'], f'target_{stem}.xlsx'))
+
+
+def write_sheet(path, rows, ncols, sync_cols, comments, fill, rng):
+    """
+    用 openpyxl 的只写模式生成工作簿
+
+    rows: [(序号, 姓名, 区域)]；comments: { (行下标, 列字母): (文本, 作者) }
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.comments import Comment
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('考勤汇总')
+    ws.append(['员工考勤汇总表（基准测试数据）'])
+    ws.append(['序号', '姓名', '区域'] + [f'字段{column_letter(i)}' for i in range(4, ncols + 1)])
+
+    sync_indexes = {column_index(col): col for col in sync_cols}
+    for i, (seq, name, region) in enumerate(rows):
+        values = [seq, name, region]
+        for col_idx in range(4, ncols + 1):
+            value = rng.randint(0, 100) if rng.random() < fill else None
+            comment = comments.get((i, sync_indexes.get(col_idx)))
+            if comment:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.comment = Comment(*comment)
+                value = cell
+            values.append(value)
+        ws.append(values)
+    wb.save(path)
+
+
+def generate_dataset(spec, force=False):
+    """
+    生成一对源文件/目标文件
+
+    - 源文件：rows 行人员，同步列中按 density 的比例带批注
+    - 目标文件：同一批人员、行顺序打乱，同步列中按 existing 的比例已有批注
+    - 区域从前 regions 个区域中随机选取
+    """
+    source_file, target_file = dataset_paths(spec)
+    if not force and os.path.exists(source_file) and os.path.exists(target_file):
+        return source_file, target_file
+
+    os.makedirs(spec['data_dir'], exist_ok=True)
+    rng = random.Random(spec['seed'])
+    ncols = column_index(spec['cols'])
+    sync_cols = spec['sync_cols']
+    regions = REGIONS[:spec['regions']]
+
+    names = make_names(spec['rows'], rng)
+    people = [(i + 1, name, rng.choice(regions)) for i, name in enumerate(names)]
+
+    source_comments = {}
+    for i in range(len(people)):
+        for col in sync_cols:
+            if rng.random() < spec['density']:
+                source_comments[i, col] = (make_comment_text(rng), rng.choice(AUTHORS))
+
+    order = list(range(len(people)))
+    rng.shuffle(order)
+    target_people = [people[i] for i in order]
+    target_comments = {}
+    for i in range(len(target_people)):
+        for col in sync_cols:
+            if rng.random() < spec['existing']:
+                target_comments[i, col] = (make_comment_text(rng), rng.choice(AUTHORS))
+
+    print(f"正在生成源文件: {source_file} ...")
+    write_sheet(source_file, people, ncols, sync_cols, source_comments, spec['fill'], rng)
+    print(f"正在生成目标文件: {target_file} ...")
+    write_sheet(target_file, target_people, ncols, sync_cols, target_comments, spec['fill'], rng)
+    return source_file, target_file
+
+
+def peak_rss_mb(who='self'):
+    """进程（或已结束的子进程）的内存峰值（MB），无法获取时返回 None"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        if who != 'self':
+            return None
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 1024 / 1024
+        except (ImportError, AttributeError):
+            return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN).ru_maxrss
+    # macOS 单位为字节，Linux 为 KB
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def run_scenario(scenario, result_file):
+    """在当前进程中运行一次同步（由 run 命令在独立子进程中调用），结果写入 result_file"""
+    sys.path.insert(0, SCRIPT_DIR)
+    work_dir = os.path.dirname(os.path.abspath(result_file))
+    with contextlib.redirect_stdout(open(os.devnull, 'w', encoding='utf-8')):
+        import sync_comments as sc
+
+        # 不读取配置文件，在默认配置上设置场景参数；日志和输出写到工作目录
+        sc.SCRIPT_DIR = work_dir
+        config = dict(sc.DEFAULT_CONFIG)
+        config.update({
+            'SOURCE_FILE': scenario['source_file'],
+            'TARGET_FILE': scenario['target_file'],
+            'OUTPUT_FILE': os.path.join(work_dir, 'bench_output.xlsx'),
+            'COL_NAME': NAME_COL,
+            'COL_REGION': REGION_COL,
+            'START_ROW': START_ROW,
+            'TARGET_REGION': scenario['target_regions'] or None,
+            'COLS_TO_SYNC': scenario['sync_cols'],
+            'MERGE_COMMENTS': True,
+            'SOURCE_ENGINE': scenario['engine'],
+            'OUTPUT_MODE': scenario['mode'],
+            'PARALLEL_LOAD': scenario['parallel'],
+            'CACHE_ENABLED': False,
+            'INCREMENTAL_SYNC': False,
+        })
+        sc.apply_config(config)
+
+        stats = sc.sync_excel_comments(use_cache=False, incremental=False)
+
+    phases = {name: entry['wall'] for name, entry in stats['phases'].items()}
+    phases['总计'] = stats['total']['wall']
+    result = {
+        'phases': phases,
+        'cpu': {name: entry['cpu'] for name, entry in stats['phases'].items()},
+        'counts': stats['counts'],
+        'peak_rss_mb': peak_rss_mb('self'),
+        'children_peak_rss_mb': peak_rss_mb('children'),
+        'output_bytes': os.path.getsize(os.path.join(work_dir, 'bench_output.xlsx')),
+    }
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+def scenario_key(scenario):
+    """用于比较两次结果时匹配同一场景"""
+    return (f"rows={scenario['rows']} cols={scenario['cols']} density={scenario['density']} "
+            f"existing={scenario['existing']} mode={scenario['mode']} engine={scenario['engine']} "
+            f"parallel={scenario['parallel']}")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args):
+    """对每种 行数 × 输出方式 × 读取方式 组合运行 repeat 次，各阶段取中位数"""
+    import openpyxl
+
+    bench_dir = os.path.join(args.data_dir, 'run')
+    os.makedirs(bench_dir, exist_ok=True)
+    results = []
+    for rows in args.rows:
+        spec = dataset_spec(args, rows)
+        source_file, target_file = generate_dataset(spec)
+        for mode in args.modes:
+            for engine in args.engines:
+                scenario = dict(spec, source_file=source_file, target_file=target_file, mode=mode,
+                                engine=engine, parallel=args.parallel,
+                                target_regions=REGIONS[:args.filter_regions] if args.filter_regions else [])
+                runs = []
+                for i in range(args.repeat):
+                    result_file = os.path.join(bench_dir, 'result.json')
+                    if os.path.exists(result_file):
+                        os.remove(result_file)
+                    subprocess.check_call([sys.executable, os.path.abspath(__file__), '_run_one',
+                                           json.dumps(scenario, ensure_ascii=False), result_file])
+                    with open(result_file, 'r', encoding='utf-8') as f:
+                        runs.append(json.load(f))
+
+                phases = {}
+                for run in runs:
+                    for phase, seconds in run['phases'].items():
+                        phases.setdefault(phase, []).append(seconds)
+                entry = {
+                    'key': scenario_key(scenario),
+                    'scenario': {k: v for k, v in scenario.items() if k not in ('data_dir',)},
+                    'phases': {phase: statistics.median(values) for phase, values in phases.items()},
+                    'peak_rss_mb': max((r['peak_rss_mb'] or 0) for r in runs) or None,
+                    'children_peak_rss_mb': max((r['children_peak_rss_mb'] or 0) for r in runs) or None,
+                    'output_bytes': runs[-1]['output_bytes'],
+                    'runs': runs,
+                }
+                results.append(entry)
+                rss = f"{entry['peak_rss_mb']:.0f} MB" if entry['peak_rss_mb'] else '未知'
+                print(f"[完成] {entry['key']}: 总计 {entry['phases']['总计']:.3f} 秒，内存峰值 {rss}")
+
+    report = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'openpyxl': openpyxl.__version__,
+            'git_commit': git_commit(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"基准测试结果已保存为: {args.output}")
+
+
+def compare_results(args):
+    """
+    比较两次基准测试结果
+
+    同一场景中某个阶段的用时比基准慢 threshold 以上、且差值超过 min_seconds 时记为变慢；
+    内存峰值增加 threshold 以上、且超过 5 MB 时记为内存增加。有任何一项时返回 1。
+    """
+    with open(args.base, 'r', encoding='utf-8') as f:
+        base = {entry['key']: entry for entry in json.load(f)['results']}
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = {entry['key']: entry for entry in json.load(f)['results']}
+
+    regressions = 0
+    for key in sorted(set(base) & set(new)):
+        print(key)
+        for phase in new[key]['phases']:
+            old_seconds = base[key]['phases'].get(phase)
+            new_seconds = new[key]['phases'][phase]
+            if old_seconds is None:
+                print(f"  {phase}: {new_seconds:.3f} 秒（新增阶段）")
+                continue
+            change = (new_seconds - old_seconds) / old_seconds if old_seconds else 0.0
+            flag = ''
+            if change > args.threshold and new_seconds - old_seconds > args.min_seconds:
+                flag = '  ← 变慢'
+                regressions += 1
+            elif change < -args.threshold and old_seconds - new_seconds > args.min_seconds:
+                flag = '  ← 变快'
+            print(f"  {phase}: {old_seconds:.3f} → {new_seconds:.3f} 秒 ({change:+.1%}){flag}")
+
+        old_rss, new_rss = base[key].get('peak_rss_mb'), new[key].get('peak_rss_mb')
+        if old_rss and new_rss:
+            change = (new_rss - old_rss) / old_rss
+            flag = ''
+            if change > args.threshold and new_rss - old_rss > 5:
+                flag = '  ← 内存增加'
+                regressions += 1
+            print(f"  内存峰值: {old_rss:.0f} → {new_rss:.0f} MB ({change:+.1%}){flag}")
+
+    for key in sorted(set(base) ^ set(new)):
+        print(f"{key}: 只存在于{'基准' if key in base else '新'}结果中，跳过")
+
+    if regressions:
+        print(f"发现 {regressions} 项性能退化")
+        return 1
+    print("没有发现性能退化")
+    return 0
+
+
+def dataset_spec(args, rows):
+    """测试数据的生成参数"""
+    return {
+        'rows': rows,
+        'cols': args.cols.upper(),
+        'sync_cols': [c.strip().upper() for c in args.sync_cols.split(',')] if args.sync_cols
+                     else default_sync_cols(args.cols.upper()),
+        'density': args.density,
+        'existing': args.existing,
+        'regions': args.regions,
+        'fill': args.fill,
+        'seed': args.seed,
+        'data_dir': args.data_dir,
+    }
+
+
+def add_dataset_arguments(parser):
+    parser.add_argument('--cols', default='DU', help='最后一列（最多 ZZ），默认 DU')
+    parser.add_argument('--sync-cols', help='同步列（逗号分隔），默认 DO, DP, DS, DU 或最后四列')
+    parser.add_argument('--density', type=float, default=0.05, help='源文件同步列中带批注的单元格比例，默认 0.05')
+    parser.add_argument('--existing', type=float, default=0.02, help='目标文件同步列中已有批注的比例，默认 0.02')
+    parser.add_argument('--regions', type=int, default=6, help='人员分布的区域数（最多 10），默认 6')
+    parser.add_argument('--fill', type=float, default=0.2, help='其余数据列中有值的单元格比例，默认 0.2')
+    parser.add_argument('--seed', type=int, default=42, help='随机数种子')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='测试文件目录，默认 bench_data')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Excel 批注同步工具 - 性能基准测试')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    gen = commands.add_parser('generate', help='生成测试用的源文件和目标文件')
+    gen.add_argument('--rows', type=int, default=10000, help='人员行数，默认 10000')
+    gen.add_argument('--force', action='store_true', help='已存在时也重新生成')
+    add_dataset_arguments(gen)
+
+    run = commands.add_parser('run', help='运行基准测试')
+    run.add_argument('--rows', type=int, nargs='+', default=[1000, 10000], help='人员行数（可多个），默认 1000 10000')
+    run.add_argument('--modes', nargs='+', default=['patch', 'openpyxl'], choices=['patch', 'openpyxl'],
+                     help='输出方式，默认 patch openpyxl')
+    run.add_argument('--engines', nargs='+', default=['xml'], choices=['xml', 'openpyxl'], help='源文件读取方式，默认 xml')
+    run.add_argument('--filter-regions', type=int, default=3, help='筛选前几个区域（0 表示不筛选），默认 3')
+    run.add_argument('--parallel', action='store_true', help='启用并行加载（默认关闭，便于看清各阶段用时）')
+    run.add_argument('--repeat', type=int, default=3, help='每个场景运行次数，各阶段取中位数，默认 3')
+    run.add_argument('--output', default=f'bench_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json',
+                     help='结果文件，默认 bench_<时间>.json')
+    add_dataset_arguments(run)
+
+    cmp = commands.add_parser('compare', help='比较两次基准测试结果')
+    cmp.add_argument('base', help='基准结果文件')
+    cmp.add_argument('new', help='新结果文件')
+    cmp.add_argument('--threshold', type=float, default=0.1, help='变慢多少比例记为退化，默认 0.1')
+    cmp.add_argument('--min-seconds', type=float, default=0.05, help='差值小于该秒数时忽略，默认 0.05')
+
+    one = commands.add_parser('_run_one')  # 内部使用：在子进程中运行单个场景
+    one.add_argument('scenario')
+    one.add_argument('result_file')
+
+    args = parser.parse_args()
+    if args.command == 'generate':
+        source_file, target_file = generate_dataset(dataset_spec(args, args.rows), force=args.force)
+        print(f"源文件: {source_file}\n目标文件: {target_file}")
+    elif args.command == 'run':
+        run_benchmarks(args)
+    elif args.command == 'compare':
+        return compare_results(args)
+    elif args.command == '_run_one':
+        run_scenario(json.loads(args.scenario), args.result_file)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,18 +4,62 @@
 """
 
 import subprocess
+import argparse
 import sys
 import os
 
+# --onedir 打包时排除的模块（同步工具运行时不会导入）
+# openpyxl 的图表（chart）、数据透视表（pivot）、图形（drawing）模块会被它的读取和保存代码直接导入，
+# 排除后 openpyxl 读取/输出方式无法使用，因此不能排除；这里只排除确实用不到的子模块
+EXCLUDED_MODULES = [
+    # openpyxl 中读取、保存工作簿都不会用到的子模块
+    "openpyxl.compat.abc",
+    "openpyxl.compat.product",
+    "openpyxl.compat.singleton",
+    "openpyxl.descriptors.slots",
+    "openpyxl.packaging.interface",
+    "openpyxl.utils.dataframe",
+    "openpyxl.utils.inference",
+    "openpyxl.worksheet.cell_watch",
+    "openpyxl.worksheet.controls",
+    "openpyxl.worksheet.custom",
+    "openpyxl.worksheet.errors",
+    "openpyxl.worksheet.ole",
+    "openpyxl.worksheet.picture",
+    "openpyxl.worksheet.smart_tag",
+    # openpyxl 的可选依赖（开发环境中安装了也不打包）
+    "PIL",
+    "numpy",
+    "pandas",
+    "lxml",
+    "IPython",
+    "matplotlib",
+    # 用不到的标准库
+    "tkinter",
+    "unittest",
+    "pydoc",
+    "doctest",
+    "lib2to3",
+    "test",
+]
+
+# sync_comments.py 在函数内导入（用到时才导入）的模块，显式列出，保证打包进去
+HIDDEN_IMPORTS = ["xlsx_patch", "audit", "index", "server"]
+
 def install_pyinstaller():
     """安装 PyInstaller"""
     print("正在安装 PyInstaller...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
     print("PyInstaller 安装完成！\n")
 
-def build_executable():
-    """使用 PyInstaller 打包"""
-    print("开始打包...")
+def build_executable(onedir=False):
+    """
+    使用 PyInstaller 打包
+
+    onedir=False：打包成单个可执行文件，便于分发；每次启动都要先解压到临时目录
+    onedir=True：打包成一个文件夹，启动时不需要解压，并排除用不到的模块，启动更快
+    """
+    print(f"开始打包（{'文件夹' if onedir else '单文件'}模式）...")
     
     # 获取当前脚本所在目录
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -30,18 +74,17 @@ def build_executable():
     # PyInstaller 命令参数
     cmd = [
         "pyinstaller",
-        "--onefile",  # 打包成单个文件
+        "--onedir" if onedir else "--onefile",  # 打包成文件夹或单个文件
         "--name=批注同步工具",  # 可执行文件名称
         "--clean",  # 清理临时文件
         "--noconfirm",  # 不询问确认
         "--console",  # 显示控制台窗口
-        f"--add-data={config_file}:.",  # 将配置文件打包进去（Windows 用分号，macOS/Linux 用冒号）
-        target_script
+        f"--add-data={config_file}{os.pathsep}.",  # 将配置文件打包进去（Windows 用分号，macOS/Linux 用冒号）
     ]
-    
-    # 根据操作系统调整 add-data 参数
-    if sys.platform == "win32":
-        cmd[6] = f"--add-data={config_file};."
+    cmd.extend(f"--hidden-import={module}" for module in HIDDEN_IMPORTS)
+    if onedir:
+        cmd.extend(f"--exclude-module={module}" for module in EXCLUDED_MODULES)
+    cmd.append(target_script)
     
     # 执行打包
     subprocess.check_call(cmd, cwd=script_dir)
@@ -49,7 +92,10 @@ def build_executable():
     print("\n" + "="*60)
     print("打包完成！")
     print("="*60)
-    print(f"可执行文件位置: {os.path.join(script_dir, 'dist', '批注同步工具')}")
+    if onedir:
+        print(f"程序文件夹位置: {os.path.join(script_dir, 'dist', '批注同步工具')}（需要整个文件夹一起分发）")
+    else:
+        print(f"可执行文件位置: {os.path.join(script_dir, 'dist', '批注同步工具')}")
     print("\n使用说明:")
     print("1. 将 dist 文件夹中的可执行文件复制到需要的位置")
     print("2. 将 config.ini 复制到与可执行文件相同的目录")
@@ -62,6 +108,11 @@ def build_executable():
     print("="*60)
 
 if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="打包批注同步工具")
+    arg_parser.add_argument("--onedir", action="store_true",
+                            help="打包成文件夹（启动更快，需要整个文件夹一起分发），默认打包成单个文件")
+    args = arg_parser.parse_args()
+
     try:
         # 检查是否已安装 PyInstaller
         try:
@@ -71,11 +122,11 @@ if __name__ == "__main__":
             install_pyinstaller()
         
         # 执行打包
-        build_executable()
+        build_executable(onedir=args.onedir)
         
     except Exception as e:
         print(f"\n错误: {e}")
         print("\n如果遇到问题，请手动执行以下命令:")
         print("1. pip install pyinstaller")
-        print("2. pyinstaller --onefile --name=批注同步工具 sync_comments.py")
+        print("2. pyinstaller --onefile --name=批注同步工具 --hidden-import=xlsx_patch --hidden-import=audit --hidden-import=index --hidden-import=server sync_comments.py")
         sys.exit(1)
@@ -0,0 +1,405 @@
+"""
+HR 数据导出 - 把 hrdata.xlsx 转换为 hr-dashboard 使用的 hrdata.json / hrdata.js
+
+替代 converter.html（浏览器中用 XLSX.read 一次性读入整个工作簿，数据量大时页面会崩溃）：
+- 用 openpyxl 只读模式逐行读取，数据逐条写入临时文件，内存占用不随行数增长
+- 表头合并规则、记录内容与 converter.html 相同（日期输出为 Excel 序列号）
+- 一次读取同时生成看板需要的所有文件
+
+输出格式：
+- rows：与 converter.html 相同，{"meta": ..., "data": [{列名: 值, ...}, ...]}
+- columnar：看板直接加载的列式格式，每列一个数组，不重复列名；
+  部门、组别、区域、岗位列用整数编码，并预先统计筛选项的取值和人数（见 write_columnar）
+
+用法:
+    # 使用默认路径：读取仓库根目录的 hrdata.xlsx，生成全部文件
+    python export_hrdata.py
+
+    # 指定 Excel 文件和工作表
+    python export_hrdata.py 考勤.xlsx --sheet 在职
+
+    # 只生成指定的文件（默认 .json 为 rows 格式，.js 为 columnar 格式）
+    python export_hrdata.py --output out/hrdata.json out/hrdata.js
+
+    # 指定输出格式
+    python export_hrdata.py --output out/hrdata.js --format rows
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import functools
+import collections
+from datetime import datetime, timezone, date, time as dt_time, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SCRIPT_DIR)
+DEFAULT_INPUT = os.path.join(REPO_DIR, 'hrdata.xlsx')
+
+FORMATS = ('rows', 'columnar')
+
+# 默认生成的数据文件及格式：.json 为纯 JSON，.js 为 window.hrData = {...}
+# 看板运行时在 Web Worker 中 fetch public/hrdata.json；以 file:// 打开时不能 fetch，改为加载 public/hrdata.js
+# hr-dashboard/hrdata/ 中是之前构建好的看板，只能读取 rows 格式，重新构建（npm run build）后再改为 columnar
+DEFAULT_OUTPUTS = [
+    (os.path.join(REPO_DIR, 'hrdata.json'), 'rows'),
+    (os.path.join(REPO_DIR, 'hr-dashboard', 'public', 'hrdata.json'), 'columnar'),
+    (os.path.join(REPO_DIR, 'hr-dashboard', 'public', 'hrdata.js'), 'columnar'),
+    (os.path.join(REPO_DIR, 'hr-dashboard', 'hrdata', 'hrdata.js'), 'rows'),
+]
+JS_PREFIX = 'window.hrData = '
+COLUMNAR_VERSION = 1
+
+# 表头第一行为空或为“基本信息”时只使用第二行的列名
+BASE_CATEGORY = '基本信息'
+
+# meta.filters 中的筛选项：(键名, 列名)
+FILTER_COLUMNS = [
+    ('departments', '部门'),
+    ('groups', '组别'),
+    ('areas', '区域'),
+    ('positions', '岗位'),
+]
+
+# 写入临时文件的缓冲区大小（字节）
+WRITE_BUFFER = 1024 * 1024
+
+ARRAY_INDEX = re.compile(r'0|[1-9][0-9]{0,9}')
+
+# 公式错误值，SheetJS 输出为空字符串（只读模式下无法区分内容恰好相同的文本）
+ERROR_CODES = frozenset(['#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'])
+
+
+def js_value(value):
+    """
+    把单元格的值转换为与 SheetJS（sheet_to_json, raw）相同的 JSON 值
+
+    日期、时间输出为 Excel 序列号，整数值的浮点数输出为整数（与 JavaScript 一致），
+    空单元格、False 和公式错误值输出为空字符串。
+    """
+    if value is None or value is False:
+        return ''
+    if isinstance(value, str):
+        return '' if value in ERROR_CODES else value
+    if value is True or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value
+    if isinstance(value, (datetime, date, dt_time, timedelta)):
+        from openpyxl.utils.datetime import to_excel
+        return js_value(to_excel(value))
+    return str(value)
+
+
+def js_string(value):
+    """与 JavaScript 的 String(value || '') 相同，用于拼接列名"""
+    value = js_value(value)
+    if value is True:
+        return 'true'
+    if not value:
+        return ''
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def merge_header(header_row1, header_row2):
+    """
+    合并两行表头为列名：第一行为空或“基本信息”时使用第二行，否则为 “第一行_第二行”
+
+    合并单元格只有左上角有值，因此如 “1月 / 年假、事假h、病假...” 会得到 1月_年假、事假h、病假...
+    """
+    columns = []
+    for i in range(max(len(header_row1), len(header_row2))):
+        category = js_string(header_row1[i] if i < len(header_row1) else None)
+        sub_category = js_string(header_row2[i] if i < len(header_row2) else None)
+        if not category or category == BASE_CATEGORY or not category.strip():
+            columns.append(sub_category)
+        else:
+            columns.append(f'{category}_{sub_category}')
+    return columns
+
+
+def record_layout(columns):
+    """
+    返回记录的 [(键名, 列号)]，键的顺序与 JavaScript 对象相同
+
+    列名重复时（如每个月都有 事假h）后面的列覆盖前面的值，但键保留第一次出现的位置；
+    数组下标形式的键（如 "1"）在 JavaScript 对象中排在最前面，按数值排序。
+    """
+    last_index = {}
+    for i, name in enumerate(columns):
+        last_index[name] = i
+    keys = list(last_index)
+    index_keys = sorted((k for k in keys if ARRAY_INDEX.fullmatch(k) and int(k) < 2 ** 32 - 1), key=int)
+    keys = index_keys + [k for k in keys if k not in index_keys]
+    return [(k, last_index[k]) for k in keys]
+
+
+def js_sort_key(value):
+    """与 JavaScript 数组默认的 sort() 相同：转换为字符串后按 UTF-16 编码排序"""
+    return js_string(value).encode('utf-16-be')
+
+
+def indent_json(obj, level):
+    """按 JSON.stringify(obj, null, 2) 的格式输出，整体缩进 level 层"""
+    text = json.dumps(obj, ensure_ascii=False, indent=2)
+    return text.replace('\n', '\n' + '  ' * level)
+
+
+def iter_sheet_rows(input_file, sheet_name=None):
+    """用 openpyxl 只读模式逐行读取工作表（默认第一个），返回 (列数, 行迭代器)"""
+    import openpyxl
+
+    # 不读取外部链接：只需要单元格中缓存的值，hrdata.xlsx 的外部链接部件解析要花几秒
+    wb = openpyxl.load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+    ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+    width = ws.max_column or 0
+
+    def rows():
+        try:
+            for row in ws.iter_rows(values_only=True):
+                yield row
+        finally:
+            wb.close()
+
+    return width, rows()
+
+
+class RowsWriter:
+    """rows 格式：记录按 JSON.stringify(data, null, 2) 的格式逐条写入临时文件"""
+
+    def __init__(self):
+        self.data_file = tempfile.TemporaryFile('w+', encoding='utf-8', newline='', buffering=WRITE_BUFFER)
+        self.count = 0
+
+    def add(self, record):
+        self.data_file.write(('\n    ' if self.count == 0 else ',\n    ') + indent_json(record, 2))
+        self.count += 1
+
+    def write(self, f, meta):
+        meta = {key: meta[key] for key in ('generatedAt', 'totalRecords', 'columns', 'filters')}
+        f.write('{\n  "meta": ' + indent_json(meta, 1) + ',\n  "data": [')
+        if self.count:
+            self.data_file.seek(0)
+            shutil.copyfileobj(self.data_file, f, WRITE_BUFFER)
+            f.write('\n  ]\n}')
+        else:
+            f.write(']\n}')
+
+    def close(self):
+        self.data_file.close()
+
+
+class ColumnarWriter:
+    """
+    columnar 格式：每列的值写入各自的临时文件，读完后拼接为
+
+        {"format": "columnar", "version": 1, "meta": {..., "facets": {...}},
+         "columns": {列名: {"type": "num", "data": [...]}, ...}}
+
+    列的类型：
+    - num：非空值都是数字，data 为数字数组，空值为 null（看板中转换为 Float64Array，空值为 NaN）
+    - dict：筛选列（部门、组别、区域、岗位），values 为不重复的取值，codes 为每行取值的下标
+    - str：其他列，data 为原值数组，空值为 null
+    """
+
+    def __init__(self, keys, dict_keys):
+        self.keys = keys
+        self.files = {key: tempfile.TemporaryFile('w+', encoding='utf-8', newline='') for key in keys}
+        self.numeric = dict.fromkeys(keys, True)
+        self.dicts = {key: {} for key in dict_keys}
+        self.count = 0
+
+    def add(self, record):
+        sep = ',' if self.count else ''
+        for key in self.keys:
+            value = record[key]
+            codes = self.dicts.get(key)
+            if codes is not None:
+                code = codes.setdefault(value, len(codes))
+                self.files[key].write(f'{sep}{code}')
+                continue
+            if value == '':
+                text = 'null'
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                text = json.dumps(value)
+            else:
+                self.numeric[key] = False
+                text = json.dumps(value, ensure_ascii=False)
+            self.files[key].write(sep + text)
+        self.count += 1
+
+    def write(self, f, meta):
+        dump = functools.partial(json.dumps, ensure_ascii=False, separators=(',', ':'))
+        f.write(f'{{"format":"columnar","version":{COLUMNAR_VERSION},"meta":{dump(meta)},"columns":{{')
+        for i, key in enumerate(self.keys):
+            data_file = self.files[key]
+            data_file.flush()
+            data_file.seek(0)
+            f.write(('' if i == 0 else ',') + dump(key) + ':')
+            if key in self.dicts:
+                f.write(f'{{"type":"dict","values":{dump(list(self.dicts[key]))},"codes":[')
+            else:
+                f.write(f'{{"type":"{"num" if self.numeric[key] else "str"}","data":[')
+            shutil.copyfileobj(data_file, f, WRITE_BUFFER)
+            f.write(']}')
+        f.write('}}')
+
+    def close(self):
+        for data_file in self.files.values():
+            data_file.close()
+
+
+def iter_records(rows, layout):
+    """把数据行转换为记录（与 converter.html 相同：第一列为空的行跳过）"""
+    for row in rows:
+        if not row or not js_value(row[0]):
+            continue
+        record = {}
+        for key, idx in layout:
+            record[key] = js_value(row[idx]) if idx < len(row) else ''
+        yield record
+
+
+def resolve_filter_columns(columns):
+    """
+    筛选项对应的记录键名，找不到时为 None
+
+    converter.html 按 部门、组别 等列名取值，但基本信息列合并表头后为 部门_、组别_，
+    导致筛选项始终为空；这里找不到原列名时使用 “列名_”。
+    """
+    resolved = []
+    for key, name in FILTER_COLUMNS:
+        if name in columns:
+            resolved.append((key, name))
+        else:
+            resolved.append((key, f'{name}_' if f'{name}_' in columns else None))
+    return resolved
+
+
+def generated_at():
+    """与 JavaScript 的 new Date().toISOString() 格式相同"""
+    now = datetime.now(timezone.utc)
+    return now.strftime('%Y-%m-%dT%H:%M:%S.') + f'{now.microsecond // 1000:03d}Z'
+
+
+def build_facets(filter_columns, facet_counts):
+    """筛选项的取值（按 JavaScript 的 sort() 排序，不含空值）和对应的人数"""
+    filters = {}
+    facets = {}
+    for key, name in filter_columns:
+        counts = facet_counts.get(key, {})
+        values = sorted((v for v in counts if v), key=js_sort_key)
+        filters[key] = values
+        facets[key] = {'column': name, 'values': values, 'counts': [counts[v] for v in values]}
+    return filters, facets
+
+
+def output_format(output_file, fmt='auto'):
+    """输出格式：auto 时 .js 为 columnar（看板加载的文件），其他为 rows"""
+    if fmt != 'auto':
+        return fmt
+    return 'columnar' if output_file.endswith('.js') else 'rows'
+
+
+def write_output(output_file, meta, writer):
+    """生成一个输出文件；先写临时文件再替换，避免留下不完整的文件"""
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+        if output_file.endswith('.js'):
+            f.write(JS_PREFIX)
+        writer.write(f, meta)
+    os.replace(tmp_file, output_file)
+
+
+def export_hrdata(input_file, outputs, sheet_name=None):
+    """
+    读取 Excel 并生成所有输出文件，返回 meta
+
+    outputs: [(输出文件, 格式)]，格式为 rows 或 columnar
+    """
+    start = time.perf_counter()
+    print(f"正在读取: {input_file} ...")
+    width, rows = iter_sheet_rows(input_file, sheet_name)
+
+    header_row1 = next(rows, None)
+    header_row2 = next(rows, None)
+    if header_row1 is None or header_row2 is None:
+        rows.close()
+        raise ValueError('Excel 文件格式不正确：至少需要两行表头')
+    # 与 sheet_to_json 相同，表头按工作表范围的列数补齐
+    pad = max(0, width - len(header_row2))
+    columns = merge_header(header_row1, tuple(header_row2) + (None,) * pad)
+    layout = record_layout(columns)
+    filter_columns = resolve_filter_columns(columns)
+
+    # 数据先写入临时文件，读完后才能确定写在前面的 meta（总记录数、筛选项）
+    formats = {fmt for _, fmt in outputs}
+    writers = {}
+    if 'rows' in formats:
+        writers['rows'] = RowsWriter()
+    if 'columnar' in formats:
+        dict_keys = [name for _, name in filter_columns if name is not None]
+        writers['columnar'] = ColumnarWriter([key for key, _ in layout], dict_keys)
+    facet_counts = {key: collections.Counter() for key, name in filter_columns if name is not None}
+    facet_keys = [(facet_counts[key], name) for key, name in filter_columns if name is not None]
+
+    try:
+        total = 0
+        for record in iter_records(rows, layout):
+            for counts, name in facet_keys:
+                counts[record[name]] += 1
+            for writer in writers.values():
+                writer.add(record)
+            total += 1
+        read_seconds = time.perf_counter() - start
+
+        filters, facets = build_facets(filter_columns, facet_counts)
+        meta = {
+            'generatedAt': generated_at(),
+            'totalRecords': total,
+            'columns': columns,
+            'filters': filters,
+            'facets': facets,
+        }
+        for output_file, fmt in outputs:
+            write_output(output_file, meta, writers[fmt])
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    print(f"共 {total} 条记录、{len(columns)} 列，读取用时 {read_seconds:.2f} 秒，总用时 {time.perf_counter() - start:.2f} 秒")
+    for output_file, fmt in outputs:
+        print(f"  已生成: {output_file}（{fmt}，{os.path.getsize(output_file) / 1024:.0f} KB）")
+    return meta
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='把 hrdata.xlsx 转换为 hr-dashboard 使用的 JSON/JS 数据文件')
+    arg_parser.add_argument('input', nargs='?', default=DEFAULT_INPUT, help='Excel 文件，默认仓库根目录的 hrdata.xlsx')
+    arg_parser.add_argument('--sheet', help='工作表名称，默认第一个工作表')
+    arg_parser.add_argument('--output', nargs='+', metavar='文件',
+                            help='输出文件（.json 或 .js），默认生成 hrdata.json 以及 hr-dashboard 中的各份数据文件')
+    arg_parser.add_argument('--format', choices=('auto',) + FORMATS, default='auto',
+                            help='--output 文件的格式，默认 auto：.js 为 columnar，.json 为 rows')
+    args = arg_parser.parse_args(argv)
+
+    if args.output:
+        outputs = [(output_file, output_format(output_file, args.format)) for output_file in args.output]
+    else:
+        outputs = DEFAULT_OUTPUTS
+    try:
+        export_hrdata(args.input, outputs, args.sheet)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"错误: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,341 @@
+"""
+批注检索：为归档工作簿建立批注全文索引（SQLite），按关键词或人员搜索历史批注
+
+由 sync_comments 在用到时才导入（不影响其他命令的启动时间）；
+配置项由 sync_comments.apply_config 设置，这里通过 core 读取当前值
+"""
+
+import contextlib
+import fnmatch
+import glob
+import json
+import os
+import re
+import time
+import unicodedata
+from datetime import datetime
+
+import sync_comments as core
+
+
+# 索引内容或分词方式变化时递增，旧索引中的文件全部重新索引
+INDEX_VERSION = 1
+# 搜索结果默认显示的条数
+SEARCH_LIMIT = 50
+# 搜索结果中命中位置前后显示的字符数
+SNIPPET_WIDTH = 20
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    sha256 TEXT,
+    settings TEXT,
+    comments INTEGER,
+    indexed TEXT
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    sheet TEXT,
+    name TEXT,
+    region TEXT,
+    match_key TEXT,
+    row INTEGER,
+    col TEXT,
+    author TEXT,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_comments_file ON comments(file_id);
+CREATE INDEX IF NOT EXISTS idx_comments_name ON comments(name);
+CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(body);
+"""
+
+# FTS5 的 unicode61 分词器把连续的汉字当作一个词，“病假”搜不到“请病假三天”；
+# 索引和搜索时都在每个中日韩字符两侧加空格，搜索词按短语（逐字相连）查询，任意长度的词都能命中
+CJK_CHAR_RE = re.compile('([⺀-鿿가-힯豈-﫿\U00020000-\U0002ffff])')
+
+
+def search_tokens(text):
+    """写入全文索引的文本：NFKC 标准化（全角转半角）后逐个切开中日韩字符"""
+    return CJK_CHAR_RE.sub(r' \1 ', unicodedata.normalize('NFKC', text or ''))
+
+
+def fts_query(query):
+    """
+    把搜索词转换为 FTS5 查询，返回 (查询, [搜索词])
+
+    空格分隔的每个词都必须出现（AND），每个词按短语匹配；没有可搜索的文字时查询为 None。
+    """
+    terms = [term for term in unicodedata.normalize('NFKC', query).split() if re.search(r'\w', term)]
+    if not terms:
+        return None, []
+    return ' '.join('"' + search_tokens(term).replace('"', '""') + '"' for term in terms), terms
+
+
+def comment_snippet(text, terms, width=SNIPPET_WIDTH):
+    """批注中第一个命中的搜索词及前后各 width 个字符，命中部分用【】标出，换行显示为 /"""
+    text = unicodedata.normalize('NFKC', text)
+    folded = text.casefold()
+    hits = [(folded.find(term.casefold()), len(term)) for term in terms]
+    hits = [hit for hit in hits if hit[0] >= 0]
+    if hits:
+        pos, length = min(hits)
+        end = pos + length
+        snippet = (('…' if pos > width else '') + text[max(0, pos - width):pos] + f'【{text[pos:end]}】'
+                   + text[end:end + width] + ('…' if end + width < len(text) else ''))
+    else:
+        # 按词命中但原文中不连续（如英文词形），显示开头
+        snippet = text[:width * 2] + ('…' if len(text) > width * 2 else '')
+    return re.sub(r'\s*\n\s*', ' / ', snippet.strip())
+
+
+def index_db_path():
+    return core.INDEX_DB if os.path.isabs(core.INDEX_DB) else os.path.join(core.SCRIPT_DIR, core.INDEX_DB)
+
+
+def index_settings():
+    """影响索引内容的配置；与建立索引时不同则重新索引"""
+    return json.dumps([INDEX_VERSION, core.COL_NAME, core.COL_REGION, core.START_ROW, core.MATCH_COLS, core.NORMALIZE_KEYS])
+
+
+class CommentIndex:
+    """
+    批注全文索引数据库（SQLite FTS5）
+
+    files 表每个工作簿一行（路径、大小、修改时间、内容哈希）；comments 表每个批注一行；
+    comments_fts 为全文索引，rowid 与 comments.id 相同。一个文件的批注在一个事务中整体替换。
+    """
+
+    def __init__(self, path=None):
+        import sqlite3
+
+        self.path = path or index_db_path()
+        self.conn = sqlite3.connect(self.path, timeout=60)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.create_function('search_tokens', 1, search_tokens, deterministic=True)
+        try:
+            self.conn.executescript(INDEX_SCHEMA)
+        except sqlite3.OperationalError as e:
+            self.conn.close()
+            raise RuntimeError(f"当前 Python 自带的 SQLite 不支持 FTS5 全文索引（{e}）") from e
+
+    def close(self):
+        self.conn.close()
+
+    def files(self):
+        """已索引的文件 { 路径: 行 }"""
+        return {row['path']: row for row in self.conn.execute("SELECT * FROM files")}
+
+    def touch(self, fingerprint):
+        """内容没有变化、只是修改时间变了的文件：更新大小和修改时间，下次直接跳过"""
+        with self.conn:
+            self.conn.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                              (fingerprint['size'], fingerprint['mtime_ns'], fingerprint['path']))
+
+    def delete_file(self, path):
+        file_id = self.conn.execute("SELECT file_id FROM files WHERE path = ?", (path,)).fetchone()
+        if file_id is None:
+            return
+        self.conn.execute("DELETE FROM comments_fts WHERE rowid IN (SELECT id FROM comments WHERE file_id = ?)",
+                          (file_id[0],))
+        self.conn.execute("DELETE FROM comments WHERE file_id = ?", (file_id[0],))
+        self.conn.execute("DELETE FROM files WHERE file_id = ?", (file_id[0],))
+
+    def remove(self, path):
+        with self.conn:
+            self.delete_file(path)
+
+    def replace(self, fingerprint, records):
+        """用 records（见 extract_workbook_comments）替换一个文件的全部批注"""
+        with self.conn:
+            self.delete_file(fingerprint['path'])
+            file_id = self.conn.execute(
+                "INSERT INTO files (path, size, mtime_ns, sha256, settings, comments, indexed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (fingerprint['path'], fingerprint['size'], fingerprint['mtime_ns'], fingerprint['sha256'],
+                 index_settings(), len(records), datetime.now().isoformat(timespec='seconds')),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO comments (file_id, sheet, name, region, match_key, row, col, author, text) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((file_id, *record) for record in records),
+            )
+            self.conn.execute(
+                "INSERT INTO comments_fts (rowid, body) SELECT id, search_tokens(text) FROM comments WHERE file_id = ?",
+                (file_id,),
+            )
+
+    def search(self, fts, name=None, limit=None):
+        """全文检索，按文件路径、文件中的顺序返回 [行]；name 为姓名（按匹配键的规则标准化后比较）"""
+        sql = (
+            "SELECT f.path, c.sheet, c.name, c.match_key, c.row, c.col, c.author, c.text "
+            "FROM comments_fts JOIN comments c ON c.id = comments_fts.rowid JOIN files f ON f.file_id = c.file_id "
+            "WHERE comments_fts MATCH ?"
+        )
+        params = [fts]
+        if name:
+            sql += " AND c.name = ?"
+            params.append(core.normalize_key_value(name))
+        sql += " ORDER BY f.path, c.id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+
+def extract_workbook_comments(path):
+    """
+    读取一个工作簿所有工作表中的批注，返回 [(工作表, 姓名, 区域, 匹配键, 行号, 列字母, 作者, 批注文本)]
+
+    与同步使用相同的读取方式和人员模型：从数据起始行开始、有姓名的行，按匹配列得到匹配键；
+    收录所有列的批注，不按筛选区域和同步列筛选。
+    """
+    records = []
+    for sheet in core.list_sheet_names(path):
+        rows = [row for row in core.read_source_rows(path, sheet) if row[4]]
+        keys = core.match_keys([row[3] for row in rows])
+        for (row_idx, name_val, region_val, _, row_comments), key in zip(rows, keys):
+            for col in sorted(row_comments, key=core.column_letter_to_index):
+                comment = row_comments[col]
+                records.append((sheet, core.normalize_key_value(name_val), core.normalize_key_value(region_val),
+                                core.format_match_key(key) if key else '', row_idx, col, comment.author, comment.text))
+    return records
+
+
+def index_workbook(task):
+    """在工作进程中读取一个工作簿的批注；task 为 (路径, 已计算的文件指纹或 None)"""
+    path, fingerprint = task
+    result = {'path': path, 'fingerprint': None, 'records': [], 'error': None}
+    try:
+        result['fingerprint'] = fingerprint or core.file_fingerprint(path)
+        result['records'] = extract_workbook_comments(path)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def glob_match(parts, pattern_parts):
+    """按 glob 的规则逐级比较路径：* 和 ? 不跨目录，** 匹配任意层目录（包括零层）"""
+    if not pattern_parts:
+        return not parts
+    if pattern_parts[0] == '**':
+        return any(glob_match(parts[i:], pattern_parts[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatch(parts[0], pattern_parts[0]) and glob_match(parts[1:], pattern_parts[1:])
+
+
+def resolve_archive_files(pattern):
+    """
+    归档目录（包括子目录）中的所有 .xlsx 文件，或通配符匹配的文件，返回 (文件列表, 范围判断函数)
+
+    范围判断函数用于找出索引中已被删除的文件：只清理本次扫描的目录或通配符范围内的文件。
+    通配符按 glob 的规则逐级比较，例如 归档/*.xlsx 不包括子目录中的文件。
+    """
+    if not os.path.isabs(pattern):
+        pattern = os.path.join(core.SCRIPT_DIR, pattern)
+    if os.path.isdir(pattern):
+        root = os.path.abspath(pattern)
+        pattern = os.path.join(root, '**', '*.xlsx')
+        in_scope = lambda path: path.startswith(root + os.sep)  # noqa: E731
+    else:
+        pattern_parts = os.path.abspath(pattern).split(os.sep)
+        in_scope = lambda path: glob_match(path.split(os.sep), pattern_parts)  # noqa: E731
+    files = sorted(
+        os.path.abspath(path) for path in glob.glob(pattern, recursive=True)
+        if os.path.isfile(path) and not os.path.basename(path).startswith('~$')
+    )
+    return files, in_scope
+
+
+def build_comment_index(pattern=None, workers=None):
+    """
+    为归档目录中的工作簿建立或更新批注全文索引，返回 {'indexed', 'unchanged', 'removed', 'failed'}
+
+    增量更新：大小和修改时间都没变的文件直接跳过；有变化的文件先计算内容哈希，与上次相同时只更新修改时间。
+    需要重新索引的文件在多个进程中并行读取（进程数同批量模式），主进程依次写入数据库，一个文件一个事务。
+    目录中已不存在的文件从索引中删除；姓名列、匹配列等设置变化后所有文件重新索引。
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    files, in_scope = resolve_archive_files(pattern or core.INDEX_DIR)
+    index = CommentIndex()
+    try:
+        known = index.files()
+        settings = index_settings()
+        tasks, unchanged = [], 0
+        for path in files:
+            entry = known.get(path)
+            fingerprint = None
+            if entry is not None and entry['settings'] == settings:
+                stat = os.stat(path)
+                if entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                    unchanged += 1
+                    continue
+                fingerprint = core.file_fingerprint(path)
+                if fingerprint['sha256'] == entry['sha256']:
+                    index.touch(fingerprint)
+                    unchanged += 1
+                    continue
+            tasks.append((path, fingerprint))
+
+        present = set(files)
+        removed = [path for path in known if in_scope(path) and path not in present]
+        for path in removed:
+            index.remove(path)
+            print(f"[删除] {core.source_label(path)}: 文件已不存在")
+
+        workers = max(1, min(workers or core.BATCH_WORKERS or os.cpu_count() or 1, len(tasks) or 1))
+        print(f"共 {len(files)} 个工作簿，{unchanged} 个没有变化，{len(tasks)} 个需要索引"
+              + (f"（{workers} 个进程并行读取）" if workers > 1 else ''))
+        indexed, failed, comments = 0, 0, 0
+        with (ProcessPoolExecutor(max_workers=workers, initializer=core.apply_config, initargs=(core.CONFIG,))
+              if workers > 1 else contextlib.nullcontext()) as executor:
+            results = executor.map(index_workbook, tasks) if executor else map(index_workbook, tasks)
+            for result in results:
+                if result['error']:
+                    failed += 1
+                    print(f"[失败] {core.source_label(result['path'])}: {result['error']}")
+                    continue
+                index.replace(result['fingerprint'], result['records'])
+                indexed += 1
+                comments += len(result['records'])
+                print(f"[索引] {core.source_label(result['path'])}: {len(result['records'])} 个批注")
+    finally:
+        index.close()
+
+    print(f"索引完成，用时 {time.perf_counter() - start:.2f} 秒：新索引 {indexed} 个文件（{comments} 个批注），"
+          f"跳过 {unchanged} 个，删除 {len(removed)} 个，失败 {failed} 个。索引数据库: {index_db_path()}")
+    return {'indexed': indexed, 'unchanged': unchanged, 'removed': len(removed), 'failed': failed}
+
+
+def search_comments(query, name=None, limit=None):
+    """在批注全文索引中搜索，逐条输出 姓名、文件、工作表!单元格 和命中片段，返回结果行"""
+    path = index_db_path()
+    if not os.path.exists(path):
+        print(f"批注索引不存在: {path}（先用 --index 建立索引）")
+        return []
+    fts, terms = fts_query(query)
+    if fts is None:
+        print("请输入要搜索的文字")
+        return []
+
+    start = time.perf_counter()
+    index = CommentIndex(path)
+    try:
+        rows = index.search(fts, name, limit or SEARCH_LIMIT)
+    finally:
+        index.close()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for row in rows:
+        person = row['match_key'] or row['name']
+        print(f"{person}  {core.source_label(row['path'])}  {row['sheet']}!{row['col']}{row['row']}  "
+              f"{comment_snippet(row['text'], terms)}")
+    more = '（已达到显示上限，可用 --limit 调整）' if len(rows) == (limit or SEARCH_LIMIT) else ''
+    print(f"共 {len(rows)} 条结果{more}，用时 {elapsed_ms:.1f} 毫秒")
+    return rows
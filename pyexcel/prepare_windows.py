@@ -26,6 +26,10 @@ def prepare_windows_package():
     # 需要复制的文件列表
     files_to_copy = [
         "sync_comments.py",
+        "xlsx_patch.py",
+        "audit.py",
+        "index.py",
+        "server.py",
         "config.ini",
         "build_exe.py",
         "create_distribution.py",
@@ -0,0 +1,384 @@
+"""
+服务模式：常驻后台，保留内存中的源数据，命令行通过本地 HTTP 把同步、对比任务提交给后台服务
+
+由 sync_comments 在用到时才导入（不影响其他命令的启动时间）；
+配置项由 sync_comments.apply_config 设置，这里通过 core 读取当前值
+"""
+
+import collections
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+import sync_comments as core
+
+
+# 服务信息文件：端口、进程号和访问令牌，命令行据此把任务提交给后台服务
+SERVER_INFO_FILE = os.path.join(core.CACHE_DIR, 'server.json')
+# 任务输出保留的最大行数，超出时丢弃最早的行（查看进度时只需要最近的输出）
+JOB_OUTPUT_LIMIT = 5000
+
+
+class ThreadOutput:
+    """
+    按线程分发 print 的输出
+
+    任务线程的输出记录到各自的任务中，供客户端实时查看；其余线程仍写到原来的控制台。
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        job = getattr(self.local, 'job', None)
+        if job is None:
+            return self.stream.write(text)
+        job.emit(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class SyncJob:
+    """后台服务中的一个任务：命令、参数、状态和输出"""
+
+    def __init__(self, job_id, command, options):
+        self.id = job_id
+        self.command = command
+        self.options = options
+        self.status = '排队中'
+        self.error = None
+        self.result = None
+        self.created = time.time()
+        self.started = self.finished = None
+        self.lines = collections.deque(maxlen=JOB_OUTPUT_LIMIT)
+        self.offset = 0  # 已被丢弃的行数
+        self.partial = ''
+        self.cond = threading.Condition()
+
+    def emit(self, text):
+        with self.cond:
+            text = self.partial + text
+            *lines, self.partial = text.split('\n')
+            for line in lines:
+                if len(self.lines) == self.lines.maxlen:
+                    self.offset += 1
+                self.lines.append(line)
+            self.cond.notify_all()
+
+    def finish(self, status, error=None, result=None):
+        with self.cond:
+            if self.partial:
+                self.lines.append(self.partial)
+                self.partial = ''
+            self.status, self.error, self.result = status, error, result
+            self.finished = time.time()
+            self.cond.notify_all()
+
+    @property
+    def done(self):
+        return self.status in ('完成', '失败')
+
+    def wait_lines(self, position, timeout=15):
+        """返回第 position 行之后的输出 (新位置, 行列表, 是否已结束)；没有新输出时最多等待 timeout 秒"""
+        with self.cond:
+            if position - self.offset >= len(self.lines) and not self.done:
+                self.cond.wait(timeout)
+            start = max(position, self.offset)
+            lines = list(self.lines)[start - self.offset:]
+            return start + len(lines), lines, self.done
+
+    def as_dict(self):
+        return {
+            'id': self.id, 'command': self.command, 'options': self.options, 'status': self.status,
+            'error': self.error, 'created': self.created, 'started': self.started, 'finished': self.finished,
+        }
+
+
+class SyncServer:
+    """
+    常驻的同步服务：任务队列 + 固定数量的工作线程
+
+    - 源数据解析结果保留在内存中（SourceMemoryCache），重复同步时不再解析源文件
+    - config.ini 修改后，在没有任务运行时重新加载
+    - 输出到同一文件（或同一输出目录）的任务依次执行，其余任务并发执行
+    """
+
+    def __init__(self, workers):
+        import queue
+
+        self.queue = queue.Queue()
+        self.jobs = collections.OrderedDict()
+        self.next_id = 1
+        self.lock = threading.Lock()
+        self.path_locks = collections.defaultdict(threading.Lock)
+        self.config_cond = threading.Condition()
+        self.config_mtime = self.read_config_mtime()
+        self.active = 0
+        self.threads = [
+            threading.Thread(target=self.worker, name=f'sync-worker-{i + 1}', daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    @staticmethod
+    def read_config_mtime():
+        try:
+            return os.stat(core.CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return None
+
+    def submit(self, command, options):
+        with self.lock:
+            job = SyncJob(str(self.next_id), command, options)
+            self.next_id += 1
+            self.jobs[job.id] = job
+            # 只保留最近 100 个任务的记录
+            while len(self.jobs) > 100 and next(iter(self.jobs.values())).done:
+                self.jobs.popitem(last=False)
+        self.queue.put(job)
+        return job
+
+    def worker(self):
+        while True:
+            job = self.queue.get()
+            self.begin_job()
+            try:
+                self.run_job(job)
+            finally:
+                self.end_job()
+
+    def begin_job(self):
+        """config.ini 有变化时等待运行中的任务结束，然后重新加载配置"""
+        with self.config_cond:
+            while self.read_config_mtime() != self.config_mtime and self.active:
+                self.config_cond.wait()
+            mtime = self.read_config_mtime()
+            if mtime != self.config_mtime:
+                self.config_mtime = mtime
+                print("检测到 config.ini 已修改，重新加载配置")
+                core.apply_config(core.load_config())
+            self.active += 1
+
+    def end_job(self):
+        with self.config_cond:
+            self.active -= 1
+            self.config_cond.notify_all()
+
+    def job_lock(self, job):
+        """输出到同一位置的任务使用同一把锁；预演不写文件，不需要加锁"""
+        if job.command == 'sync':
+            return self.path_locks[os.path.abspath(core.OUTPUT_FILE)]
+        if job.command == 'batch':
+            output_dir = job.options.get('output_dir') or core.BATCH_OUTPUT_DIR
+            return self.path_locks[os.path.abspath(os.path.join(core.SCRIPT_DIR, output_dir))]
+        return contextlib.nullcontext()
+
+    def run_job(self, job):
+        sys.stdout.local.job = job
+        job.status, job.started = '运行中', time.time()
+        try:
+            with self.job_lock(job):
+                result = run_command(job.command, job.options)
+            job.finish('完成', result=result)
+        except Exception as e:
+            job.emit(f"错误: {type(e).__name__}: {e}\n")
+            job.finish('失败', error=f"{type(e).__name__}: {e}")
+        finally:
+            sys.stdout.local.job = None
+
+    def status(self):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return {
+            'pid': os.getpid(),
+            'workers': len(self.threads),
+            'queued': sum(1 for job in jobs if job.status == '排队中'),
+            'running': sum(1 for job in jobs if job.status == '运行中'),
+            'memory_cache': core.SOURCE_MEMORY_CACHE.stats() if core.SOURCE_MEMORY_CACHE is not None else None,
+            'jobs': [job.as_dict() for job in jobs[-20:]],
+        }
+
+
+def run_command(command, options):
+    """执行一个同步命令（sync / batch / dry-run / diff），返回可写入 JSON 的结果"""
+    use_cache = not options.get('no_cache')
+    if command == 'diff':
+        report = core.diff_workbooks(options.get('old_file'), options.get('new_files'), options.get('report_file'),
+                                use_cache=use_cache)
+        return report['summary']
+    if command == 'dry-run':
+        core.dry_run(options.get('plan_file') or None, options.get('batch'), options.get('workers'), use_cache=use_cache)
+        return None
+    if command == 'batch':
+        results = core.sync_batch(options.get('batch') or core.BATCH_TARGETS, options.get('output_dir'),
+                             options.get('workers'), use_cache=use_cache)
+        return {'targets': len(results), 'failed': sum(1 for r in results if r['error'])}
+    if command == 'sync':
+        stats = core.sync_excel_comments(use_cache=use_cache, incremental=not options.get('full'))
+        return {'total': stats['total']}
+    raise ValueError(f"未知的命令: {command}")
+
+
+def make_request_handler(server, token):
+    """生成 HTTP 请求处理类；所有请求都需要在 X-Sync-Token 头中带上服务信息文件中的令牌"""
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, data, status=200):
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def authorized(self):
+            if self.headers.get('X-Sync-Token') == token:
+                return True
+            self.send_json({'error': '令牌错误'}, 403)
+            return False
+
+        def do_GET(self):
+            if not self.authorized():
+                return
+            parts = self.path.strip('/').split('/')
+            if parts == ['status']:
+                return self.send_json(server.status())
+            job = server.jobs.get(parts[1]) if len(parts) >= 2 and parts[0] == 'jobs' else None
+            if job is None:
+                return self.send_json({'error': '没有这个任务'}, 404)
+            if len(parts) == 2:
+                return self.send_json(job.as_dict())
+            if parts[2] == 'events':
+                return self.stream_events(job)
+            return self.send_json({'error': '未知的路径'}, 404)
+
+        def stream_events(self, job):
+            """逐行输出任务进度（每行一个 JSON），任务结束时输出结果后关闭连接"""
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+            self.end_headers()
+            position, finished = 0, False
+            while not finished:
+                position, lines, finished = job.wait_lines(position)
+                events = [{'type': 'output', 'text': line} for line in lines]
+                if finished:
+                    events.append({'type': 'end', 'status': job.status, 'error': job.error, 'result': job.result})
+                elif not lines:
+                    events.append({'type': 'status', 'status': job.status})
+                self.wfile.write(''.join(json.dumps(event, ensure_ascii=False) + '\n' for event in events).encode('utf-8'))
+                self.wfile.flush()
+
+        def do_POST(self):
+            if not self.authorized():
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                return self.send_json({'error': '请求格式错误'}, 400)
+            if self.path.rstrip('/') != '/jobs' or request.get('command') not in ('sync', 'batch', 'dry-run', 'diff'):
+                return self.send_json({'error': '未知的命令'}, 400)
+            job = server.submit(request['command'], request.get('options') or {})
+            self.send_json(job.as_dict(), 202)
+
+    return Handler
+
+
+def serve(port=None):
+    """
+    以服务模式运行：只监听本机地址，接收命令行提交的同步任务，直到按 Ctrl+C 退出
+
+    端口为 0 时由系统分配空闲端口；端口和访问令牌写入 .sync_cache/server.json。
+    """
+    import secrets
+    from http.server import ThreadingHTTPServer
+
+    # 工作线程中启动子进程时不使用 fork，避免复制其他线程持有的锁
+    multiprocessing.set_start_method('spawn', force=True)
+    core.SOURCE_MEMORY_CACHE = core.SourceMemoryCache(core.SERVER_MEMORY_MB)
+    sys.stdout = ThreadOutput(sys.stdout)
+
+    server = SyncServer(core.SERVER_JOBS)
+    token = secrets.token_hex(16)
+    httpd = ThreadingHTTPServer(('127.0.0.1', core.SERVER_PORT if port is None else port), make_request_handler(server, token))
+    httpd.daemon_threads = True
+    info = {'port': httpd.server_address[1], 'pid': os.getpid(), 'token': token}
+    os.makedirs(core.CACHE_DIR, exist_ok=True)
+    with open(SERVER_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump(info, f)
+
+    print(f"同步服务已启动: http://127.0.0.1:{info['port']}（进程 {info['pid']}，{len(server.threads)} 个并发任务，"
+          f"内存上限 {core.SERVER_MEMORY_MB} MB）")
+    print("直接运行本工具时任务会提交到此服务；按 Ctrl+C 停止服务")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n正在停止同步服务...")
+    finally:
+        httpd.server_close()
+        try:
+            with open(SERVER_INFO_FILE, 'r', encoding='utf-8') as f:
+                if json.load(f).get('pid') == os.getpid():
+                    os.remove(SERVER_INFO_FILE)
+        except (OSError, ValueError):
+            pass
+
+
+def run_via_server(command, options):
+    """
+    把任务提交给后台服务并实时输出进度，返回任务是否成功
+
+    没有运行中的服务（没有服务信息文件或无法连接）时返回 None，由调用方在本进程中执行。
+    """
+    try:
+        with open(SERVER_INFO_FILE, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    import http.client
+
+    headers = {'Content-Type': 'application/json', 'X-Sync-Token': info.get('token', '')}
+    try:
+        conn = http.client.HTTPConnection('127.0.0.1', info['port'], timeout=5)
+        conn.request('POST', '/jobs', json.dumps({'command': command, 'options': options}).encode('utf-8'), headers)
+        response = conn.getresponse()
+        job = json.loads(response.read())
+        conn.close()
+        if response.status != 202:
+            print(f"后台服务拒绝了任务（{job.get('error')}），改为直接运行")
+            return None
+    except (OSError, ValueError, KeyError, http.client.HTTPException):
+        print("后台服务没有响应，改为直接运行")
+        return None
+
+    print(f"已提交到后台同步服务（端口 {info['port']}，任务 {job['id']}）")
+    conn = http.client.HTTPConnection('127.0.0.1', info['port'])
+    conn.request('GET', f"/jobs/{job['id']}/events", headers=headers)
+    response = conn.getresponse()
+    status = None
+    for line in response:
+        event = json.loads(line)
+        if event['type'] == 'output':
+            print(event['text'])
+        elif event['type'] == 'end':
+            status = event['status']
+            if event['error']:
+                print(f"任务失败: {event['error']}")
+    conn.close()
+    return status == '完成'
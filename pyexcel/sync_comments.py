@@ -1,12 +1,36 @@
-import openpyxl
-from openpyxl.comments import Comment
-from openpyxl.utils import column_index_from_string
-
+# openpyxl 只在需要时导入（openpyxl 读取/输出方式、XML 解析失败后的回退），
+# 默认的 XML 读取和补丁式写入路径不导入 openpyxl，缩短启动时间
 
 # ================= 配置加载 =================
 import os
+import re
 import sys
+import glob
+import json
+import time
+import pickle
+import struct
+import fnmatch
+import hashlib
+import threading
+import functools
+import itertools
+import gc
+import unicodedata
+import contextlib
+import tracemalloc
+import collections
+import multiprocessing
+from datetime import datetime
+import zipfile
+import posixpath
 import configparser
+import xml.etree.ElementTree as ET
+
+# 直接运行脚本时本模块名为 __main__（多进程子进程中为 __mp_main__），而拆分出的模块
+# （xlsx_patch、audit、index、server）通过 import sync_comments 读取配置和公共函数，
+# 这里登记为同一个模块对象，避免重新导入一份未经 apply_config 设置的副本
+sys.modules.setdefault('sync_comments', sys.modules[__name__])
 
 # 获取可执行文件所在目录（支持 PyInstaller 打包）
 if getattr(sys, 'frozen', False):
@@ -29,7 +53,32 @@ DEFAULT_CONFIG = {
     'COLS_TO_SYNC': ['DO', 'DP', 'DS', 'DU'],
     'MERGE_COMMENTS': True,
     'MERGE_SEPARATOR': '\n---\n',
-    'START_ROW': 3
+    'START_ROW': 3,
+    'MATCH_COLS': [],
+    'NORMALIZE_KEYS': True,
+    'SKIP_DUPLICATE_KEYS': False,
+    'SHEET_MAPPING': [],
+    'SOURCE_ENGINE': 'xml',
+    'OUTPUT_MODE': 'patch',
+    'CACHE_ENABLED': True,
+    'CACHE_MAX_MB': 100,
+    'PARALLEL_LOAD': True,
+    'INCREMENTAL_SYNC': True,
+    'BATCH_TARGETS': 'targets',
+    'BATCH_OUTPUT_DIR': 'output',
+    'BATCH_WORKERS': 0,
+    'SERVER_PORT': 0,
+    'SERVER_MEMORY_MB': 512,
+    'SERVER_JOBS': 2,
+    'WATCH_DEBOUNCE': 2.0,
+    'WATCH_POLL_INTERVAL': 1.0,
+    'WATCH_TARGET': False,
+    'WATCH_METHOD': 'auto',
+    'AUDIT_ENABLED': True,
+    'AUDIT_DB': 'sync_audit.db',
+    'AUDIT_TEXT_LOG': True,
+    'INDEX_DIR': 'archive',
+    'INDEX_DB': 'comment_index.db',
 }
 
 def load_config():
@@ -56,8 +105,11 @@ def load_config():
             config['COL_NAME'] = parser.get('列配置', '姓名列', fallback=config['COL_NAME']).strip()
             
             # 读取同步列（逗号分隔）
+            # 填写 * 表示同步所有有批注的列
             cols_str = parser.get('列配置', '同步列', fallback='')
-            if cols_str:
+            if cols_str.strip() in ('*', '全部'):
+                config['COLS_TO_SYNC'] = ['*']
+            elif cols_str:
                 config['COLS_TO_SYNC'] = [col.strip() for col in cols_str.split(',') if col.strip()]
         
         # 读取筛选条件
@@ -72,6 +124,20 @@ def load_config():
         # 读取数据设置
         if parser.has_section('数据设置'):
             config['START_ROW'] = parser.getint('数据设置', '数据起始行', fallback=config['START_ROW'])
+
+        # 读取匹配设置（匹配列留空表示只按姓名列匹配）
+        if parser.has_section('匹配设置'):
+            match_str = parser.get('匹配设置', '匹配列', fallback='')
+            config['MATCH_COLS'] = [col.strip() for col in match_str.split(',') if col.strip()]
+            config['NORMALIZE_KEYS'] = parser.getboolean('匹配设置', '标准化', fallback=config['NORMALIZE_KEYS'])
+            config['SKIP_DUPLICATE_KEYS'] = parser.getboolean(
+                '匹配设置', '重复时跳过', fallback=config['SKIP_DUPLICATE_KEYS']
+            )
+
+        # 读取工作表映射（留空表示只处理两个文件的活动工作表）
+        if parser.has_section('工作表'):
+            mapping_str = parser.get('工作表', '映射', fallback='')
+            config['SHEET_MAPPING'] = [item.strip() for item in mapping_str.split(',') if item.strip()]
         
         # 读取批注合并设置
         if parser.has_section('批注合并'):
@@ -80,6 +146,53 @@ def load_config():
             # 处理转义字符
             config['MERGE_SEPARATOR'] = separator.replace('\\n', '\n').replace('\\t', '\t')
         
+        # 读取性能设置
+        if parser.has_section('性能设置'):
+            engine = parser.get('性能设置', '源文件读取方式', fallback=config['SOURCE_ENGINE']).strip().lower()
+            if engine in ('xml', 'openpyxl'):
+                config['SOURCE_ENGINE'] = engine
+            else:
+                print(f"警告: 未知的源文件读取方式 {engine}，将使用 {config['SOURCE_ENGINE']}")
+            mode = parser.get('性能设置', '输出方式', fallback=config['OUTPUT_MODE']).strip().lower()
+            if mode in ('patch', 'openpyxl'):
+                config['OUTPUT_MODE'] = mode
+            else:
+                print(f"警告: 未知的输出方式 {mode}，将使用 {config['OUTPUT_MODE']}")
+            config['CACHE_ENABLED'] = parser.getboolean('性能设置', '启用缓存', fallback=config['CACHE_ENABLED'])
+            config['CACHE_MAX_MB'] = parser.getint('性能设置', '缓存上限MB', fallback=config['CACHE_MAX_MB'])
+            config['PARALLEL_LOAD'] = parser.getboolean('性能设置', '并行加载', fallback=config['PARALLEL_LOAD'])
+            config['INCREMENTAL_SYNC'] = parser.getboolean('性能设置', '增量同步', fallback=config['INCREMENTAL_SYNC'])
+        
+        # 读取批量处理设置
+        if parser.has_section('批量处理'):
+            config['BATCH_TARGETS'] = parser.get('批量处理', '目标文件', fallback=config['BATCH_TARGETS']).strip()
+            config['BATCH_OUTPUT_DIR'] = parser.get('批量处理', '输出目录', fallback=config['BATCH_OUTPUT_DIR']).strip()
+            config['BATCH_WORKERS'] = parser.getint('批量处理', '并行进程数', fallback=config['BATCH_WORKERS'])
+
+        # 读取服务模式设置
+        if parser.has_section('服务模式'):
+            config['SERVER_PORT'] = parser.getint('服务模式', '端口', fallback=config['SERVER_PORT'])
+            config['SERVER_MEMORY_MB'] = parser.getint('服务模式', '内存上限MB', fallback=config['SERVER_MEMORY_MB'])
+            config['SERVER_JOBS'] = parser.getint('服务模式', '并发任务数', fallback=config['SERVER_JOBS'])
+
+        # 读取监视模式设置
+        if parser.has_section('监视模式'):
+            config['WATCH_DEBOUNCE'] = parser.getfloat('监视模式', '等待秒数', fallback=config['WATCH_DEBOUNCE'])
+            config['WATCH_POLL_INTERVAL'] = parser.getfloat('监视模式', '检查间隔秒数', fallback=config['WATCH_POLL_INTERVAL'])
+            config['WATCH_TARGET'] = parser.getboolean('监视模式', '监视目标文件', fallback=config['WATCH_TARGET'])
+            config['WATCH_METHOD'] = parser.get('监视模式', '监视方式', fallback=config['WATCH_METHOD']).strip().lower()
+
+        # 读取审计记录设置
+        if parser.has_section('审计记录'):
+            config['AUDIT_ENABLED'] = parser.getboolean('审计记录', '启用', fallback=config['AUDIT_ENABLED'])
+            config['AUDIT_DB'] = parser.get('审计记录', '数据库', fallback=config['AUDIT_DB']).strip() or config['AUDIT_DB']
+            config['AUDIT_TEXT_LOG'] = parser.getboolean('审计记录', '文字日志', fallback=config['AUDIT_TEXT_LOG'])
+
+        # 读取批注检索设置
+        if parser.has_section('批注检索'):
+            config['INDEX_DIR'] = parser.get('批注检索', '归档目录', fallback=config['INDEX_DIR']).strip() or config['INDEX_DIR']
+            config['INDEX_DB'] = parser.get('批注检索', '数据库', fallback=config['INDEX_DB']).strip() or config['INDEX_DB']
+        
         print(f"✓ 已从配置文件加载配置: {CONFIG_FILE}\n")
         
     except Exception as e:
@@ -88,190 +201,2851 @@ def load_config():
     
     return config
 
-# 加载配置
-config = load_config()
-
-# 将配置赋值给变量（保持原有代码兼容）
-SOURCE_FILE = os.path.join(SCRIPT_DIR, config['SOURCE_FILE'])
-TARGET_FILE = os.path.join(SCRIPT_DIR, config['TARGET_FILE'])
-OUTPUT_FILE = os.path.join(SCRIPT_DIR, config['OUTPUT_FILE'])
-COL_REGION = config['COL_REGION']
-COL_NAME = config['COL_NAME']
-TARGET_REGION = config['TARGET_REGION']
-COLS_TO_SYNC = config['COLS_TO_SYNC']
-MERGE_COMMENTS = config['MERGE_COMMENTS']
-MERGE_SEPARATOR = config['MERGE_SEPARATOR']
-START_ROW = config['START_ROW']
+def apply_config(config):
+    """
+    把配置赋值给模块级变量（各函数直接使用这些变量）
+
+    导入模块时只应用默认配置，不读取配置文件；配置文件在 main() 中读取。
+    子进程（spawn 方式）不会继承主进程的设置，进程池用本函数作为初始化函数传入配置。
+    """
+    global CONFIG, SOURCE_FILES, TARGET_FILE, OUTPUT_FILE, COL_REGION, COL_NAME, TARGET_REGION
+    global COLS_TO_SYNC, SYNC_ALL_COLUMNS, MERGE_COMMENTS, MERGE_SEPARATOR, START_ROW, MATCH_COLS, NORMALIZE_KEYS
+    global SKIP_DUPLICATE_KEYS
+    global SHEET_MAPPING
+    global SOURCE_ENGINE, OUTPUT_MODE, CACHE_ENABLED, CACHE_MAX_MB, PARALLEL_LOAD, INCREMENTAL_SYNC
+    global BATCH_TARGETS, BATCH_OUTPUT_DIR, BATCH_WORKERS, SERVER_PORT, SERVER_MEMORY_MB, SERVER_JOBS
+    global WATCH_DEBOUNCE, WATCH_POLL_INTERVAL, WATCH_TARGET, WATCH_METHOD, AUDIT_ENABLED, AUDIT_DB, AUDIT_TEXT_LOG
+    global INDEX_DIR, INDEX_DB
+
+    CONFIG = config
+    # 源文件可以是逗号分隔的多个文件，按配置顺序合并
+    SOURCE_FILES = [os.path.join(SCRIPT_DIR, f.strip()) for f in config['SOURCE_FILE'].split(',') if f.strip()]
+    TARGET_FILE = os.path.join(SCRIPT_DIR, config['TARGET_FILE'])
+    OUTPUT_FILE = os.path.join(SCRIPT_DIR, config['OUTPUT_FILE'])
+    COL_REGION = config['COL_REGION']
+    COL_NAME = config['COL_NAME']
+    TARGET_REGION = config['TARGET_REGION']
+    COLS_TO_SYNC = config['COLS_TO_SYNC']
+    SYNC_ALL_COLUMNS = COLS_TO_SYNC == ['*']
+    MERGE_COMMENTS = config['MERGE_COMMENTS']
+    MERGE_SEPARATOR = config['MERGE_SEPARATOR']
+    START_ROW = config['START_ROW']
+    # 匹配列可以写列字母，也可以写 姓名、区域（对应姓名列、区域列）
+    named_cols = {'姓名': COL_NAME, '区域': COL_REGION}
+    MATCH_COLS = [named_cols.get(col, col).upper() for col in config['MATCH_COLS']] or [COL_NAME.upper()]
+    NORMALIZE_KEYS = config['NORMALIZE_KEYS']
+    SKIP_DUPLICATE_KEYS = config['SKIP_DUPLICATE_KEYS']
+    SHEET_MAPPING = config['SHEET_MAPPING']
+    SOURCE_ENGINE = config['SOURCE_ENGINE']
+    OUTPUT_MODE = config['OUTPUT_MODE']
+    CACHE_ENABLED = config['CACHE_ENABLED']
+    CACHE_MAX_MB = config['CACHE_MAX_MB']
+    PARALLEL_LOAD = config['PARALLEL_LOAD']
+    INCREMENTAL_SYNC = config['INCREMENTAL_SYNC']
+    BATCH_TARGETS = config['BATCH_TARGETS']
+    BATCH_OUTPUT_DIR = config['BATCH_OUTPUT_DIR']
+    BATCH_WORKERS = config['BATCH_WORKERS']
+    SERVER_PORT = config['SERVER_PORT']
+    SERVER_MEMORY_MB = config['SERVER_MEMORY_MB']
+    SERVER_JOBS = config['SERVER_JOBS']
+    WATCH_DEBOUNCE = config['WATCH_DEBOUNCE']
+    WATCH_POLL_INTERVAL = config['WATCH_POLL_INTERVAL']
+    WATCH_TARGET = config['WATCH_TARGET']
+    WATCH_METHOD = config['WATCH_METHOD']
+    AUDIT_ENABLED = config['AUDIT_ENABLED']
+    AUDIT_DB = config['AUDIT_DB']
+    AUDIT_TEXT_LOG = config['AUDIT_TEXT_LOG']
+    INDEX_DIR = config['INDEX_DIR']
+    INDEX_DB = config['INDEX_DB']
+
+
+apply_config(DEFAULT_CONFIG)
 # =======================================================
 
 
-def sync_excel_comments():
-    print(f"正在加载源文件: {SOURCE_FILE} ...")
-    wb_source = openpyxl.load_workbook(SOURCE_FILE, data_only=False)
-    ws_source = wb_source.active # 或者指定 sheet 名: wb_source['Sheet1']
+# ================= 性能统计 =================
+
+def peak_rss_mb():
+    """当前进程的内存峰值（MB），无法获取时返回 None"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 1024 / 1024
+        except (ImportError, AttributeError):
+            return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 单位为字节，Linux 为 KB
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+class PhaseStats:
+    """
+    记录各阶段的墙钟时间、CPU 时间和内存峰值，以及行数、批注数等计数
+
+    用法: with stats.phase('读取源文件'): ...
+    内存峰值为进程截至该阶段结束时的峰值；trace_memory 为 True 时另用 tracemalloc
+    记录每个阶段内 Python 对象分配的峰值（会明显拖慢运行，默认关闭）。
+    """
+
+    def __init__(self, trace_memory=False):
+        self.phases = {}
+        self.counts = {}
+        self.total = None
+        self.trace_memory = trace_memory
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        if trace_memory:
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall, time.process_time() - cpu, peak_rss_mb())
+            if self.trace_memory:
+                self.phases[name]['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+
+    def add(self, name, wall, cpu=None, peak_mb=None):
+        """记录在别处（如子进程中）测得的阶段用时"""
+        self.phases[name] = {'wall': wall, 'cpu': cpu, 'peak_rss_mb': peak_mb}
+
+    def wall(self, *names):
+        return sum(self.phases[name]['wall'] for name in names if name in self.phases)
+
+    def finish(self):
+        """记录从开始到现在的总用时"""
+        self.total = {
+            'wall': time.perf_counter() - self.start_wall,
+            'cpu': time.process_time() - self.start_cpu,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        if self.trace_memory:
+            self.total['traced_peak_mb'] = max(
+                (p.get('traced_peak_mb') or 0 for p in self.phases.values()), default=0
+            )
+        return self.total
+
+    def throughput(self):
+        """读取、处理速度（行/秒、个/秒）"""
+        def rate(count_name, *phase_names):
+            seconds = self.wall(*phase_names)
+            count = self.counts.get(count_name)
+            return count / seconds if count is not None and seconds > 0 else None
+
+        return {
+            '源文件扫描速度（行/秒）': rate('源文件行数', '读取源文件', '读取源文件（子进程）'),
+            '源批注读取速度（个/秒）': rate('源批注数', '读取源文件', '读取源文件（子进程）'),
+            '目标文件扫描速度（行/秒）': rate('目标文件行数', '加载目标文件'),
+            '批注处理速度（个/秒）': rate('处理批注数', '匹配', '保存'),
+        }
+
+    def as_dict(self):
+        return {
+            'phases': self.phases,
+            'total': self.total,
+            'counts': self.counts,
+            'throughput': self.throughput(),
+        }
+
+
+def format_phase_stats(name, entry):
+    """一个阶段的统计，用于控制台和日志"""
+    text = f"用时 {entry['wall']:7.3f} 秒"
+    if entry.get('cpu') is not None:
+        text += f" | CPU {entry['cpu']:7.3f} 秒"
+    if entry.get('peak_rss_mb') is not None:
+        text += f" | 内存峰值 {entry['peak_rss_mb']:7.1f} MB"
+    if entry.get('traced_peak_mb') is not None:
+        text += f" | Python 分配峰值 {entry['traced_peak_mb']:7.1f} MB"
+    # 按显示宽度对齐（中文字符占两格）
+    return f"{name}{' ' * max(0, 12 - len(name) * 2)}  {text}"
+
 
-    print(f"正在加载目标文件: {TARGET_FILE} ...")
-    wb_target = openpyxl.load_workbook(TARGET_FILE, data_only=False)
-    ws_target = wb_target.active
+# ================= 源文件读取 =================
+
+# 源数据中的批注内容（与 openpyxl 的 Comment 一样提供 .text 和 .author）
+# source 为批注来源的源文件名，合并多个源文件时设置
+CommentText = collections.namedtuple('CommentText', ['text', 'author', 'source'], defaults=(None,))
+
+
+# gc_paused 的使用计数：服务模式下多个任务在不同线程中同时运行，而垃圾回收的开关对整个进程生效
+GC_PAUSE_LOCK = threading.Lock()
+GC_PAUSE_STATE = {'count': 0, 'was_enabled': False}
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    暂时关闭循环垃圾回收
+
+    建立索引和匹配时一次创建几十万个元组和字典（没有循环引用），每分配一批对象就会触发分代回收，
+    扫描已加载的全部源数据行和目标行，这部分耗时可能超过匹配本身。
+    多个线程同时使用时，第一个进入时关闭，最后一个退出时才恢复为进入前的状态。
+    """
+    with GC_PAUSE_LOCK:
+        if GC_PAUSE_STATE['count'] == 0:
+            GC_PAUSE_STATE['was_enabled'] = gc.isenabled()
+            gc.disable()
+        GC_PAUSE_STATE['count'] += 1
+    try:
+        yield
+    finally:
+        with GC_PAUSE_LOCK:
+            GC_PAUSE_STATE['count'] -= 1
+            if GC_PAUSE_STATE['count'] == 0 and GC_PAUSE_STATE['was_enabled']:
+                gc.enable()
+
+
+def normalize_key_value(value):
+    """
+    匹配键中的单个值：数字 1.0 与 1 视为相同；启用标准化时，
+    全角字符转为半角（NFKC），去掉首尾空白，连续空白合并为一个空格
+    """
+    if type(value) is str:
+        text = value
+    elif value is None:
+        return ''
+    elif isinstance(value, float) and value.is_integer():
+        text = str(int(value))
+    else:
+        text = str(value)
+    if NORMALIZE_KEYS:
+        text = ' '.join(unicodedata.normalize('NFKC', text).split())
+    return text
+
+
+def match_key(key_vals):
+    """由匹配列的值得到匹配键（元组）；所有列都为空时返回 None"""
+    key = tuple(normalize_key_value(value) for value in key_vals)
+    return key if any(key) else None
+
+
+def normalize_column(values):
+    """标准化一列值，结果与逐个调用 normalize_key_value 相同；字符串直接在推导式中处理，省去函数调用"""
+    if NORMALIZE_KEYS:
+        nfkc = unicodedata.normalize
+        return [' '.join(nfkc('NFKC', v).split()) if type(v) is str else normalize_key_value(v) for v in values]
+    return [v if type(v) is str else normalize_key_value(v) for v in values]
+
+
+def match_keys(key_rows):
+    """
+    批量计算匹配键，结果与逐行调用 match_key 相同
+
+    key_rows: 每行匹配列的值 [(值, ...), ...]
+    按列处理：先把每个匹配列整列标准化，再按行组合成键。
+    """
+    if not key_rows:
+        return []
+    columns = [normalize_column([vals[i] for vals in key_rows]) for i in range(len(key_rows[0]))]
+    if len(columns) == 1:
+        return [(text,) if text else None for text in columns[0]]
+    return [key if any(key) else None for key in zip(*columns)]
+
+
+def format_match_key(key):
+    """日志中显示的匹配键，例如 张三 / 厦门"""
+    return ' / '.join(key)
+
+
+def assemble_comments_map(source_rows, origin=None):
+    """
+    按区域筛选和同步列，从源数据行得到批注映射表
+
+    source_rows: 按行号顺序的 (行号, 姓名, 区域, (匹配列的值, ...), { 列字母: 批注 })
+    返回 ({ 匹配键: { 列字母: 批注 } }, [匹配冲突])
+
+    匹配键相同的多行：默认与以前一样使用最后一行的批注，不记为冲突；
+    配置了 重复时跳过 时，只要其中有一行带同步列的批注就无法确定该用哪一行，
+    这样的键不进入映射表，记为冲突：{'key': 匹配键, 'source': 来源, 'rows': [行号, ...]}
+    """
+    regions = None
+    if TARGET_REGION:
+        regions = frozenset(TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION])
+    sync_cols = None if SYNC_ALL_COLUMNS else [(col, col.upper()) for col in COLS_TO_SYNC]
+    sync_src_cols = None if sync_cols is None else frozenset(src_col for _, src_col in sync_cols)
+
+    # 先整体筛选区域和姓名，再批量计算匹配键
+    if regions:
+        source_rows = [row for row in source_rows if row[1] and row[2] in regions]
+    else:
+        source_rows = [row for row in source_rows if row[1]]
+    keys = match_keys([row[3] for row in source_rows])
 
-    # --- 第一步：构建源数据的批注映射表 ---
-    # 结构: { "张三": { "DN": "批注内容A", "DO": "批注内容B" } }
     comments_map = {}
-    
-    print("正在建立源数据索引...")
-    # 获取列的数字索引 (openpyxl 内部用)
-    idx_region = column_index_from_string(COL_REGION) - 1
-    idx_name = column_index_from_string(COL_NAME) - 1
-    
-    for row in ws_source.iter_rows(min_row=START_ROW):
-        # 1. 区域筛选 - 支持多区域
-        region_val = row[idx_region].value
-        
-        # 如果设置了区域筛选，且当前行不匹配，则跳过
-        if TARGET_REGION:
-            # 将 TARGET_REGION 统一转换为列表处理
-            regions = TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION]
-            if region_val not in regions:
-                continue
-            
-        # 2. 获取姓名
-        name_val = row[idx_name].value
-        if not name_val:
+    first_rows = {}  # 每个匹配键第一次出现的行号
+    duplicate_rows = {}  # 出现多次的匹配键：{ 匹配键: [行号, ...] }
+    for (row_idx, _, _, _, row_comments), key in zip(source_rows, keys):
+        if key is None:
             continue
-            
-        # 3. 提取指定列的批注
-        comments_map[name_val] = {}
-        for col_letter in COLS_TO_SYNC:
-            # 拼接单元格坐标，例如 "DN5"
-            cell_ref = f"{col_letter}{row[0].row}"
-            source_cell = ws_source[cell_ref]
-            
-            if source_cell.comment:
-                # 存下批注对象
-                comments_map[name_val][col_letter] = source_cell.comment
 
-    print(f"索引完成，共找到 {len(comments_map)} 个符合区域筛选的人员数据。")
-    if TARGET_REGION:
-        regions = TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION]
-        print(f"筛选区域: {', '.join(regions)}")
+        if sync_cols is None:
+            comments = dict(sorted(row_comments.items(), key=lambda item: column_letter_to_index(item[0])))
+        elif row_comments.keys().isdisjoint(sync_src_cols):
+            # 大多数行的批注都不在同步列中
+            comments = {}
+        else:
+            comments = {
+                col: row_comments[src_col] for col, src_col in sync_cols if src_col in row_comments
+            }
 
-    # --- 第二步：写入目标文件 ---
-    print("正在同步批注到目标文件...")
-    updated_count = 0
-    merged_count = 0
-    
-    # 记录详细信息
-    sync_details = []  # 记录所有同步操作的详情
-    merged_details = []  # 记录合并操作的详情
-    
-    for row in ws_target.iter_rows(min_row=START_ROW):
-        name_val = row[idx_name].value
-        
-        # 如果这个人在我们的源映射表中
-        if name_val in comments_map:
-            user_comments = comments_map[name_val]
-            
-            for col_letter, source_comment in user_comments.items():
-                # 定位目标单元格
-                target_cell_ref = f"{col_letter}{row[0].row}"
-                target_cell = ws_target[target_cell_ref]
-                
-                # 检查目标单元格是否已有批注
-                if target_cell.comment and MERGE_COMMENTS:
-                    # 合并批注：原有批注 + 分隔符 + 新批注
-                    existing_text = target_cell.comment.text
-                    new_text = existing_text + MERGE_SEPARATOR + source_comment.text
-                    
-                    # 保留原有批注的作者，或者使用源批注的作者
-                    author = target_cell.comment.author or source_comment.author
-                    new_comment = Comment(new_text, author)
-                    merged_count += 1
-                    
-                    # 记录合并详情
-                    merged_details.append({
-                        'name': name_val,
-                        'cell': target_cell_ref,
-                        'column': col_letter,
-                        'original': existing_text[:50] + '...' if len(existing_text) > 50 else existing_text,
-                        'new': source_comment.text[:50] + '...' if len(source_comment.text) > 50 else source_comment.text
-                    })
-                    
-                    sync_details.append(f"[合并] {name_val} - 列{col_letter} (单元格{target_cell_ref})")
-                else:
-                    # 直接创建新批注（覆盖或新增）
-                    new_comment = Comment(source_comment.text, source_comment.author)
-                    action = "覆盖" if target_cell.comment else "新增"
-                    sync_details.append(f"[{action}] {name_val} - 列{col_letter} (单元格{target_cell_ref})")
-                
-                # 写入批注
-                target_cell.comment = new_comment
-                updated_count += 1
-
-    # --- 第三步：保存 ---
-    wb_target.save(OUTPUT_FILE)
-    
-    # --- 第四步：生成日志文件 ---
-    from datetime import datetime
-    log_file = os.path.join(SCRIPT_DIR, f'sync_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt')
-    
-    with open(log_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("Excel 批注同步日志\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write(f"执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # 配置信息
-        f.write("【配置信息】\n")
-        f.write(f"源文件: {SOURCE_FILE}\n")
-        f.write(f"目标文件: {TARGET_FILE}\n")
-        f.write(f"输出文件: {OUTPUT_FILE}\n")
-        f.write(f"区域列: {COL_REGION}\n")
-        f.write(f"姓名列: {COL_NAME}\n")
-        
-        if TARGET_REGION:
-            regions = TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION]
-            f.write(f"筛选区域: {', '.join(regions)}\n")
+        if key not in comments_map:
+            first_rows[key] = row_idx
+            comments_map[key] = comments
+        elif not SKIP_DUPLICATE_KEYS:
+            comments_map[key] = comments
         else:
-            f.write("筛选区域: 无筛选\n")
-            
-        f.write(f"同步列: {', '.join(COLS_TO_SYNC)}\n")
-        f.write(f"批注合并: {'启用' if MERGE_COMMENTS else '禁用'}\n")
-        f.write(f"数据起始行: {START_ROW}\n\n")
-        
-        # 统计信息
-        f.write("【统计信息】\n")
-        f.write(f"匹配人员数: {len(comments_map)} 人\n")
-        f.write(f"同步批注数: {updated_count} 个\n")
-        f.write(f"合并批注数: {merged_count} 个\n")
-        f.write(f"新增/覆盖数: {updated_count - merged_count} 个\n\n")
-        
-        # 详细操作记录
-        f.write("=" * 80 + "\n")
-        f.write("【详细操作记录】\n")
-        f.write("=" * 80 + "\n\n")
-        
-        for detail in sync_details:
-            f.write(detail + "\n")
-        
-        # 合并详情
-        if merged_details:
-            f.write("\n" + "=" * 80 + "\n")
-            f.write("【合并批注详情】\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for idx, item in enumerate(merged_details, 1):
-                f.write(f"{idx}. 姓名: {item['name']} | 列: {item['column']} | 单元格: {item['cell']}\n")
-                f.write(f"   原批注: {item['original']}\n")
-                f.write(f"   新批注: {item['new']}\n")
-                f.write("\n")
-    
-    # 控制台输出
-    print(f"处理完成！成功同步了 {updated_count} 个批注。")
-    if merged_count > 0:
-        print(f"其中 {merged_count} 个批注与原有批注进行了合并。")
-    print(f"文件已保存为: {OUTPUT_FILE}")
-    print(f"详细日志已保存为: {log_file}")
+            duplicate_rows.setdefault(key, [first_rows[key]]).append(row_idx)
+            if comments:
+                comments_map[key] = comments
+
+    collisions = []
+    for key, rows in sorted(duplicate_rows.items(), key=lambda item: item[1][0]):
+        if comments_map[key]:
+            del comments_map[key]
+            collisions.append({'key': key, 'source': origin, 'rows': rows})
+
+    return comments_map, collisions
+
+
+def combine_comment_parts(parts):
+    """
+    合并多个源文件中同一单元格的批注
+
+    parts: [(源文件顺序, 来源, 批注)]；按源文件顺序、再按作者排序后拼接，
+    内容完全相同的批注只保留第一次出现的。
+    """
+    parts = sorted(parts, key=lambda part: (part[0], part[2].author or ''))
+    if len(parts) == 1:
+        _, origin, comment = parts[0]
+        return CommentText(comment.text, comment.author, origin)
+
+    texts, authors, origins = [], [], []
+    for _, origin, comment in parts:
+        if comment.text in texts:
+            continue
+        texts.append(comment.text)
+        if comment.author and comment.author not in authors:
+            authors.append(comment.author)
+        if origin not in origins:
+            origins.append(origin)
+    author = ', '.join(authors) if authors else parts[0][2].author
+    return CommentText(MERGE_SEPARATOR.join(texts), author, '、'.join(origins))
+
+
+def combine_comments_maps(source_maps):
+    """
+    把多个源文件的批注映射表合并为一个，每个批注标注来源
+
+    source_maps: 按配置顺序的 [(来源, { 匹配键: { 列字母: 批注 } })]
+    同一人员同一列在多个源文件中都有批注时，按源文件顺序、再按作者合并。
+    """
+    if SYNC_ALL_COLUMNS:
+        col_order = column_letter_to_index
+    else:
+        positions = {col: i for i, col in enumerate(COLS_TO_SYNC)}
+        col_order = positions.get
+
+    if len(source_maps) == 1:
+        # 只有一个源文件：列的顺序在 assemble_comments_map 中已经排好，
+        # 直接在其生成的映射表上标注来源，不再逐人复制
+        origin, comments_map = source_maps[0]
+        for row_comments in comments_map.values():
+            for col, comment in row_comments.items():
+                row_comments[col] = CommentText(comment.text, comment.author, origin)
+        return comments_map
+
+    parts_map = {}
+    for order, (origin, comments_map) in enumerate(source_maps):
+        for key, row_comments in comments_map.items():
+            person = parts_map.setdefault(key, {})
+            for col, comment in row_comments.items():
+                person.setdefault(col, []).append((order, origin, comment))
+
+    return {
+        key: {
+            col: combine_comment_parts(person[col]) for col in sorted(person, key=col_order)
+        }
+        for key, person in parts_map.items()
+    }
+
+
+def source_label(source_file):
+    """日志中显示的批注来源：脚本目录下的源文件显示相对路径，其余显示完整路径"""
+    try:
+        label = os.path.relpath(source_file, SCRIPT_DIR)
+    except ValueError:  # Windows 下不在同一盘符
+        return source_file
+    return source_file if label.startswith(os.pardir) else label
+
+
+def group_comments_by_row(comments):
+    """
+    把 (单元格坐标, 批注) 按行号分组，只保留 START_ROW 及之后的批注
+
+    只遍历实际存在的批注，耗时与批注数量成正比，与行数、同步列数无关。
+    返回 { 行号: { 列字母: 批注 } }，例如 { 5: { "DO": 批注, "DP": 批注 } }
+    """
+    comments_by_row = {}
+    for ref, comment in comments:
+        col_letter, row_idx = split_cell_ref(ref)
+        if row_idx >= START_ROW:
+            comments_by_row.setdefault(row_idx, {})[col_letter] = comment
+    return comments_by_row
+
+
+def merge_source_rows(rows, comments_by_row):
+    """把 (行号, 姓名, 区域, 匹配列的值) 与按行分组的批注合并为源数据行，跳过没有姓名的行"""
+    return [
+        (row_idx, name_val, region_val, key_vals, comments_by_row.get(row_idx, {}))
+        for row_idx, name_val, region_val, key_vals in rows
+        if name_val
+    ]
+
+
+def iter_sheet_comments(archive, worksheet_path):
+    """逐个读取工作表批注部件（xl/comments*.xml）中的批注，返回 (单元格坐标, 批注)"""
+    from openpyxl.comments.comment_sheet import CommentSheet
+    from openpyxl.packaging.relationship import get_dependents, get_rels_path
+    from openpyxl.xml.constants import COMMENTS_NS
+    from openpyxl.xml.functions import fromstring
+
+    rels_path = get_rels_path(worksheet_path)
+    if rels_path not in archive.namelist():
+        return
+
+    rels = get_dependents(archive, rels_path)
+    for rel in rels.find(COMMENTS_NS):
+        comment_sheet = CommentSheet.from_tree(fromstring(archive.read(rel.target)))
+        for ref, comment in comment_sheet.comments:
+            yield ref, CommentText(comment.text, comment.author)
+
+
+def read_source_rows_streaming(source_file, sheet=None):
+    """
+    用 openpyxl 只读模式流式读取源数据行（sheet 为 None 时读取活动工作表）
+
+    只读模式（read_only）逐行读取姓名列和区域列的值，内存占用与列数无关；
+    只读模式不会加载批注，因此批注单独从批注部件中读取，并按行号分组。
+    结果与完整加载工作簿后逐个单元格读取批注完全一致。
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(source_file, read_only=True, data_only=False)
+    try:
+        ws = wb.active if sheet is None else wb[sheet]
+
+        # 第一遍：读取批注，按行号分组
+        comments_by_row = group_comments_by_row(iter_sheet_comments(wb._archive, ws._worksheet_path))
+
+        # 第二遍：流式扫描姓名列、区域列和匹配列
+        idx_region = column_letter_to_index(COL_REGION) - 1
+        idx_name = column_letter_to_index(COL_NAME) - 1
+        idx_keys = [column_letter_to_index(col) - 1 for col in MATCH_COLS]
+        max_col = max(idx_region, idx_name, *idx_keys) + 1
+
+        def iter_rows():
+            rows = ws.iter_rows(min_row=START_ROW, max_col=max_col, values_only=True)
+            for row_idx, values in enumerate(rows, START_ROW):
+                name_val = values[idx_name] if idx_name < len(values) else None
+                region_val = values[idx_region] if idx_region < len(values) else None
+                key_vals = tuple(values[idx] if idx < len(values) else None for idx in idx_keys)
+                yield row_idx, name_val, region_val, key_vals
+
+        return merge_source_rows(iter_rows(), comments_by_row)
+    finally:
+        wb.close()
+
+
+# ---------- XML 直接解析（不经过 openpyxl 的单元格模型） ----------
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+REL_OFFICE_DOCUMENT = REL_NS + '/officeDocument'
+REL_SHARED_STRINGS = REL_NS + '/sharedStrings'
+REL_WORKSHEET = REL_NS + '/worksheet'
+REL_COMMENTS = REL_NS + '/comments'
+
+CELL_REF_RE = re.compile(r'^\$?([A-Za-z]{1,3})\$?(\d+)$')
+
+
+class SharedStringRef(int):
+    """尚未解析的共享字符串下标（sharedStrings.xml 在工作表扫描之后按需读取）"""
+
+
+def split_cell_ref(ref):
+    """把 "DO15" 拆分为 ("DO", 15)"""
+    match = CELL_REF_RE.match(ref)
+    if not match:
+        raise ValueError(f"无效的单元格坐标: {ref}")
+    return match.group(1).upper(), int(match.group(2))
+
+
+@functools.lru_cache(maxsize=None)
+def column_letter_to_index(col_letter):
+    """把列字母转换为从 1 开始的列号，如 "A" -> 1, "DO" -> 119"""
+    index = 0
+    for ch in col_letter.upper():
+        index = index * 26 + ord(ch) - 64
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def column_index_to_letter(col_idx):
+    """把从 1 开始的列号转换为列字母，如 1 -> "A", 119 -> "DO"，与 column_letter_to_index 相反"""
+    letters = ''
+    while col_idx:
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def read_rels(archive, part):
+    """读取部件的关系文件，返回 { rId: (关系类型, 目标部件路径) }"""
+    folder, filename = posixpath.split(part)
+    rels_path = posixpath.join(folder, '_rels', f'{filename}.rels')
+    if rels_path not in archive.namelist():
+        return {}
+
+    rels = {}
+    root = ET.fromstring(archive.read(rels_path))
+    for rel in root.iter(f'{NS_PKG_REL}Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get('Id')] = (rel.get('Type'), target)
+    return rels
+
+
+def find_rel_target(rels, rel_type):
+    """返回第一个指定类型关系的目标路径，没有则返回 None"""
+    for target_type, target in rels.values():
+        if target_type == rel_type:
+            return target
+    return None
+
+
+def read_workbook_sheets(archive):
+    """
+    读取 workbook.xml 中的工作表列表
+
+    返回 (工作簿关系, [(工作表名, 关系类型, 部件路径)], 活动工作表序号)
+    """
+    workbook_part = find_rel_target(read_rels(archive, ''), REL_OFFICE_DOCUMENT)
+    if workbook_part is None:
+        raise ValueError("找不到 workbook.xml")
+    workbook_rels = read_rels(archive, workbook_part)
+
+    root = ET.fromstring(archive.read(workbook_part))
+    sheets = [
+        (sheet.get('name'), *workbook_rels[sheet.get(f'{{{REL_NS}}}id')])
+        for sheet in root.findall(f'{NS_MAIN}sheets/{NS_MAIN}sheet')
+    ]
+    view = root.find(f'{NS_MAIN}bookViews/{NS_MAIN}workbookView')
+    active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+    return workbook_rels, sheets, active_tab
+
+
+def list_sheet_names(path):
+    """文件中所有工作表（不含图表工作表）的名称，按工作簿中的顺序"""
+    with zipfile.ZipFile(path) as archive:
+        _, sheets, _ = read_workbook_sheets(archive)
+    return [name for name, rel_type, _ in sheets if rel_type == REL_WORKSHEET]
+
+
+def find_sheet_parts(archive, sheet_name=None):
+    """
+    定位工作表相关的 XML 部件，sheet_name 为 None 时为活动工作表
+
+    返回 (工作表部件, 批注部件或 None, 共享字符串部件或 None)
+    """
+    workbook_rels, sheets, active_tab = read_workbook_sheets(archive)
+    if sheet_name is None:
+        sheet_part = sheets[active_tab][2]
+    else:
+        parts = {name: part for name, _, part in sheets}
+        if sheet_name not in parts:
+            raise ValueError(f"找不到工作表: {sheet_name}")
+        sheet_part = parts[sheet_name]
+
+    comments_part = find_rel_target(read_rels(archive, sheet_part), REL_COMMENTS)
+    strings_part = find_rel_target(workbook_rels, REL_SHARED_STRINGS)
+    return sheet_part, comments_part, strings_part
+
+
+def text_content(node):
+    """富文本节点（<text>、<si>、<is>）的纯文本，忽略拼音标注 <rPh>"""
+    if node is None:
+        return ''
+    parts = []
+    plain = node.find(f'{NS_MAIN}t')
+    if plain is not None and plain.text:
+        parts.append(plain.text)
+    for run in node.findall(f'{NS_MAIN}r'):
+        run_text = run.find(f'{NS_MAIN}t')
+        if run_text is not None and run_text.text:
+            parts.append(run_text.text)
+    return ''.join(parts)
+
+
+def iter_comments_xml(archive, comments_part):
+    """iterparse 增量解析批注部件，逐个返回 (单元格坐标, 批注文本, 作者)"""
+    authors = []
+    with archive.open(comments_part) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f'{NS_MAIN}author':
+                authors.append(elem.text)
+            elif elem.tag == f'{NS_MAIN}comment':
+                author = authors[int(elem.get('authorId', 0))]
+                yield elem.get('ref'), text_content(elem.find(f'{NS_MAIN}text')), author
+                elem.clear()
+
+
+def parse_cell_value(cell):
+    """
+    解析 <c> 单元格的值，与 openpyxl（data_only=False）的结果保持一致
+
+    共享字符串返回 SharedStringRef，稍后统一解析；
+    遇到无法在单元格内还原的公式（共享/数组公式）时抛出 ValueError，交由 openpyxl 处理。
+    """
+    data_type = cell.get('t', 'n')
+
+    formula = cell.find(f'{NS_MAIN}f')
+    if formula is not None:
+        if formula.get('t') in ('array', 'dataTable') or (formula.get('t') == 'shared' and not formula.text):
+            raise ValueError(f"单元格 {cell.get('r')} 含共享/数组公式")
+        return '=' + (formula.text or '')
+
+    if data_type == 'inlineStr':
+        inline = cell.find(f'{NS_MAIN}is')
+        return text_content(inline) if inline is not None else None
+
+    value = cell.findtext(f'{NS_MAIN}v') or None
+    if value is None:
+        return None
+    if data_type == 'n':
+        if '.' in value or 'E' in value or 'e' in value:
+            return float(value)
+        return int(value)
+    if data_type == 's':
+        return SharedStringRef(int(value))
+    if data_type == 'b':
+        return bool(int(value))
+    if data_type in ('str', 'e'):
+        return value
+    raise ValueError(f"单元格 {cell.get('r')} 的类型 {data_type} 不支持直接解析")
+
+
+def scan_sheet_columns(archive, sheet_part, col_indexes):
+    """
+    iterparse 逐行扫描工作表 XML，只解析指定列的单元格
+
+    返回 [(行号, { 列号: 值 })]，只包含 START_ROW 及之后的行；
+    已处理的 <row> 节点会被立即清空，内存占用只与保留的值有关。
+    """
+    rows = []
+    row_tag = f'{NS_MAIN}row'
+    row_counter = 0
+
+    with archive.open(sheet_part) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag != row_tag:
+                continue
+
+            row_counter = int(elem.get('r', row_counter + 1))
+            if row_counter >= START_ROW:
+                values = {}
+                col_counter = 0
+                for cell in elem:
+                    ref = cell.get('r')
+                    if ref:
+                        col_counter = column_letter_to_index(ref.rstrip('0123456789'))
+                    else:
+                        col_counter += 1
+                    if col_counter in col_indexes:
+                        values[col_counter] = parse_cell_value(cell)
+                rows.append((row_counter, values))
+
+            elem.clear()
+
+    return rows
+
+
+def read_shared_strings(archive, strings_part, wanted):
+    """iterparse 读取共享字符串表，只保留 wanted 中的下标，返回 { 下标: 文本 }"""
+    strings = {}
+    index = 0
+    with archive.open(strings_part) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f'{NS_MAIN}si':
+                if index in wanted:
+                    strings[index] = text_content(elem).replace('x005F_', '')
+                index += 1
+                elem.clear()
+    return strings
+
+
+def read_column_values(archive, sheet_part, strings_part, col_indexes):
+    """扫描工作表指定列，并把共享字符串下标替换为文本，返回 [(行号, { 列号: 值 })]"""
+    rows = scan_sheet_columns(archive, sheet_part, col_indexes)
+
+    # 只解析实际用到的共享字符串
+    wanted = {v for _, values in rows for v in values.values() if isinstance(v, SharedStringRef)}
+    if not wanted:
+        return rows
+    if strings_part is None:
+        raise ValueError("找不到 sharedStrings.xml")
+    strings = read_shared_strings(archive, strings_part, wanted)
+
+    for _, values in rows:
+        for col_idx, value in values.items():
+            if isinstance(value, SharedStringRef):
+                values[col_idx] = strings[value]
+    return rows
+
+
+def read_source_rows_xml(source_file, sheet=None):
+    """
+    直接解析 xlsx 内部 XML 读取源数据行（sheet 为 None 时读取活动工作表）
+
+    只读取批注部件、工作表中的姓名列/区域列/匹配列以及被引用到的共享字符串，
+    不创建 openpyxl 的工作簿和单元格对象。
+    """
+    with zipfile.ZipFile(source_file) as archive:
+        sheet_part, comments_part, strings_part = find_sheet_parts(archive, sheet)
+
+        # 1. 批注：按行号分组
+        comments_by_row = {}
+        if comments_part:
+            comments_by_row = group_comments_by_row(
+                (ref, CommentText(text, author)) for ref, text, author in iter_comments_xml(archive, comments_part)
+            )
+
+        # 2. 姓名列、区域列和匹配列
+        idx_name = column_letter_to_index(COL_NAME)
+        idx_region = column_letter_to_index(COL_REGION)
+        idx_keys = [column_letter_to_index(col) for col in MATCH_COLS]
+        rows = read_column_values(archive, sheet_part, strings_part, {idx_name, idx_region, *idx_keys})
+
+    resolved_rows = (
+        (row_idx, values.get(idx_name), values.get(idx_region), tuple(values.get(idx) for idx in idx_keys))
+        for row_idx, values in rows
+    )
+    return merge_source_rows(resolved_rows, comments_by_row)
+
+
+def read_source_rows(source_file, sheet=None):
+    """按配置的读取方式读取源数据行，XML 直接解析失败时自动改用 openpyxl"""
+    if SOURCE_ENGINE == 'xml':
+        try:
+            return read_source_rows_xml(source_file, sheet)
+        except Exception as e:
+            print(f"警告: XML 直接解析失败（{e}），改用 openpyxl 读取")
+    return read_source_rows_streaming(source_file, sheet)
+
+
+def load_cached_source_rows(source_file, sheet=None, fingerprint=None):
+    """
+    从缓存读取源数据行，返回 (文件指纹, 源数据行)；未命中时源数据行为 None
+
+    服务模式下先查内存中的源数据，命中时不计算文件指纹，返回的指纹为 None。
+    """
+    if SOURCE_MEMORY_CACHE is not None:
+        source_rows = SOURCE_MEMORY_CACHE.get(source_file, sheet)
+        if source_rows is not None:
+            print(f"✓ 已使用内存中的源数据，跳过源文件解析{sheet_suffix(sheet)}")
+            return fingerprint, source_rows
+
+    fingerprint = fingerprint or file_fingerprint(source_file)
+    source_rows = load_source_cache(fingerprint, sheet)
+    if source_rows is not None:
+        print(f"✓ 已使用源数据缓存，跳过源文件解析{sheet_suffix(sheet)}")
+        remember_source_rows(fingerprint, sheet, source_rows)
+    return fingerprint, source_rows
+
+
+def store_source_rows(source_file, fingerprint, sheet, source_rows):
+    """解析得到的源数据行写入磁盘缓存（服务模式下同时保留在内存中）"""
+    fingerprint = fingerprint or file_fingerprint(source_file)
+    save_source_cache(fingerprint, source_rows, sheet)
+    remember_source_rows(fingerprint, sheet, source_rows)
+
+
+def load_source_rows(source_file, use_cache=True, sheet=None):
+    """读取一个工作表的源数据行（全部列的批注，未做区域筛选），优先使用缓存"""
+    if not use_cache:
+        return read_source_rows(source_file, sheet)
+
+    fingerprint, source_rows = load_cached_source_rows(source_file, sheet)
+    if source_rows is None:
+        source_rows = read_source_rows(source_file, sheet)
+        store_source_rows(source_file, fingerprint, sheet, source_rows)
+    return source_rows
+
+
+# ---------- 多工作表 ----------
+
+def sheet_suffix(sheet):
+    """日志和控制台中附加在文件名或单元格前后的工作表名，活动工作表为空字符串"""
+    return '' if sheet is None else f" [{sheet}]"
+
+
+def sheet_cell(sheet, cell):
+    """带工作表名的单元格坐标，例如 1月!DO15；活动工作表只显示坐标"""
+    return cell if sheet is None else f"{sheet}!{cell}"
+
+
+def format_sheet_pairs(sheet_pairs):
+    """工作表对应关系的文字说明，例如 1月, 2月 → 二月"""
+    return ', '.join(src if src == tgt else f"{src} → {tgt}" for src, tgt in sheet_pairs)
+
+
+def resolve_sheet_pairs(source_file):
+    """
+    按 [工作表] 映射 得到要同步的 [(源工作表, 目标工作表)]
+
+    映射为空时只同步活动工作表，返回 [(None, None)]。每一项可以是：
+    - 源工作表 -> 目标工作表：指定一对工作表
+    - 工作表名或通配符（如 *月、*）：第一个源文件中匹配的工作表，同步到目标文件中的同名工作表
+    同一目标工作表只保留第一个映射。
+    """
+    if not SHEET_MAPPING:
+        return [(None, None)]
+
+    source_sheets = list_sheet_names(source_file)
+    pairs, targets = [], set()
+    for item in SHEET_MAPPING:
+        if '->' in item:
+            src, tgt = (name.strip() for name in item.split('->', 1))
+            matched = [(src, tgt)] if src in source_sheets else []
+        else:
+            matched = [(name, name) for name in source_sheets if fnmatch.fnmatchcase(name, item)]
+        if not matched:
+            print(f"警告: 源文件中没有与 {item} 对应的工作表，已跳过")
+        for src, tgt in matched:
+            if tgt not in targets:
+                targets.add(tgt)
+                pairs.append((src, tgt))
+    return pairs
+
+
+def source_sheet_tasks(source_files, sheet_pairs):
+    """
+    需要读取的 [(源文件, 源工作表)]，每个源文件的每个工作表只读取一次
+
+    源文件中没有映射中的工作表时给出警告并跳过该文件的这个工作表。
+    """
+    sheets = list(dict.fromkeys(src for src, _ in sheet_pairs))
+    if sheets == [None]:
+        return [(source_file, None) for source_file in source_files]
+
+    tasks = []
+    for source_file in source_files:
+        names = set(list_sheet_names(source_file))
+        for sheet in sheets:
+            if sheet in names:
+                tasks.append((source_file, sheet))
+            else:
+                print(f"警告: 源文件 {source_label(source_file)} 中没有工作表 {sheet}，已跳过")
+    return tasks
+
+
+def combine_source_rows(source_files, source_rows_list):
+    """
+    按区域筛选和同步列处理每个源文件的数据行，合并为一个批注映射表
+
+    返回 (批注映射表, 匹配冲突)；同一匹配键出现在不同源文件中属于正常的合并，
+    只有同一源文件内的重复才记为冲突。
+    """
+    source_maps, collisions = [], []
+    for source_file, source_rows in zip(source_files, source_rows_list):
+        origin = source_label(source_file)
+        comments_map, file_collisions = assemble_comments_map(source_rows, origin)
+        source_maps.append((origin, comments_map))
+        collisions.extend(file_collisions)
+    return combine_comments_maps(source_maps), collisions
+
+
+def combine_sheet_rows(sheet_pairs, tasks, source_rows_list):
+    """
+    为每对工作表建立批注映射表
+
+    tasks 与 source_rows_list 一一对应，见 source_sheet_tasks。
+    返回 ({ 目标工作表: 批注映射表 }, 匹配冲突)；活动工作表的键为 None，
+    匹配冲突中记录所在的源工作表（sheet）。
+    """
+    rows_by_task = dict(zip(tasks, source_rows_list))
+    sheet_maps, collisions = {}, []
+    with gc_paused():
+        for src, tgt in sheet_pairs:
+            files = [source_file for source_file, sheet in tasks if sheet == src]
+            comments_map, sheet_collisions = combine_source_rows(files, [rows_by_task[f, src] for f in files])
+            for item in sheet_collisions:
+                item['sheet'] = src
+            sheet_maps[tgt] = comments_map
+            collisions.extend(sheet_collisions)
+    return sheet_maps, collisions
+
+
+def build_sheet_maps(source_files, use_cache=True):
+    """
+    构建所有源文件合并后的批注映射表，返回 ([(源工作表, 目标工作表)], { 目标工作表: 批注映射表 }, 匹配冲突)
+
+    源数据行优先从缓存读取；区域筛选和同步列在此基础上处理，
+    因此修改筛选条件不会使缓存失效。
+    """
+    sheet_pairs = resolve_sheet_pairs(source_files[0])
+    tasks = source_sheet_tasks(source_files, sheet_pairs)
+    source_rows_list = [load_source_rows(source_file, use_cache, sheet) for source_file, sheet in tasks]
+    return (sheet_pairs, *combine_sheet_rows(sheet_pairs, tasks, source_rows_list))
+
+
+def count_people(sheet_maps):
+    """所有工作表的匹配人员数之和"""
+    return sum(len(comments_map) for comments_map in sheet_maps.values())
+
+
+def load_source_rows_plain(source_file, use_cache=True, sheet=None):
+    """
+    子进程入口：读取源数据行，返回 (纯元组形式的源数据行, 用时秒数, CPU 秒数, 内存峰值 MB)
+
+    批注转为普通元组再传回主进程，避免在 spawn 方式下反序列化本模块中定义的类型。
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    source_rows = load_source_rows(source_file, use_cache, sheet)
+    return (source_rows_to_plain(source_rows), time.perf_counter() - wall,
+            time.process_time() - cpu, peak_rss_mb())
+
+
+# ================= 源数据缓存 =================
+
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.sync_cache')
+CACHE_INDEX_FILE = os.path.join(CACHE_DIR, 'index.json')
+# 缓存数据格式变化时递增，旧缓存自动失效
+CACHE_VERSION = 2
+
+
+def file_fingerprint(path):
+    """文件指纹：路径、大小、修改时间和内容哈希"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    stat = os.stat(path)
+    return {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': digest.hexdigest(),
+    }
+
+
+def source_cache_key(fingerprint, sheet=None):
+    """缓存键：文件指纹 + 工作表 + 影响解析结果的配置（姓名列、区域列、匹配列、数据起始行）"""
+    key_data = [
+        CACHE_VERSION, fingerprint['path'], fingerprint['size'], fingerprint['mtime_ns'],
+        fingerprint['sha256'], COL_NAME.upper(), COL_REGION.upper(), MATCH_COLS, START_ROW,
+    ]
+    if sheet is not None:
+        key_data.append(sheet)
+    return hashlib.sha256(json.dumps(key_data, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+@contextlib.contextmanager
+def cache_index_lock():
+    """
+    缓存索引的文件锁（进程间、线程间都有效）
+
+    并行加载的子进程、批量模式和服务模式的任务可能同时读改写索引；不加锁时后写入的一方会覆盖
+    另一方新增的条目，对应的 .pkl 文件不再被统计和淘汰。
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CACHE_INDEX_FILE + '.lock', 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK 重试约 10 秒后仍未获得锁时抛出，继续等待
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def load_cache_index():
+    """读取缓存索引 { 缓存键: 条目信息 }，不存在或损坏时返回空索引"""
+    try:
+        with open(CACHE_INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache_index(index):
+    """写入缓存索引；调用方需持有 cache_index_lock"""
+    tmp_file = f"{CACHE_INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, CACHE_INDEX_FILE)
+
+
+def source_rows_to_plain(source_rows):
+    """源数据行中的批注转为普通元组（用于缓存和进程间传递）"""
+    return [
+        (row_idx, name_val, region_val, key_vals, {col: (c.text, c.author) for col, c in row_comments.items()})
+        for row_idx, name_val, region_val, key_vals, row_comments in source_rows
+    ]
+
+
+def source_rows_from_plain(plain_rows):
+    """source_rows_to_plain 的逆操作"""
+    return [
+        (row_idx, name_val, region_val, key_vals, {col: CommentText(*c) for col, c in row_comments.items()})
+        for row_idx, name_val, region_val, key_vals, row_comments in plain_rows
+    ]
+
+
+def load_source_cache(fingerprint, sheet=None):
+    """读取源数据缓存，未命中或缓存损坏时返回 None"""
+    key = source_cache_key(fingerprint, sheet)
+    index = load_cache_index()
+    data_file = os.path.join(CACHE_DIR, f'{key}.pkl')
+    if key not in index or not os.path.exists(data_file):
+        return None
+
+    try:
+        with open(data_file, 'rb') as f:
+            cached_rows = pickle.load(f)
+    except Exception as e:
+        print(f"警告: 读取缓存失败（{e}），将重新解析源文件")
+        return None
+
+    # 更新最近使用时间（LRU）；加锁后重新读取索引，不覆盖其他进程刚写入的条目
+    try:
+        with cache_index_lock():
+            index = load_cache_index()
+            if key in index:
+                index[key]['last_used'] = time.time()
+                save_cache_index(index)
+    except OSError:
+        pass
+
+    return source_rows_from_plain(cached_rows)
+
+
+def save_source_cache(fingerprint, source_rows, sheet=None):
+    """写入源数据缓存，并按最近使用时间淘汰超出容量上限的旧缓存"""
+    key = source_cache_key(fingerprint, sheet)
+    data_file = os.path.join(CACHE_DIR, f'{key}.pkl')
+    cached_rows = source_rows_to_plain(source_rows)
+
+    try:
+        # 数据文件也在锁内写入，淘汰时不会把刚写好、还没登记的数据文件当作孤立文件删除
+        with cache_index_lock():
+            tmp_file = f"{data_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cached_rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, data_file)
+
+            index = load_cache_index()
+            index[key] = dict(fingerprint, bytes=os.path.getsize(data_file), last_used=time.time())
+            evict_source_cache(index)
+            save_cache_index(index)
+    except OSError as e:
+        print(f"警告: 写入缓存失败（{e}）")
+
+
+def evict_source_cache(index):
+    """
+    按最近使用时间（LRU）删除旧缓存，直到总大小不超过上限；至少保留最近的一个
+
+    索引中没有登记的数据文件（例如写入途中被中断）无法命中，直接删除。调用方需持有 cache_index_lock。
+    """
+    for filename in os.listdir(CACHE_DIR):
+        if filename.endswith('.pkl') and filename[:-len('.pkl')] not in index:
+            try:
+                os.remove(os.path.join(CACHE_DIR, filename))
+            except OSError:
+                pass
+
+    limit = CACHE_MAX_MB * 1024 * 1024
+    entries = sorted(index.items(), key=lambda item: item[1].get('last_used', 0))
+    total = sum(entry.get('bytes', 0) for _, entry in entries)
+    for key, entry in entries[:-1]:
+        if total <= limit:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, f'{key}.pkl'))
+        except OSError:
+            pass
+        total -= entry.get('bytes', 0)
+        del index[key]
+
+
+# ---------- 内存中的源数据（服务模式） ----------
+
+class SourceMemoryCache:
+    """
+    服务模式下保留在内存中的源数据行，按最近使用时间（LRU）淘汰
+
+    键为 (文件路径, 工作表, 影响解析结果的配置)。文件大小和修改时间未变时直接命中；
+    变化时再比较内容哈希，内容相同（例如只是被重新保存）仍然命中。
+    占用按序列化后的大小估算，超出上限时删除最久未使用的条目，至少保留一个。
+    """
+
+    def __init__(self, limit_mb):
+        self.limit = limit_mb * 1024 * 1024
+        self.entries = collections.OrderedDict()  # { 键: (文件指纹, 源数据行, 字节数) }
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(path, sheet):
+        return (os.path.abspath(path), sheet, COL_NAME.upper(), COL_REGION.upper(), tuple(MATCH_COLS), START_ROW)
+
+    def get(self, path, sheet=None):
+        key = self.key(path, sheet)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None:
+            fingerprint, source_rows, size = entry
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_size, stat.st_mtime_ns) != (fingerprint['size'], fingerprint['mtime_ns']):
+                # 修改时间变化：内容相同时更新指纹后继续使用
+                current = file_fingerprint(path)
+                if current['sha256'] == fingerprint['sha256']:
+                    entry = (current, source_rows, size)
+                else:
+                    entry = None
+            elif stat is None:
+                entry = None
+
+        with self.lock:
+            if entry is None:
+                self.entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, fingerprint, sheet, source_rows):
+        key = self.key(fingerprint['path'], sheet)
+        size = len(pickle.dumps(source_rows_to_plain(source_rows), protocol=pickle.HIGHEST_PROTOCOL))
+        with self.lock:
+            self.entries[key] = (fingerprint, source_rows, size)
+            self.entries.move_to_end(key)
+            total = sum(entry[2] for entry in self.entries.values())
+            while total > self.limit and len(self.entries) > 1:
+                _, (_, _, evicted) = self.entries.popitem(last=False)
+                total -= evicted
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'mb': round(sum(entry[2] for entry in self.entries.values()) / 1024 / 1024, 1),
+                'limit_mb': self.limit // 1024 // 1024,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+# 服务模式下的内存源数据（SourceMemoryCache），一次性运行时为 None
+SOURCE_MEMORY_CACHE = None
+
+
+def remember_source_rows(fingerprint, sheet, source_rows):
+    """服务模式下把源数据行保留在内存中"""
+    if SOURCE_MEMORY_CACHE is not None:
+        SOURCE_MEMORY_CACHE.put(fingerprint, sheet, source_rows)
+
+
+# ================= 增量同步快照 =================
+
+# 快照格式变化时递增，旧快照自动失效
+SNAPSHOT_VERSION = 3
+
+
+def comment_hash(comment):
+    """批注内容（文本和作者）的哈希"""
+    content = f"{comment.text}\0{comment.author or ''}"
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+
+
+def snapshot_path(target_file, output_file):
+    """每组 目标文件 → 输出文件 对应一个快照文件"""
+    key = f"{os.path.abspath(target_file)}\n{os.path.abspath(output_file)}"
+    return os.path.join(CACHE_DIR, f"snapshot_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json")
+
+
+def snapshot_settings():
+    """影响匹配和合并结果的配置；与上次不同时不能增量同步"""
+    return [COL_NAME, START_ROW, MATCH_COLS, NORMALIZE_KEYS, SKIP_DUPLICATE_KEYS, SHEET_MAPPING, MERGE_COMMENTS,
+            MERGE_SEPARATOR]
+
+
+def load_sync_snapshot(target_file, output_file):
+    """
+    读取上次同步的快照，返回 { (目标工作表, 匹配键, 列字母): 批注哈希 }
+
+    以下情况返回 None（需要完整同步）：没有快照、配置变化、
+    目标文件内容变化、输出文件不存在或在上次同步后被修改。
+    """
+    path = snapshot_path(target_file, output_file)
+    if not os.path.exists(path) or not os.path.exists(output_file):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"警告: 读取上次同步的快照失败（{e}），将完整同步")
+        return None
+
+    if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('settings') != snapshot_settings():
+        return None
+    if snapshot.get('target') != file_fingerprint(target_file)['sha256']:
+        return None
+    if snapshot.get('output') != file_fingerprint(output_file)['sha256']:
+        return None
+    return {(sheet, tuple(key), col): digest for sheet, key, col, digest in snapshot['cells']}
+
+
+def save_sync_snapshot(target_file, output_file, sheet_maps):
+    """同步成功后保存快照：每个 (工作表, 匹配键, 列) 的批注哈希，以及目标文件和输出文件的指纹"""
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'settings': snapshot_settings(),
+        'target': file_fingerprint(target_file)['sha256'],
+        'output': file_fingerprint(output_file)['sha256'],
+        'cells': [
+            [sheet, list(key), col, comment_hash(comment)]
+            for sheet, comments_map in sheet_maps.items()
+            for key, row_comments in comments_map.items()
+            for col, comment in row_comments.items()
+        ],
+    }
+    path = snapshot_path(target_file, output_file)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        print(f"警告: 保存同步快照失败（{e}）")
+
+
+def diff_comments_map(sheet_maps, snapshot_cells):
+    """
+    与上次同步的快照比较，返回只包含新增或内容变化的批注的映射表 { 目标工作表: 批注映射表 }
+
+    有批注被删除时返回 None：输出文件中已写入的批注需要恢复为目标文件的原样，只能完整同步。
+    """
+    current = set()
+    changed_maps = {}
+    for sheet, comments_map in sheet_maps.items():
+        for key, row_comments in comments_map.items():
+            for col, comment in row_comments.items():
+                current.add((sheet, key, col))
+                if snapshot_cells.get((sheet, key, col)) != comment_hash(comment):
+                    changed_maps.setdefault(sheet, {}).setdefault(key, {})[col] = comment
+
+    if any(cell not in current for cell in snapshot_cells):
+        return None
+    return changed_maps
+
+
+# ================= 匹配与写入 =================
+
+# 写入时跳过的计划操作
+SKIPPED_ACTIONS = ("未变化", "冲突")
+
+
+def new_comment_segments(existing_text, source_text):
+    """
+    按合并分隔符拆分批注，返回源批注中目标批注尚未包含的段落
+
+    段落去掉首尾空白后放入集合按哈希比较，重复运行时已合并过的内容不会再次追加。
+    """
+    present = {segment.strip() for segment in existing_text.split(MERGE_SEPARATOR)}
+    segments = []
+    for segment in source_text.split(MERGE_SEPARATOR):
+        key = segment.strip()
+        if key not in present:
+            present.add(key)
+            segments.append(segment)
+    return segments
+
+
+def plan_comment_updates(target_rows, comments_map, get_existing_comment, sheet=None):
+    """
+    遍历目标文件的行，生成批注修改计划（不修改目标文件）
+
+    target_rows: 可迭代的 (行号, 姓名, (匹配列的值, ...))
+    get_existing_comment: 根据 (行号, 列号) 返回目标单元格已有的批注（没有则返回 None）
+    sheet: 目标工作表名（None 为活动工作表），记录在每项操作中
+    逐项生成操作（不在内存中保存完整的操作列表），每项包含
+    sheet/name/key/row/column/cell/action/text/author/original/source_text/origin；
+    action 为 合并/覆盖/新增/未变化/冲突，未变化和冲突的单元格写入时直接跳过
+
+    目标文件中有多行匹配键相同时，默认与以前一样写入每一行；配置了 重复时跳过 时
+    无法确定写到哪一行，这些行的操作都记为冲突，不写入任何一行。
+    只访问源批注所在的单元格，不按 行 × 同步列 逐个定位。
+    """
+    with gc_paused():
+        # 第一遍：批量计算匹配键，与有批注的人员做一次哈希连接，并统计每个匹配键在目标文件中的行数
+        # （没有批注的人员不产生操作；只用有批注的键建表，表更小，查找更快）
+        target_rows = target_rows if isinstance(target_rows, list) else list(target_rows)
+        active = {key: comments for key, comments in comments_map.items() if comments}
+        if len(MATCH_COLS) == 1:
+            # 只有一个匹配列（默认）：按标准化后的文本查找，只为匹配上的行取出键元组
+            texts = normalize_column([row[2][0] for row in target_rows])
+            active_texts = {key[0]: key for key in active}
+            matched_rows = [
+                (row[0], row[1], active_texts[text]) for row, text in zip(target_rows, texts) if text in active_texts
+            ]
+        else:
+            keys = match_keys([row[2] for row in target_rows])
+            matched_rows = [(row[0], row[1], key) for row, key in zip(target_rows, keys) if key in active]
+        key_counts = collections.Counter([key for _, _, key in matched_rows])
+
+        for row_idx, name_val, key in matched_rows:
+            for col_letter, source_comment in active[key].items():
+                target_cell_ref = f"{col_letter}{row_idx}"
+                existing = get_existing_comment(row_idx, column_letter_to_index(col_letter))
+
+                # 检查目标单元格是否已有批注
+                if SKIP_DUPLICATE_KEYS and key_counts[key] > 1:
+                    action = "冲突"
+                    text, author = (existing.text, existing.author) if existing else (None, None)
+                elif existing and MERGE_COMMENTS:
+                    # 合并批注：原有批注 + 分隔符 + 原有批注中还没有的段落
+                    # 保留原有批注的作者，或者使用源批注的作者
+                    segments = new_comment_segments(existing.text, source_comment.text)
+                    if segments:
+                        action = "合并"
+                        text = existing.text + MERGE_SEPARATOR + MERGE_SEPARATOR.join(segments)
+                        author = existing.author or source_comment.author
+                    else:
+                        action = "未变化"
+                        text, author = existing.text, existing.author
+                elif (existing and existing.text == source_comment.text
+                      and (existing.author or '') == (source_comment.author or '')):
+                    action = "未变化"
+                    text, author = existing.text, existing.author
+                else:
+                    # 直接创建新批注（覆盖或新增）
+                    action = "覆盖" if existing else "新增"
+                    text = source_comment.text
+                    author = source_comment.author
+
+                yield {
+                    'sheet': sheet,
+                    'name': name_val,
+                    'key': key,
+                    'row': row_idx,
+                    'column': col_letter,
+                    'cell': target_cell_ref,
+                    'action': action,
+                    'text': text,
+                    'author': author,
+                    'original': existing.text if existing else None,
+                    'source_text': source_comment.text,
+                    'origin': source_comment.source,
+                }
+
+
+def load_target_openpyxl(target_file):
+    """用 openpyxl 完整加载目标文件"""
+    print(f"正在加载目标文件: {target_file} ...")
+    import openpyxl
+
+    return 'openpyxl', openpyxl.load_workbook(target_file, data_only=False)
+
+
+def target_worksheets(wb_target, sheets):
+    """按工作表名取出目标工作表 [(工作表名, 工作表)]，None 为活动工作表；没有的工作表给出警告并跳过"""
+    worksheets = []
+    for sheet in sheets:
+        if sheet is None:
+            worksheets.append((None, wb_target.active))
+        elif sheet in wb_target.sheetnames:
+            worksheets.append((sheet, wb_target[sheet]))
+        else:
+            print(f"警告: 目标文件中没有工作表 {sheet}，已跳过")
+    return worksheets
+
+
+def plan_target_openpyxl(wb_target, sheet_maps):
+    """在已加载的目标工作簿中逐个工作表匹配人员，逐项生成批注修改计划"""
+    # 只读取姓名列和匹配列；单元格按 (行号, 列号) 定位，不拼接和解析坐标字符串
+    idx_name = column_letter_to_index(COL_NAME)
+    idx_keys = [column_letter_to_index(col) for col in MATCH_COLS]
+    min_col, max_col = min(idx_name, *idx_keys), max(idx_name, *idx_keys)
+
+    for sheet, ws_target in target_worksheets(wb_target, sheet_maps):
+        rows = ws_target.iter_rows(min_row=START_ROW, min_col=min_col, max_col=max_col, values_only=True)
+        target_rows = (
+            (row_idx, row[idx_name - min_col], tuple(row[idx - min_col] for idx in idx_keys))
+            for row_idx, row in enumerate(rows, START_ROW)
+        )
+        yield from plan_comment_updates(
+            target_rows, sheet_maps[sheet],
+            lambda row_idx, col_idx, ws=ws_target: ws.cell(row_idx, col_idx).comment, sheet
+        )
+
+
+def apply_target_openpyxl(wb_target, sheet_maps, output_file, stats, audit):
+    """在已加载的目标工作簿中写入所有工作表的批注后整体保存一次"""
+    from openpyxl.comments import Comment
+
+    print("正在同步批注到目标文件...")
+    with stats.phase('匹配'):
+        for op in record_operations(plan_target_openpyxl(wb_target, sheet_maps), audit):
+            if op['action'] in SKIPPED_ACTIONS:
+                continue
+            ws_target = wb_target.active if op['sheet'] is None else wb_target[op['sheet']]
+            target_cell = ws_target.cell(op['row'], column_letter_to_index(op['column']))
+            target_cell.comment = Comment(op['text'], op['author'])
+
+    with stats.phase('保存'):
+        wb_target.save(output_file)
+
+
+def read_target_xml(archive, sheet_part, comments_part, strings_part):
+    """直接解析目标工作表 XML，返回 ([(行号, 姓名, 匹配列的值)], { (行号, 列号): 已有批注 })"""
+    idx_name = column_letter_to_index(COL_NAME)
+    idx_keys = [column_letter_to_index(col) for col in MATCH_COLS]
+    rows = read_column_values(archive, sheet_part, strings_part, {idx_name, *idx_keys})
+    target_rows = [
+        (row_idx, values.get(idx_name), tuple(values.get(idx) for idx in idx_keys))
+        for row_idx, values in rows
+    ]
+
+    existing_comments = {}
+    if comments_part:
+        for ref, text, author in iter_comments_xml(archive, comments_part):
+            col_letter, row_idx = split_cell_ref(ref)
+            existing_comments[row_idx, column_letter_to_index(col_letter)] = CommentText(text, author)
+    return target_rows, existing_comments
+
+
+def load_target_patch(target_file, sheets=(None,)):
+    """
+    直接解析目标文件 XML，只读取指定工作表的姓名列、匹配列和已有批注
+
+    返回 ('patch', { 工作表名: (目标数据行, 已有批注) })；没有的工作表给出警告并跳过。
+    """
+    print(f"正在读取目标文件: {target_file} ...")
+    with zipfile.ZipFile(target_file) as archive:
+        names = None
+        if any(sheet is not None for sheet in sheets):
+            _, workbook_sheets, _ = read_workbook_sheets(archive)
+            names = {name for name, _, _ in workbook_sheets}
+
+        target_data = {}
+        for sheet in sheets:
+            if names is not None and sheet is not None and sheet not in names:
+                print(f"警告: 目标文件中没有工作表 {sheet}，已跳过")
+                continue
+            sheet_part, comments_part, strings_part = find_sheet_parts(archive, sheet)
+            target_data[sheet] = read_target_xml(archive, sheet_part, comments_part, strings_part)
+        return 'patch', target_data
+
+
+def plan_target_patch(target_data, sheet_maps):
+    """根据直接解析得到的各工作表姓名列和已有批注，逐项生成批注修改计划"""
+    for sheet, comments_map in sheet_maps.items():
+        if sheet not in target_data:
+            continue
+        target_rows, existing_comments = target_data[sheet]
+        yield from plan_comment_updates(
+            target_rows, comments_map,
+            lambda row_idx, col_idx, existing=existing_comments: existing.get((row_idx, col_idx)), sheet
+        )
+
+
+def record_operations(operations, audit):
+    """逐项返回操作，同时每 AUDIT_BATCH_SIZE 项写入一次审计记录（只在内存中保留一块操作）"""
+    from audit import AUDIT_BATCH_SIZE
+
+    chunk = []
+    for op in operations:
+        chunk.append(op)
+        if len(chunk) >= AUDIT_BATCH_SIZE:
+            audit.record(chunk)
+            chunk = []
+        yield op
+    if chunk:
+        audit.record(chunk)
+
+
+def sheet_updates(operations, skipped_actions=SKIPPED_ACTIONS):
+    """把需要写入的操作按工作表分组：{ 工作表名: { 单元格坐标: (批注文本, 作者) } }"""
+    updates = {}
+    for op in operations:
+        if op['action'] not in skipped_actions:
+            updates.setdefault(op['sheet'], {})[op['cell']] = (op['text'], op['author'])
+    return updates
+
+
+def apply_target_patch(target_data, sheet_maps, target_file, output_file, stats, audit):
+    """匹配人员，并以补丁方式只重写批注相关部件（所有工作表一次写出）"""
+    from xlsx_patch import write_comments_patch
+
+    print("正在同步批注到目标文件...")
+    with stats.phase('匹配'):
+        updates = sheet_updates(record_operations(plan_target_patch(target_data, sheet_maps), audit))
+
+    with stats.phase('保存'):
+        write_comments_patch(target_file, output_file, updates)
+
+
+def load_target(target_file, sheets=(None,)):
+    """按配置的输出方式加载目标文件，返回 (方式, 数据)；XML 解析失败时自动改用 openpyxl"""
+    if OUTPUT_MODE == 'patch':
+        try:
+            return load_target_patch(target_file, sheets)
+        except Exception as e:
+            print(f"警告: 补丁式读取失败（{e}），改用 openpyxl 完整加载")
+    return load_target_openpyxl(target_file)
+
+
+def apply_target(loaded_target, sheet_maps, target_file, output_file, audit, stats=None):
+    """
+    把批注写入已加载的目标文件并保存，补丁式写入失败时自动改用 openpyxl
+
+    sheet_maps: { 目标工作表: 批注映射表 }，所有工作表处理完后只保存一次。
+    audit: 本次运行的 AuditRun，匹配时分块写入操作记录
+    stats 不为 None 时记录 匹配 和 保存 两个阶段的统计。
+    """
+    stats = PhaseStats() if stats is None else stats
+    mode, target_data = loaded_target
+    if mode == 'patch':
+        try:
+            return apply_target_patch(target_data, sheet_maps, target_file, output_file, stats, audit)
+        except Exception as e:
+            print(f"警告: 补丁式写入失败（{e}），改用 openpyxl 完整保存")
+            audit.discard()
+        mode, target_data = load_target_openpyxl(target_file)
+    apply_target_openpyxl(target_data, sheet_maps, output_file, stats, audit)
+
+
+def count_target_rows(loaded_target, sheets=(None,)):
+    """已加载的目标文件各工作表中从数据起始行开始的行数之和"""
+    mode, target_data = loaded_target
+    if mode == 'patch':
+        return sum(len(target_rows) for target_rows, _ in target_data.values())
+    worksheets = [
+        target_data.active if sheet is None else target_data[sheet]
+        for sheet in sheets if sheet is None or sheet in target_data.sheetnames
+    ]
+    return sum(max(0, ws.max_row - START_ROW + 1) for ws in worksheets)
+
+
+def sync_target(sheet_maps, target_file, output_file, audit):
+    """按配置的输出方式同步一个目标文件"""
+    apply_target(load_target(target_file, list(sheet_maps)), sheet_maps, target_file, output_file, audit)
+
+
+def plan_target(sheet_maps, target_file):
+    """
+    只生成一个目标文件的批注修改计划（操作列表），不写入也不保存
+
+    无论输出方式如何都先用 XML 直接解析目标文件，失败时改用 openpyxl 加载。
+    """
+    try:
+        _, target_data = load_target_patch(target_file, list(sheet_maps))
+        return list(plan_target_patch(target_data, sheet_maps))
+    except Exception as e:
+        print(f"警告: 补丁式读取失败（{e}），改用 openpyxl 完整加载")
+    _, wb_target = load_target_openpyxl(target_file)
+    return list(plan_target_openpyxl(wb_target, sheet_maps))
+
+
+def sync_target_incremental(changed_maps, target_file, output_file, stats, audit):
+    """
+    增量同步：只为有变化的批注匹配目标文件，在上次的输出文件上补丁式写入
+
+    合并仍以目标文件中的原批注为准。“未变化”是与目标文件相比，输出文件中的这些单元格
+    可能还是上次写入的批注（例如源批注改回了与目标文件相同的内容），因此也要写入，
+    写入后批注文本和作者与完整同步相同；只有冲突的单元格（完整同步也不写入）跳过。
+    """
+    from xlsx_patch import write_comments_patch
+
+    with stats.phase('加载目标文件'):
+        loaded_target = load_target_patch(target_file, list(changed_maps))
+    stats.counts['目标文件行数'] = count_target_rows(loaded_target)
+
+    with stats.phase('匹配'):
+        operations = record_operations(plan_target_patch(loaded_target[1], changed_maps), audit)
+        updates = sheet_updates(operations, ("冲突",))
+
+    if updates:
+        with stats.phase('保存'):
+            write_comments_patch(output_file, output_file, updates)
+
+
+def write_sync_log(log_file, target_file, output_file, sheet_maps, store, run_id, changed_cells=None, stats=None,
+                   collisions=None, sheet_pairs=None):
+    """
+    生成同步日志文件，返回 (同步批注数, 合并批注数, 未变化数, 冲突数)
+
+    sheet_maps: { 目标工作表: 批注映射表 }
+    store, run_id: 记录了本次操作的审计数据库和运行编号，统计和详细记录都从数据库中逐行查询
+    changed_cells: 增量同步时与上次同步相比有变化的单元格数，完整同步时为 None
+    stats: 本次运行的 PhaseStats，写入【统计信息】中的用时、内存和速度
+    collisions: 源文件中的匹配冲突（见 assemble_comments_map），写入【匹配冲突】
+    sheet_pairs: [(源工作表, 目标工作表)]，配置了工作表映射时写入【各工作表统计】
+    """
+    collisions = collisions or []
+    sheet_pairs = sheet_pairs or [(None, None)]
+    action_counts = store.action_counts(run_id)
+    updated_count, merged_count, unchanged_count, conflict_count = count_operations(action_counts)
+    sheet_counts = {tgt: collections.Counter() for _, tgt in sheet_pairs}  # 各工作表的操作数
+    for (sheet, action), count in action_counts.items():
+        sheet_counts.setdefault(sheet, collections.Counter())[action] += count
+    target_conflicts = {}  # 目标文件中匹配键重复的行：{ (工作表, 匹配键): [行号, ...] }
+    if conflict_count:
+        for op in store.operations(run_id, action="冲突"):
+            rows = target_conflicts.setdefault((op['sheet'], op['match_key']), [])
+            if op['row'] not in rows:
+                rows.append(op['row'])
+    
+    with open(log_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 80 + "\n")
+        f.write("Excel 批注同步日志\n")
+        f.write("=" * 80 + "\n\n")
+        
+        f.write(f"执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        # 配置信息
+        f.write("【配置信息】\n")
+        f.write(f"源文件: {', '.join(SOURCE_FILES)}\n")
+        f.write(f"目标文件: {target_file}\n")
+        f.write(f"输出文件: {output_file}\n")
+        f.write(f"区域列: {COL_REGION}\n")
+        f.write(f"姓名列: {COL_NAME}\n")
+        f.write(f"匹配列: {', '.join(MATCH_COLS)}（{'标准化' if NORMALIZE_KEYS else '不标准化'}）\n")
+        if SHEET_MAPPING:
+            f.write(f"工作表: {format_sheet_pairs(sheet_pairs)}\n")
+        
+        if TARGET_REGION:
+            regions = TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION]
+            f.write(f"筛选区域: {', '.join(regions)}\n")
+        else:
+            f.write("筛选区域: 无筛选\n")
+            
+        f.write(f"同步列: {'全部有批注的列' if SYNC_ALL_COLUMNS else ', '.join(COLS_TO_SYNC)}\n")
+        f.write(f"批注合并: {'启用' if MERGE_COMMENTS else '禁用'}\n")
+        f.write(f"数据起始行: {START_ROW}\n")
+        if changed_cells is None:
+            f.write("同步方式: 完整同步\n\n")
+        else:
+            f.write(f"同步方式: 增量同步（与上次同步相比有变化的批注 {changed_cells} 个）\n\n")
+        
+        # 统计信息
+        f.write("【统计信息】\n")
+        f.write(f"匹配人员数: {count_people(sheet_maps)} 人\n")
+        f.write(f"同步批注数: {updated_count} 个\n")
+        f.write(f"合并批注数: {merged_count} 个\n")
+        f.write(f"新增/覆盖数: {updated_count - merged_count} 个\n")
+        f.write(f"未变化数: {unchanged_count} 个\n")
+        f.write(f"冲突数: {conflict_count} 个（源文件中重复的匹配键 {len(collisions)} 个）\n")
+        if stats is not None:
+            write_log_stats(f, stats)
+        f.write("\n")
+
+        # 各工作表统计
+        if SHEET_MAPPING:
+            f.write("【各工作表统计】\n")
+            for src, tgt in sheet_pairs:
+                counts = sheet_counts[tgt]
+                updated = sum(counts.values()) - counts["未变化"] - counts["冲突"]
+                f.write(f"{format_sheet_pairs([(src, tgt)])}: 匹配人员 {len(sheet_maps.get(tgt, {}))} 人 | "
+                        f"同步 {updated} 个 | 合并 {counts['合并']} 个 | 未变化 {counts['未变化']} 个 | "
+                        f"冲突 {counts['冲突']} 个\n")
+            f.write("\n")
+        
+        write_operation_details(f, store.operations(run_id), show_origin=len(SOURCE_FILES) > 1,
+                                merged_operations=store.operations(run_id, action="合并"))
+
+        # 匹配冲突
+        if collisions or target_conflicts:
+            f.write("\n" + "=" * 80 + "\n")
+            f.write("【匹配冲突】\n")
+            f.write("=" * 80 + "\n\n")
+            f.write("以下匹配键对应多行，无法确定批注属于哪一行，均未同步：\n\n")
+
+            for item in collisions:
+                rows = ', '.join(str(row) for row in item['rows'])
+                source = f"{item['source']}{sheet_suffix(item.get('sheet'))}"
+                f.write(f"源文件 {source} | 匹配键: {format_match_key(item['key'])} | 行: {rows}\n")
+            for (sheet, key), rows in target_conflicts.items():
+                rows = ', '.join(str(row) for row in rows)
+                f.write(f"目标文件{sheet_suffix(sheet)} | 匹配键: {key} | 行: {rows}\n")
+
+    return updated_count, merged_count, unchanged_count, conflict_count
+
+
+def count_operations(action_counts):
+    """
+    根据各操作的数目返回 (同步批注数, 合并批注数, 未变化数, 冲突数)
+
+    action_counts: { 操作: 数目 } 或 AuditStore.action_counts 返回的 { (工作表, 操作): 数目 }
+    """
+    counts = collections.Counter()
+    for action, count in action_counts.items():
+        counts[action[1] if isinstance(action, tuple) else action] += count
+    unchanged_count, conflict_count = counts["未变化"], counts["冲突"]
+    return sum(counts.values()) - unchanged_count - conflict_count, counts["合并"], unchanged_count, conflict_count
+
+
+def write_operation_details(f, operations, show_origin=False, merged_operations=None):
+    """
+    写入日志的【详细操作记录】和【合并批注详情】
+
+    逐项直接写入文件，不在内存中另存一份文字记录。
+    operations 为操作列表时合并详情从中筛选；为只能遍历一次的查询结果时，需另外传入合并操作 merged_operations。
+    show_origin: 是否标注来源文件（多个源文件时）
+    """
+    f.write("=" * 80 + "\n")
+    f.write("【详细操作记录】\n")
+    f.write("=" * 80 + "\n\n")
+
+    for op in operations:
+        detail = f"[{op['action']}] {op['name']} - 列{op['column']} (单元格{sheet_cell(op['sheet'], op['cell'])})"
+        if show_origin:
+            detail += f" 来源: {op['origin']}"
+        f.write(detail + "\n")
+
+    # 合并详情
+    if merged_operations is None:
+        merged_operations = operations
+    idx = 0
+    for op in merged_operations:
+        if op['action'] != "合并":
+            continue
+        idx += 1
+        if idx == 1:
+            f.write("\n" + "=" * 80 + "\n")
+            f.write("【合并批注详情】\n")
+            f.write("=" * 80 + "\n\n")
+        original = op['original'][:50] + '...' if len(op['original']) > 50 else op['original']
+        new = op['source_text'][:50] + '...' if len(op['source_text']) > 50 else op['source_text']
+        f.write(f"{idx}. 姓名: {op['name']} | 列: {op['column']} | 单元格: {sheet_cell(op['sheet'], op['cell'])}\n")
+        f.write(f"   原批注: {original}\n")
+        f.write(f"   新批注: {new}\n")
+        f.write("\n")
+
+
+def print_collisions(collisions):
+    """在控制台提示源文件中的匹配冲突"""
+    if collisions:
+        print(f"警告: 源文件中有 {len(collisions)} 个匹配键对应多行批注，已跳过，详见日志【匹配冲突】")
+
+
+def write_log_stats(f, stats):
+    """在日志的【统计信息】中写入用时、内存和速度"""
+    total = stats.total
+    f.write(f"总用时: {total['wall']:.3f} 秒（CPU {total['cpu']:.3f} 秒，不含生成日志）\n")
+    if total.get('peak_rss_mb') is not None:
+        f.write(f"内存峰值: {total['peak_rss_mb']:.1f} MB\n")
+    for name, value in stats.counts.items():
+        f.write(f"{name}: {value}\n")
+    for name, value in stats.throughput().items():
+        if value is not None:
+            f.write(f"{name}: {value:,.0f}\n")
+    f.write("各阶段用时:\n")
+    for name, entry in stats.phases.items():
+        f.write(f"  {format_phase_stats(name, entry)}\n")
+
+
+def load_source_and_target_parallel(tasks, target_file, target_sheets, use_cache, stats):
+    """
+    源文件在子进程中解析，主进程同时加载目标文件，返回 ([源数据行], 已加载的目标文件)
+
+    tasks: [(源文件, 源工作表)]，每个源文件的每个工作表各占一个子进程（不超过 CPU 核心数 - 1）。
+    子进程无法启动或异常退出时返回 None，由调用方改为顺序加载。
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    workers = max(1, min(len(tasks), (os.cpu_count() or 1) - 1))
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=apply_config, initargs=(CONFIG,))
+        source_futures = [
+            executor.submit(load_source_rows_plain, source_file, use_cache, sheet) for source_file, sheet in tasks
+        ]
+    except Exception as e:
+        print(f"警告: 无法启动子进程（{e}），改为顺序加载")
+        return None
+
+    with executor:
+        with stats.phase('加载目标文件'):
+            loaded_target = load_target(target_file, target_sheets)
+
+        source_rows_list = []
+        child_wall = child_cpu = 0.0
+        child_peak = None
+        try:
+            with stats.phase('等待源文件'):
+                for future in source_futures:
+                    plain_rows, wall, cpu, peak_mb = future.result()
+                    source_rows_list.append(source_rows_from_plain(plain_rows))
+                    child_wall += wall
+                    child_cpu += cpu
+                    child_peak = max(child_peak or 0, peak_mb or 0) or None
+        except BrokenProcessPool as e:
+            print(f"警告: 源文件子进程异常退出（{e}），改为顺序加载")
+            return None
+        # 子进程的用时合计，内存峰值为各子进程中的最大值
+        stats.add('读取源文件（子进程）', child_wall, child_cpu, child_peak)
+    return source_rows_list, loaded_target
+
+
+def load_source_and_target(tasks, target_file, target_sheets, use_cache, stats):
+    """
+    加载所有源文件的工作表和目标文件，返回 ([源数据行], 已加载的目标文件)
+
+    tasks: [(源文件, 源工作表)]，返回的源数据行与之一一对应；target_sheets 为要加载的目标工作表。
+    源数据缓存全部命中时直接顺序加载；否则在多核机器上，未命中缓存的工作表
+    在子进程中并行解析，同时加载目标文件（见 并行加载 配置）。各阶段统计记录到 stats。
+    """
+    fingerprints, source_rows_list = {}, [None] * len(tasks)
+    if use_cache:
+        with stats.phase('读取源数据缓存'):
+            for i, (source_file, sheet) in enumerate(tasks):
+                # 同一文件的多个工作表只计算一次文件指纹
+                fingerprint, source_rows_list[i] = load_cached_source_rows(
+                    source_file, sheet, fingerprints.get(source_file)
+                )
+                fingerprints[source_file] = fingerprint
+    pending = [i for i, source_rows in enumerate(source_rows_list) if source_rows is None]
+
+    if pending and PARALLEL_LOAD and (os.cpu_count() or 1) > 1:
+        loaded = load_source_and_target_parallel(
+            [tasks[i] for i in pending], target_file, target_sheets, use_cache, stats
+        )
+        if loaded is not None:
+            parsed_rows, loaded_target = loaded
+            for i, source_rows in zip(pending, parsed_rows):
+                source_rows_list[i] = source_rows
+                # 子进程已写入磁盘缓存，这里只保留在内存中
+                if use_cache and SOURCE_MEMORY_CACHE is not None:
+                    source_file, sheet = tasks[i]
+                    remember_source_rows(fingerprints[source_file] or file_fingerprint(source_file), sheet, source_rows)
+            return source_rows_list, loaded_target
+
+    if pending:
+        with stats.phase('读取源文件'):
+            for i in pending:
+                source_file, sheet = tasks[i]
+                source_rows_list[i] = read_source_rows(source_file, sheet)
+                if use_cache:
+                    store_source_rows(source_file, fingerprints[source_file], sheet, source_rows_list[i])
+
+    with stats.phase('加载目标文件'):
+        loaded_target = load_target(target_file, target_sheets)
+    return source_rows_list, loaded_target
+
+
+def print_phase_stats(stats):
+    """输出各阶段统计；并行加载时给出重叠节省的时间"""
+    print("各阶段用时:")
+    for name, entry in stats.phases.items():
+        print(f"  {format_phase_stats(name, entry)}")
+    print(f"  {format_phase_stats('总计', stats.total)}")
+    if '读取源文件（子进程）' in stats.phases:
+        sequential = stats.wall('读取源文件（子进程）', '加载目标文件')
+        parallel = stats.wall('加载目标文件', '等待源文件')
+        print(f"  并行加载节省约 {max(0.0, sequential - parallel):.3f} 秒")
+
+
+def write_stats_json(stats_file, log_file, stats, result):
+    """把本次运行的统计写入 JSON 文件（与日志同名），便于程序读取"""
+    data = {
+        'log_file': log_file,
+        'source_files': SOURCE_FILES,
+        'target_file': TARGET_FILE,
+        'output_file': OUTPUT_FILE,
+        'result': result,
+    }
+    data.update(stats.as_dict())
+    with open(stats_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def sync_excel_comments(use_cache=True, incremental=True, trace_memory=False):
+    """
+    同步一个目标文件，返回本次运行的统计（各阶段用时、CPU 时间、内存峰值、计数和速度）
+
+    trace_memory 为 True 时用 tracemalloc 记录每个阶段的 Python 对象分配峰值。
+    """
+    from audit import AuditRun
+
+    with AuditRun('同步', TARGET_FILE, OUTPUT_FILE) as audit:
+        stats = PhaseStats(trace_memory=trace_memory)
+        use_cache = use_cache and CACHE_ENABLED
+        incremental = incremental and INCREMENTAL_SYNC
+
+        snapshot_cells = None
+        if incremental:
+            with stats.phase('读取同步快照'):
+                snapshot_cells = load_sync_snapshot(TARGET_FILE, OUTPUT_FILE)
+
+        # --- 第一步：加载源文件和目标文件 ---
+        # 源文件只读取姓名列、区域列和批注，不为每个单元格创建对象
+        print(f"正在读取源文件并建立索引: {', '.join(SOURCE_FILES)} ...")
+        sheet_pairs = resolve_sheet_pairs(SOURCE_FILES[0])
+        tasks = source_sheet_tasks(SOURCE_FILES, sheet_pairs)
+        target_sheets = [tgt for _, tgt in sheet_pairs]
+        if SHEET_MAPPING:
+            print(f"工作表: {format_sheet_pairs(sheet_pairs)}")
+        loaded_target = None
+        if snapshot_cells is not None:
+            # 有可用的快照：先只读源文件，确认有变化后再加载目标文件
+            with stats.phase('读取源文件'):
+                source_rows_list = [load_source_rows(source_file, use_cache, sheet) for source_file, sheet in tasks]
+        else:
+            source_rows_list, loaded_target = load_source_and_target(tasks, TARGET_FILE, target_sheets, use_cache, stats)
+            stats.counts['目标文件行数'] = count_target_rows(loaded_target, target_sheets)
+        stats.counts['源文件行数'] = sum(len(source_rows) for source_rows in source_rows_list)
+        stats.counts['源批注数'] = sum(
+            len(row[4]) for source_rows in source_rows_list for row in source_rows
+        )
+
+        # --- 第二步：构建源数据的批注映射表（每个目标工作表一个） ---
+        # 结构: { 目标工作表: { ("张三",): { "DN": 批注对象A, "DO": 批注对象B } } }
+        with stats.phase('建立索引'):
+            sheet_maps, collisions = combine_sheet_rows(sheet_pairs, tasks, source_rows_list)
+
+        print(f"索引完成，共找到 {count_people(sheet_maps)} 个符合区域筛选的人员数据。")
+        print_collisions(collisions)
+        if TARGET_REGION:
+            regions = TARGET_REGION if isinstance(TARGET_REGION, list) else [TARGET_REGION]
+            print(f"筛选区域: {', '.join(regions)}")
+
+        # --- 第三步：与上次同步的快照比较（增量同步） ---
+        changed_maps = None
+        if snapshot_cells is not None:
+            changed_maps = diff_comments_map(sheet_maps, snapshot_cells)
+            if changed_maps is None:
+                print("与上次同步相比有批注被删除，改为完整同步")
+            elif changed_maps and OUTPUT_MODE != 'patch':
+                print("增量同步需要补丁式输出，改为完整同步")
+                changed_maps = None
+
+        # --- 第四步：匹配目标文件，写入批注并保存（所有工作表只保存一次） ---
+        changed_cells = None
+        if changed_maps is not None:
+            changed_cells = sum(
+                len(row_comments) for changed_map in changed_maps.values() for row_comments in changed_map.values()
+            )
+            print(f"增量同步：与上次同步相比有 {changed_cells} 个批注发生变化")
+            try:
+                if changed_maps:
+                    sync_target_incremental(changed_maps, TARGET_FILE, OUTPUT_FILE, stats, audit)
+            except Exception as e:
+                print(f"警告: 增量同步失败（{e}），改为完整同步")
+                audit.discard()
+                changed_maps = changed_cells = None
+        if changed_maps is None:
+            if loaded_target is None:
+                with stats.phase('加载目标文件'):
+                    loaded_target = load_target(TARGET_FILE, target_sheets)
+                stats.counts['目标文件行数'] = count_target_rows(loaded_target, target_sheets)
+            apply_target(loaded_target, sheet_maps, TARGET_FILE, OUTPUT_FILE, audit, stats)
+        # 操作在匹配时已分块写入审计数据库（未启用审计记录时写入临时数据库），统计和日志都从数据库中查询
+        action_counts = audit.action_counts()
+        stats.counts['处理批注数'] = sum(action_counts.values())
+
+        if INCREMENTAL_SYNC:
+            with stats.phase('保存同步快照'):
+                save_sync_snapshot(TARGET_FILE, OUTPUT_FILE, sheet_maps)
+
+        # --- 第五步：生成日志文件（日志中的总用时截至生成日志之前） ---
+        stats.finish()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        counts = count_operations(action_counts)
+        log_file = None
+        if AUDIT_TEXT_LOG or audit.store is None:
+            log_file = os.path.join(SCRIPT_DIR, f'sync_log_{timestamp}.txt')
+            with stats.phase('生成日志'):
+                counts = write_sync_log(
+                    log_file, TARGET_FILE, OUTPUT_FILE, sheet_maps, *audit.operations_store(), changed_cells, stats,
+                    collisions, sheet_pairs
+                )
+        stats.finish()
+        updated_count, merged_count, unchanged_count, conflict_count = counts
+        audit.finish(counts, changed_cells, stats.as_dict(), log_file)
+        stats_file = os.path.join(SCRIPT_DIR, f'sync_log_{timestamp}.json')
+        write_stats_json(stats_file, log_file, stats, {
+            'updated': updated_count, 'merged': merged_count, 'unchanged': unchanged_count,
+            'conflicts': conflict_count, 'changed_cells': changed_cells, 'audit_run': audit.run_id,
+        })
+    
+        # 控制台输出
+        print(f"处理完成！成功同步了 {updated_count} 个批注。")
+        if merged_count > 0:
+            print(f"其中 {merged_count} 个批注与原有批注进行了合并。")
+        if unchanged_count > 0:
+            print(f"另有 {unchanged_count} 个批注内容未变化，已跳过。")
+        if conflict_count > 0:
+            print(f"另有 {conflict_count} 个批注因目标文件中匹配键重复未同步，详见日志【匹配冲突】。")
+        if changed_cells == 0:
+            print(f"源批注与上次同步相同，输出文件已是最新: {OUTPUT_FILE}")
+        else:
+            print(f"文件已保存为: {OUTPUT_FILE}")
+        if log_file:
+            print(f"详细日志已保存为: {log_file}")
+        if audit.run_id:
+            print(f"操作记录已写入审计数据库: {audit.store.path}（运行编号 {audit.run_id}）")
+        print(f"性能统计已保存为: {stats_file}")
+        print_phase_stats(stats)
+        return stats.as_dict()
+
+
+# ================= 批量处理 =================
+
+# 工作进程中的源数据批注映射表、匹配冲突和工作表对应关系（由进程池初始化函数设置，每个进程只传输一次）
+WORKER_SHEET_MAPS = None
+WORKER_COLLISIONS = None
+WORKER_SHEET_PAIRS = None
+# 批量运行在审计数据库中的运行编号，各目标文件的记录以此为上级
+WORKER_AUDIT_PARENT = None
+
+
+def init_batch_worker(config, sheet_maps, collisions=None, sheet_pairs=None, audit_parent=None):
+    global WORKER_SHEET_MAPS, WORKER_COLLISIONS, WORKER_SHEET_PAIRS, WORKER_AUDIT_PARENT
+    apply_config(config)
+    WORKER_SHEET_MAPS = sheet_maps
+    WORKER_COLLISIONS = collisions
+    WORKER_SHEET_PAIRS = sheet_pairs
+    WORKER_AUDIT_PARENT = audit_parent
+
+
+def sync_batch_target(target_file, output_file, log_file):
+    """在工作进程中同步一个目标文件并写日志，返回该文件的统计信息"""
+    from audit import AuditRun
+
+    start = time.perf_counter()
+    result = {'target': target_file, 'output': output_file, 'log': log_file,
+              'updated': 0, 'merged': 0, 'unchanged': 0, 'conflicts': 0, 'seconds': 0.0, 'error': None}
+    try:
+        with AuditRun('批量', target_file, output_file, WORKER_AUDIT_PARENT) as audit:
+            sync_target(WORKER_SHEET_MAPS, target_file, output_file, audit)
+            counts = count_operations(audit.action_counts())
+            if AUDIT_TEXT_LOG or audit.store is None:
+                counts = write_sync_log(
+                    log_file, target_file, output_file, WORKER_SHEET_MAPS, *audit.operations_store(),
+                    collisions=WORKER_COLLISIONS, sheet_pairs=WORKER_SHEET_PAIRS
+                )
+            else:
+                result['log'] = None
+            result['updated'], result['merged'], result['unchanged'], result['conflicts'] = counts
+            audit.finish(counts, log_file=result['log'])
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def resolve_batch_targets(pattern, output_dir):
+    """
+    根据目录或通配符找出所有目标文件
+
+    目录表示其中所有 .xlsx 文件；跳过 Excel 的临时文件（~$ 开头）和输出目录中的文件。
+    """
+    if not os.path.isabs(pattern):
+        pattern = os.path.join(SCRIPT_DIR, pattern)
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.xlsx')
+
+    output_dir = os.path.abspath(output_dir)
+    targets = []
+    for path in sorted(glob.glob(pattern)):
+        path = os.path.abspath(path)
+        if not os.path.isfile(path) or os.path.basename(path).startswith('~$'):
+            continue
+        if os.path.dirname(path) == output_dir:
+            continue
+        targets.append(path)
+    return targets
+
+
+def sync_batch(pattern, output_dir=None, workers=None, use_cache=True):
+    """
+    批量模式：源数据索引只构建一次，目标文件分发到进程池并行同步
+
+    每个目标文件生成各自的输出文件和日志，最后生成一份汇总日志。
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    output_dir = output_dir or BATCH_OUTPUT_DIR
+    if not os.path.isabs(output_dir):
+        output_dir = os.path.join(SCRIPT_DIR, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    targets = resolve_batch_targets(pattern, output_dir)
+    if not targets:
+        print(f"没有找到目标文件: {pattern}")
+        return []
+
+    print(f"正在读取源文件并建立索引: {', '.join(SOURCE_FILES)} ...")
+    sheet_pairs, sheet_maps, collisions = build_sheet_maps(SOURCE_FILES, use_cache=use_cache and CACHE_ENABLED)
+    print(f"索引完成，共找到 {count_people(sheet_maps)} 个符合区域筛选的人员数据。")
+    print_collisions(collisions)
+
+    workers = workers or BATCH_WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(targets)))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    print(f"共 {len(targets)} 个目标文件，使用 {workers} 个进程并行处理...")
+
+    from audit import AuditRun
+
+    with AuditRun('批量', None, output_dir) as audit:
+        start = time.perf_counter()
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                 initargs=(CONFIG, sheet_maps, collisions, sheet_pairs, audit.run_id)) as executor:
+            futures = []
+            for target_file in targets:
+                stem = os.path.splitext(os.path.basename(target_file))[0]
+                output_file = os.path.join(output_dir, f'{stem}_updated.xlsx')
+                log_file = os.path.join(output_dir, f'sync_log_{stem}_{timestamp}.txt')
+                futures.append(executor.submit(sync_batch_target, target_file, output_file, log_file))
+
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                name = os.path.basename(result['target'])
+                if result['error']:
+                    print(f"[失败] {name}: {result['error']}")
+                else:
+                    print(f"[完成] {name}: 同步 {result['updated']} 个批注，用时 {result['seconds']:.2f} 秒")
+        elapsed = time.perf_counter() - start
+
+        results.sort(key=lambda r: r['target'])
+        summary_file = os.path.join(output_dir, f'sync_summary_{timestamp}.txt')
+        write_batch_summary(summary_file, sheet_maps, collisions, results, workers, elapsed)
+        totals = tuple(sum(r[key] for r in results) for key in ('updated', 'merged', 'unchanged', 'conflicts'))
+        audit.finish(totals, log_file=summary_file)
+
+    failed = sum(1 for r in results if r['error'])
+    print(f"批量处理完成！成功 {len(results) - failed} 个，失败 {failed} 个，总用时 {elapsed:.2f} 秒。")
+    print(f"汇总日志已保存为: {summary_file}")
+    if audit.run_id:
+        print(f"操作记录已写入审计数据库: {audit.store.path}（运行编号 {audit.run_id}）")
+    return results
+
+
+def write_batch_summary(summary_file, sheet_maps, collisions, results, workers, elapsed):
+    """生成批量处理的汇总日志"""
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 80 + "\n")
+        f.write("Excel 批注同步 - 批量处理汇总\n")
+        f.write("=" * 80 + "\n\n")
+
+        f.write(f"执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"源文件: {', '.join(SOURCE_FILES)}\n")
+        f.write(f"匹配人员数: {count_people(sheet_maps)} 人\n")
+        f.write(f"源文件中重复的匹配键: {len(collisions)} 个\n")
+        f.write(f"目标文件数: {len(results)} 个\n")
+        f.write(f"并行进程数: {workers}\n")
+        f.write(f"总用时: {elapsed:.2f} 秒\n\n")
+
+        f.write("【统计信息】\n")
+        f.write(f"成功: {sum(1 for r in results if not r['error'])} 个\n")
+        f.write(f"失败: {sum(1 for r in results if r['error'])} 个\n")
+        f.write(f"同步批注数: {sum(r['updated'] for r in results)} 个\n")
+        f.write(f"合并批注数: {sum(r['merged'] for r in results)} 个\n")
+        f.write(f"未变化数: {sum(r['unchanged'] for r in results)} 个\n")
+        f.write(f"冲突数: {sum(r['conflicts'] for r in results)} 个\n\n")
+
+        f.write("=" * 80 + "\n")
+        f.write("【各文件结果】\n")
+        f.write("=" * 80 + "\n\n")
+        for r in results:
+            f.write(f"{os.path.basename(r['target'])}\n")
+            if r['error']:
+                f.write(f"   失败: {r['error']}\n")
+            else:
+                f.write(f"   同步: {r['updated']} 个 | 合并: {r['merged']} 个 | 未变化: {r['unchanged']} 个 | "
+                        f"冲突: {r['conflicts']} 个 | 用时: {r['seconds']:.2f} 秒\n")
+                f.write(f"   输出文件: {r['output']}\n")
+                if r['log']:
+                    f.write(f"   日志文件: {r['log']}\n")
+            f.write("\n")
+
+# ================= 预演（只生成修改计划） =================
+
+PLAN_ACTIONS = ("新增", "覆盖", "合并", "未变化", "冲突")
+
+
+def plan_batch_target(target_file):
+    """在工作进程中生成一个目标文件的修改计划"""
+    result = {'target': target_file, 'operations': [], 'error': None}
+    try:
+        result['operations'] = plan_target(WORKER_SHEET_MAPS, target_file)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def dry_run(plan_file=None, batch_pattern=None, workers=None, use_cache=True):
+    """
+    预演：只建立索引并匹配目标文件，把每个单元格的计划操作（新增/覆盖/合并/未变化/冲突）输出为 JSON
+
+    不修改、不保存目标文件，也不生成日志和同步快照。
+    plan_file 为 '-' 时输出到控制台，为空时保存为 sync_plan_<时间>.json。
+    batch_pattern 不为 None 时预演批量模式的所有目标文件。
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    print(f"正在读取源文件并建立索引: {', '.join(SOURCE_FILES)} ...")
+    sheet_pairs, sheet_maps, collisions = build_sheet_maps(SOURCE_FILES, use_cache=use_cache and CACHE_ENABLED)
+    print(f"索引完成，共找到 {count_people(sheet_maps)} 个符合区域筛选的人员数据。")
+    print_collisions(collisions)
+
+    if batch_pattern is None:
+        results = [{'target': TARGET_FILE, 'operations': plan_target(sheet_maps, TARGET_FILE), 'error': None}]
+    else:
+        output_dir = BATCH_OUTPUT_DIR if os.path.isabs(BATCH_OUTPUT_DIR) else os.path.join(SCRIPT_DIR, BATCH_OUTPUT_DIR)
+        targets = resolve_batch_targets(batch_pattern or BATCH_TARGETS, output_dir)
+        workers = max(1, min(workers or BATCH_WORKERS or os.cpu_count() or 1, len(targets) or 1))
+        print(f"共 {len(targets)} 个目标文件，使用 {workers} 个进程并行预演...")
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                 initargs=(CONFIG, sheet_maps)) as executor:
+            results = list(executor.map(plan_batch_target, targets))
+
+    plan = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'source_files': SOURCE_FILES,
+        'match_columns': MATCH_COLS,
+        'sheets': [{'source': src, 'target': tgt} for src, tgt in sheet_pairs],
+        'collisions': collisions,
+        'targets': [],
+    }
+    for result in results:
+        summary = {action: 0 for action in PLAN_ACTIONS}
+        operations = []
+        for op in result['operations']:
+            summary[op['action']] += 1
+            operations.append({key: op[key] for key in
+                               ('sheet', 'name', 'key', 'row', 'column', 'cell', 'action', 'text', 'author',
+                                'original', 'origin')})
+        plan['targets'].append({
+            'target': result['target'],
+            'error': result['error'],
+            'summary': summary,
+            'operations': operations,
+        })
+        counts = '，'.join(f"{action} {count} 个" for action, count in summary.items())
+        if result['error']:
+            print(f"[失败] {os.path.basename(result['target'])}: {result['error']}")
+        else:
+            print(f"[预演] {os.path.basename(result['target'])}: {counts}")
+
+    if plan_file == '-':
+        print(json.dumps(plan, ensure_ascii=False, indent=2))
+    else:
+        plan_file = plan_file or os.path.join(SCRIPT_DIR, f'sync_plan_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+        with open(plan_file, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, ensure_ascii=False, indent=2)
+        print(f"预演完成，用时 {time.perf_counter() - start:.2f} 秒，修改计划已保存为: {plan_file}")
+    return plan
+
+
+# ================= 批注比较（比较两个工作簿的批注） =================
+
+DIFF_STATUSES = ("新增", "删除", "修改", "相同")
+
+# xlsx 报告中各状态的底色
+DIFF_FILLS = {'新增': 'C6EFCE', '删除': 'FFC7CE', '修改': 'FFEB9C'}
+
+
+def diff_comments_maps(old_map, new_map):
+    """
+    逐个 (匹配键, 列) 比较两个批注映射表，返回 [(匹配键, 列字母, 状态, 旧批注, 新批注)]
+
+    状态为 新增（只有新文件有）/ 删除（只有旧文件有）/ 修改 / 相同；两边都有的批注
+    只比较内容哈希（文本和作者，见 comment_hash），不逐字比较文本。
+    按人员分组，顺序为旧文件中的人员顺序，之后是只在新文件中出现的人员。
+    """
+    cells = []
+    for key, old_comments in old_map.items():
+        new_comments = new_map.get(key, {})
+        for col, old in old_comments.items():
+            new = new_comments.get(col)
+            if new is None:
+                cells.append((key, col, '删除', old, None))
+            else:
+                status = '相同' if comment_hash(old) == comment_hash(new) else '修改'
+                cells.append((key, col, status, old, new))
+        cells.extend((key, col, '新增', None, new) for col, new in new_comments.items() if col not in old_comments)
+    for key, new_comments in new_map.items():
+        if key not in old_map:
+            cells.extend((key, col, '新增', None, new) for col, new in new_comments.items())
+    return cells
+
+
+def load_diff_rows(tasks, use_cache=True):
+    """
+    读取比较双方的工作表，返回与 tasks（[(文件, 工作表)]）一一对应的 [源数据行]
+
+    与同步使用相同的读取方式和源数据缓存；多核机器上未命中缓存的工作表
+    在子进程中并行解析（见 并行加载 配置），子进程失败时改为顺序加载。
+    """
+    fingerprints, rows_list = {}, [None] * len(tasks)
+    if use_cache:
+        for i, (path, sheet) in enumerate(tasks):
+            fingerprints[path], rows_list[i] = load_cached_source_rows(path, sheet, fingerprints.get(path))
+    pending = [i for i, rows in enumerate(rows_list) if rows is None]
+
+    if len(pending) > 1 and PARALLEL_LOAD and (os.cpu_count() or 1) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count()),
+                                     initializer=apply_config, initargs=(CONFIG,)) as executor:
+                futures = {i: executor.submit(load_source_rows_plain, tasks[i][0], use_cache, tasks[i][1])
+                           for i in pending}
+                for i, future in futures.items():
+                    rows_list[i] = source_rows_from_plain(future.result()[0])
+                    # 子进程已写入磁盘缓存，这里只保留在内存中
+                    if use_cache and SOURCE_MEMORY_CACHE is not None:
+                        path, sheet = tasks[i]
+                        remember_source_rows(fingerprints[path] or file_fingerprint(path), sheet, rows_list[i])
+        except (OSError, BrokenProcessPool) as e:
+            print(f"警告: 子进程加载失败（{e}），改为顺序加载")
+        pending = [i for i in pending if rows_list[i] is None]
+
+    for i in pending:
+        path, sheet = tasks[i]
+        rows_list[i] = read_source_rows(path, sheet)
+        if use_cache:
+            store_source_rows(path, fingerprints.get(path), sheet, rows_list[i])
+    return rows_list
+
+
+def diff_report_files(report_file=None):
+    """报告文件 (JSON, xlsx)：report_file 可以带 .json/.xlsx 扩展名，为空时保存为 comment_diff_<时间>"""
+    stem = report_file or os.path.join(SCRIPT_DIR, f'comment_diff_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
+    stem = re.sub(r'\.(json|xlsx)$', '', stem, flags=re.IGNORECASE)
+    return stem + '.json', stem + '.xlsx'
+
+
+# XML 1.0 中不允许出现的控制字符（openpyxl 写入时会报错）
+ILLEGAL_XML_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def report_styles():
+    """xlsx 报告的单元格样式：{ 样式名: { 单元格属性: 样式对象 } }，单元格写成 (值, 样式名)"""
+    from openpyxl.styles import Font, PatternFill
+
+    styles = {'bold': {'font': Font(bold=True)}}
+    for status in ('新增', '删除', '修改'):
+        styles[status] = {'fill': PatternFill('solid', fgColor=f'FF{DIFF_FILLS[status]}')}
+    return styles
+
+
+def report_cell(ws, value, styles):
+    """
+    报告中的一个单元格：普通值直接交给 openpyxl，带样式的值创建 WriteOnlyCell
+
+    字符串去掉 XML 不允许的控制字符；以 = 开头的批注按文本写入，不当作公式。
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    style = None
+    if isinstance(value, tuple):
+        value, style = value
+    if isinstance(value, str):
+        value = ILLEGAL_XML_CHARS_RE.sub('', value)
+    if style is None and not (isinstance(value, str) and value.startswith('=')):
+        return value
+    cell = WriteOnlyCell(ws, value)
+    if isinstance(value, str):
+        cell.data_type = 's'
+    for attr, style_object in styles.get(style, {}).items():
+        setattr(cell, attr, style_object)
+    return cell
+
+
+def write_report_xlsx(report_file, sheets):
+    """
+    用 openpyxl 只写模式生成 xlsx 报告：sheets 为 [(工作表名, 行)]，每行是单元格值的列表，带样式的单元格写成 (值, 样式名)
+
+    行可以是生成器，逐行写入，不在内存中保存整个工作表。
+    """
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    styles = report_styles()
+    for name, rows in sheets:
+        ws = wb.create_sheet(name)
+        for values in rows:
+            ws.append([report_cell(ws, value, styles) for value in values])
+
+    tmp_file = report_file + '.tmp'
+    try:
+        wb.save(tmp_file)
+        os.replace(tmp_file, report_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def write_diff_xlsx(report_file, report):
+    """把比较结果写成 xlsx 报告（汇总、差异、人员、匹配冲突四个工作表）"""
+    def header(*titles):
+        return [(title, 'bold') for title in titles]
+
+    summary_rows = [
+        ['旧文件', report['old_file']],
+        ['新文件', ', '.join(report['new_files'])],
+        ['生成时间', report['generated_at']],
+        [],
+        header('列', *DIFF_STATUSES),
+        *([col, *(counts[status] for status in DIFF_STATUSES)] for col, counts in report['columns'].items()),
+        [('合计', 'bold'), *(report['summary'][status] for status in DIFF_STATUSES)],
+    ]
+    difference_rows = itertools.chain(
+        [header('工作表', '匹配键', '列', '状态', '旧批注', '旧作者', '新批注', '新作者', '来源')],
+        ([item['sheet'], format_match_key(item['key']), item['column'], (item['status'], item['status']),
+          item['old_text'], item['old_author'], item['new_text'], item['new_author'], item['origin']]
+         for item in report['differences']),
+    )
+    people_rows = itertools.chain(
+        [header('工作表', '匹配键', *DIFF_STATUSES)],
+        ([person['sheet'], format_match_key(person['key']), *(person[status] for status in DIFF_STATUSES)]
+         for person in report['people']),
+    )
+    collision_rows = [header('文件', '工作表', '匹配键', '行号')] + [
+        [f"{label}: {item['source']}", item.get('sheet'), format_match_key(item['key']),
+         ', '.join(map(str, item['rows']))]
+        for side, label in (('old', '旧'), ('new', '新')) for item in report['collisions'][side]
+    ]
+    write_report_xlsx(report_file, [
+        ('汇总', summary_rows), ('差异', difference_rows), ('人员', people_rows), ('匹配冲突', collision_rows),
+    ])
+
+
+def diff_workbooks(old_file=None, new_files=None, report_file=None, use_cache=True):
+    """
+    比较两个工作簿的批注，生成 JSON 和 xlsx 报告，返回报告内容
+
+    默认比较目标文件（旧）和源文件（新，多个源文件按同步的规则合并），即同步前两边批注的差异。
+    两边都用同步的模型建立批注索引：匹配列得到匹配键，按筛选区域和同步列筛选；
+    匹配键重复又有批注的行记为匹配冲突，不参与比较。
+    工作表按 [工作表] 映射 对应：新文件中为源工作表，旧文件中为目标工作表。
+    """
+    stats = PhaseStats()
+    old_file = old_file or TARGET_FILE
+    new_files = new_files or SOURCE_FILES
+    print(f"正在比较批注: {source_label(old_file)}（旧） → {', '.join(map(source_label, new_files))}（新）")
+
+    sheet_pairs = resolve_sheet_pairs(new_files[0])
+    if any(tgt is not None for _, tgt in sheet_pairs):
+        old_sheets = set(list_sheet_names(old_file))
+        for _, tgt in sheet_pairs:
+            if tgt is not None and tgt not in old_sheets:
+                print(f"警告: {source_label(old_file)} 中没有工作表 {tgt}，已跳过")
+        sheet_pairs = [(src, tgt) for src, tgt in sheet_pairs if tgt is None or tgt in old_sheets]
+    old_tasks = [(old_file, tgt) for _, tgt in sheet_pairs]
+    new_tasks = source_sheet_tasks(new_files, sheet_pairs)
+
+    with stats.phase('读取文件'):
+        rows_list = load_diff_rows(old_tasks + new_tasks, use_cache)
+
+    with stats.phase('建立索引'):
+        new_maps, new_collisions = combine_sheet_rows(sheet_pairs, new_tasks, rows_list[len(old_tasks):])
+        old_maps, old_collisions = {}, []
+        with gc_paused():
+            for (_, tgt), rows in zip(sheet_pairs, rows_list):
+                old_maps[tgt], collisions = assemble_comments_map(rows, source_label(old_file))
+                for item in collisions:
+                    item['sheet'] = tgt
+                old_collisions.extend(collisions)
+        del rows_list
+
+    with stats.phase('比较'):
+        summary = dict.fromkeys(DIFF_STATUSES, 0)
+        columns, people, differences = {}, [], []
+        for _, sheet in sheet_pairs:
+            person = None
+            for key, col, status, old, new in diff_comments_maps(old_maps[sheet], new_maps[sheet]):
+                summary[status] += 1
+                columns.setdefault(col, dict.fromkeys(DIFF_STATUSES, 0))[status] += 1
+                # diff_comments_maps 按人员分组返回
+                if person is None or person['key'] != key:
+                    person = {'sheet': sheet, 'key': key, **dict.fromkeys(DIFF_STATUSES, 0)}
+                    people.append(person)
+                person[status] += 1
+                if status != '相同':
+                    differences.append({
+                        'sheet': sheet,
+                        'key': key,
+                        'column': col,
+                        'status': status,
+                        'old_text': old.text if old else None,
+                        'old_author': old.author if old else None,
+                        'new_text': new.text if new else None,
+                        'new_author': new.author if new else None,
+                        'origin': new.source if new else None,
+                    })
+
+    report = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'old_file': old_file,
+        'new_files': new_files,
+        'match_columns': MATCH_COLS,
+        'sheets': [{'old': tgt, 'new': src} for src, tgt in sheet_pairs],
+        'summary': summary,
+        'columns': dict(sorted(columns.items(), key=lambda item: column_letter_to_index(item[0]))),
+        'collisions': {'old': old_collisions, 'new': new_collisions},
+        'people': people,
+        'differences': differences,
+    }
+
+    json_file, xlsx_file = diff_report_files(report_file)
+    with stats.phase('生成报告'):
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        write_diff_xlsx(xlsx_file, report)
+
+    stats.finish()
+    counts = '，'.join(f"{status} {count} 个" for status, count in summary.items())
+    print(f"比较完成（{len(people)} 人）：{counts}")
+    if old_collisions or new_collisions:
+        print(f"警告: 有 {len(old_collisions) + len(new_collisions)} 个匹配键对应多行批注，未参与比较，详见报告【匹配冲突】")
+    print_phase_stats(stats)
+    print(f"比较报告已保存为: {json_file}、{xlsx_file}")
+    return report
+
+
+# ================= 监视模式（源文件变化时自动同步） =================
+
+class InotifyWatcher:
+    """
+    Linux 上用 inotify 监视文件所在的目录
+
+    Excel 保存时先写临时文件再改名替换原文件，因此监视目录中的写入完成、改名和删除事件，
+    只报告被监视的文件名。不打开被监视的文件，不会妨碍 Excel 保存。
+    """
+
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    MASK = 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+    def __init__(self, paths):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 失败')
+        self.paths = {os.path.abspath(path) for path in paths}
+        self.dirs = {}  # { 监视描述符: 目录 }
+        for directory in sorted({os.path.dirname(path) for path in self.paths}):
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f'无法监视目录 {directory}')
+            self.dirs[wd] = directory
+
+    def wait(self, timeout=None):
+        """等待被监视的文件变化，返回有变化的文件路径集合；超时返回空集合"""
+        import select
+
+        # 同一目录中其他文件（如输出文件和日志）的事件不算变化，继续等待
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return set()
+            changed = self.read_events()
+            if changed:
+                return changed
+
+    def read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = struct.unpack_from('iIII', data, offset)
+                offset += 16
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                path = os.path.join(self.dirs.get(wd, ''), name)
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """没有 inotify 时定时比较文件的大小和修改时间（只读取文件属性，不打开文件）"""
+
+    def __init__(self, paths, interval):
+        self.interval = interval
+        self.signatures = {os.path.abspath(path): self.signature(path) for path in paths}
+
+    @staticmethod
+    def signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, old in self.signatures.items():
+                new = self.signature(path)
+                if new != old:
+                    self.signatures[path] = new
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            delay = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self):
+        pass
+
+
+def make_watcher(paths):
+    """Linux 上优先使用 inotify，不可用时改为定时检查"""
+    if WATCH_METHOD != 'poll' and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths), 'inotify'
+        except (OSError, AttributeError) as e:
+            print(f"警告: 无法使用 inotify（{e}），改为每 {WATCH_POLL_INTERVAL:g} 秒检查一次文件")
+    return PollingWatcher(paths, WATCH_POLL_INTERVAL), 'poll'
+
+
+def files_ready(paths):
+    """文件都存在且是完整的 xlsx（Excel 仍在保存时 zip 目录尚未写入）"""
+    for path in paths:
+        if not os.path.exists(path):
+            return False
+        if not zipfile.is_zipfile(path):
+            return False
+    return True
+
+
+def watch():
+    """
+    监视源文件（可选同时监视目标文件），变化后自动增量同步，直到按 Ctrl+C 退出
+
+    解析过的源数据保留在内存中，多个源文件时只重新解析有变化的文件；
+    增量同步只修改源批注有变化的单元格。文件停止变化 WATCH_DEBOUNCE 秒后才开始同步。
+    """
+    global SOURCE_MEMORY_CACHE
+    SOURCE_MEMORY_CACHE = SourceMemoryCache(SERVER_MEMORY_MB)
+
+    paths = [os.path.abspath(path) for path in SOURCE_FILES]
+    if WATCH_TARGET:
+        if os.path.abspath(TARGET_FILE) == os.path.abspath(OUTPUT_FILE):
+            print("警告: 输出文件与目标文件相同，不监视目标文件")
+        else:
+            paths.append(os.path.abspath(TARGET_FILE))
+    watcher, method = make_watcher(paths)
+
+    def run_sync(reason):
+        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] {reason}")
+        try:
+            sync_excel_comments(use_cache=True, incremental=True)
+        except Exception as e:
+            print(f"同步失败: {type(e).__name__}: {e}，等待文件再次变化")
+
+    try:
+        run_sync("开始监视前先同步一次")
+        print(f"\n正在监视（{'inotify' if method == 'inotify' else '定时检查'}）: {', '.join(paths)}")
+        print("文件保存后自动同步；按 Ctrl+C 停止")
+        pending = set()
+        while True:
+            changed = watcher.wait(WATCH_DEBOUNCE if pending else None)
+            if changed:
+                pending |= changed
+                continue
+            if not pending:
+                continue
+            # 防抖：文件已停止变化一段时间，且已完整写入
+            if not files_ready(pending):
+                continue
+            names = ', '.join(os.path.basename(path) for path in sorted(pending))
+            pending.clear()
+            run_sync(f"检测到文件变化: {names}")
+    except KeyboardInterrupt:
+        print("\n已停止监视")
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    """命令行入口：解析参数、读取配置文件，然后执行同步"""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='Excel 批注同步工具')
+    arg_parser.add_argument('--no-cache', action='store_true', help='不使用源数据缓存，重新解析源文件')
+    arg_parser.add_argument('--full', action='store_true', help='忽略上次同步的快照，完整同步')
+    arg_parser.add_argument('--profile', metavar='文件', nargs='?', const='',
+                            help='用 cProfile 记录主进程的函数耗时，保存为 pstats 文件（默认 sync_profile_<时间>.prof）')
+    arg_parser.add_argument('--trace-memory', action='store_true',
+                            help='用 tracemalloc 记录每个阶段的 Python 内存分配峰值（会拖慢运行）')
+    arg_parser.add_argument('--batch', metavar='目录或通配符', nargs='?', const='',
+                            help='批量模式：同步目录中（或通配符匹配）的所有目标文件，不指定时使用配置文件中的设置')
+    arg_parser.add_argument('--output-dir', metavar='目录', help='批量模式的输出目录')
+    arg_parser.add_argument('--workers', type=int, metavar='N', help='批量模式和 --index 的并行进程数')
+    arg_parser.add_argument('--dry-run', metavar='JSON文件', nargs='?', const='',
+                            help='预演：只输出修改计划（JSON），不修改目标文件；填 - 输出到控制台')
+    arg_parser.add_argument('--diff', metavar='文件', nargs='*',
+                            help='比较批注：不带文件时比较目标文件（旧）和源文件（新）；'
+                                 '也可以指定 旧文件 新文件（多个新文件按同步的规则合并），生成 JSON 和 xlsx 报告')
+    arg_parser.add_argument('--diff-report', metavar='文件',
+                            help='--diff 的报告文件名（默认 comment_diff_<时间>），同时生成 .json 和 .xlsx')
+    arg_parser.add_argument('--serve', action='store_true',
+                            help='服务模式：常驻后台，在内存中保留源数据，接收本机提交的同步任务')
+    arg_parser.add_argument('--local', action='store_true', help='即使后台服务在运行，也在本进程中执行')
+    arg_parser.add_argument('--watch', action='store_true', help='监视模式：源文件保存后自动增量同步，按 Ctrl+C 停止')
+    arg_parser.add_argument('--audit', choices=['runs', 'query', 'export', 'log'],
+                            help='查看审计数据库：runs 列出最近的运行，query 查询操作记录，'
+                                 'export 导出为 CSV/JSON，log 根据记录生成文字日志')
+    arg_parser.add_argument('--index', metavar='目录或通配符', nargs='?', const='',
+                            help='为归档目录（包括子目录）中的工作簿建立批注全文索引，只处理新增或有变化的文件；'
+                                 '不指定时使用配置文件中的归档目录')
+    arg_parser.add_argument('--search', metavar='关键词',
+                            help='在批注索引中搜索（多个词用空格分隔，都要出现），可加 --name 只看某人')
+    arg_parser.add_argument('--run', metavar='运行编号', help='--audit 只查看这次运行（批量运行包括其中各文件）')
+    arg_parser.add_argument('--name', metavar='姓名', help='--audit / --search 只查看这个人的记录')
+    arg_parser.add_argument('--action', metavar='操作', help='--audit 只查看这种操作（新增/覆盖/合并/未变化/冲突）')
+    arg_parser.add_argument('--limit', type=int, metavar='N', help='--audit / --search 最多显示的条数')
+    arg_parser.add_argument('--audit-file', metavar='文件', help='--audit export/log 的输出文件（.csv 或 .json）')
+    args = arg_parser.parse_args(argv)
+    if args.diff is not None and len(args.diff) == 1:
+        arg_parser.error('--diff 需要同时指定旧文件和新文件，或者都不指定')
+
+    # 后台服务在运行时只提交任务并显示进度；分析性能时需要在本进程中执行
+    if not (args.serve or args.watch or args.audit or args.index is not None or args.search is not None
+            or args.local or args.profile is not None or args.trace_memory):
+        command = ('diff' if args.diff is not None else 'dry-run' if args.dry_run is not None
+                   else 'batch' if args.batch is not None else 'sync')
+        plan_file = args.dry_run
+        if plan_file and plan_file != '-':
+            plan_file = os.path.abspath(plan_file)
+        diff_files = [os.path.abspath(path) for path in args.diff or []]
+        options = {
+            'no_cache': args.no_cache, 'full': args.full, 'batch': args.batch, 'workers': args.workers,
+            'output_dir': os.path.abspath(args.output_dir) if args.output_dir else None, 'plan_file': plan_file,
+            'old_file': diff_files[0] if diff_files else None, 'new_files': diff_files[1:] or None,
+            'report_file': os.path.abspath(args.diff_report) if args.diff_report else None,
+        }
+        from server import run_via_server
+
+        ok = run_via_server(command, options)
+        if ok is not None:
+            return 0 if ok else 1
+
+    config = load_config()
+    profiler = None
+    if args.profile is not None:
+        import cProfile
+        # 子进程中的耗时无法记录，分析时改为在主进程中顺序加载
+        config['PARALLEL_LOAD'] = False
+        profiler = cProfile.Profile()
+        profiler.enable()
+    apply_config(config)
+
+    # 审计、检索和服务模式在各自的模块中，只在用到时导入
+    if args.audit:
+        from audit import audit_command
+        return audit_command(args)
+    if args.index is not None:
+        from index import build_comment_index
+        result = build_comment_index(args.index or None, args.workers)
+        return 1 if result['failed'] else 0
+    if args.search is not None:
+        from index import search_comments
+        search_comments(args.search, args.name, args.limit)
+        return 0
+    if args.serve:
+        from server import serve
+        serve()
+        return 0
+    if args.watch:
+        watch()
+        return 0
+    if args.diff is not None:
+        diff_files = [os.path.abspath(path) for path in args.diff]
+        diff_workbooks(diff_files[0] if diff_files else None, diff_files[1:] or None, args.diff_report,
+                       use_cache=not args.no_cache)
+    elif args.dry_run is not None:
+        dry_run(args.dry_run, args.batch, args.workers, use_cache=not args.no_cache)
+    elif args.batch is not None:
+        sync_batch(args.batch or BATCH_TARGETS, args.output_dir, args.workers, use_cache=not args.no_cache)
+    else:
+        sync_excel_comments(use_cache=not args.no_cache, incremental=not args.full, trace_memory=args.trace_memory)
+
+    if profiler is not None:
+        import pstats
+        profiler.disable()
+        profile_file = args.profile or os.path.join(
+            SCRIPT_DIR, f'sync_profile_{datetime.now().strftime("%Y%m%d_%H%M%S")}.prof'
+        )
+        profiler.dump_stats(profile_file)
+        print("\n耗时最多的函数（按累计时间）:")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+        print(f"性能分析数据已保存为: {profile_file}（可用 python -m pstats 或 snakeviz 查看）")
+    return 0
+
 
 if __name__ == '__main__':
-    sync_excel_comments()
\ No newline at end of file
+    # PyInstaller 打包后使用多进程需要先调用
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,793 @@
+"""sync_comments.py 的回归测试（python -m pytest）"""
+
+import itertools
+import json
+import os
+import threading
+import time
+import zipfile
+
+import openpyxl
+import pytest
+from openpyxl.comments import Comment
+
+import audit
+import index
+import server
+import sync_comments
+import xlsx_patch
+
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+def write_workbook(path, comment_text):
+    """第 1 行为表头，第 2 行为 张三 / 厦门，D2 上有一个批注（comment_text 为 None 时没有批注）"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['序号', '姓名', '区域', '备注'])
+    ws.append([1, '张三', '厦门', ''])
+    if comment_text is not None:
+        ws['D2'].comment = Comment(comment_text, '人事')
+    wb.save(path)
+
+
+def write_people(path, people, comments=None):
+    """第 1 行为表头，从第 2 行起每行一个 (姓名, 区域)；comments: { 单元格坐标: 批注文本 }"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['序号', '姓名', '区域', '备注'])
+    for idx, (name, region) in enumerate(people, 1):
+        ws.append([idx, name, region])
+    for ref, text in (comments or {}).items():
+        ws[ref].comment = Comment(text, '人事')
+    wb.save(path)
+
+
+def write_sheets(path, sheets):
+    """多工作表版本的 write_people：sheets 为 { 工作表名: (人员列表, 批注) }"""
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    for title, (people, comments) in sheets.items():
+        ws = wb.create_sheet(title)
+        ws.append(['序号', '姓名', '区域', '备注'])
+        for idx, (name, region) in enumerate(people, 1):
+            ws.append([idx, name, region])
+        for ref, text in (comments or {}).items():
+            ws[ref].comment = Comment(text, '人事')
+    wb.save(path)
+
+
+def read_comments(path, sheet=None):
+    """{ 单元格坐标: (批注文本, 作者) }；sheet 为 None 时读取活动工作表"""
+    wb = openpyxl.load_workbook(path)
+    ws = wb.active if sheet is None else wb[sheet]
+    return {
+        cell.coordinate: (cell.comment.text, cell.comment.author)
+        for row in ws.iter_rows() for cell in row if cell.comment
+    }
+
+
+def zip_entries(path):
+    """{ 条目名: (CRC, 压缩后大小, 压缩方式, 内容) }；原样复制的条目这几项都不变"""
+    with zipfile.ZipFile(path) as archive:
+        return {
+            info.filename: (info.CRC, info.compress_size, info.compress_type, archive.read(info))
+            for info in archive.infolist()
+        }
+
+
+def write_xlsx_parts(path, sheet_data, shared_strings=(), comments=None):
+    """
+    直接用 XML 写出一个只有一个工作表的 xlsx，用来构造 openpyxl 不会生成的写法
+    （共享字符串、省略 r 属性的单元格、富文本批注、t="d" 的单元格等）
+
+    sheet_data: <sheetData> 的内容；shared_strings: <si> 的内容列表；
+    comments: [(单元格坐标, 作者序号, <text> 的内容)]，作者为 人事、主管
+    """
+    content_types = (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/sharedStrings.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+        '<Override PartName="/xl/comments1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.comments+xml"/>'
+        '</Types>'
+    )
+    sheet_rels = ''
+    if comments is not None:
+        sheet_rels = f'<Relationship Id="rId1" Type="{REL_NS}/comments" Target="../comments1.xml"/>'
+    parts = {
+        '[Content_Types].xml': content_types,
+        '_rels/.rels': (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+        ),
+        'xl/workbook.xml': (
+            f'<workbook xmlns="{NS_MAIN}" xmlns:r="{REL_NS}">'
+            '<sheets><sheet name="Sheet" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ),
+        'xl/_rels/workbook.xml.rels': (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>'
+        ),
+        'xl/worksheets/sheet1.xml': f'<worksheet xmlns="{NS_MAIN}"><sheetData>{sheet_data}</sheetData></worksheet>',
+        'xl/worksheets/_rels/sheet1.xml.rels': (
+            f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{sheet_rels}'
+            '</Relationships>'
+        ),
+        'xl/sharedStrings.xml': (
+            f'<sst xmlns="{NS_MAIN}" count="{len(shared_strings)}" uniqueCount="{len(shared_strings)}">'
+            + ''.join(f'<si>{si}</si>' for si in shared_strings) + '</sst>'
+        ),
+    }
+    if comments is not None:
+        parts['xl/comments1.xml'] = (
+            f'<comments xmlns="{NS_MAIN}"><authors><author>人事</author><author>主管</author></authors><commentList>'
+            + ''.join(f'<comment ref="{ref}" authorId="{author}"><text>{text}</text></comment>'
+                      for ref, author, text in comments)
+            + '</commentList></comments>'
+        )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in parts.items():
+            archive.writestr(name, '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + xml)
+
+
+def read_comment(path):
+    comment = openpyxl.load_workbook(path)['Sheet']['D2'].comment
+    return comment.text if comment else None
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """在临时目录中同步：源文件、目标文件、输出文件、缓存和日志都不写到工具所在目录"""
+    monkeypatch.setattr(sync_comments, 'SCRIPT_DIR', str(tmp_path))
+    cache_dir = str(tmp_path / '.sync_cache')
+    monkeypatch.setattr(sync_comments, 'CACHE_DIR', cache_dir)
+    monkeypatch.setattr(sync_comments, 'CACHE_INDEX_FILE', os.path.join(cache_dir, 'index.json'))
+    monkeypatch.setattr(server, 'SERVER_INFO_FILE', os.path.join(cache_dir, 'server.json'))
+
+    def configure(**overrides):
+        config = dict(sync_comments.DEFAULT_CONFIG, TARGET_REGION=[], COLS_TO_SYNC=['D'], START_ROW=2,
+                      PARALLEL_LOAD=False, CACHE_ENABLED=False, AUDIT_ENABLED=False, AUDIT_TEXT_LOG=False)
+        config.update(overrides)
+        sync_comments.apply_config(config)
+
+    yield tmp_path, configure
+    sync_comments.apply_config(sync_comments.DEFAULT_CONFIG)
+
+
+@pytest.mark.parametrize('merge, first_result', [
+    (False, 'B'),
+    (True, 'A' + sync_comments.DEFAULT_CONFIG['MERGE_SEPARATOR'] + 'B'),
+])
+def test_incremental_sync_rewrites_cells_unchanged_against_target(workspace, merge, first_result):
+    """源批注改回与目标文件相同的内容时，增量同步也要把输出文件恢复为完整同步的结果"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=merge)
+    write_workbook(tmp_path / 'target.xlsx', 'A')
+    write_workbook(tmp_path / 'source.xlsx', 'B')
+    output_file = tmp_path / 'target_updated.xlsx'
+
+    sync_comments.sync_excel_comments()
+    assert read_comment(output_file) == first_result
+
+    # 源批注改为与目标文件相同：与目标文件相比“未变化”，但输出文件中还是上次写入的批注
+    write_workbook(tmp_path / 'source.xlsx', 'A')
+    stats = sync_comments.sync_excel_comments()
+    assert '读取源文件' in stats['phases']  # 有可用的快照，走增量同步
+    assert read_comment(output_file) == 'A'
+
+    # 快照记录的是正确的结果，再次增量同步不改变输出
+    sync_comments.sync_excel_comments()
+    assert read_comment(output_file) == 'A'
+
+    sync_comments.sync_excel_comments(incremental=False)
+    assert read_comment(output_file) == 'A'
+
+
+def test_gc_paused_is_shared_between_threads():
+    """服务模式的多个任务同时运行：先结束的任务不能提前恢复垃圾回收"""
+    import gc
+    import threading
+
+    assert gc.isenabled()
+    first_inside, first_done, second_checked = threading.Event(), threading.Event(), threading.Event()
+    seen = []
+
+    def first():
+        with sync_comments.gc_paused():
+            first_inside.set()
+            second_checked.wait(5)
+
+    def second():
+        first_inside.wait(5)
+        with sync_comments.gc_paused():
+            second_checked.set()
+            first_done.wait(5)
+            seen.append(gc.isenabled())
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    threads[0].join(5)
+    first_done.set()
+    threads[1].join(5)
+
+    assert seen == [False]
+    assert gc.isenabled()
+
+
+# 源文件：共享字符串（含富文本和 _x005F_ 转义）、内联字符串、数字姓名、省略 r 属性的行和单元格、公式
+SOURCE_STRINGS = [
+    '<t>序号</t>', '<t>姓名</t>', '<t>区域</t>', '<t>张三</t>', '<t>厦门</t>',
+    '<r><t>龙</t></r><r><rPr><b/></rPr><t>岩</t></r>', '<t>_x005F_x0041_李四</t>',
+]
+SOURCE_SHEET = (
+    '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c></row>'
+    '<row r="2"><c r="A2"><v>1</v></c><c r="B2" t="s"><v>3</v></c><c r="C2" t="s"><v>4</v></c>'
+    '<c r="E2" t="inlineStr"><is><t>工号_1</t></is></c></row>'
+    '<row r="3"><c><v>2</v></c><c><v>123</v></c><c t="inlineStr"><is><r><t>广</t></r><r><t>州</t></r></is></c></row>'
+    '<row><c r="A4"><v>3</v></c><c r="B4" t="s"><v>6</v></c><c r="C4" t="s"><v>5</v></c><c r="E4"><v>1.5</v></c></row>'
+    '<row r="5"><c r="B5" t="str"><f>"王"&amp;"五"</f><v>王五</v></c><c r="C5" t="b"><v>1</v></c></row>'
+    '<row r="6"><c r="A6"><v>6</v></c><c r="C6" t="s"><v>4</v></c></row>'
+)
+SOURCE_COMMENTS = [
+    ('D2', 0, '<r><rPr><b/></rPr><t>病假</t></r><r><t xml:space="preserve"> 3 天</t></r>'
+              '<rPh sb="0" eb="1"><t>びょう</t></rPh>'),
+    ('B3', 1, '<t>数字姓名</t>'),
+    ('DO4', 0, '<t>第一行\n第二行 &amp; &lt;备注&gt;</t>'),
+    ('D6', 0, '<t>没有姓名的行</t>'),
+    ('D1', 0, '<t>表头</t>'),
+]
+SOURCE_ROWS = [
+    (2, '张三', '厦门', ('张三', '工号_1'), {'D': sync_comments.CommentText('病假 3 天', '人事')}),
+    (3, 123, '广州', (123, None), {'B': sync_comments.CommentText('数字姓名', '主管')}),
+    (4, '_x0041_李四', '龙岩', ('_x0041_李四', 1.5), {'DO': sync_comments.CommentText('第一行\n第二行 & <备注>', '人事')}),
+    (5, '="王"&"五"', True, ('="王"&"五"', None), {}),
+]
+
+
+@pytest.mark.parametrize('engine', ['xml', 'openpyxl'])
+def test_source_engines_read_the_same_rows(workspace, capsys, engine):
+    """XML 直接解析与 openpyxl 只读模式读取同一个文件，结果相同"""
+    tmp_path, configure = workspace
+    configure(SOURCE_ENGINE=engine, MATCH_COLS=['姓名', 'E'])
+    write_xlsx_parts(tmp_path / 'source.xlsx', SOURCE_SHEET, SOURCE_STRINGS, SOURCE_COMMENTS)
+
+    assert sync_comments.read_source_rows(str(tmp_path / 'source.xlsx')) == SOURCE_ROWS
+    assert '改用 openpyxl' not in capsys.readouterr().out
+
+
+def test_source_xml_engine_falls_back_to_openpyxl_for_date_cells(workspace, capsys):
+    """t="d" 的单元格不能直接解析，改用 openpyxl 读取，结果与 openpyxl 一致"""
+    tmp_path, configure = workspace
+    configure(SOURCE_ENGINE='xml')
+    sheet = SOURCE_SHEET.replace('<c r="C2" t="s"><v>4</v></c>', '<c r="C2" t="d"><v>2026-01-07T00:00:00</v></c>')
+    source_file = str(tmp_path / 'source.xlsx')
+    write_xlsx_parts(source_file, sheet, SOURCE_STRINGS, SOURCE_COMMENTS)
+
+    with pytest.raises(ValueError):
+        sync_comments.read_source_rows_xml(source_file)
+    rows = sync_comments.read_source_rows(source_file)
+    assert '改用 openpyxl 读取' in capsys.readouterr().out
+    assert rows == sync_comments.read_source_rows_streaming(source_file)
+    assert rows[0][2].year == 2026
+
+
+# ---------- 补丁式写入 ----------
+
+SPECIAL_TEXT = 'a < b & "c" > \'d\'\n第二行 ]]> &amp;'
+
+
+def test_patch_creates_comment_parts_for_sheet_without_comments(workspace):
+    """目标工作表没有批注：新建批注部件、VML 部件和工作表关系，并登记内容类型"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False)
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_people(tmp_path / 'target.xlsx', people)
+    write_people(tmp_path / 'source.xlsx', people, {'D2': SPECIAL_TEXT, 'D3': '普通批注'})
+
+    sync_comments.sync_excel_comments(incremental=False)
+
+    target_file, output_file = tmp_path / 'target.xlsx', tmp_path / 'target_updated.xlsx'
+    before, after = zip_entries(target_file), zip_entries(output_file)
+    created = {'xl/comments1.xml', 'xl/drawings/vmlDrawing1.vml', 'xl/worksheets/_rels/sheet1.xml.rels'}
+    assert created <= set(after) and not created & set(before)
+    types_xml = after['[Content_Types].xml'][3].decode('utf-8')
+    assert 'PartName="/xl/comments1.xml"' in types_xml and 'Extension="vml"' in types_xml
+    assert b'<legacyDrawing ' in after['xl/worksheets/sheet1.xml'][3]
+
+    assert read_comments(output_file) == {'D2': (SPECIAL_TEXT, '人事'), 'D3': ('普通批注', '人事')}
+    for name in set(before) - {'[Content_Types].xml', 'xl/worksheets/sheet1.xml'}:
+        assert after[name] == before[name], name
+
+
+@pytest.mark.parametrize('merge, expected', [
+    (False, SPECIAL_TEXT),
+    (True, '原批注' + sync_comments.DEFAULT_CONFIG['MERGE_SEPARATOR'] + SPECIAL_TEXT),
+])
+def test_patch_overwrites_or_merges_existing_comment(workspace, merge, expected):
+    """已有批注的单元格覆盖或合并，其他批注和 VML 中已有的形状不变"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=merge)
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_people(tmp_path / 'target.xlsx', people, {'D2': '原批注', 'B3': '其他列的批注'})
+    write_people(tmp_path / 'source.xlsx', people, {'D2': SPECIAL_TEXT})
+
+    sync_comments.sync_excel_comments(incremental=False)
+
+    target_file, output_file = tmp_path / 'target.xlsx', tmp_path / 'target_updated.xlsx'
+    assert read_comments(output_file) == {'D2': (expected, '人事'), 'B3': ('其他列的批注', '人事')}
+    before, after = zip_entries(target_file), zip_entries(output_file)
+    assert set(after) == set(before)
+    changed = {name for name in before if after[name] != before[name]}
+    assert changed == {'xl/comments/comment1.xml'}
+
+
+def test_patch_merge_is_idempotent(workspace):
+    """在同一个文件上重复同步：第二次合并时源批注已在原批注中，批注不变"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=True, OUTPUT_FILE='target.xlsx')
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_people(tmp_path / 'target.xlsx', people, {'D2': '原批注'})
+    write_people(tmp_path / 'source.xlsx', people, {'D2': SPECIAL_TEXT, 'D3': '新增'})
+
+    sync_comments.sync_excel_comments(incremental=False)
+    first = zip_entries(tmp_path / 'target.xlsx')
+    sync_comments.sync_excel_comments(incremental=False)
+    second = zip_entries(tmp_path / 'target.xlsx')
+
+    separator = sync_comments.DEFAULT_CONFIG['MERGE_SEPARATOR']
+    assert read_comments(tmp_path / 'target.xlsx') == {
+        'D2': ('原批注' + separator + SPECIAL_TEXT, '人事'), 'D3': ('新增', '人事'),
+    }
+    assert second == first
+
+
+def test_zip_raw_copy_uses_supported_internals(tmp_path):
+    """原始复制依赖的 zipfile 内部接口在当前 Python 中存在，复制出的条目与原条目逐字节相同"""
+    source = tmp_path / 'source.zip'
+    with zipfile.ZipFile(source, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('a.xml', '<a>' + '批注' * 1000 + '</a>')
+        archive.writestr('b.bin', bytes(range(256)), zipfile.ZIP_STORED)
+
+    copy = tmp_path / 'copy.zip'
+    with zipfile.ZipFile(source) as archive, zipfile.ZipFile(copy, 'w') as zout:
+        assert xlsx_patch.zip_raw_copy_supported(zout)
+        for info in archive.infolist():
+            xlsx_patch.copy_zip_entry_raw(archive.fp, info, zout)
+
+    with zipfile.ZipFile(copy) as archive:
+        assert archive.testzip() is None
+    assert zip_entries(copy) == zip_entries(source)
+
+
+# ---------- 源数据缓存 ----------
+
+def test_source_cache_hit_miss_and_invalidation(workspace, monkeypatch):
+    """第一次解析并写入缓存，之后命中；源文件内容或影响解析的配置变化后缓存失效"""
+    tmp_path, configure = workspace
+    configure(CACHE_ENABLED=True)
+    source_file = str(tmp_path / 'source.xlsx')
+    write_people(source_file, [('张三', '厦门')], {'D2': '第一版'})
+
+    parsed = []
+    read_source_rows = sync_comments.read_source_rows
+    monkeypatch.setattr(sync_comments, 'read_source_rows', lambda *args: parsed.append(args) or read_source_rows(*args))
+
+    first = sync_comments.load_source_rows(source_file)
+    assert len(parsed) == 1
+    assert sync_comments.load_source_rows(source_file) == first
+    assert len(parsed) == 1
+
+    write_people(source_file, [('张三', '厦门')], {'D2': '第二版'})
+    second = sync_comments.load_source_rows(source_file)
+    assert len(parsed) == 2
+    assert second[0][4]['D'].text == '第二版'
+
+    configure(CACHE_ENABLED=True, START_ROW=3)
+    assert sync_comments.load_source_rows(source_file) == []
+    assert len(parsed) == 3
+
+
+def fake_fingerprint(n):
+    return {'path': f'/archive/source{n}.xlsx', 'size': n, 'mtime_ns': n, 'sha256': f'{n:064x}'}
+
+
+def cache_rows(n):
+    return [(2, f'人员{n}', '厦门', (f'人员{n}',), {'D': sync_comments.CommentText('批' * 20000, '人事')})]
+
+
+def cached_keys():
+    return set(sync_comments.load_cache_index())
+
+
+def test_source_cache_evicts_least_recently_used(workspace, monkeypatch):
+    """超过容量上限时删除最久未使用的缓存；读取缓存会更新使用时间"""
+    tmp_path, configure = workspace
+    clock = itertools.count(1000)
+    monkeypatch.setattr(time, 'time', lambda: next(clock))
+    configure(CACHE_ENABLED=True)
+
+    sync_comments.save_source_cache(fake_fingerprint(1), cache_rows(1))
+    entry_bytes = sync_comments.load_cache_index()[sync_comments.source_cache_key(fake_fingerprint(1))]['bytes']
+    configure(CACHE_ENABLED=True, CACHE_MAX_MB=entry_bytes * 2.5 / (1024 * 1024))
+    sync_comments.save_source_cache(fake_fingerprint(2), cache_rows(2))
+    assert sync_comments.load_source_cache(fake_fingerprint(1)) == cache_rows(1)
+
+    sync_comments.save_source_cache(fake_fingerprint(3), cache_rows(3))
+    keys = {n: sync_comments.source_cache_key(fake_fingerprint(n)) for n in (1, 2, 3)}
+    assert cached_keys() == {keys[1], keys[3]}
+    assert sync_comments.load_source_cache(fake_fingerprint(2)) is None
+    pickles = {name for name in os.listdir(sync_comments.CACHE_DIR) if name.endswith('.pkl')}
+    assert pickles == {f'{keys[1]}.pkl', f'{keys[3]}.pkl'}
+
+
+def test_source_cache_index_keeps_concurrent_entries(workspace):
+    """多个任务同时写入缓存时索引不丢失条目；没有登记的数据文件在淘汰时删除"""
+    tmp_path, configure = workspace
+    configure(CACHE_ENABLED=True)
+    os.makedirs(sync_comments.CACHE_DIR)
+    orphan = os.path.join(sync_comments.CACHE_DIR, 'orphan.pkl')
+    open(orphan, 'wb').close()
+
+    threads = [
+        threading.Thread(target=sync_comments.save_source_cache, args=(fake_fingerprint(n), cache_rows(n)))
+        for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cached_keys() == {sync_comments.source_cache_key(fake_fingerprint(n)) for n in range(8)}
+    assert not os.path.exists(orphan)
+
+
+# ---------- 匹配键 ----------
+
+@pytest.mark.parametrize('skip, expected', [
+    (False, {'D2': ('新批注', '人事'), 'D4': ('新批注', '人事')}),
+    (True, {}),
+])
+def test_target_duplicate_keys(workspace, skip, expected):
+    """目标文件中匹配键重复：默认每一行都写入（与以前的版本相同），配置 重复时跳过 后记为冲突、都不写入"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, SKIP_DUPLICATE_KEYS=skip)
+    write_people(tmp_path / 'target.xlsx', [('张三', '厦门'), ('李四', '广州'), ('张三', '龙岩')])
+    write_people(tmp_path / 'source.xlsx', [('张三', '厦门')], {'D2': '新批注'})
+
+    sync_comments.sync_excel_comments(incremental=False)
+
+    assert read_comments(tmp_path / 'target_updated.xlsx') == expected
+
+
+@pytest.mark.parametrize('skip, expected', [
+    (False, {'D2': ('第二行', '人事')}),
+    (True, {}),
+])
+def test_source_duplicate_keys(workspace, skip, expected):
+    """源文件中匹配键重复：默认使用最后一行的批注，配置 重复时跳过 后不同步并记为匹配冲突"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, SKIP_DUPLICATE_KEYS=skip)
+    write_people(tmp_path / 'target.xlsx', [('张三', '厦门')])
+    write_people(tmp_path / 'source.xlsx', [('张三', '厦门'), ('张三', '厦门')], {'D2': '第一行', 'D3': '第二行'})
+
+    source_rows = sync_comments.read_source_rows(str(tmp_path / 'source.xlsx'))
+    _, collisions = sync_comments.assemble_comments_map(source_rows)
+    assert collisions == ([{'key': ('张三',), 'source': None, 'rows': [2, 3]}] if skip else [])
+
+    sync_comments.sync_excel_comments(incremental=False)
+    assert read_comments(tmp_path / 'target_updated.xlsx') == expected
+
+
+def test_composite_key_normalization(workspace):
+    """组合匹配键：全角字符转半角、去掉首尾空白、合并连续空白后比较，区域不同的人员不匹配"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, MATCH_COLS=['姓名', '区域'])
+    write_people(tmp_path / 'target.xlsx', [(' Li   Lei ', '厦门'), ('Li Lei', '广州'), ('ＡＢ１', ' 龙岩')])
+    write_people(tmp_path / 'source.xlsx', [('Ｌｉ　Ｌｅｉ', '厦门　'), ('AB1', '龙岩')], {'D2': '厦门的', 'D3': '龙岩的'})
+
+    assert sync_comments.match_key(('Ｌｉ　Ｌｅｉ', '厦门　')) == sync_comments.match_key((' Li   Lei ', '厦门'))
+    sync_comments.sync_excel_comments(incremental=False)
+
+    assert read_comments(tmp_path / 'target_updated.xlsx') == {'D2': ('厦门的', '人事'), 'D4': ('龙岩的', '人事')}
+
+    configure(MERGE_COMMENTS=False, MATCH_COLS=['姓名', '区域'], NORMALIZE_KEYS=False)
+    sync_comments.sync_excel_comments(incremental=False)
+    assert read_comments(tmp_path / 'target_updated.xlsx') == {}
+
+
+# ---------- 多工作表 ----------
+
+def test_sheet_mapping_routes_sheets_and_skips_missing(workspace, capsys):
+    """多个源工作表分别同步到对应的目标工作表；映射中不存在的工作表给出警告并跳过，其余照常同步"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, SHEET_MAPPING=['1月 -> 一月', '2月', '3月', '不存在 -> 一月', '*季度'])
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_sheets(tmp_path / 'source.xlsx', {
+        '1月': (people, {'D2': '一月的批注'}),
+        '2月': (people, {'D3': '二月的批注'}),
+        '3月': (people, {'D2': '三月的批注'}),
+    })
+    write_sheets(tmp_path / 'target.xlsx', {'一月': (people, None), '2月': (people, None), '1月': (people, None)})
+
+    assert sync_comments.resolve_sheet_pairs(str(tmp_path / 'source.xlsx')) == [
+        ('1月', '一月'), ('2月', '2月'), ('3月', '3月'),
+    ]
+    sync_comments.sync_excel_comments()
+    out = capsys.readouterr().out
+    assert '源文件中没有与 不存在 -> 一月 对应的工作表' in out
+    assert '源文件中没有与 *季度 对应的工作表' in out
+    assert '目标文件中没有工作表 3月' in out
+
+    output_file = tmp_path / 'target_updated.xlsx'
+    assert read_comments(output_file, '一月') == {'D2': ('一月的批注', '人事')}
+    assert read_comments(output_file, '2月') == {'D3': ('二月的批注', '人事')}
+    assert read_comments(output_file, '1月') == {}
+
+    # 只修改一个工作表后增量同步，另一个工作表的批注保留
+    write_sheets(tmp_path / 'source.xlsx', {
+        '1月': (people, {'D2': '一月的批注'}),
+        '2月': (people, {'D3': '二月的批注（修改）'}),
+        '3月': (people, {'D2': '三月的批注'}),
+    })
+    stats = sync_comments.sync_excel_comments()
+    assert '读取源文件' in stats['phases']
+    assert read_comments(output_file, '一月') == {'D2': ('一月的批注', '人事')}
+    assert read_comments(output_file, '2月') == {'D3': ('二月的批注（修改）', '人事')}
+
+
+@pytest.fixture
+def sync_server(workspace, monkeypatch):
+    """在本进程中启动后台服务（端口由系统分配），并写好服务信息文件供 run_via_server 使用"""
+    from http.server import ThreadingHTTPServer
+
+    tmp_path, configure = workspace
+    monkeypatch.setattr(sync_comments, 'CONFIG_FILE', str(tmp_path / 'config.ini'))
+    monkeypatch.setattr(sync_comments, 'SOURCE_MEMORY_CACHE', sync_comments.SourceMemoryCache(64))
+    token = 'test-token'
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), server.make_request_handler(server.SyncServer(2), token))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    os.makedirs(sync_comments.CACHE_DIR, exist_ok=True)
+    with open(server.SERVER_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'port': httpd.server_address[1], 'pid': os.getpid(), 'token': token}, f)
+    try:
+        yield tmp_path, configure, httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+
+def test_server_runs_concurrent_jobs(sync_server, monkeypatch):
+    """同时提交同步和比较两个任务，两个任务都完成且结果正确；令牌错误的请求被拒绝"""
+    import http.client
+
+    tmp_path, configure, port = sync_server
+    # 与 serve() 相同，任务线程的输出按线程分发（pytest 在各阶段之间会替换 sys.stdout，因此在测试中设置）
+    monkeypatch.setattr(server.sys, 'stdout', server.ThreadOutput(server.sys.stdout))
+    configure(MERGE_COMMENTS=False)
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_people(tmp_path / 'source.xlsx', people, {'D2': '源批注', 'D3': '新批注'})
+    write_people(tmp_path / 'target.xlsx', people, {'D2': '旧批注'})
+
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    conn.request('GET', '/status', headers={'X-Sync-Token': 'wrong'})
+    response = conn.getresponse()
+    assert response.status == 403
+    assert json.loads(response.read()) == {'error': '令牌错误'}
+    conn.close()
+
+    report_file = str(tmp_path / 'diff_report.json')
+    jobs = [('sync', {'full': True}), ('diff', {'report_file': report_file})]
+    results = [None] * len(jobs)
+
+    def submit(i, command, options):
+        results[i] = server.run_via_server(command, options)
+
+    threads = [threading.Thread(target=submit, args=(i, *job), daemon=True) for i, job in enumerate(jobs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    assert results == [True, True]
+
+    assert read_comments(tmp_path / 'target_updated.xlsx') == {
+        'D2': ('源批注', '人事'), 'D3': ('新批注', '人事'),
+    }
+    with open(report_file, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['summary'] == {'新增': 1, '删除': 0, '修改': 1, '相同': 0}
+
+
+def test_run_via_server_falls_back_when_server_is_gone(workspace, capsys):
+    """没有服务信息文件，或服务信息文件中的端口已无人监听时，返回 None 由命令行直接运行"""
+    import socket
+
+    assert server.run_via_server('sync', {}) is None
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    os.makedirs(sync_comments.CACHE_DIR, exist_ok=True)
+    with open(server.SERVER_INFO_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'port': port, 'pid': 0, 'token': 'stale'}, f)
+    assert server.run_via_server('sync', {}) is None
+    assert '后台服务没有响应，改为直接运行' in capsys.readouterr().out
+
+
+def test_audit_operations_are_written_in_chunks(workspace, monkeypatch):
+    """匹配时每 AUDIT_BATCH_SIZE 个操作写入一次审计数据库，统计和日志从数据库中查询"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, AUDIT_ENABLED=True, AUDIT_TEXT_LOG=True)
+    monkeypatch.setattr(audit, 'AUDIT_BATCH_SIZE', 2)
+    batches = []
+    insert_operations = audit.AuditStore.insert_operations
+
+    def record_batch(store, rows):
+        batches.append(len(rows))
+        insert_operations(store, rows)
+
+    monkeypatch.setattr(audit.AuditStore, 'insert_operations', record_batch)
+    people = [(f'员工{i}', '厦门') for i in range(5)]
+    write_people(tmp_path / 'source.xlsx', people, {f'D{i + 2}': f'批注{i}' for i in range(5)})
+    write_people(tmp_path / 'target.xlsx', people, {'D2': '批注0', 'D3': '旧批注'})
+
+    stats = sync_comments.sync_excel_comments(incremental=False)
+    assert batches == [2, 2, 1]
+    assert stats['counts']['处理批注数'] == 5
+
+    store = audit.AuditStore()
+    try:
+        run = store.runs(1)[0]
+        assert (run['updated'], run['merged'], run['unchanged'], run['conflicts']) == (4, 0, 1, 0)
+        actions = [op['action'] for op in store.operations(run['run_id'])]
+        assert actions == ['未变化', '覆盖', '新增', '新增', '新增']
+    finally:
+        store.close()
+    log = open(run['log_file'], encoding='utf-8').read()
+    assert '同步批注数: 4 个' in log
+    assert '[覆盖] 员工1 - 列D (单元格D3)' in log
+
+
+def test_sync_log_without_audit_database(workspace):
+    """未启用审计记录时操作写入临时数据库，日志照常生成，不创建审计数据库"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=True, SKIP_DUPLICATE_KEYS=True)
+    write_people(tmp_path / 'source.xlsx', [('张三', '厦门'), ('李四', '广州')], {'D2': '新内容', 'D3': '批注'})
+    write_people(tmp_path / 'target.xlsx', [('张三', '厦门'), ('李四', '广州'), ('李四', '广州')],
+                 {'D2': '原内容'})
+
+    sync_comments.sync_excel_comments(incremental=False)
+    assert not (tmp_path / 'sync_audit.db').exists()
+    log_file, = tmp_path.glob('sync_log_*.txt')
+    log = log_file.read_text(encoding='utf-8')
+    assert '同步批注数: 1 个' in log
+    assert '冲突数: 2 个' in log
+    assert '原批注: 原内容' in log
+    assert '目标文件 | 匹配键: 李四 | 行: 3, 4' in log
+
+
+def test_patch_fallback_does_not_duplicate_audit_records(workspace, monkeypatch, capsys):
+    """补丁式写入失败改用 openpyxl 时，先删除已写入的操作，不重复记录"""
+    tmp_path, configure = workspace
+    configure(MERGE_COMMENTS=False, AUDIT_ENABLED=True)
+
+    def fail(*args):
+        raise ValueError('模拟失败')
+
+    monkeypatch.setattr(xlsx_patch, 'write_comments_patch', fail)
+    write_people(tmp_path / 'source.xlsx', [('张三', '厦门'), ('李四', '广州')], {'D2': '批注', 'D3': '批注'})
+    write_people(tmp_path / 'target.xlsx', [('张三', '厦门'), ('李四', '广州')])
+
+    sync_comments.sync_excel_comments(incremental=False)
+    assert '补丁式写入失败（模拟失败）' in capsys.readouterr().out
+    assert read_comments(tmp_path / 'target_updated.xlsx') == {'D2': ('批注', '人事'), 'D3': ('批注', '人事')}
+    store = audit.AuditStore()
+    try:
+        assert len(list(store.operations())) == 2
+    finally:
+        store.close()
+
+
+def test_diff_reports_added_removed_and_changed(workspace):
+    """比较两个工作簿：JSON 报告中的新增/删除/修改与实际差异一致，xlsx 报告用 openpyxl 可以读回"""
+    tmp_path, configure = workspace
+    configure(COLS_TO_SYNC=['C', 'D'])
+    people = [('张三', '厦门'), ('李四', '广州'), ('王五', '厦门')]
+    write_people(tmp_path / 'old.xlsx', people, {'D2': '相同', 'D3': '旧内容', 'D4': '被删除'})
+    write_people(tmp_path / 'new.xlsx', people, {'D2': '相同', 'D3': '=新内容', 'C4': '新增的批注'})
+
+    report = sync_comments.diff_workbooks(str(tmp_path / 'old.xlsx'), [str(tmp_path / 'new.xlsx')],
+                                          str(tmp_path / 'report'))
+    with open(tmp_path / 'report.json', encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['summary'] == report['summary'] == {'新增': 1, '删除': 1, '修改': 1, '相同': 1}
+    differences = {(tuple(item['key']), item['column']): item for item in saved['differences']}
+    assert {cell for cell, item in differences.items() if item['status'] == '新增'} == {(('王五',), 'C')}
+    assert {cell for cell, item in differences.items() if item['status'] == '删除'} == {(('王五',), 'D')}
+    assert {cell for cell, item in differences.items() if item['status'] == '修改'} == {(('李四',), 'D')}
+    assert differences[('李四',), 'D']['old_text'] == '旧内容'
+    assert differences[('李四',), 'D']['new_text'] == '=新内容'
+
+    wb = openpyxl.load_workbook(tmp_path / 'report.xlsx')
+    assert wb.sheetnames == ['汇总', '差异', '人员', '匹配冲突']
+    rows = list(wb['差异'].iter_rows(min_row=2, values_only=True))
+    assert sorted((row[1], row[2], row[3]) for row in rows) == [('李四', 'D', '修改'), ('王五', 'C', '新增'),
+                                                              ('王五', 'D', '删除')]
+    changed = next(row for row in wb['差异'].iter_rows(min_row=2) if row[3].value == '修改')
+    assert changed[6].value == '=新内容' and changed[6].data_type == 's'
+    assert changed[3].fill.fgColor.rgb == 'FF' + sync_comments.DIFF_FILLS['修改']
+    assert wb['差异']['A1'].font.bold
+
+
+def index_counts(pattern):
+    result = index.build_comment_index(pattern, workers=1)
+    return result['indexed'], result['unchanged'], result['removed'], result['failed']
+
+
+def search_hits(query):
+    return sorted((os.path.basename(row['path']), row['name'], f"{row['col']}{row['row']}")
+                  for row in index.search_comments(query))
+
+
+def test_comment_index_updates_incrementally(workspace):
+    """建立索引后按两个汉字的词搜索；修改、删除文件后重新索引，只处理有变化的文件"""
+    tmp_path, configure = workspace
+    configure()
+    archive = tmp_path / 'archive'
+    archive.mkdir()
+    people = [('张三', '厦门'), ('李四', '广州')]
+    write_people(archive / 'a.xlsx', people, {'D2': '请病假三天', 'B3': '调岗'})
+    write_people(archive / 'b.xlsx', people, {'D3': '病假已批准'})
+    write_people(archive / 'c.xlsx', people, {'D2': '年假'})
+
+    assert index_counts('archive') == (3, 0, 0, 0)
+    assert search_hits('病假') == [('a.xlsx', '张三', 'D2'), ('b.xlsx', '李四', 'D3')]
+    assert search_hits('病三') == []
+    assert search_hits('病假 三天') == [('a.xlsx', '张三', 'D2')]
+
+    # 没有变化的文件直接跳过；只改了修改时间的文件比较内容哈希后也跳过
+    os.utime(archive / 'c.xlsx', ns=(1, 1))
+    assert index_counts('archive') == (0, 3, 0, 0)
+
+    write_people(archive / 'a.xlsx', people, {'D2': '请事假一天'})
+    os.remove(archive / 'b.xlsx')
+    assert index_counts('archive') == (1, 1, 1, 0)
+    assert search_hits('病假') == []
+    assert search_hits('事假') == [('a.xlsx', '张三', 'D2')]
+    assert search_hits('调岗') == []
+
+
+def test_comment_index_only_removes_files_in_scope(workspace):
+    """只删除本次扫描范围内已不存在的文件：同名前缀的目录、子目录和其他通配符范围内的索引保留"""
+    tmp_path, configure = workspace
+    configure()
+    people = [('张三', '厦门')]
+    for path in ('archive/a.xlsx', 'archive/sub/b.xlsx', 'archive2/c.xlsx'):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        write_people(tmp_path / path, people, {'D2': '病假'})
+
+    assert index_counts('archive') == (2, 0, 0, 0)
+    assert index_counts('archive2') == (1, 0, 0, 0)
+    assert index_counts(os.path.join('archive', '*.xlsx')) == (0, 1, 0, 0)
+    assert len(search_hits('病假')) == 3
+
+    os.remove(tmp_path / 'archive2' / 'c.xlsx')
+    assert index_counts('archive') == (0, 2, 0, 0)
+    assert len(search_hits('病假')) == 3
+    os.remove(tmp_path / 'archive' / 'sub' / 'b.xlsx')
+    assert index_counts(os.path.join('archive', '*.xlsx')) == (0, 1, 0, 0)
+    assert index_counts(os.path.join('archive', '**', '*.xlsx')) == (0, 1, 1, 0)
+    assert index_counts('archive2') == (0, 0, 1, 0)
+    assert search_hits('病假') == [('a.xlsx', '张三', 'D2')]
@@ -0,0 +1,365 @@
+"""
+补丁式写入：只重写目标文件中与批注相关的部件（批注、VML 图形、关系和内容类型），其余部件原样复制
+
+由 sync_comments 在用到时才导入（不影响其他命令的启动时间）；
+配置项由 sync_comments.apply_config 设置，这里通过 core 读取当前值
+"""
+
+import copy
+import os
+import posixpath
+import re
+import struct
+import xml.etree.ElementTree as ET
+import zipfile
+
+import sync_comments as core
+
+
+NS_VML = 'urn:schemas-microsoft-com:vml'
+NS_OFFICE = 'urn:schemas-microsoft-com:office:office'
+NS_EXCEL = 'urn:schemas-microsoft-com:office:excel'
+REL_VML_DRAWING = core.REL_NS + '/vmlDrawing'
+COMMENTS_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.comments+xml'
+VML_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.vmlDrawing'
+
+# 工作表中位于 <legacyDrawing> 之后的元素（按 CT_Worksheet 的顺序）
+ELEMENTS_AFTER_LEGACY_DRAWING = (
+    'legacyDrawingHF', 'drawingHF', 'picture', 'oleObjects',
+    'controls', 'webPublishItems', 'tableParts',
+)
+
+VML_SHAPETYPE = (
+    '<v:shapetype id="_x0000_t202" coordsize="21600,21600" o:spt="202" '
+    'path="m,l,21600r21600,l21600,xe">'
+    '<v:stroke joinstyle="miter"/><v:path gradientshapeok="t" o:connecttype="rect"/>'
+    '</v:shapetype>'
+)
+
+# 与 openpyxl 生成的批注形状一致；命名空间在形状上就地声明，
+# 这样无论已有 VML 的根节点如何声明前缀，追加的形状都有效
+VML_COMMENT_SHAPE = (
+    f'<v:shape xmlns:v="{NS_VML}" xmlns:o="{NS_OFFICE}" xmlns:x="{NS_EXCEL}" '
+    'id="_x0000_s{shape_id}" type="#_x0000_t202" '
+    'style="position:absolute; margin-left:59.25pt;margin-top:1.5pt;width:144px;height:79px;'
+    'z-index:1;visibility:hidden" fillcolor="#ffffe1" o:insetmode="auto">'
+    '<v:fill color2="#ffffe1"/><v:shadow color="black" obscured="t"/>'
+    '<v:path o:connecttype="none"/>'
+    '<v:textbox style="mso-direction-alt:auto"><div style="text-align:left"/></v:textbox>'
+    '<x:ClientData ObjectType="Note"><x:MoveWithCells/><x:SizeWithCells/>'
+    '<x:AutoFill>False</x:AutoFill><x:Row>{row}</x:Row><x:Column>{column}</x:Column>'
+    '</x:ClientData></v:shape>'
+)
+
+
+# copy_zip_entry_raw 用到的 zipfile 内部接口。Python 3.9～3.13 中都相同（打包使用 3.9），
+# test_sync_comments.py 检查这些接口；缺少任何一个时改为解压后重新压缩
+ZIP_RAW_COPY_ATTRS = ('fp', 'filelist', 'NameToInfo', 'start_dir', '_didModify')
+
+
+def zip_raw_copy_supported(zout):
+    """当前 Python 的 zipfile 是否有原始复制需要的内部接口"""
+    return callable(getattr(zipfile.ZipInfo, 'FileHeader', None)) and all(
+        hasattr(zout, attr) for attr in ZIP_RAW_COPY_ATTRS
+    )
+
+
+def copy_zip_entry_raw(src_fp, info, zout):
+    """
+    不解压，直接把条目压缩后的原始字节复制到输出 zip
+
+    zipfile 没有公开的原始复制接口，这里按 zip 格式读取本地文件头后的压缩数据，
+    写入新的本地文件头并登记到输出 zip 的中央目录（见 ZIP_RAW_COPY_ATTRS）。
+    """
+    src_fp.seek(info.header_offset)
+    local_header = src_fp.read(30)
+    name_len, extra_len = struct.unpack('<HH', local_header[26:30])
+    src_fp.seek(info.header_offset + 30 + name_len + extra_len)
+    data = src_fp.read(info.compress_size)
+
+    out_info = copy.copy(info)
+    # 本地文件头直接写入 CRC 和大小，不再使用数据描述符
+    out_info.flag_bits &= ~0x08
+    out_info.header_offset = zout.fp.tell()
+    zout.fp.write(out_info.FileHeader())
+    zout.fp.write(data)
+
+    zout.filelist.append(out_info)
+    zout.NameToInfo[out_info.filename] = out_info
+    zout.start_dir = zout.fp.tell()
+    zout._didModify = True
+
+
+def comment_sort_key(ref):
+    col_letter, row_idx = core.split_cell_ref(ref)
+    return row_idx, core.column_letter_to_index(col_letter)
+
+
+COMMENT_ELEMENT_RE = re.compile(r'<comment\b[^>]*>.*?</comment>', re.S)
+COMMENT_REF_RE = re.compile(r'\bref="([^"]+)"')
+
+
+def render_comments_xml(archive, comments_part, updates):
+    """
+    生成新的批注部件：未修改的批注按原始文本保留（含富文本格式），修改和新增的批注写成纯文本
+
+    updates: { 单元格坐标: (批注文本, 作者) }
+    返回 (批注部件 XML, 原来没有批注的单元格坐标列表)
+    """
+    from xml.sax.saxutils import escape as xml_escape
+
+    if comments_part:
+        xml = archive.read(comments_part).decode('utf-8')
+        xml = xml.replace('<commentList/>', '<commentList></commentList>', 1)
+    else:
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<comments xmlns="{core.NS_MAIN[1:-1]}"><authors></authors><commentList></commentList></comments>'
+        )
+
+    authors_match = re.search(r'<authors>(.*?)</authors>|<authors/>', xml, re.S)
+    list_start = xml.find('<commentList>')
+    list_end = xml.rfind('</commentList>')
+    if authors_match is None or list_start < 0 or list_end < 0:
+        raise ValueError(f"无法识别的批注部件格式: {comments_part}")
+
+    authors = []
+    if authors_match.group(1):
+        authors = [a.text or '' for a in ET.fromstring(f'<authors>{authors_match.group(1)}</authors>')]
+
+    # 原有批注：以单元格坐标为键保留原始 XML 片段，被修改的批注稍后替换
+    list_start += len('<commentList>')
+    fragments = {}
+    for match in COMMENT_ELEMENT_RE.finditer(xml, list_start, list_end):
+        ref = COMMENT_REF_RE.search(match.group(0)).group(1)
+        fragments[ref] = match.group(0)
+    new_refs = [ref for ref in updates if ref not in fragments]
+
+    author_ids = {}
+    for idx, author in enumerate(authors):
+        author_ids.setdefault(author, idx)
+
+    for ref, (text, author) in updates.items():
+        author = author or ''
+        if author not in author_ids:
+            author_ids[author] = len(authors)
+            authors.append(author)
+        fragments[ref] = (
+            f'<comment ref="{ref}" authorId="{author_ids[author]}">'
+            f'<text><t xml:space="preserve">{xml_escape(text)}</t></text></comment>'
+        )
+
+    parts = [xml[:authors_match.start()], '<authors>']
+    parts.extend(f'<author>{xml_escape(author)}</author>' for author in authors)
+    parts.append('</authors>')
+    parts.append(xml[authors_match.end():list_start])
+    parts.extend(fragments[ref] for ref in sorted(fragments, key=comment_sort_key))
+    parts.append(xml[list_end:])
+    return ''.join(parts).encode('utf-8'), new_refs
+
+
+def render_vml(existing_vml, new_refs):
+    """
+    在 VML 绘图中为新增批注追加形状，已有形状保持不变
+
+    existing_vml: 原有 VML 文本，没有时为 None（生成新的 VML 部件）
+    """
+    vml = existing_vml or ''
+    shape_ids = [int(i) for i in re.findall(r'_x0000_s(\d+)', vml)]
+    next_id = max(shape_ids) + 1 if shape_ids else 1025
+
+    shapes = []
+    blocks = set()
+    for ref in sorted(new_refs, key=comment_sort_key):
+        row_idx, col_idx = comment_sort_key(ref)
+        shapes.append(VML_COMMENT_SHAPE.format(shape_id=next_id, row=row_idx - 1, column=col_idx - 1))
+        blocks.add(next_id // 1024)
+        next_id += 1
+
+    if existing_vml is None:
+        idmap = ','.join(str(b) for b in sorted(blocks)) or '1'
+        return (
+            f'<xml xmlns:v="{NS_VML}" xmlns:o="{NS_OFFICE}" xmlns:x="{NS_EXCEL}">'
+            f'<o:shapelayout v:ext="edit"><o:idmap v:ext="edit" data="{idmap}"/></o:shapelayout>'
+            + VML_SHAPETYPE + ''.join(shapes) + '</xml>'
+        ).encode('utf-8')
+
+    # 新形状编号所在的编号块需要登记到 o:idmap 中
+    def extend_idmap(match):
+        existing = {int(b) for b in match.group(2).split(',') if b.strip().isdigit()}
+        return match.group(1) + ','.join(str(b) for b in sorted(existing | blocks)) + match.group(3)
+    vml = re.sub(r'(idmap\b[^>]*\bdata=")([^"]*)(")', extend_idmap, vml, count=1)
+
+    if '_x0000_t202' not in vml:
+        shapes.insert(0, VML_SHAPETYPE.replace('<v:shapetype ', f'<v:shapetype xmlns:v="{NS_VML}" xmlns:o="{NS_OFFICE}" ', 1))
+    end = vml.rindex('</xml>')
+    return (vml[:end] + ''.join(shapes) + vml[end:]).encode('utf-8')
+
+
+def add_relationship(rels_xml, rel_type, target):
+    """在关系文件中追加一条关系，返回 (新的关系文件文本, 关系 Id)"""
+    from xml.sax.saxutils import escape as xml_escape
+
+    if rels_xml is None:
+        rels_xml = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<Relationships xmlns="{core.NS_PKG_REL[1:-1]}"></Relationships>'
+        )
+    used = set(re.findall(r'\bId="([^"]*)"', rels_xml))
+    n = len(used) + 1
+    while f'rId{n}' in used:
+        n += 1
+    rel_id = f'rId{n}'
+
+    end = rels_xml.rindex('</Relationships>')
+    target = xml_escape(target, {'"': '&quot;'})
+    rel = f'<Relationship Id="{rel_id}" Type="{rel_type}" Target="{target}"/>'
+    return rels_xml[:end] + rel + rels_xml[end:], rel_id
+
+
+def add_content_type_override(types_xml, part, content_type):
+    """在 [Content_Types].xml 中登记一个部件的内容类型"""
+    end = types_xml.rindex('</Types>')
+    override = f'<Override PartName="/{part}" ContentType="{content_type}"/>'
+    return types_xml[:end] + override + types_xml[end:]
+
+
+def add_content_type_default(types_xml, extension, content_type):
+    """在 [Content_Types].xml 中登记扩展名的默认内容类型（已存在时不变）"""
+    if f'Extension="{extension}"' in types_xml:
+        return types_xml
+    end = types_xml.rindex('</Types>')
+    default = f'<Default Extension="{extension}" ContentType="{content_type}"/>'
+    return types_xml[:end] + default + types_xml[end:]
+
+
+def insert_legacy_drawing(sheet_xml, rel_id):
+    """在工作表 XML 中按元素顺序插入 <legacyDrawing r:id="..."/>"""
+    prefix = re.search(r'<(\w+:)?worksheet\b', sheet_xml).group(1) or ''
+    pos = sheet_xml.rindex(f'</{prefix}worksheet>')
+
+    # 工作表级的 extLst 是最后一个子元素，从末尾向前找到与之配对的开始标签
+    if sheet_xml[:pos].rstrip().endswith(f'</{prefix}extLst>'):
+        depth = 0
+        for match in reversed(list(re.finditer(rf'<(/?){prefix}extLst\b', sheet_xml[:pos]))):
+            depth += 1 if match.group(1) else -1
+            if depth == 0:
+                pos = match.start()
+                break
+
+    for name in ELEMENTS_AFTER_LEGACY_DRAWING:
+        match = re.search(rf'<{prefix}{name}\b', sheet_xml[:pos])
+        if match:
+            pos = match.start()
+            break
+
+    element = f'<{prefix}legacyDrawing xmlns:r="{core.REL_NS}" r:id="{rel_id}"/>'
+    return sheet_xml[:pos] + element + sheet_xml[pos:]
+
+
+def unique_part_name(names, pattern):
+    n = 1
+    while pattern.format(n) in names:
+        n += 1
+    return pattern.format(n)
+
+
+def patch_sheet_comments(archive, names, sheet_part, comments_part, updates, replaced, types_xml):
+    """
+    生成一个工作表的批注相关部件，放入 replaced { 部件路径: 新内容 }
+
+    names 为压缩包中已有的部件名，新建的部件会加入其中，避免多个工作表新建同名部件。
+    types_xml 为已修改过的 [Content_Types].xml（没有则为 None），返回修改后的内容。
+    """
+    sheet_rels = core.read_rels(archive, sheet_part)
+    vml_part = core.find_rel_target(sheet_rels, REL_VML_DRAWING)
+    folder, filename = posixpath.split(sheet_part)
+    rels_path = posixpath.join(folder, '_rels', f'{filename}.rels')
+    rels_xml = archive.read(rels_path).decode('utf-8') if rels_path in names else None
+    rels_changed = False
+
+    if comments_part is None:
+        # 工作表第一次出现批注：新建批注部件
+        comments_xml, new_refs = render_comments_xml(archive, None, updates)
+        comments_part = unique_part_name(names, 'xl/comments{0}.xml')
+        names.add(comments_part)
+        rels_xml, _ = add_relationship(rels_xml, core.REL_COMMENTS, posixpath.relpath(comments_part, folder))
+        types_xml = types_xml or archive.read('[Content_Types].xml').decode('utf-8')
+        types_xml = add_content_type_override(types_xml, comments_part, COMMENTS_CONTENT_TYPE)
+        rels_changed = True
+    else:
+        comments_xml, new_refs = render_comments_xml(archive, comments_part, updates)
+    replaced[comments_part] = comments_xml
+
+    if vml_part is None:
+        # 没有 VML 绘图部件：新建并在工作表中引用
+        vml_part = unique_part_name(names, 'xl/drawings/vmlDrawing{0}.vml')
+        names.add(vml_part)
+        rels_xml, rel_id = add_relationship(rels_xml, REL_VML_DRAWING, posixpath.relpath(vml_part, folder))
+        types_xml = types_xml or archive.read('[Content_Types].xml').decode('utf-8')
+        types_xml = add_content_type_default(types_xml, 'vml', VML_CONTENT_TYPE)
+        sheet_xml = archive.read(sheet_part).decode('utf-8')
+        replaced[sheet_part] = insert_legacy_drawing(sheet_xml, rel_id).encode('utf-8')
+        replaced[vml_part] = render_vml(None, new_refs)
+        rels_changed = True
+    elif new_refs:
+        replaced[vml_part] = render_vml(archive.read(vml_part).decode('utf-8'), new_refs)
+
+    # 关系文件只在新建部件时才会变化
+    if rels_changed:
+        replaced[rels_path] = rels_xml.encode('utf-8')
+    return types_xml
+
+
+def write_comments_patch(target_file, output_file, sheet_updates):
+    """
+    以补丁方式写出目标文件：逐个复制 zip 条目，只重新生成批注相关部件
+
+    - 批注部件（xl/comments*.xml）重新生成，VML 绘图部件只追加新批注的形状
+    - 工作表第一次出现批注时，新建批注/VML 部件，并更新工作表关系、
+      [Content_Types].xml 以及工作表中的 <legacyDrawing>
+    - 其余条目直接复制压缩后的原始字节，不解压也不重新压缩（zipfile 内部接口不可用时重新压缩）
+    - 所有工作表的修改一次写出；先写入临时文件，关闭目标文件后再替换输出文件
+      （输出文件可以就是目标文件；Windows 下不能替换仍然打开着的文件）
+
+    sheet_updates: { 工作表名（None 为活动工作表）: { 单元格坐标: (批注文本, 作者) } }
+    """
+    with zipfile.ZipFile(target_file) as archive:
+        names = set(archive.namelist())
+        replaced = {}
+        types_xml = None
+        for sheet, updates in sheet_updates.items():
+            if not updates:
+                continue
+            sheet_part, comments_part, _ = core.find_sheet_parts(archive, sheet)
+            types_xml = patch_sheet_comments(archive, names, sheet_part, comments_part, updates, replaced, types_xml)
+        if types_xml is not None:
+            replaced['[Content_Types].xml'] = types_xml.encode('utf-8')
+
+        tmp_file = output_file + '.tmp'
+        try:
+            with zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED) as zout:
+                raw_copy = zip_raw_copy_supported(zout)
+                for info in archive.infolist():
+                    if info.filename in replaced:
+                        data = replaced.pop(info.filename)
+                        zout.writestr(zipfile.ZipInfo(info.filename, info.date_time), data, zipfile.ZIP_DEFLATED)
+                    elif raw_copy:
+                        copy_zip_entry_raw(archive.fp, info, zout)
+                    else:
+                        zout.writestr(info, archive.read(info))
+
+                # 新建的部件
+                for name, data in replaced.items():
+                    zout.writestr(name, data)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+    try:
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise